@@ -1,10 +1,156 @@
-
+import types
+import hashlib
+import numpy as np
 
 class Condition(object):
+    '''
+    Condition to mark the events on the EventFinder
+
+    Use one:
+        1. expression: see finance.events.Expressions, e.g.
+           Expressions.condition((price.lag(1) >= 3) & (price < 3))
+        2. array_function(values): vectorized, receives the matrix of values
+           (rows: dates, columns: symbols) and returns a boolean matrix of the
+           same shape, True on the events. e.g.
+           lambda values: (Condition.previous(values) >= 3) & (values < 3)
+        3. function(i, item, data): evaluated for each symbol and each date
+
+    The EventFinder caches the events of each symbol by the hash of the condition.
+    A condition where the events of a symbol depend on the other symbols (e.g. an
+    array_function that ranks the symbols of each date) needs cross_sectional = True,
+    its events are not cached.
+    '''
     def __init__(self):
         self.id = None
         self.function = Condition.default
+        self.array_function = None
+        self.expression = None
+        self.cross_sectional = False
 
     @staticmethod
     def default(i, item, data):
-        raise Exception('Condition.function needs to be written')
\ No newline at end of file
+        raise Exception('Condition.function needs to be written')
+
+    def hash(self):
+        '''
+        Returns the md5 of the content of the condition: the key of the expression
+        or the code, defaults, closure and referenced globals of the function; used
+        by the EventFinder to cache the events.
+        None if the content can not be described on a deterministic way (e.g. the
+        function uses objects without a stable representation): not cached
+        '''
+        if self.expression is not None:
+            return self.expression.hash()
+        function = self.array_function if self.array_function is not None else self.function
+        try:
+            description = Condition.describe(function)
+        except ValueError:
+            return None
+        return hashlib.md5(description.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def describe(obj, seen=None):
+        '''
+        Returns a string with the content of an object, the same on every run:
+            functions: code, defaults, kwdefaults, closure and the values of the globals they read
+            code: bytecode, constants and names
+            numbers, str, np.array, containers, modules, classes and expressions
+        Raises ValueError for other objects (their repr can have memory addresses)
+        '''
+        seen = set() if seen is None else seen
+        if isinstance(obj, (type(None), bool, int, float, complex, str, bytes, np.generic)):
+            return repr(obj)
+        if isinstance(obj, np.ndarray):
+            return repr((obj.dtype.str, obj.shape, hashlib.md5(np.ascontiguousarray(obj).tobytes()).hexdigest()))
+        if isinstance(obj, (list, tuple)):
+            return repr((type(obj).__name__, [Condition.describe(item, seen) for item in obj]))
+        if isinstance(obj, (set, frozenset)):
+            return repr(sorted(Condition.describe(item, seen) for item in obj))
+        if isinstance(obj, dict):
+            return repr(sorted((Condition.describe(k, seen), Condition.describe(v, seen)) for k, v in obj.items()))
+        if isinstance(obj, types.CodeType):
+            consts = [Condition.describe(const, seen) for const in obj.co_consts]
+            return repr((obj.co_code, consts, obj.co_names))
+        if isinstance(obj, types.ModuleType):
+            return 'module %s' % obj.__name__
+        if isinstance(obj, type):
+            return 'class %s.%s' % (obj.__module__, obj.__qualname__)
+        if isinstance(obj, (types.BuiltinFunctionType, np.ufunc)):
+            return repr(obj)
+        if hasattr(obj, 'key') and hasattr(obj, 'compute'):
+            # Expressions
+            return obj.key
+        if isinstance(obj, types.MethodType):
+            return repr((Condition.describe(obj.__func__, seen), Condition.describe(obj.__self__, seen)))
+        if isinstance(obj, types.FunctionType):
+            if id(obj) in seen:
+                # Recursive functions
+                return obj.__qualname__
+            seen.add(id(obj))
+            code = obj.__code__
+            closure = [Condition.describe(cell.cell_contents, seen) for cell in obj.__closure__ or []]
+            names = Condition.names(code)
+            referenced = [(name, Condition.describe(obj.__globals__[name], seen))
+                          for name in sorted(names) if name in obj.__globals__]
+            return repr((Condition.describe(code, seen), Condition.describe(obj.__defaults__, seen),
+                         Condition.describe(obj.__kwdefaults__, seen), closure, referenced))
+        raise ValueError('%s can not be described' % type(obj).__name__)
+
+    @staticmethod
+    def names(code):
+        '''
+        Returns the names used by a code object and the code objects it defines
+        '''
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names.update(Condition.names(const))
+        return names
+
+    @staticmethod
+    def previous(values, periods=1):
+        '''
+        Returns the values of the previous dates: the values shifted down,
+        the first rows are NaN
+
+        Parameters
+        ----------
+            values: np.array of shape (dates, symbols)
+            periods: int
+        '''
+        values = np.asarray(values, dtype=np.float64)
+        ans = np.empty(values.shape)
+        ans[:periods] = np.nan
+        ans[periods:] = values[:len(values) - periods]
+        return ans
+
+    def evaluate(self, values, context=None):
+        '''
+        Evaluates the condition on the matrix of values
+
+        Parameters
+        ----------
+            values: np.array of shape (dates, symbols)
+            context: Expressions.Context, data of other fields and symbols used by the expression
+
+        Returns
+        -------
+            events: np.array of boolean of shape (dates, symbols); the first date is never an event
+        '''
+        values = np.asarray(values, dtype=np.float64)
+        if self.expression is not None or self.array_function is not None:
+            if self.expression is not None:
+                events = self.expression.evaluate(values, context)
+            else:
+                with np.errstate(invalid='ignore'):
+                    events = self.array_function(values)
+            events = np.broadcast_to(np.asarray(events, dtype=bool), values.shape).copy()
+            events[:1] = False
+            return events
+
+        events = np.zeros(values.shape, dtype=bool)
+        for col in range(values.shape[1]):
+            data = values[1:, col]
+            for i, item in enumerate(data):
+                events[i + 1, col] = bool(self.function(i, item, data))
+        return events
@@ -1,73 +1,332 @@
+import pickle
 import numpy as np
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from finance.utils import DateUtils
 from finance.utils import DataAccess
 from finance.events import Condition
+from finance.events.Expressions import Context, Field
+from finance.events.EventMatrix import EventMatrix
 
 class EventFinder(object):
     def __init__(self):
         self.data_access = DataAccess()
+        self.calendar = self.data_access.calendar
 
         self.symbols = []
         self.start_date = None
         self.end_date = None
         self.field = 'adjusted_close'
+        self.market = 'SPY'
 
         self.condition = Condition()
-        self.matrix = None
+        self.events = None
+        self.list = None
+        self.table = None
         self.num_events = 0
 
         self.oneEventPerEquity = True
+        self.cooldown = 0
 
-    def generate_filename(self):
-        return '%s%s%s%s%s%s' % (''.join(self.symbols), self.start_date.strftime('%Y-%m-%d'),
-                self.end_date.strftime('%Y-%m-%d'), self.field, self.condition.id,
-                str(self.oneEventPerEquity))
+    def cache_name(self, symbol):
+        '''
+        Returns the name of the cached events of a symbol: the events depend on the
+        symbol, the content of the condition (Condition.hash), the data and the dates
+        '''
+        return '%s_%s_%s_%s_%s_%s' % (symbol, self.condition.hash(), self.field, self.market,
+                self.start_date.strftime('%Y-%m-%d'), self.end_date.strftime('%Y-%m-%d'))
 
-    def search(self, oneEventPerEquity=True, useCache=True, save=True):
+    def load_events(self, symbols, index):
+        '''
+        Loads the cached events of the symbols
+
+        Parameters
+        ----------
+            symbols: list of str
+            index: pd.DatetimeIndex, dates of the search
+
+        Returns
+        -------
+            events: EventMatrix of the symbols with cached events
+            missing: list of str, symbols without cached events
+        '''
+        found, missing = [], []
+        dates, cols, values = [np.array([], dtype='datetime64[ns]')], [np.array([], dtype=np.int64)], [np.array([])]
+        for symbol in symbols:
+            saved = self.data_access.load(self.cache_name(symbol), '.evt')
+            if saved is None:
+                missing.append(symbol)
+                continue
+            dates.append(saved.index.values)
+            cols.append(np.full(len(saved), len(found), dtype=np.int64))
+            values.append(saved['value'].values)
+            found.append(symbol)
+        events = EventMatrix.from_dates(index, found, np.concatenate(dates),
+                                        np.concatenate(cols), np.concatenate(values))
+        return events, missing
+
+    def save_events(self, events):
+        '''
+        Saves the events of each symbol of an EventMatrix (binary: see DataAccess.cache_format)
+        '''
+        for symbol in events.symbols:
+            self.data_access.save(events.frame(symbol), self.cache_name(symbol), '.evt')
+
+    def thin(self, events):
+        '''
+        Applies oneEventPerEquity and cooldown to the events
+        '''
+        if self.oneEventPerEquity == True:
+            # Keep only the first event of each equity
+            return events.first()
+        elif self.cooldown > 0:
+            return events.cooldown(self.cooldown)
+        return events
+
+    @property
+    def matrix(self):
+        '''
+        Dense matrix of the events (only dates and symbols with events), created
+        from the sparse self.events
+        '''
+        if self.events is None:
+            return None
+        return self.events.dense()
+
+    def load(self, field, symbol, index, symbols=None, save=True):
+        '''
+        Returns the values of a field aligned to index, used by the expressions
+        of the conditions (see Expressions.Context)
+
+        Parameters
+        ----------
+            field: str
+            symbol: str, None for all the symbols
+            index: pd.DatetimeIndex
+            symbols: list of str, default self.symbols
+            save: boolean, passed to DataAccess.get_data
+
+        Returns
+        -------
+            values: np.array of shape (len(index), len(symbols)) or (len(index), 1)
+        '''
+        if symbols is None:
+            symbols = self.symbols
+        if symbol is not None:
+            symbols = [symbol]
+        data = self.data_access.get_data(symbols, index[0], index[-1], field, save=save)
+        if len(data.columns) == 1:
+            data.columns = symbols
+        return data[symbols].reindex(index).values
+
+    def context(self, symbols, save=True):
+        '''
+        Loads the data of the symbols to evaluate the conditions
+
+        Parameters
+        ----------
+            symbols: list of str
+            save: boolean, passed to DataAccess.get_data
+
+        Returns
+        -------
+            index: pd.DatetimeIndex, dates of the data
+            context: Expressions.Context, shared by all the conditions evaluated on it
+        '''
+        # 1. Get the dates, and Download/Import the data
+        nyse_dates = self.calendar.range(self.start_date, self.end_date)
+        data = self.data_access.get_data(symbols, nyse_dates[0], nyse_dates[-1], self.field, save=save)
+        # Special case
+        if len(data.columns) == 1:
+            data.columns = symbols
+
+        data = data[self.start_date:self.end_date]
+        context = Context(data[symbols].values, self.field, market=self.market,
+                          loader=lambda field, symbol: self.load(field, symbol, data.index, symbols, save))
+        return data.index, context
+
+    def evaluate(self, condition, index, context, symbols):
+        '''
+        Evaluates a condition on the data of a context: one evaluation for all the symbols
+
+        Returns
+        -------
+            events: EventMatrix, all the events (see EventFinder.thin)
+        '''
+        events = condition.evaluate(context.values, context)
+        return EventMatrix.from_dense(events, index, symbols)
+
+    def find(self, symbols, save=True):
+        '''
+        Loads the data of the symbols and evaluates the condition on them
+
+        Parameters
+        ----------
+            symbols: list of str
+            save: boolean, passed to DataAccess.get_data
+
+        Returns
+        -------
+            events: EventMatrix, all the events (see EventFinder.thin)
+        '''
+        index, context = self.context(symbols, save)
+        return self.evaluate(self.condition, index, context, symbols)
+
+    def find_parallel(self, symbols, processes):
+        '''
+        Splits the symbols on shards and evaluates each shard on a pool of processes.
+        The events of the shards are merged on the order of symbols.
+
+        The missing data is downloaded first on this process, the workers only read it.
+
+        Parameters
+        ----------
+            symbols: list of str
+            processes: int, number of processes
+
+        Returns
+        -------
+            events: EventMatrix, all the events (see EventFinder.thin)
+        '''
+        # 1. Download the missing data before starting the workers
+        nyse_dates = self.calendar.range(self.start_date, self.end_date)
+        download = list(symbols)
+        if self.condition.expression is not None and Field.MARKET in self.condition.expression.key:
+            download.append(self.market)
+        self.data_access.file_manager.get_filenames(download, nyse_dates[0], nyse_dates[-1])
+
+        # 2. Search each shard: few shards per process to balance the load
+        num_shards = min(len(symbols), processes * 4)
+        shards = [list(shard) for shard in np.array_split(symbols, num_shards)]
+        settings = {'start_date': self.start_date, 'end_date': self.end_date,
+                    'field': self.field, 'market': self.market, 'condition': self.condition}
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(find_shard, self.data_access.dir, settings, shard) for shard in shards]
+            matrices = [future.result() for future in futures]
+        return EventMatrix.concat(matrices, symbols)
+
+    def search(self, oneEventPerEquity=True, useCache=True, save=True, cooldown=0, processes=1):
+        '''
+        Search the events of the condition on the symbols between the start and end dates
+
+        Parameters
+        ----------
+            oneEventPerEquity: boolean, True to keep only the first event of each symbol
+            useCache: boolean, True to load the events of the symbols searched before
+                      (same condition, field, market and dates); only the new symbols are searched.
+                      The events are not cached if the condition is not cacheable (see EventFinder.cacheable)
+            save: boolean, True to save the events of each symbol
+            cooldown: int, minimum number of dates between two events of the same symbol:
+                      events with a kept event of the same symbol on the previous cooldown dates
+                      are dropped. 0 keeps all the events
+            processes: int, number of processes to search the symbols; 1 on this process.
+                       The condition needs to be picklable (e.g. Expressions or SampleConditions,
+                       not lambdas), otherwise the search runs on this process
+
+        Results
+        -------
+            self.events: EventMatrix
+            self.list: pd.Series, index: dates, values: symbols; one item for each event
+            self.table: pd.DataFrame, columns: date, symbol, value; one row for each event
+            self.num_events: int
+        '''
         self.oneEventPerEquity = oneEventPerEquity
+        self.cooldown = cooldown
+        index = self.calendar.range(self.start_date, self.end_date)
+
+        # 1. Load the events of the symbols searched before, if requested
+        matrices = []
+        missing = self.symbols
+        cacheable = self.cacheable()
+        if useCache and cacheable:
+            cached, missing = self.load_events(self.symbols, index)
+            matrices.append(cached)
+
+        # 2. Search only the symbols not cached
+        if len(missing) > 0:
+            if processes > 1 and len(missing) > 1 and self.picklable():
+                new = self.find_parallel(missing, processes)
+            else:
+                new = self.find(missing)
+            if save and cacheable:
+                self.save_events(new)
+            matrices.append(new)
+        self.events = self.thin(EventMatrix.concat(matrices, self.symbols, index))
 
-        # 1. Load the data if requested and available
-        self.matrix = self.data_access.load(self.generate_filename(), '.evt_matrix')
-        if useCache and self.matrix is not None:
-            pass
-        else:
-            # 2. Data was not loaded
-            # 2.1 Get the dates, and Download/Import the data
-            nyse_dates = DateUtils.nyse_dates(start=self.start_date, end=self.end_date)
-            data = self.data_access.get_data(self.symbols, nyse_dates[0], nyse_dates[-1], self.field)
-            # Special case
-            if len(data.columns) == 1:
-                data.columns = self.symbols
-
-            # 2.2 Create and fill the matrix of events
-            data = data[self.start_date:self.end_date]
-            self.matrix = pd.DataFrame(index=data.index, columns=self.symbols)
-
-            for symbol in self.symbols:
-                i = 0
-                for item in data[symbol][1:]:
-                    e = self.condition.function(i, item, data[symbol][1:])
-                    if e:
-                        self.matrix[symbol][i+1] = 1
-                        if oneEventPerEquity == True:
-                            break
-                    i = i + 1
-
-
-        # 3. Calculate other results and save if requested
-        # Reduce Matrix: Sum each row and columns: if is greater than 0 there is an event
-        self.matrix = self.matrix[self.matrix.fillna(value=0).sum(axis=1) > 0]
-        valid_cols = self.matrix.columns[self.matrix.fillna(value=0).sum(axis=0) > 0].values
-        self.matrix = self.matrix[valid_cols]
-        # 3.2 Create list of events
-        self.list = pd.Series(index=self.matrix.index, name='Equity')
-        for idx, row in self.matrix.iterrows():
-            equity = row[row == 1].index[0]
-            self.list.loc[idx] = equity
-        # 3.3 Save
+        # 3. Calculate other results
+        # 3.1 Create list and table of events: all the events sorted by date and symbol
+        self.list = pd.Series(self.events.equities, index=self.events.dates, name='Equity')
+        self.table = self.events.table()
         self.num_events = len(self.list)
-        if save:
-            self.data_access.save(self.matrix, self.generate_filename(), '.evt_matrix')
 
+    def search_many(self, conditions, oneEventPerEquity=True, cooldown=0):
+        '''
+        Search the events of many conditions loading the data once.
+        The conditions written with Expressions share the subexpressions,
+        e.g. the price of the previous date is computed once for all of them
+
+        Parameters
+        ----------
+            conditions: list of Condition
+            oneEventPerEquity: boolean
+            cooldown: int
+
+        Returns
+        -------
+            events: list of EventMatrix, one for each condition
+        '''
+        self.oneEventPerEquity = oneEventPerEquity
+        self.cooldown = cooldown
+        dates = self.calendar.range(self.start_date, self.end_date)
+        index, context = self.context(self.symbols)
+        return [self.thin(EventMatrix.concat([self.evaluate(condition, index, context, self.symbols)],
+                                             self.symbols, dates)) for condition in conditions]
+
+    def search_grid(self, factory, values, oneEventPerEquity=True, cooldown=0):
+        '''
+        Search the events of a condition for many parameters loading the data once
+
+        Parameters
+        ----------
+            factory: function(value) returns a Condition, e.g. SampleConditions.went_below
+            values: list of parameters, e.g. [1, 2, 3]
+            oneEventPerEquity: boolean
+            cooldown: int
+
+        Returns
+        -------
+            events: dict, value -> EventMatrix
+        '''
+        conditions = [factory(value) for value in values]
+        events = self.search_many(conditions, oneEventPerEquity, cooldown)
+        return dict(zip(values, events))
+
+    def cacheable(self):
+        '''
+        True if the events of the condition can be cached by symbol: the condition has a
+        deterministic hash (see Condition.hash) and the events of each symbol depend only
+        on its own data (Condition.cross_sectional is False)
+        '''
+        return not self.condition.cross_sectional and self.condition.hash() is not None
+
+    def picklable(self):
+        '''
+        True if the condition can be sent to other processes
+        '''
+        try:
+            pickle.dumps(self.condition)
+            return True
+        except Exception:
+            return False
+
+def find_shard(path, settings, symbols):
+    '''
+    Worker of EventFinder.find_parallel: searches the events of a shard of symbols
+    on a new EventFinder; the data is only read (not saved)
+    '''
+    DataAccess.path = path
+    finder = EventFinder()
+    for name, value in settings.items():
+        setattr(finder, name, value)
+    return finder.find(symbols, save=False)
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+class EventMatrix(object):
+    '''
+    Sparse matrix of events: only the coordinates (date, symbol) of the
+    events are stored, sorted by date and symbol.
+    The dense matrix (rows: dates, columns: symbols) is created on demand.
+
+    Parameters
+    ----------
+        index: pd.DatetimeIndex, dates of the rows
+        symbols: list of str, symbols of the columns
+        rows: np.array of int, date index of each event
+        cols: np.array of int, symbol index of each event
+        values: np.array of float, value of each event; default 1
+    '''
+    def __init__(self, index, symbols, rows, cols, values=None):
+        self.index = pd.DatetimeIndex(index)
+        self.symbols = list(symbols)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        if values is None:
+            values = np.ones(len(self.rows))
+        self.values = np.asarray(values, dtype=np.float64)
+
+    @classmethod
+    def from_dense(cls, events, index, symbols):
+        '''
+        Creates the matrix from a boolean matrix of shape (dates, symbols)
+        '''
+        rows, cols = np.nonzero(events)
+        return cls(index, symbols, rows, cols)
+
+    @classmethod
+    def from_dates(cls, index, symbols, dates, cols, values):
+        '''
+        Creates the matrix from the date and symbol index of each event
+        The events on dates not in index are dropped
+
+        Parameters
+        ----------
+            index: pd.DatetimeIndex, dates of the rows
+            symbols: list of str
+            dates: np.array of datetime64[ns], date of each event
+            cols: np.array of int, symbol index of each event
+            values: np.array of float, value of each event
+        '''
+        index = pd.DatetimeIndex(index)
+        dates = np.asarray(dates, dtype='datetime64[ns]')
+        rows = np.searchsorted(index.values, dates)
+        found = rows < len(index)
+        found[found] = index.values[rows[found]] == dates[found]
+        rows, cols, values = rows[found], np.asarray(cols)[found], np.asarray(values)[found]
+        order = np.lexsort((cols, rows))
+        return cls(index, symbols, rows[order], cols[order], values[order])
+
+    @classmethod
+    def concat(cls, matrices, symbols, index=None):
+        '''
+        Merges the matrices of different symbols (e.g. shards of a universe)
+        The result is sorted by date and by the order of symbols
+
+        Parameters
+        ----------
+            matrices: list of EventMatrix
+            symbols: list of str, all the symbols of the matrices
+            index: pd.DatetimeIndex, dates of the result; default: all the dates of the matrices
+        '''
+        if index is None:
+            index = pd.DatetimeIndex(np.unique(np.concatenate([m.index.values for m in matrices])),
+                                     name=matrices[0].index.name)
+        position = dict((symbol, i) for i, symbol in enumerate(symbols))
+        dates, cols, values = [], [], []
+        for m in matrices:
+            dates.append(m.index.values[m.rows])
+            cols.append(np.array([position[symbol] for symbol in m.symbols], dtype=np.int64)[m.cols])
+            values.append(m.values)
+        return cls.from_dates(index, symbols, np.concatenate(dates),
+                              np.concatenate(cols), np.concatenate(values))
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def dates(self):
+        '''
+        Date of each event: pd.DatetimeIndex
+        '''
+        return self.index[self.rows]
+
+    @property
+    def equities(self):
+        '''
+        Symbol of each event: np.array of str
+        '''
+        return np.array(self.symbols, dtype=object)[self.cols]
+
+    def select(self, mask):
+        '''
+        Returns a new EventMatrix with the events where mask is True
+        '''
+        return EventMatrix(self.index, self.symbols, self.rows[mask], self.cols[mask], self.values[mask])
+
+    def first(self):
+        '''
+        Returns a new EventMatrix with only the first event of each symbol
+        '''
+        cols, idx = np.unique(self.cols, return_index=True)
+        mask = np.zeros(len(self), dtype=bool)
+        mask[idx] = True
+        return self.select(mask)
+
+    def cooldown(self, periods):
+        '''
+        Returns a new EventMatrix without the clustered events: an event is kept
+        only if the same symbol had no kept event on the previous periods dates,
+        e.g. a condition true on every date gives one event each periods + 1 dates
+
+        Parameters
+        ----------
+            periods: int, number of dates (rows)
+        '''
+        order = np.lexsort((self.rows, self.cols))
+        rows, cols = self.rows[order], self.cols[order]
+        keep = np.zeros(len(order), dtype=bool)
+        if len(order) > 0:
+            # One sorted key for all the symbols: the events of a symbol are
+            # contiguous and never closer than periods + 1 to the next symbol
+            width = np.int64(rows.max()) + periods + 2
+            keys = cols.astype(np.int64) * width + rows
+            starts = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+            ends = np.r_[starts[1:], len(order)]
+            # The first event of each symbol is kept, the next kept event is the first
+            # after periods dates: each step jumps to the next kept event of every symbol
+            current = starts
+            while len(current) > 0:
+                keep[current] = True
+                following = np.searchsorted(keys, keys[current] + periods + 1)
+                inside = following < ends
+                current, ends = following[inside], ends[inside]
+        mask = np.zeros(len(self), dtype=bool)
+        mask[order[keep]] = True
+        return self.select(mask)
+
+    def table(self):
+        '''
+        Returns the events on long format: one row for each event
+            columns: date, symbol, value
+        '''
+        return pd.DataFrame({'date': self.dates, 'symbol': self.equities, 'value': self.values},
+                            columns=['date', 'symbol', 'value'])
+
+    def frame(self, symbol):
+        '''
+        Returns the events of one symbol, used to save them
+            index: dates (timestamp)
+            columns: value
+        '''
+        mask = self.cols == self.symbols.index(symbol)
+        index = pd.DatetimeIndex(self.dates[mask], name='timestamp')
+        return pd.DataFrame({'value': self.values[mask]}, index=index, columns=['value'])
+
+    def dense(self, reduce=True):
+        '''
+        Returns the dense matrix of events: value on the events, NaN otherwise
+
+        Parameters
+        ----------
+            reduce: boolean, True to keep only the dates and symbols with events
+
+        Returns
+        -------
+            matrix: pd.DataFrame, index: dates, columns: symbols
+        '''
+        if reduce:
+            rows, row_idx = np.unique(self.rows, return_inverse=True)
+            cols, col_idx = np.unique(self.cols, return_inverse=True)
+        else:
+            rows, row_idx = np.arange(len(self.index)), self.rows
+            cols, col_idx = np.arange(len(self.symbols)), self.cols
+        values = np.full((len(rows), len(cols)), np.nan)
+        values[row_idx, col_idx] = self.values
+        return pd.DataFrame(values, index=self.index[rows],
+                            columns=[self.symbols[col] for col in cols])
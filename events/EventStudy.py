@@ -4,6 +4,74 @@ from scipy import stats
 from datetime import datetime
 from finance.utils import Calculator
 
+def windows(values, positions, offsets, cols=None):
+    '''
+    Extracts the windows of many events at once using fancy indexing
+
+    Parameters
+    ----------
+        values: np.array of shape (dates, columns)
+        positions: np.array of int, date index of each event
+        offsets: np.array of int, offsets of the window relative to the event, e.g. range(-20, 21)
+        cols: np.array of int, column of each event; default the first column
+
+    Returns
+    -------
+        windows: np.array of shape (len(positions), len(offsets)); NaN outside of values
+    '''
+    values = np.asarray(values, dtype=np.float64).reshape(len(values), -1)
+    positions = np.asarray(positions, dtype=np.int64)
+    if cols is None:
+        cols = np.zeros(len(positions), dtype=np.int64)
+    rows = positions[:, np.newaxis] + np.asarray(offsets, dtype=np.int64)[np.newaxis, :]
+    valid = (rows >= 0) & (rows < len(values))
+    ans = values[np.clip(rows, 0, max(len(values) - 1, 0)), np.asarray(cols)[:, np.newaxis]]
+    ans[~valid] = np.nan
+    return ans
+
+def windows_frame(windows, offsets, names, name=None):
+    '''
+    Returns the windows as a DataFrame: index: offsets, columns: events
+    '''
+    frame = pd.DataFrame(windows.T, index=offsets, columns=names)
+    frame.columns.name = name
+    return frame
+
+def market_model(x, y):
+    '''
+    Ordinary least squares of the market model (y = intercept + slope * x) of
+    many events at once, using the closed-form sums
+
+    Parameters
+    ----------
+        x: np.array of shape (events, days), returns of the market
+        y: np.array of shape (events, days), returns of the equities
+
+    Returns
+    -------
+        slope: np.array of shape (events, )
+        intercept: np.array of shape (events, )
+        residual_var: np.array of shape (events, ), variance of the residuals (days - 2 degrees of freedom)
+        slope_std_error: np.array of shape (events, ), same as the stderr of scipy.stats.linregress
+    '''
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.shape[1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = x.mean(axis=1)
+        mean_y = y.mean(axis=1)
+        dx = x - mean_x[:, np.newaxis]
+        dy = y - mean_y[:, np.newaxis]
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+
+        slope = sxy / sxx
+        intercept = mean_y - slope * mean_x
+        residual_var = np.maximum(syy - slope * sxy, 0) / (n - 2)
+        slope_std_error = np.sqrt(residual_var / sxx)
+    return slope, intercept, residual_var, slope_std_error
+
 class EventStudy(object):
     def __init__(self):
         self.data = None
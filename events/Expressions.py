@@ -0,0 +1,354 @@
+'''
+Expressions to write the conditions of the EventFinder
+
+The expressions are combined with the python operators and evaluated on
+the matrix of all the symbols (rows: dates, columns: symbols) at once.
+
+    from finance.events import Expressions as ex
+    price = ex.price()
+    cond = ex.condition((price.lag(1) >= 3) & (price < 3) &
+                        (ex.field('volume') > ex.field('volume').mean(20) * 2))
+
+Operators
+---------
+    arithmetic: +, -, *, /, unary -
+    comparisons: <, <=, >, >=
+    boolean: & (and), | (or), ~ (not)
+
+The comparisons with a NaN operand (e.g. dates before the listing of a
+symbol or gaps of the data) are unknown, not False: the boolean results
+are computed as 1.0 (True), 0.0 (False) or NaN (unknown) and the logic is
+three-valued, e.g. ~(price > 3) is unknown where the price is NaN and
+False & unknown is False. Expression.evaluate returns True only where the
+result is known to be True.
+    methods: lag(n), change(n), mean(n), std(n), min(n), max(n), sum(n)
+
+Each expression has a canonical key (e.g. 'a > b' and 'b < a' have the same
+key) and the key is used to:
+    1. Compute each subexpression once on each evaluation: the same rolling
+       mean used by two clauses is computed one time
+    2. Generate the id of the condition (md5 of the key) used on the cache
+'''
+import hashlib
+import numpy as np
+import pandas as pd
+from finance.events.Condition import Condition
+
+class Context(object):
+    '''
+    Values and memoized results of one evaluation of the expressions
+
+    Parameters
+    ----------
+        values: np.array of shape (dates, symbols), values of the default field
+        field: str, name of the default field, e.g. 'adjusted_close'
+        loader: function(field, symbol): returns the values of other fields;
+                symbol=None for all the symbols: np.array of shape (dates, symbols)
+                symbol=str (e.g. the market): np.array of shape (dates, 1)
+        market: str, symbol of the market, e.g. 'SPY'
+    '''
+    def __init__(self, values, field=None, loader=None, market=None):
+        self.values = np.asarray(values, dtype=np.float64)
+        self.field = field
+        self.loader = loader
+        self.market = market
+        self.cache = {}
+        self.hits = 0
+
+    def data(self, field, symbol):
+        '''
+        Returns the values of a field of all the symbols (symbol=None) or of one symbol
+        '''
+        if symbol is None and (field is None or field == self.field):
+            return self.values
+        if self.loader is None:
+            raise Exception('No data for the field %s of %s' % (field, symbol or 'the symbols'))
+        if symbol == Field.MARKET:
+            if self.market is None:
+                raise Exception('No market defined')
+            symbol = self.market
+        return np.asarray(self.loader(field or self.field, symbol), dtype=np.float64)
+
+    def evaluate(self, expression):
+        '''
+        Returns the result of an expression, computed once for each key
+        '''
+        key = expression.key
+        if key in self.cache:
+            self.hits = self.hits + 1
+        else:
+            self.cache[key] = expression.compute(self)
+        return self.cache[key]
+
+
+class Expression(object):
+    '''
+    Base class of the expressions: subclasses define key and compute(context)
+    '''
+    key = None
+    boolean = False
+
+    def compute(self, context):
+        raise Exception('Expression.compute needs to be written')
+
+    def evaluate(self, values, context=None):
+        '''
+        Evaluates the expression
+
+        Parameters
+        ----------
+            values: np.array of shape (dates, symbols)
+            context: Context, None to create a new one
+        '''
+        if context is None:
+            context = Context(values)
+        result = context.evaluate(self)
+        if self.boolean:
+            return np.asarray(result) == 1
+        return result
+
+    def hash(self):
+        '''
+        Returns the md5 of the canonical key
+        '''
+        return hashlib.md5(self.key.encode('utf-8')).hexdigest()
+
+    def __repr__(self):
+        return self.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    # Arithmetic
+    def __add__(self, other):
+        return BinaryOp('add', self, other)
+
+    def __radd__(self, other):
+        return BinaryOp('add', other, self)
+
+    def __sub__(self, other):
+        return BinaryOp('sub', self, other)
+
+    def __rsub__(self, other):
+        return BinaryOp('sub', other, self)
+
+    def __mul__(self, other):
+        return BinaryOp('mul', self, other)
+
+    def __rmul__(self, other):
+        return BinaryOp('mul', other, self)
+
+    def __truediv__(self, other):
+        return BinaryOp('div', self, other)
+
+    def __rtruediv__(self, other):
+        return BinaryOp('div', other, self)
+
+    def __neg__(self):
+        return UnaryOp('neg', self)
+
+    # Comparisons: lower than is written as greater than
+    def __gt__(self, other):
+        return BinaryOp('gt', self, other)
+
+    def __ge__(self, other):
+        return BinaryOp('ge', self, other)
+
+    def __lt__(self, other):
+        return BinaryOp('gt', other, self)
+
+    def __le__(self, other):
+        return BinaryOp('ge', other, self)
+
+    # Boolean
+    def __and__(self, other):
+        return BinaryOp('and', self, other)
+
+    def __rand__(self, other):
+        return BinaryOp('and', other, self)
+
+    def __or__(self, other):
+        return BinaryOp('or', self, other)
+
+    def __ror__(self, other):
+        return BinaryOp('or', other, self)
+
+    def __invert__(self):
+        return UnaryOp('not', self)
+
+    # Time series
+    def lag(self, periods=1):
+        '''
+        Values of periods dates before
+        '''
+        return Lag(self, periods)
+
+    def change(self, periods=1):
+        '''
+        Difference with the value of periods dates before
+        '''
+        return self - self.lag(periods)
+
+    def mean(self, window):
+        return Rolling(self, window, 'mean')
+
+    def std(self, window):
+        return Rolling(self, window, 'std')
+
+    def min(self, window):
+        return Rolling(self, window, 'min')
+
+    def max(self, window):
+        return Rolling(self, window, 'max')
+
+    def sum(self, window):
+        return Rolling(self, window, 'sum')
+
+
+class Constant(Expression):
+    def __init__(self, value):
+        self.value = float(value)
+        self.key = repr(self.value)
+
+    def compute(self, context):
+        return self.value
+
+
+class Field(Expression):
+    '''
+    Values of a field (e.g. 'volume') of all the symbols or of one symbol
+
+    Parameters
+    ----------
+        name: str, None for the field of the EventFinder
+        symbol: str, None for all the symbols; Field.MARKET for the market of the EventFinder
+    '''
+    MARKET = '$market'
+
+    def __init__(self, name=None, symbol=None):
+        self.name = name
+        self.symbol = symbol
+        self.key = 'field(%s)' % (name or '') if symbol is None else 'field(%s,%s)' % (name or '', symbol)
+
+    def compute(self, context):
+        return context.data(self.name, self.symbol)
+
+
+class Lag(Expression):
+    def __init__(self, expression, periods):
+        self.expression = expression
+        self.periods = int(periods)
+        self.key = 'lag(%s,%d)' % (expression.key, self.periods)
+
+    def compute(self, context):
+        values = context.evaluate(self.expression)
+        return Condition.previous(values, self.periods)
+
+
+class Rolling(Expression):
+    '''
+    Rolling statistic over a window of dates: NaN until the window is complete
+    '''
+    def __init__(self, expression, window, how):
+        self.expression = expression
+        self.window = int(window)
+        self.how = how
+        self.key = '%s(%s,%d)' % (how, expression.key, self.window)
+
+    def compute(self, context):
+        values = np.asarray(context.evaluate(self.expression), dtype=np.float64)
+        rolling = pd.DataFrame(values.reshape(len(values), -1)).rolling(self.window)
+        return getattr(rolling, self.how)().values.reshape(values.shape)
+
+
+class UnaryOp(Expression):
+    functions = {'neg': np.negative, 'not': lambda values: 1 - truth(values)}
+
+    def __init__(self, op, expression):
+        self.op = op
+        self.expression = expression
+        self.boolean = op == 'not'
+        self.key = '%s(%s)' % (op, expression.key)
+
+    def compute(self, context):
+        return self.functions[self.op](context.evaluate(self.expression))
+
+
+class BinaryOp(Expression):
+    functions = {'add': np.add, 'sub': np.subtract, 'mul': np.multiply, 'div': np.divide,
+                 'gt': np.greater, 'ge': np.greater_equal}
+    commutative = ('add', 'mul', 'and', 'or')
+    booleans = ('gt', 'ge', 'and', 'or')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = wrap(left)
+        self.right = wrap(right)
+        self.boolean = op in self.booleans
+        keys = [self.left.key, self.right.key]
+        if op in self.commutative:
+            keys = sorted(keys)
+        self.key = '%s(%s,%s)' % (op, keys[0], keys[1])
+
+    def compute(self, context):
+        left = np.asarray(context.evaluate(self.left), dtype=np.float64)
+        right = np.asarray(context.evaluate(self.right), dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if self.op == 'and':
+                left, right = truth(left), truth(right)
+                return np.where((left == 0) | (right == 0), 0.0,
+                                np.where((left == 1) & (right == 1), 1.0, np.nan))
+            if self.op == 'or':
+                left, right = truth(left), truth(right)
+                return np.where((left == 1) | (right == 1), 1.0,
+                                np.where((left == 0) & (right == 0), 0.0, np.nan))
+            ans = self.functions[self.op](left, right)
+            if self.op in ('gt', 'ge'):
+                # Unknown where an operand is NaN
+                ans = np.where(np.isnan(left) | np.isnan(right), np.nan, ans.astype(np.float64))
+            return ans
+
+
+def truth(values):
+    '''
+    Returns the values as three-valued booleans: 1.0 (True), 0.0 (False), NaN (unknown)
+    '''
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(values), np.nan, (values != 0).astype(np.float64))
+
+def wrap(value):
+    '''
+    Returns value as an Expression: numbers are Constants
+    '''
+    if isinstance(value, Expression):
+        return value
+    return Constant(value)
+
+def field(name=None, symbol=None):
+    '''
+    Values of a field of all the symbols, e.g. field('volume')
+    None for the field of the EventFinder (default: 'adjusted_close')
+    '''
+    return Field(name, symbol)
+
+def price():
+    '''
+    Values of the field of the EventFinder
+    '''
+    return Field()
+
+def market(name=None, symbol=None):
+    '''
+    Values of the market (EventFinder.market) or of other symbol, the same
+    for all the symbols
+    '''
+    return Field(name, Field.MARKET if symbol is None else symbol)
+
+def condition(expression):
+    '''
+    Returns a Condition of the EventFinder; the id is the hash of the expression
+    '''
+    ans = Condition()
+    ans.expression = wrap(expression)
+    ans.id = ans.expression.hash()
+    return ans
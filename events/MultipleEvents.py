@@ -1,17 +1,21 @@
 import numpy as np
 import pandas as pd
-from scipy import stats
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 from finance.plots.errorfill import *
 
 from finance.utils import DateUtils
 from finance.utils import DataAccess
 from finance.utils import Calculator
+from finance.utils import RunningMoments
+from finance.events.EventStudy import windows, windows_frame, market_model
+from finance.events.Significance import Significance
 
 class MultipleEvents(object):
     def __init__(self):
         self.data_access = DataAccess()
+        self.calendar = self.data_access.calendar
 
         self.list = None
         self.market = 'SPY'
@@ -37,29 +41,21 @@ class MultipleEvents(object):
         self.ar = None
         self.car = None
 
-    def run(self):
+    def load(self):
         '''
-        Assess the events
-
-        |-----100-----|-------20-------|-|--------20--------|
-           estimation      lookback   event   lookforward
+        Downloads/Imports the data of the equities and the market
 
-        Prerequisites
-        -------------
-            self.matrix
-            self.market = 'SPY'
-            self.lookback_days = 20
-            self.lookforward_days = 20
-            self.estimation_period = 200
-            self.field = 'adjusted_close'
+        Returns
+        -------
+            data: pd.DataFrame, columns: symbols of self.list
+            market: pd.DataFrame, column: self.field
         '''
-        # 0. Get the dates and Download/Import the data
         symbols = list(set(self.list))
         start_date = self.list.index[0]
         end_date = self.list.index[-1]
-        nyse_dates = DateUtils.nyse_dates(start=start_date, end=end_date,
-                        lookbackDays=self.lookback_days + self.estimation_period + 1,
-                        lookforwardDays=self.lookforward_days)
+        nyse_dates = self.calendar.range(start_date, end_date,
+                        back=self.lookback_days + self.estimation_period + 1,
+                        forward=self.lookforward_days)
 
         data = self.data_access.get_data(symbols, nyse_dates[0], nyse_dates[-1], self.field)
         market = self.data_access.get_data(self.market, nyse_dates[0], nyse_dates[-1], self.field)
@@ -72,85 +68,88 @@ class MultipleEvents(object):
 
         data = data.fillna(method='ffill').fillna(method='bfill')
         market = market.fillna(method='ffill').fillna(method='bfill')
+        return data, market
+
+    def positions(self, data):
+        '''
+        Returns the positions of the events on the data: date index and column of each event
+        Raises KeyError if there is no data of the symbol of an event
+        '''
+        evt_idxs = DateUtils.search_closer_dates(self.list.index, data.index, exact=True)
+        if (evt_idxs == -1).any():
+            raise ValueError('%s is not in the list' % self.list.index[evt_idxs == -1][0])
+        evt_cols = data.columns.get_indexer(self.list.values)
+        if (evt_cols == -1).any():
+            raise KeyError('No data of %s' % self.list.values[evt_cols == -1][0])
+        return evt_idxs, evt_cols
+
+    def run(self, chunk_size=None, processes=1):
+        '''
+        Assess the events
+
+        |-----100-----|-------20-------|-|--------20--------|
+           estimation      lookback   event   lookforward
+
+        Prerequisites
+        -------------
+            self.list
+            self.market = 'SPY'
+            self.lookback_days = 20
+            self.lookforward_days = 20
+            self.estimation_period = 200
+            self.field = 'adjusted_close'
+
+        Parameters
+        ----------
+            chunk_size: int, None to keep the data of each event (equities_window, er, ar, car, ...);
+                        otherwise the events are assessed on chunks of chunk_size events and
+                        only the mean and std of ER, AR and CAR are calculated (see MultipleEvents.run_streaming)
+            processes: int, number of processes to assess the events; 1 on this process.
+                       With processes > 1 only the mean and std are calculated, as with chunk_size
+        '''
+        # 0. Get the dates and Download/Import the data
+        data, market = self.load()
+        if chunk_size is not None or processes > 1:
+            return self.run_streaming(data, market, chunk_size, processes)
 
-        # 1. Create DataFrames with the data of each event
-        windows_indexes = range(- self.lookback_days, self.lookforward_days + 1)
-        estimation_indexes = range(-self.estimation_period - self.lookback_days, - self.lookback_days)
-        self.equities_window = pd.DataFrame(index=windows_indexes)
-        self.equities_estimation = pd.DataFrame(index=estimation_indexes)
-        self.market_window = pd.DataFrame(index=windows_indexes)
-        self.market_estimation = pd.DataFrame(index=estimation_indexes)
+        # 1. Positions of the events on the data: dates and columns
+        evt_idxs, evt_cols = self.positions(data)
+        col_names = [symbol + ' ' + date.strftime('%Y-%m-%d') for symbol, date in zip(self.list.values, self.list.index)]
 
+        # 2. Extract the windows of all the events at once: arrays of shape (events, days)
+        windows_indexes = np.arange(- self.lookback_days, self.lookforward_days + 1)
+        estimation_indexes = np.arange(-self.estimation_period - self.lookback_days, - self.lookback_days)
         dr_data = Calculator.returns(data)
         dr_market = Calculator.returns(market)
-        self.dr_equities_window = pd.DataFrame(index=windows_indexes)
-        self.dr_equities_estimation = pd.DataFrame(index=estimation_indexes)
-        self.dr_market_window = pd.DataFrame(index=windows_indexes)
-        self.dr_market_estimation = pd.DataFrame(index=estimation_indexes)
-
-        # 2. Iterate over the list of events and fill the DataFrames
-        for i in range(len(self.list)):
-            symbol = self.list[i]
-            evt_date = self.list.index[i].to_pydatetime()
-            col_name = symbol + ' ' + evt_date.strftime('%Y-%m-%d')
-            evt_idx = DateUtils.search_closer_date(evt_date, data[symbol].index, exact=True)
-            
-            # 1.1 Data on the estimation period: self.equities_estimation
-            start_idx = evt_idx - self.lookback_days - self.estimation_period # estimation start idx on self.data
-            end_idx = evt_idx - self.lookback_days # estimation end idx on self.data
-            new_equities_estimation = data[symbol][start_idx:end_idx]
-            new_equities_estimation.index = self.equities_estimation.index
-            self.equities_estimation[col_name] = new_equities_estimation
-            # Daily return of the equities on the estimation period
-            new_dr_equities_estimation = dr_data[symbol][start_idx:end_idx]
-            new_dr_equities_estimation.index = self.dr_equities_estimation.index
-            self.dr_equities_estimation[col_name] = new_dr_equities_estimation
-
-            # 1.4 Market on the estimation period: self.market_estimation
-            new_market_estimation = market[self.field][start_idx:end_idx]
-            new_market_estimation.index = self.market_estimation.index
-            self.market_estimation[col_name] = new_market_estimation
-            # Daily return of the market on the estimation period
-            new_dr_market_estimation = dr_market[start_idx:end_idx]
-            new_dr_market_estimation.index = self.dr_market_estimation.index
-            self.dr_market_estimation[col_name] = new_dr_market_estimation
-
-            # 1.3 Equities on the event window: self.equities_window
-            start_idx = evt_idx - self.lookback_days # window start idx on self.data
-            end_idx = evt_idx + self.lookforward_days + 1 # window end idx on self.data
-            new_equities_window = data[symbol][start_idx:end_idx]
-            new_equities_window.index = self.equities_window.index
-            self.equities_window[col_name] = new_equities_window
-            # Daily return of the equities on the event window
-            new_dr_equities_window = dr_data[symbol][start_idx:end_idx]
-            new_dr_equities_window.index = self.dr_equities_window.index
-            self.dr_equities_window[col_name] = new_dr_equities_window
-
-            # 1.4 Market on the event window: self.market_window
-            new_market_window = market[self.field][start_idx:end_idx]
-            new_market_window.index = self.market_window.index
-            self.market_window[col_name] = new_market_window
-            # Daily return of the market on the event window
-            new_dr_market_window = dr_market[start_idx:end_idx]
-            new_dr_market_window.index = self.dr_market_window.index
-            self.dr_market_window[col_name] = new_dr_market_window
-
-        # 3. Calculate the linear regression -> expected return
-        self.reg_estimation = pd.DataFrame(index=self.dr_market_estimation.columns,
-                                        columns=['Intercept', 'Slope', 'Std Error'])
-        self.er = pd.DataFrame(index=self.dr_market_window.index,
-                                        columns=self.dr_market_window.columns)
-        # For each column (event) on the estimation period
-        for col in self.dr_market_estimation.columns:
-            # 3.1 Calculate the regression
-            x = self.dr_market_estimation[col]
-            y = self.dr_equities_estimation[col]
-            slope, intercept, r_value, p_value, slope_std_error = stats.linregress(x, y)
-            self.reg_estimation['Slope'][col] = slope
-            self.reg_estimation['Intercept'][col] = intercept
-            self.reg_estimation['Std Error'][col] = slope_std_error
-            # 3.2 Calculate the expected return of each date using the regression
-            self.er[col] = intercept + self.dr_market_window[col] * slope
+
+        extract = lambda values, offsets, cols=None: windows(values.values, evt_idxs, offsets, cols)
+        equities_estimation = extract(data, estimation_indexes, evt_cols)
+        dr_equities_estimation = extract(dr_data, estimation_indexes, evt_cols)
+        market_estimation = extract(market, estimation_indexes)
+        dr_market_estimation = extract(dr_market, estimation_indexes)
+        equities_window = extract(data, windows_indexes, evt_cols)
+        dr_equities_window = extract(dr_data, windows_indexes, evt_cols)
+        market_window = extract(market, windows_indexes)
+        dr_market_window = extract(dr_market, windows_indexes)
+
+        self.equities_estimation = windows_frame(equities_estimation, estimation_indexes, col_names)
+        self.dr_equities_estimation = windows_frame(dr_equities_estimation, estimation_indexes, col_names)
+        self.market_estimation = windows_frame(market_estimation, estimation_indexes, col_names)
+        self.dr_market_estimation = windows_frame(dr_market_estimation, estimation_indexes, col_names)
+        self.equities_window = windows_frame(equities_window, windows_indexes, col_names)
+        self.dr_equities_window = windows_frame(dr_equities_window, windows_indexes, col_names)
+        self.market_window = windows_frame(market_window, windows_indexes, col_names)
+        self.dr_market_window = windows_frame(dr_market_window, windows_indexes, col_names)
+
+        # 3. Calculate the linear regression of all the events -> expected return
+        slope, intercept, residual_var, slope_std_error = market_model(dr_market_estimation, dr_equities_estimation)
+        self.reg_estimation = pd.DataFrame({'Intercept': intercept, 'Slope': slope,
+                                            'Std Error': slope_std_error, 'Residual Var': residual_var},
+                                           index=col_names,
+                                           columns=['Intercept', 'Slope', 'Std Error', 'Residual Var'])
+        # Expected return of each date using the regression
+        er = intercept[:, np.newaxis] + dr_market_window * slope[:, np.newaxis]
+        self.er = windows_frame(er, windows_indexes, col_names)
 
         # 4. Final results
         self.er.columns.name = 'Expected return'
@@ -173,6 +172,77 @@ class MultipleEvents(object):
         self.std_car = self.car.std(axis=1)
         self.mean_car.name = 'Mean CAR'
 
+    def run_streaming(self, data, market, chunk_size, processes=1):
+        '''
+        Assess the events on chunks of chunk_size events keeping only the running
+        mean and variance (utils.RunningMoments) of ER, AR and CAR of each day:
+        the windows of all the events are never on memory at the same time.
+
+        With processes > 1 the events are split on shards assessed on a pool of
+        processes (see assess_shard); the moments of the shards are combined exactly.
+
+        Results
+        -------
+            self.moments: dict, 'er', 'ar', 'car' -> RunningMoments
+            self.mean_er, self.std_er, self.mean_ar, self.std_ar, self.mean_car, self.std_car
+            self.reg_estimation
+            The data of each event (self.equities_window, self.er, ...) is None
+        '''
+        evt_idxs, evt_cols = self.positions(data)
+        windows_indexes = np.arange(- self.lookback_days, self.lookforward_days + 1)
+        estimation_indexes = np.arange(-self.estimation_period - self.lookback_days, - self.lookback_days)
+        dr_data = Calculator.returns(data).values
+        dr_market = Calculator.returns(market).values
+
+        if processes > 1 and len(evt_idxs) > 1:
+            # Few shards per process to balance the load; each worker gets only the columns of its events
+            num_shards = min(len(evt_idxs), processes * 4)
+            shards = np.array_split(np.arange(len(evt_idxs)), num_shards)
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = []
+                for shard in shards:
+                    cols, shard_cols = np.unique(evt_cols[shard], return_inverse=True)
+                    futures.append(executor.submit(assess_shard, dr_data[:, cols], dr_market, evt_idxs[shard],
+                                                   shard_cols, windows_indexes, estimation_indexes, chunk_size))
+                results = [future.result() for future in futures]
+        else:
+            results = [assess_shard(dr_data, dr_market, evt_idxs, evt_cols,
+                                    windows_indexes, estimation_indexes, chunk_size)]
+
+        # Combine the shards on the order of the events
+        self.moments = dict((name, RunningMoments(len(windows_indexes))) for name in ['er', 'ar', 'car'])
+        for moments, regression in results:
+            for name in self.moments:
+                self.moments[name].combine(moments[name])
+
+        # Final results
+        self.equities_window = self.equities_estimation = None
+        self.market_window = self.market_estimation = None
+        self.dr_equities_window = self.dr_equities_estimation = None
+        self.dr_market_window = self.dr_market_estimation = None
+        self.er = self.ar = self.car = None
+
+        col_names = [symbol + ' ' + date.strftime('%Y-%m-%d') for symbol, date in zip(self.list.values, self.list.index)]
+        self.reg_estimation = pd.DataFrame(np.concatenate([regression for moments, regression in results]),
+                                           index=col_names,
+                                           columns=['Intercept', 'Slope', 'Std Error', 'Residual Var'])
+        for name in ['er', 'ar', 'car']:
+            label = name.upper()
+            mean = pd.Series(self.moments[name].means(), index=windows_indexes, name='Mean ' + label)
+            std = pd.Series(self.moments[name].stds(), index=windows_indexes, name='Std ' + label)
+            setattr(self, 'mean_' + name, mean)
+            setattr(self, 'std_' + name, std)
+
+    def significance(self):
+        '''
+        Returns the significance tests of the abnormal returns of the events
+        (t-test, Patell, BMP, bootstrap and permutation): see events.Significance
+        Needs the abnormal returns of each event: run() without chunk_size
+        '''
+        if self.ar is None:
+            raise Exception('The abnormal returns of each event are needed: run() without chunk_size')
+        return Significance(self.ar, self.reg_estimation['Residual Var'].values, self.estimation_period)
+
     def plot(self, which):
         x = self.mean_car.index.values
         if which == 'car':
@@ -189,6 +259,47 @@ class MultipleEvents(object):
             label = self.mean_er.name
         errorfill(x, y, yerr, label=label)
 
+def assess_shard(dr_data, dr_market, evt_idxs, evt_cols, windows_indexes, estimation_indexes, chunk_size=None):
+    '''
+    Assess a shard of events on chunks of chunk_size events (all the shard if None),
+    used by MultipleEvents.run_streaming on this process or on the workers
+
+    Parameters
+    ----------
+        dr_data: np.array of shape (dates, symbols), returns of the equities
+        dr_market: np.array of shape (dates, 1), returns of the market
+        evt_idxs: np.array of int, date index of each event
+        evt_cols: np.array of int, column of each event on dr_data
+        windows_indexes: np.array of int, days of the event window
+        estimation_indexes: np.array of int, days of the estimation period
+
+    Returns
+    -------
+        moments: dict, 'er', 'ar', 'car' -> RunningMoments
+        regression: np.array of shape (events, 4), columns: Intercept, Slope, Std Error, Residual Var
+    '''
+    if chunk_size is None:
+        chunk_size = max(len(evt_idxs), 1)
+    moments = dict((name, RunningMoments(len(windows_indexes))) for name in ['er', 'ar', 'car'])
+    regressions = [np.empty((0, 4))]
+    for first in range(0, len(evt_idxs), chunk_size):
+        idxs = evt_idxs[first:first + chunk_size]
+        cols = evt_cols[first:first + chunk_size]
+        # Regression on the estimation period
+        slope, intercept, residual_var, slope_std_error = market_model(
+                windows(dr_market, idxs, estimation_indexes),
+                windows(dr_data, idxs, estimation_indexes, cols))
+        regressions.append(np.column_stack((intercept, slope, slope_std_error, residual_var)))
+        # Expected, abnormal and cumulative abnormal return on the event window
+        er = intercept[:, np.newaxis] + windows(dr_market, idxs, windows_indexes) * slope[:, np.newaxis]
+        ar = windows(dr_data, idxs, windows_indexes, cols) - er
+        car = np.nancumsum(ar, axis=1)
+        car[np.isnan(ar)] = np.nan
+        moments['er'].update(er)
+        moments['ar'].update(ar)
+        moments['car'].update(car)
+    return moments, np.concatenate(regressions)
+
 if __name__ == '__main__':
     from datetime import datetime
     import matplotlib.pyplot as plt
@@ -28,6 +28,7 @@ class PastEvent(EventStudy):
     def __init__(self):
         # Utils
         self.data_access = DataAccess()
+        self.calendar = self.data_access.calendar
 
         # Variables
         self.date = None # Date of the event
@@ -48,8 +49,8 @@ class PastEvent(EventStudy):
 
 
     def run(self):
-        dates = DateUtils.nyse_dates_event(self.date,
-                            self.lookback_days, self.lookforward_days, self.estimation_period)
+        dates = self.calendar.window(self.date,
+                            self.estimation_period + self.lookback_days, self.lookforward_days)
         start_date = dates[0]
         end_date = dates[-1]
 
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from finance.utils import DateUtils
+from finance.utils import DataAccess
+from finance.utils import Calculator
+from finance.events.EventStudy import windows, windows_frame, market_model
+
+class PastEvents(object):
+    '''
+    Analyse many equities on many dates at once: the same results of PastEvent
+    for each (symbol, date) pair, loading the data of all the pairs once and
+    using one regression for all the events (see EventStudy.market_model)
+
+    Necesary Parameters
+    -------------------
+        events: pd.DataFrame with columns date and symbol (as EventFinder.table) or
+                pd.Series, index: dates, values: symbols (as EventFinder.list)
+
+    Optional Parameters
+    -------------------
+        market: str, default='SPY' - used to asses the events
+        lookback_days: int, default=20 - past event window size
+        lookforward_days: int, default=20 - future event window size
+        estimation_period: int, default=255
+
+    |-----255-----|-------20-------|-|--------20--------|
+       estimation      lookback   event   lookforward
+
+    Results
+    -------
+        t_test: abnormal returns over the standard deviation of the residuals of the
+                regression on the estimation period (the square root of 'Residual Var')
+        legacy_t_test: abnormal returns over the standard error of the slope, the
+                       t-test of PastEvent; kept to compare with old results
+    '''
+
+    def __init__(self):
+        # Utils
+        self.data_access = DataAccess()
+        self.calendar = self.data_access.calendar
+
+        # Variables
+        self.events = None
+        self.field = 'adjusted_close'
+        self.lookback_days = 20
+        self.lookforward_days = 20
+        self.estimation_period = 255
+        self.market = 'SPY'
+
+        # Results: index: days relative to the event, columns: one for each event
+        self.reg_estimation = None
+        self.er = None
+        self.ar = None
+        self.car = None
+        self.t_test = None
+        self.legacy_t_test = None
+        self.prob = None
+
+    def pairs(self):
+        '''
+        Returns the symbol and date of each event
+
+        Returns
+        -------
+            symbols: np.array of str
+            dates: pd.DatetimeIndex
+        '''
+        if isinstance(self.events, pd.Series):
+            return np.asarray(self.events.values, dtype=object), pd.DatetimeIndex(self.events.index)
+        return np.asarray(self.events['symbol'].values, dtype=object), pd.DatetimeIndex(self.events['date'])
+
+    def run(self):
+        symbols, dates = self.pairs()
+        names = [symbol + ' ' + date.strftime('%Y-%m-%d') for symbol, date in zip(symbols, dates)]
+
+        # 1. Download/Import the data of all the events once
+        unique = list(pd.unique(symbols))
+        nyse_dates = self.calendar.range(dates.min(), dates.max(),
+                        back=self.estimation_period + self.lookback_days, forward=self.lookforward_days)
+        data = self.data_access.get_data(unique, nyse_dates[0], nyse_dates[-1], self.field)
+        market = self.data_access.get_data(self.market, nyse_dates[0], nyse_dates[-1], self.field)
+        if len(data.columns) == 1:
+            data.columns = unique
+        data = data.reindex(nyse_dates)
+        market = market.reindex(nyse_dates)
+
+        # 2. Positions of the events on the data
+        evt_idxs = DateUtils.search_closer_dates(dates, data.index, exact=True)
+        if (evt_idxs == -1).any():
+            raise ValueError('%s is not an open date' % dates[evt_idxs == -1][0])
+        evt_cols = data.columns.get_indexer(symbols)
+        if (evt_cols == -1).any():
+            raise KeyError('No data of %s' % symbols[evt_cols == -1][0])
+
+        # 3. Linear Regression of all the events on the estimation period
+        # The estimation period ends on the first date of the event window, as PastEvent
+        estimation_indexes = np.arange(- self.estimation_period - self.lookback_days, - self.lookback_days + 1)
+        windows_indexes = np.arange(- self.lookback_days, self.lookforward_days + 1)
+        dr_data = Calculator.returns(data).values
+        dr_market = Calculator.returns(market).values
+        x = windows(dr_market, evt_idxs, estimation_indexes)
+        y = windows(dr_data, evt_idxs, estimation_indexes, evt_cols)
+        # PastEvent loads the data from the first date of the estimation period: its return is 0
+        x[:, 0] = 0
+        y[:, 0] = 0
+        slope, intercept, residual_var, slope_std_error = market_model(x, y)
+        self.reg_estimation = pd.DataFrame({'Intercept': intercept, 'Slope': slope,
+                                            'Std Error': slope_std_error, 'Residual Var': residual_var},
+                                           index=names,
+                                           columns=['Intercept', 'Slope', 'Std Error', 'Residual Var'])
+
+        # 4. Analysis on the event window
+        er = intercept[:, np.newaxis] + windows(dr_market, evt_idxs, windows_indexes) * slope[:, np.newaxis]
+        ar = windows(dr_data, evt_idxs, windows_indexes, evt_cols) - er
+        car = np.nancumsum(ar, axis=1)
+        car[np.isnan(ar)] = np.nan
+        t_test = ar / np.sqrt(residual_var)[:, np.newaxis]
+        legacy_t_test = ar / slope_std_error[:, np.newaxis]
+
+        self.er = windows_frame(er, windows_indexes, names, 'Expected return')
+        self.ar = windows_frame(ar, windows_indexes, names, 'Abnormal return')
+        self.car = windows_frame(car, windows_indexes, names, 'Cum abnormal return')
+        self.t_test = windows_frame(t_test, windows_indexes, names, 't-test')
+        self.legacy_t_test = windows_frame(legacy_t_test, windows_indexes, names, 'Legacy t-test')
+        self.prob = windows_frame(stats.norm.cdf(t_test), windows_indexes, names, 'Probability')
@@ -1,25 +1,17 @@
-from finance.events import Condition
+from finance.events import Expressions
 
 def decrease(decrease):
-    condition = Condition()
-    condition.id = 'decrease' + str(decrease)
-    condition.function = lambda i, item, data: (data[i-1] - item > decrease)
-    return condition
+    price = Expressions.price()
+    return Expressions.condition(price.lag(1) - price > decrease)
 
 def increase(increase):
-    condition = Condition()
-    condition.id = 'increase' + str(increase)
-    condition.function =  lambda i, item, data: (item - data[i-1] > increase)
-    return condition
+    price = Expressions.price()
+    return Expressions.condition(price - price.lag(1) > increase)
 
 def went_below(below):
-    condition = Condition()
-    condition.id = 'went_below' + str(below)
-    condition.function = lambda i, item, data: (data[i-1] >= below and item < below)
-    return condition
+    price = Expressions.price()
+    return Expressions.condition((price.lag(1) >= below) & (price < below))
 
 def went_above(above):
-    condition = Condition()
-    condition.id = 'went_above' + str(above)
-    condition.function = lambda i, item, data: (data[i-1] <= above and item > above)
-    return condition
\ No newline at end of file
+    price = Expressions.price()
+    return Expressions.condition((price.lag(1) <= above) & (price > above))
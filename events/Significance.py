@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from concurrent.futures import ProcessPoolExecutor
+
+class Significance(object):
+    '''
+    Significance tests of the abnormal returns of many events
+
+    All the tests are vectorized over the events and the days of the window.
+    The resamples (bootstrap and permutation) are drawn on large batches and
+    reduced with matrix products, one batch of resamples at a time.
+
+        sig = Significance(mevt.ar, mevt.reg_estimation['Residual Var'], mevt.estimation_period)
+        sig.t_test()
+        sig.bootstrap(resamples=5000, seed=0)
+
+    Parameters
+    ----------
+        ar: np.array of shape (events, days) or pd.DataFrame (index: days, columns: events)
+            as MultipleEvents.ar; NaN values are ignored
+        residual_var: np.array of shape (events, ), variance of the residuals of the
+                      market model (see EventStudy.market_model); needed by patell and bmp
+        estimation_period: int, number of days of the estimation period; needed by patell
+        days: index of the days of the window; default the index of ar or range(days)
+    '''
+    def __init__(self, ar, residual_var=None, estimation_period=None, days=None):
+        if isinstance(ar, pd.DataFrame):
+            days = ar.index if days is None else days
+            ar = ar.values.T
+        self.ar = np.asarray(ar, dtype=np.float64)
+        self.valid = ~np.isnan(self.ar)
+        self.car = np.nancumsum(self.ar, axis=1)
+        self.car[~self.valid] = np.nan
+        self.days = pd.Index(np.arange(self.ar.shape[1]) if days is None else days)
+        self.residual_var = None if residual_var is None else np.asarray(residual_var, dtype=np.float64)
+        self.estimation_period = estimation_period
+
+    def returns(self, cumulative):
+        return self.car if cumulative else self.ar
+
+    def result(self, stat, name, dist, df=None):
+        '''
+        Returns the statistic of each day with the two sided p-value
+        '''
+        if dist == 't':
+            p_value = 2 * stats.t.sf(np.abs(stat), df)
+        else:
+            p_value = 2 * stats.norm.sf(np.abs(stat))
+        return pd.DataFrame({name: stat, 'p-value': p_value}, index=self.days, columns=[name, 'p-value'])
+
+    def t_test(self, cumulative=True):
+        '''
+        Cross-sectional t-test of the mean (C)AR of each day: mean / (std / sqrt(N))
+
+        Parameters
+        ----------
+            cumulative: boolean, True to test the CAR, False the AR
+
+        Returns
+        -------
+            pd.DataFrame, index: days, columns: t-test, p-value
+        '''
+        stat, count = cross_sectional_t(self.returns(cumulative))
+        return self.result(stat, 't-test', 't', count - 1)
+
+    def standardized(self, cumulative=True):
+        '''
+        Returns the standardized (C)AR: divided by the standard deviation of the
+        residuals and, for the CAR, by the square root of the number of days cumulated
+        '''
+        if self.residual_var is None:
+            raise Exception('The residual variance of the events is needed')
+        values = self.returns(cumulative) / np.sqrt(self.residual_var)[:, np.newaxis]
+        if cumulative:
+            values = values / np.sqrt(np.cumsum(self.valid, axis=1))
+        return values
+
+    def patell(self, cumulative=True):
+        '''
+        Patell (1976) test: sum of the standardized (C)AR over its variance under the null,
+        N (T - 2) / (T - 4) with T the days of the estimation period
+
+        Returns
+        -------
+            pd.DataFrame, index: days, columns: Patell Z, p-value
+        '''
+        if self.estimation_period is None:
+            raise Exception('The estimation period is needed')
+        T = self.estimation_period
+        values = self.standardized(cumulative)
+        count = (~np.isnan(values)).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stat = np.nansum(values, axis=0) / np.sqrt(count * (T - 2.0) / (T - 4.0))
+        return self.result(stat, 'Patell Z', 'norm')
+
+    def bmp(self, cumulative=True):
+        '''
+        Boehmer, Musumeci and Poulsen (1991) test: cross-sectional t-test of the
+        standardized (C)AR, robust to the event-induced variance
+
+        Returns
+        -------
+            pd.DataFrame, index: days, columns: BMP t, p-value
+        '''
+        stat, count = cross_sectional_t(self.standardized(cumulative))
+        return self.result(stat, 'BMP t', 't', count - 1)
+
+    def bootstrap(self, resamples=1000, alpha=0.05, cumulative=True, seed=None, batch_size=None, processes=1):
+        '''
+        Bootstrap confidence band of the mean (C)AR: the events are resampled with
+        replacement and the percentiles of the resampled means are the band
+
+        Parameters
+        ----------
+            resamples: int
+            alpha: float, the band has 1 - alpha confidence
+            cumulative: boolean, True for the CAR, False for the AR
+            seed: int, the same seed and batch_size give the same band on any number of processes
+            batch_size: int, resamples drawn at once; default uses ~1e6 random numbers per batch
+            processes: int, number of processes to draw the batches
+
+        Returns
+        -------
+            pd.DataFrame, index: days, columns: Mean, Lower, Upper
+        '''
+        values = self.returns(cumulative)
+        means = self.resample('bootstrap', values, resamples, seed, batch_size, processes)
+        lower, upper = np.nanpercentile(means, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+        with np.errstate(invalid='ignore'):
+            mean = np.nanmean(values, axis=0)
+        return pd.DataFrame({'Mean': mean, 'Lower': lower, 'Upper': upper},
+                            index=self.days, columns=['Mean', 'Lower', 'Upper'])
+
+    def permutation(self, resamples=1000, cumulative=True, seed=None, batch_size=None, processes=1):
+        '''
+        Sign-flip permutation test of the mean (C)AR: under the null the (C)AR of each
+        event is symmetric around 0, the signs are flipped at random and the p-value is
+        the fraction of resampled means as extreme as the observed one
+
+        Returns
+        -------
+            pd.DataFrame, index: days, columns: Mean, p-value
+        '''
+        values = self.returns(cumulative)
+        means = self.resample('permutation', values, resamples, seed, batch_size, processes)
+        with np.errstate(invalid='ignore'):
+            mean = np.nanmean(values, axis=0)
+        extreme = (np.abs(means) >= np.abs(mean) - 1e-12).sum(axis=0)
+        p_value = (1.0 + extreme) / (1.0 + resamples)
+        return pd.DataFrame({'Mean': mean, 'p-value': p_value}, index=self.days, columns=['Mean', 'p-value'])
+
+    def resample(self, kind, values, resamples, seed, batch_size, processes):
+        '''
+        Returns the resampled means: np.array of shape (resamples, days)
+        Each batch has its own seed so the result does not depend on processes
+        '''
+        if batch_size is None:
+            batch_size = max(1, min(resamples, 1000000 // max(len(values), 1)))
+        sizes = [batch_size] * (resamples // batch_size)
+        if resamples % batch_size > 0:
+            sizes.append(resamples % batch_size)
+        seeds = np.random.RandomState(seed).randint(0, 2 ** 31 - 1, size=len(sizes))
+        batches = list(zip(sizes, seeds))
+
+        if processes > 1 and len(batches) > 1:
+            shards = [list(shard) for shard in np.array_split(np.arange(len(batches)), min(len(batches), processes))]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(resample_batches, kind, values, [batches[i] for i in shard])
+                           for shard in shards]
+                return np.concatenate([future.result() for future in futures])
+        return resample_batches(kind, values, batches)
+
+def cross_sectional_t(values):
+    '''
+    Cross-sectional t-test of each column: mean / (std / sqrt(N)), NaN values are ignored
+
+    Parameters
+    ----------
+        values: np.array of shape (events, days)
+
+    Returns
+    -------
+        t: np.array of shape (days, )
+        count: np.array of shape (days, ), number of events of each day
+    '''
+    count = (~np.isnan(values)).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+        return mean / (std / np.sqrt(count)), count
+
+def resample_batches(kind, values, batches):
+    '''
+    Resampled means of the columns of values, used by Significance.resample on
+    this process or on the workers
+
+    Parameters
+    ----------
+        kind: str, 'bootstrap': events drawn with replacement;
+                   'permutation': signs of the events flipped at random
+        values: np.array of shape (events, days)
+        batches: list of (size, seed)
+
+    Returns
+    -------
+        means: np.array of shape (sum of sizes, days)
+    '''
+    valid = (~np.isnan(values)).astype(np.float64)
+    filled = np.where(np.isnan(values), 0, values)
+    events = len(values)
+    ans = []
+    for size, seed in batches:
+        rng = np.random.RandomState(seed)
+        if kind == 'bootstrap':
+            # Number of times each event is drawn on each resample
+            draws = rng.randint(0, events, size=(size, events)) + events * np.arange(size)[:, np.newaxis]
+            weights = np.bincount(draws.ravel(), minlength=size * events).reshape(size, events).astype(np.float64)
+            count = weights.dot(valid)
+        elif kind == 'permutation':
+            weights = rng.randint(0, 2, size=(size, events)) * 2.0 - 1
+            count = np.repeat(valid.sum(axis=0)[np.newaxis, :], size, axis=0)
+        else:
+            raise Exception('Unknown resampling: %s' % kind)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ans.append(weights.dot(filled) / count)
+    return np.concatenate(ans)
@@ -1,4 +1,7 @@
 from finance.events.Condition import Condition
+from finance.events.EventMatrix import EventMatrix
+from finance.events.Significance import Significance
 from finance.events.PastEvent import PastEvent
+from finance.events.PastEvents import PastEvents
 from finance.events.EventFinder import EventFinder
 from finance.events.MultipleEvents import MultipleEvents
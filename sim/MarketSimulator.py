@@ -90,16 +90,18 @@ class MarketSimulator(object):
         # TODO: Actions BEFORE
 
         if actionAfter is not None:
-            dicts = []
-            for idx, row in self.trades.iterrows():
-                after_date = DateUtils.nyse_add(idx.to_pydatetime(), daysAfter)
-                after = pd.DataFrame([  {'symbol': row['symbol'], 
-                                        'action': actionAfter, 
-                                        'num_of_shares': sharesAfter}],
-                                    index=[after_date], columns=self.trades.columns)
-                self.trades = self.trades.append(after)
-
-        self.trades = self.trades.sort()
+            # All the dates after the events in one call
+            after_dates = DateUtils.nyse_add(self.trades.index, daysAfter)
+            if after_dates.isna().any():
+                raise IndexError('%s plus %s days is outside of the NYSE dates'
+                                 % (self.trades.index[after_dates.isna()][0], daysAfter))
+            after = pd.DataFrame({'symbol': self.trades['symbol'].values,
+                                  'action': actionAfter,
+                                  'num_of_shares': sharesAfter},
+                                index=after_dates, columns=self.trades.columns)
+            self.trades = pd.concat([self.trades, after])
+
+        self.trades = self.trades.sort_index(kind='mergesort')
     
 
     def simulate(self):
@@ -5,12 +5,19 @@ from finance.test.utils.CalculatorTypes import CalculatorTypesTest
 from finance.test.utils.CalculatorValues import CalculatorValuesTest
 from finance.test.utils.FileManager import FileManagerTest
 from finance.test.utils.DataAccess import DataAccessTest
+from finance.test.utils.PriceStore import PriceStoreTest
+from finance.test.utils.LRUCache import LRUCacheTest
+from finance.test.utils.TradingCalendar import TradingCalendarTest
+from finance.test.utils.RunningMoments import RunningMomentsTest
 
 from finance.test.sim.MarketSimulator import MarketSimulatorTest
 
 from finance.test.events.PastEvent import PastEventTest
+from finance.test.events.PastEvents import PastEventsTest
 from finance.test.events.EventFinder import EventFinderTest
+from finance.test.events.Expressions import ExpressionsTest
 from finance.test.events.MultipleEvents import MultipleEventsTest
+from finance.test.events.Significance import SignificanceTest
 
 suite = unittest.TestSuite()
 
@@ -19,6 +26,10 @@ suite.addTest(CalculatorTypesTest().suite())
 suite.addTest(CalculatorValuesTest().suite())
 suite.addTest(FileManagerTest().suite())
 suite.addTest(DataAccessTest().suite())
+suite.addTest(PriceStoreTest().suite())
+suite.addTest(LRUCacheTest().suite())
+suite.addTest(TradingCalendarTest().suite())
+suite.addTest(RunningMomentsTest().suite())
 
 # This tests won't run because alpha vantange doesn't have data for google before 2014
 # and the test data is all precalculated.
@@ -26,8 +37,11 @@ suite.addTest(DataAccessTest().suite())
 
 
 #suite.addTest(PastEventTest().suite())
+suite.addTest(PastEventsTest().suite())
 
 suite.addTest(EventFinderTest().suite())
+suite.addTest(ExpressionsTest().suite())
+suite.addTest(SignificanceTest().suite())
 
 #suite.addTest(MultipleEventsTest().suite())
 
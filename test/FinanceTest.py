@@ -5,17 +5,40 @@ import numpy.testing as np_test
 import pandas.util.testing as pd_test
 
 import os, inspect
+import shutil
+import tempfile
 from finance.utils import DataAccess
+from finance.utils import DateUtils
 
 class FinanceTest(unittest.TestCase):
 
-    def setUpDataAccess(self, delete=False):
-        self_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
-        DataAccess.path = os.path.join(self_dir, 'data')
+    def setUpDataAccess(self):
+        '''
+        Sets DataAccess on a new temporary data directory, deleted after the test
+        '''
+        DataAccess.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, DataAccess.path, True)
         self.data_access = DataAccess()
 
-        self.data_access.empty_cache(delete=delete)
-        self.data_access.empty_dir(delete=delete)
+    def setUpFixtures(self, symbols, start, end, seed=0):
+        '''
+        Writes random walk prices of the symbols on the data directory, used to
+        test without downloading the data. Call after setUpDataAccess
+        '''
+        rng = np.random.RandomState(seed)
+        index = pd.DatetimeIndex(DateUtils.nyse_dates(start=start, end=end), name='timestamp')
+        for symbol in symbols:
+            prices = 10 * np.exp(np.cumsum(rng.normal(0, 0.03, len(index))))
+            data = pd.DataFrame({'open': prices, 'high': prices * 1.01, 'low': prices * 0.99,
+                                 'close': prices, 'adjusted_close': prices,
+                                 'volume': rng.randint(1000, 5000, len(index)),
+                                 'dividend_amount': 0.0, 'split_coefficient': 1.0}, index=index,
+                                columns=['open', 'high', 'low', 'close', 'adjusted_close',
+                                         'volume', 'dividend_amount', 'split_coefficient'])
+            name = '%s_%d-%d-%d_%d-%d-%d.csv' % (symbol, start.year, start.month, start.day,
+                                                 end.year, end.month, end.day)
+            data.to_csv(os.path.join(self.data_access.dir, name))
+        self.data_access.file_manager.build_catalog()
 
     @staticmethod
     def delete_data():
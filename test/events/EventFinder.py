@@ -6,14 +6,25 @@ import pandas.util.testing as pd_test
 from datetime import datetime
 
 from finance.test import FinanceTest
+from finance.utils import DateUtils
 from finance.events import EventFinder
+from finance.events import Condition
+from finance.events import EventMatrix
 from finance.events import SampleConditions
 
+THRESHOLD = 3
+
 class EventFinderTest(FinanceTest):
 
     def suite(self):
         suite = unittest.TestSuite()
         suite.addTest(EventFinderTest('test_oneEventPerEquity'))
+        suite.addTest(EventFinderTest('test_parallel'))
+        suite.addTest(EventFinderTest('test_search_many'))
+        suite.addTest(EventFinderTest('test_conditions'))
+        suite.addTest(EventFinderTest('test_event_matrix'))
+        suite.addTest(EventFinderTest('test_cooldown'))
+        suite.addTest(EventFinderTest('test_condition_hash'))
         return suite
 
     def test_oneEventPerEquity(self):
@@ -48,6 +59,234 @@ class EventFinderTest(FinanceTest):
         self.assertEqual(date1, datetime(2008,10,27))
         self.assertEqual(date2, datetime(2008,11,11))
 
+        # Test: the events of each symbol are cached: only the new symbols are searched
+        evtf.symbols = ['AMD', 'SPY']
+        evtf.search(oneEventPerEquity=False)
+        self.assertEqual(list(evtf.table['symbol']).count('AMD'), 2)
+        cached, missing = evtf.load_events(evtf.symbols, evtf.events.index)
+        self.assertEqual(missing, [])
+        self.assertEqual(len(cached), evtf.num_events)
+
+        # Test: many conditions with one load of the data
+        events = evtf.search_grid(SampleConditions.went_below, [3, 2], oneEventPerEquity=False)
+        self.assertEqual(list(events[3].dates), list(evtf.list.index))
+        self.assertEqual(len(events[2]), 0)
+
+    def test_parallel(self):
+        '''
+        Equities: AAA, BBB, CCC, DDD (random walks from FinanceTest.setUpFixtures)
+        Function: went_below(9)
+        Period: 2008-1-1 -> 2009-12-31
+
+        Tests: the events found on many processes are the events found on one process
+        '''
+        self.setUpDataAccess()
+        symbols = ['AAA', 'BBB', 'CCC', 'DDD']
+        self.setUpFixtures(symbols, datetime(2008, 1, 1), datetime(2009, 12, 31))
+
+        evtf = EventFinder()
+        evtf.symbols = symbols
+        evtf.start_date = datetime(2008, 1, 1)
+        evtf.end_date = datetime(2009, 12, 31)
+        evtf.condition = SampleConditions.went_below(9)
+        evtf.search(oneEventPerEquity=False, useCache=False, save=False)
+        serial = evtf.table
+        self.assertTrue(evtf.num_events > 0)
+        self.assertTrue(evtf.picklable())
+        evtf.search(oneEventPerEquity=False, useCache=False, save=False, processes=2)
+        self.assertEqual(evtf.table, serial)
+        evtf.search(oneEventPerEquity=True, useCache=False, save=False, cooldown=5, processes=2)
+        parallel = evtf.table
+        evtf.search(oneEventPerEquity=True, useCache=False, save=False, cooldown=5)
+        self.assertEqual(parallel, evtf.table)
+
+        # Test: conditions that can not be pickled are searched on this process
+        condition = Condition()
+        condition.array_function = lambda values: values < 9
+        evtf.condition = condition
+        self.assertFalse(evtf.picklable())
+        evtf.search(oneEventPerEquity=False, useCache=False, save=False)
+        serial = evtf.table
+        evtf.find_parallel = lambda symbols, processes: self.fail('Searched on many processes')
+        evtf.search(oneEventPerEquity=False, useCache=False, save=False, processes=2)
+        self.assertEqual(evtf.table, serial)
+
+    def test_search_many(self):
+        '''
+        Equities: AAA, BBB, CCC (random walks from FinanceTest.setUpFixtures)
+        Function: went_below(8, 9, 10), went_above(11)
+        Period: 2008-1-1 -> 2009-12-31
+
+        Tests: the events of many conditions are the events of one search for each condition
+        '''
+        self.setUpDataAccess()
+        symbols = ['AAA', 'BBB', 'CCC']
+        self.setUpFixtures(symbols, datetime(2008, 1, 1), datetime(2009, 12, 31), seed=1)
+
+        evtf = EventFinder()
+        evtf.symbols = symbols
+        evtf.start_date = datetime(2008, 1, 1)
+        evtf.end_date = datetime(2009, 12, 31)
+        conditions = [SampleConditions.went_below(9), SampleConditions.went_above(11)]
+        for oneEventPerEquity, cooldown in [(False, 0), (True, 0), (False, 10)]:
+            events = evtf.search_many(conditions, oneEventPerEquity=oneEventPerEquity, cooldown=cooldown)
+            self.assertEqual(len(events), 2)
+            for condition, matrix in zip(conditions, events):
+                evtf.condition = condition
+                evtf.search(oneEventPerEquity=oneEventPerEquity, useCache=False, save=False, cooldown=cooldown)
+                self.assertTrue(evtf.num_events > 0)
+                self.assertEqual(matrix.table(), evtf.table)
+
+        grid = evtf.search_grid(SampleConditions.went_below, [8, 9, 10], oneEventPerEquity=False)
+        self.assertEqual(sorted(grid.keys()), [8, 9, 10])
+        for value, matrix in grid.items():
+            evtf.condition = SampleConditions.went_below(value)
+            evtf.search(oneEventPerEquity=False, useCache=False, save=False)
+            self.assertEqual(matrix.table(), evtf.table)
+
+    def test_conditions(self):
+        '''
+        Tests the vectorized conditions against the same conditions evaluated
+        on each date
+        '''
+        values = np.array([[4, 10], [2.5, 11], [3.5, 9], [2, np.nan], [1, 8]])
+        events = SampleConditions.went_below(3).evaluate(values)
+        sol = np.array([[False, False], [True, False], [False, False], [True, False], [False, False]])
+        self.assertEqual(events, sol)
+        events = SampleConditions.went_above(3).evaluate(values)
+        self.assertEqual(events[:, 0], np.array([False, False, True, False, False]))
+        events = SampleConditions.decrease(1).evaluate(values)
+        self.assertEqual(events[:, 1], np.array([False, False, True, False, False]))
+        events = SampleConditions.increase(0.5).evaluate(values)
+        self.assertEqual(events[:, 1], np.array([False, True, False, False, False]))
+
+        condition = Condition()
+        condition.function = lambda i, item, data: (i > 0 and data[i-1] >= 3 and item < 3)
+        # Test: function receives the data from the second date
+        self.assertEqual(condition.evaluate(values)[2:], sol[2:])
+
+    def test_event_matrix(self):
+        '''
+        Tests the sparse matrix of events and the dense matrix created from it
+        '''
+        index = pd.DatetimeIndex([datetime(2009, 1, 2), datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        events = np.array([[False, False, False], [True, False, True], [True, False, False]])
+        matrix = EventMatrix.from_dense(events, index, ['AAA', 'BBB', 'CCC'])
+        self.assertEqual(len(matrix), 3)
+        self.assertEqual(matrix.rows, np.array([1, 1, 2]))
+        self.assertEqual(matrix.cols, np.array([0, 2, 0]))
+        self.assertEqual(list(matrix.equities), ['AAA', 'CCC', 'AAA'])
+
+        # Test: dense matrix only with the dates and symbols with events
+        dense = matrix.dense()
+        self.assertEqual(list(dense.columns), ['AAA', 'CCC'])
+        self.assertEqual(list(dense.index), [datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        self.assertEqual(dense.values, np.array([[1, 1], [1, np.nan]]))
+        self.assertEqual(matrix.dense(reduce=False).shape, (3, 3))
+
+        # Test: first event of each equity
+        first = matrix.first()
+        self.assertEqual(first.rows, np.array([1, 1]))
+
+        # Test: the events of each symbol, used to save them
+        frame = matrix.frame('AAA')
+        self.assertEqual(list(frame.index), [datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        self.assertEqual(len(matrix.frame('BBB')), 0)
+        loaded = EventMatrix.from_dates(index, ['AAA'], frame.index.values, np.zeros(2), frame['value'].values)
+        self.assertEqual(loaded.rows, np.array([1, 2]))
+
+        # Test: merge of shards on the order of the symbols
+        shard1 = EventMatrix.from_dense(events[:, 2:], index, ['CCC'])
+        shard2 = EventMatrix.from_dense(events[1:, :2], index[1:], ['AAA', 'BBB'])
+        merged = EventMatrix.concat([shard1, shard2], ['AAA', 'BBB', 'CCC'])
+        self.assertEqual(merged.dense(), dense)
+        self.assertEqual(merged.cols, matrix.cols)
+
+        # Test: long format with all the events
+        table = matrix.table()
+        self.assertEqual(list(table.columns), ['date', 'symbol', 'value'])
+        self.assertEqual(list(table['symbol']), ['AAA', 'CCC', 'AAA'])
+
+    def test_cooldown(self):
+        '''
+        Tests the minimum spacing between the events of each symbol
+        '''
+        index = pd.DatetimeIndex(DateUtils.nyse_dates(start=datetime(2009, 1, 1), end=datetime(2009, 1, 31)))
+        events = np.zeros((len(index), 2), dtype=bool)
+        events[[1, 2, 3, 6, 10], 0] = True
+        events[[2, 4], 1] = True
+        matrix = EventMatrix.from_dense(events, index, ['AAA', 'BBB'])
+        # Test: spacing counted from the previous kept event
+        ans = matrix.cooldown(1)
+        self.assertEqual(ans.rows, np.array([1, 2, 3, 4, 6, 10]))
+        self.assertEqual(list(ans.equities), ['AAA', 'BBB', 'AAA', 'BBB', 'AAA', 'AAA'])
+        ans = matrix.cooldown(3)
+        self.assertEqual(ans.rows, np.array([1, 2, 6, 10]))
+        self.assertEqual(list(ans.equities), ['AAA', 'BBB', 'AAA', 'AAA'])
+        self.assertEqual(len(matrix.cooldown(0)), len(matrix))
+
+        # Test: a condition true on every date gives one event each cooldown + 1 dates
+        events = np.ones((len(index), 2), dtype=bool)
+        events[:3, 1] = False
+        matrix = EventMatrix.from_dense(events, index, ['AAA', 'BBB'])
+        ans = matrix.cooldown(4)
+        self.assertEqual(ans.frame('AAA').index.values, index.values[0::5])
+        self.assertEqual(ans.frame('BBB').index.values, index.values[3::5])
+
+    def test_condition_hash(self):
+        '''
+        Tests the hash of the conditions: same content same hash
+        '''
+        self.assertEqual(SampleConditions.went_below(3).hash(), SampleConditions.went_below(3).hash())
+        self.assertNotEqual(SampleConditions.went_below(3).hash(), SampleConditions.went_below(4).hash())
+
+        # Test: functions with the same id and different code
+        def create(below):
+            condition = Condition()
+            condition.id = 'below'
+            condition.array_function = lambda values: values < below
+            return condition
+        condition = Condition()
+        condition.id = 'below'
+        condition.array_function = lambda values: values <= 3
+        self.assertEqual(create(3).hash(), create(3).hash())
+        self.assertNotEqual(create(3).hash(), create(4).hash())
+        self.assertNotEqual(create(3).hash(), condition.hash())
+
+        # Test: default arguments
+        def create_default(below):
+            condition = Condition()
+            condition.array_function = lambda values, below=below: values < below
+            return condition
+        self.assertEqual(create_default(3).hash(), create_default(3).hash())
+        self.assertNotEqual(create_default(3).hash(), create_default(4).hash())
+
+        # Test: values of the globals read by the function
+        global THRESHOLD
+        condition = Condition()
+        condition.array_function = lambda values: values < THRESHOLD
+        THRESHOLD = 3
+        first = condition.hash()
+        THRESHOLD = 4
+        self.assertNotEqual(condition.hash(), first)
+
+        # Test: objects without a deterministic representation are not cached
+        class Threshold(object):
+            value = 3
+        threshold = Threshold()
+        condition = Condition()
+        condition.array_function = lambda values: values < threshold.value
+        self.assertIsNone(condition.hash())
+        self.setUpDataAccess()
+        finder = EventFinder()
+        finder.condition = condition
+        self.assertFalse(finder.cacheable())
+        # Test: cross-sectional conditions are not cached
+        finder.condition = create(3)
+        self.assertTrue(finder.cacheable())
+        finder.condition.cross_sectional = True
+        self.assertFalse(finder.cacheable())
+
 if __name__ == '__main__':
     suite = EventFinderTest().suite()
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,102 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from finance.test import FinanceTest
+from finance.events import Expressions
+from finance.events.Expressions import Context
+
+class ExpressionsTest(FinanceTest):
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(ExpressionsTest('test_keys'))
+        suite.addTest(ExpressionsTest('test_evaluate'))
+        suite.addTest(ExpressionsTest('test_fields_market'))
+        suite.addTest(ExpressionsTest('test_missing_values'))
+        return suite
+
+    def test_keys(self):
+        '''
+        Tests the canonical keys and the ids of the conditions
+        '''
+        price = Expressions.price()
+        # Test: lower than is greater than with the operands swapped
+        self.assertEqual((price < 3).key, (3 > price).key)
+        # Test: commutative operators
+        a = price.lag(1) >= 3
+        b = price < 3
+        self.assertEqual((a & b).key, (b & a).key)
+        self.assertNotEqual((a & b).key, (a | b).key)
+        # Test: the id of the condition is the hash of the key
+        cond1 = Expressions.condition(a & b)
+        cond2 = Expressions.condition(b & a)
+        self.assertEqual(cond1.id, cond2.id)
+        self.assertEqual(len(cond1.id), 32)
+        self.assertNotEqual(cond1.id, Expressions.condition(a & (price < 2)).id)
+
+    def test_evaluate(self):
+        '''
+        Tests the values and the shared subexpressions
+        '''
+        values = np.array([[1.0, 10], [2, 11], [3, 9], [4, 12], [5, 8]])
+        price = Expressions.price()
+        mean = price.mean(2)
+        expr = (price > mean) & (price.lag(1) < mean)
+        context = Context(values)
+        ans = expr.evaluate(values, context)
+        sol = np.array([[False, False], [True, True], [True, False], [True, True], [True, False]])
+        self.assertEqual(ans, sol)
+        # Test: the price and the rolling mean are computed once
+        self.assertEqual(len(context.cache), 6)
+        self.assertEqual(context.hits, 3)
+        self.assertEqual(context.evaluate(mean)[:, 0], np.array([np.nan, 1.5, 2.5, 3.5, 4.5]))
+        # Test: arithmetic and change
+        ans = Expressions.condition(price.change(1) / price.lag(1) < -0.1).evaluate(values)
+        self.assertEqual(ans[:, 1], np.array([False, False, True, False, True]))
+        ans = Expressions.condition(~(price > 2) | (price > 10)).evaluate(values)
+        self.assertEqual(ans[:, 0], np.array([False, True, False, False, False]))
+
+    def test_fields_market(self):
+        '''
+        Tests other fields and the market: loaded with the loader of the context
+        '''
+        values = np.array([[1.0, 10], [2, 11], [3, 9]])
+        fields = {('volume', None): np.array([[100.0, 100], [300, 100], [100, 250]]),
+                  ('adjusted_close', 'SPY'): np.array([[100.0], [101], [99]])}
+        context = Context(values, 'adjusted_close', market='SPY',
+                          loader=lambda field, symbol: fields[(field, symbol)])
+        volume = Expressions.field('volume')
+        market = Expressions.market()
+        cond = Expressions.condition((volume > volume.lag(1) * 2) | (market.change(1) < 0))
+        ans = cond.evaluate(values, context)
+        self.assertEqual(ans, np.array([[False, False], [True, False], [True, True]]))
+        # Test: the fields are needed
+        self.assertRaises(Exception, cond.evaluate, values)
+
+    def test_missing_values(self):
+        '''
+        Tests that the dates with NaN values (before the listing and gaps) are never events
+        The first date is never an event of a condition
+        '''
+        values = np.array([[np.nan, 1.0], [np.nan, 5], [4, np.nan], [2, 2], [np.nan, 1]])
+        price = Expressions.price()
+        # Test: negation and comparisons
+        ans = Expressions.condition(~(price > 3)).evaluate(values)
+        self.assertEqual(ans, np.array([[False, False], [False, False], [False, False],
+                                        [True, True], [False, True]]))
+        ans = Expressions.condition(price <= 3).evaluate(values)
+        self.assertEqual(ans, np.array([[False, False], [False, False], [False, False],
+                                        [True, True], [False, True]]))
+        # Test: lagged values before the first value
+        ans = Expressions.condition(~(price.lag(1) < 3)).evaluate(values)
+        self.assertEqual(ans[:, 0], np.array([False, False, False, True, False]))
+        # Test: three-valued and / or: unknown & False is False
+        ans = Expressions.condition(~((price > 3) & (price.lag(1) > 3))).evaluate(values)
+        self.assertEqual(ans[:, 0], np.array([False, False, False, True, True]))
+        ans = Expressions.condition((price > 3) | (price.lag(1) > 3)).evaluate(values)
+        self.assertEqual(ans[:, 0], np.array([False, False, True, True, False]))
+
+if __name__ == '__main__':
+    suite = ExpressionsTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
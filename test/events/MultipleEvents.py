@@ -2,18 +2,25 @@ import unittest
 import os, inspect
 import numpy as np
 import pandas as pd
+from scipy import stats
 from datetime import datetime
 
 from finance.test import FinanceTest
 from finance.events import EventFinder
 from finance.events import SampleConditions
 from finance.events import MultipleEvents
+from finance.events import EventStudy
+from finance.events.MultipleEvents import assess_shard
 
 class MultipleEventsTest(FinanceTest):
 
     def suite(self):
         suite = unittest.TestSuite()
         suite.addTest(MultipleEventsTest('test_window'))
+        suite.addTest(MultipleEventsTest('test_extract_windows'))
+        suite.addTest(MultipleEventsTest('test_market_model'))
+        suite.addTest(MultipleEventsTest('test_assess_shards'))
+        suite.addTest(MultipleEventsTest('test_positions'))
         return suite
 
     def test_window(self):
@@ -72,6 +79,98 @@ class MultipleEventsTest(FinanceTest):
             self.assertEqual(mul_evt.mean_ar, solution['Mean AR'])
             self.assertEqual(mul_evt.mean_car, solution['Mean CAR'])
 
+        # Test 5: streaming mode (one event on each chunk) has the same mean and std
+        mean_ar, std_ar, mean_car, std_car = mul_evt.mean_ar, mul_evt.std_ar, mul_evt.mean_car, mul_evt.std_car
+        mul_evt.run(chunk_size=1)
+        self.assertIsNone(mul_evt.er)
+        self.assertEqual(mul_evt.mean_ar.values, mean_ar.values, 10)
+        self.assertEqual(mul_evt.std_ar.values, std_ar.values, 10)
+        self.assertEqual(mul_evt.mean_car.values, mean_car.values, 10)
+        self.assertEqual(mul_evt.std_car.values, std_car.values, 10)
+        # Test 6: events assessed on two processes
+        mul_evt.run(processes=2)
+        self.assertEqual(mul_evt.mean_car.values, mean_car.values, 10)
+        self.assertEqual(mul_evt.std_car.values, std_car.values, 10)
+
+    def test_extract_windows(self):
+        '''
+        Tests the windows of many events extracted at once
+        '''
+        values = np.arange(20, dtype=np.float64).reshape(10, 2)
+        positions = np.array([2, 5, 9])
+        cols = np.array([0, 1, 0])
+        ans = EventStudy.windows(values, positions, range(-1, 2), cols)
+        sol = np.array([[2, 4, 6], [9, 11, 13], [16, 18, np.nan]])
+        self.assertEqual(ans, sol)
+        # Test: default column
+        ans = EventStudy.windows(values[:, 1], positions, [-2])
+        self.assertEqual(ans, np.array([[1], [7], [15]]))
+
+        frame = EventStudy.windows_frame(sol, range(-1, 2), ['A', 'B', 'C'], 'Window')
+        self.assertEqual(list(frame.index), [-1, 0, 1])
+        self.assertEqual(frame['B'].values, np.array([9.0, 11, 13]))
+
+    def test_market_model(self):
+        '''
+        Tests the regression of many events against scipy.stats.linregress
+        '''
+        rng = np.random.RandomState(0)
+        x = rng.normal(0, 0.01, size=(5, 100))
+        y = 0.001 + 1.5 * x + rng.normal(0, 0.02, size=(5, 100))
+        slope, intercept, residual_var, slope_std_error = EventStudy.market_model(x, y)
+        for i in range(5):
+            sol = stats.linregress(x[i], y[i])
+            self.assertAlmostEqual(slope[i], sol[0], 10)
+            self.assertAlmostEqual(intercept[i], sol[1], 10)
+            self.assertAlmostEqual(slope_std_error[i], sol[4], 10)
+            residuals = y[i] - sol[1] - sol[0] * x[i]
+            self.assertAlmostEqual(residual_var[i], (residuals ** 2).sum() / 98, 10)
+
+    def test_assess_shards(self):
+        '''
+        Tests that the moments of shards of events combined are the moments of all the events
+        '''
+        rng = np.random.RandomState(0)
+        dr_market = rng.normal(0, 0.01, size=(300, 1))
+        dr_data = 0.5 * dr_market + rng.normal(0, 0.02, size=(300, 4))
+        evt_idxs = np.array([150, 160, 170, 180, 250, 260])
+        evt_cols = np.array([0, 1, 2, 3, 0, 1])
+        windows_indexes = np.arange(-5, 6)
+        estimation_indexes = np.arange(-105, -5)
+
+        moments, regression = assess_shard(dr_data, dr_market, evt_idxs, evt_cols,
+                                           windows_indexes, estimation_indexes)
+        left, left_reg = assess_shard(dr_data, dr_market, evt_idxs[:4], evt_cols[:4],
+                                      windows_indexes, estimation_indexes, chunk_size=3)
+        right, right_reg = assess_shard(dr_data[:, :2], dr_market, evt_idxs[4:], evt_cols[4:],
+                                        windows_indexes, estimation_indexes, chunk_size=1)
+        self.assertEqual(np.concatenate((left_reg, right_reg)), regression, 10)
+        for name in ['er', 'ar', 'car']:
+            left[name].combine(right[name])
+            self.assertEqual(left[name].means(), moments[name].means(), 10)
+            self.assertEqual(left[name].stds(), moments[name].stds(), 10)
+
+    def test_positions(self):
+        '''
+        Tests the positions of the events and the errors for dates and symbols without data
+        '''
+        self.setUpDataAccess()
+        index = pd.DatetimeIndex([datetime(2009, 1, 2), datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        data = pd.DataFrame({'AAA': [1.0, 2, 3], 'BBB': [4.0, 5, 6]}, index=index, columns=['AAA', 'BBB'])
+
+        mul_evt = MultipleEvents()
+        mul_evt.list = pd.Series(['BBB', 'AAA'], index=[datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        evt_idxs, evt_cols = mul_evt.positions(data)
+        self.assertEqual(np.asarray(evt_idxs), np.array([1, 2]))
+        self.assertEqual(np.asarray(evt_cols), np.array([1, 0]))
+
+        # Test: symbol without data
+        mul_evt.list = pd.Series(['AAA', 'ZZZ'], index=[datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        self.assertRaises(KeyError, mul_evt.positions, data)
+        # Test: date without data
+        mul_evt.list = pd.Series(['AAA'], index=[datetime(2009, 1, 7)])
+        self.assertRaises(ValueError, mul_evt.positions, data)
+
 if __name__ == '__main__':
     suite = MultipleEventsTest().suite()
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+import pandas as pd
+from scipy import stats
+from datetime import datetime
+
+from finance.test import FinanceTest
+from finance.utils import Calculator
+from finance.events import PastEvent
+from finance.events import PastEvents
+
+class PastEventsTest(FinanceTest):
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(PastEventsTest('test_batch'))
+        suite.addTest(PastEventsTest('test_missing'))
+        return suite
+
+    def setUpEvents(self):
+        self.setUpDataAccess()
+        self.setUpFixtures(['AAA', 'BBB', 'SPY'], datetime(2008, 1, 1), datetime(2010, 12, 31))
+        events = pd.DataFrame({'date': [datetime(2009, 6, 1), datetime(2010, 3, 1), datetime(2009, 6, 1)],
+                               'symbol': ['AAA', 'AAA', 'BBB']}, columns=['date', 'symbol'])
+        evts = PastEvents()
+        evts.events = events
+        evts.lookback_days = 10
+        evts.lookforward_days = 10
+        evts.estimation_period = 252
+        return evts
+
+    def test_batch(self):
+        '''
+        Equities: AAA, BBB, market: SPY (random walks from FinanceTest.setUpFixtures)
+
+        Tests
+        -----
+            1. Expected returns, abnormal returns and CAR of one PastEvent for each (symbol, date)
+            2. Legacy t-test: the t-test of PastEvent
+            3. t-test: abnormal returns over the std of the residuals of the regression
+        '''
+        evts = self.setUpEvents()
+        evts.run()
+        events = evts.events
+        self.assertEqual(list(evts.er.columns), ['AAA 2009-06-01', 'AAA 2010-03-01', 'BBB 2009-06-01'])
+
+        for i in range(len(events)):
+            evt = PastEvent()
+            evt.symbol = events['symbol'][i]
+            evt.lookback_days = 10
+            evt.lookforward_days = 10
+            evt.estimation_period = 252
+            evt.date = events['date'][i]
+            evt.run()
+            # Test 1
+            self.assertEqual(evts.er.iloc[:, i].values, evt.er.values, 10)
+            self.assertEqual(evts.ar.iloc[:, i].values, evt.ar.values, 10)
+            self.assertEqual(evts.car.iloc[:, i].values, evt.car.values, 10)
+            # Test 2
+            self.assertEqual(evts.legacy_t_test.iloc[:, i].values, evt.t_test.values, 10)
+
+            # Test 3
+            x = Calculator.returns(evt.market).iloc[:, 0][evt.start_period:evt.end_period]
+            y = Calculator.returns(evt.data).iloc[:, 0][evt.start_period:evt.end_period]
+            slope, intercept, r_value, p_value, std_error = stats.linregress(x, y)
+            residuals = y - (intercept + slope * x)
+            residual_var = (residuals ** 2).sum() / (len(residuals) - 2)
+            self.assertEqual(evts.reg_estimation['Residual Var'].iloc[i], residual_var, 10)
+            t_test = evt.ar.values / np.sqrt(residual_var)
+            self.assertEqual(evts.t_test.iloc[:, i].values, t_test, 10)
+            self.assertEqual(evts.prob.iloc[:, i].values, stats.norm.cdf(t_test), 10)
+
+    def test_missing(self):
+        '''
+        Tests the events of symbols without data and on closed dates
+        '''
+        evts = self.setUpEvents()
+        # No data of CCC: the download is tried once
+        evts.data_access.file_manager.retries = 0
+        evts.events = pd.DataFrame({'date': [datetime(2009, 6, 1)], 'symbol': ['CCC']})
+        self.assertRaises(KeyError, evts.run)
+        evts.events = pd.Series(['AAA'], index=[datetime(2009, 6, 6)])
+        self.assertRaises(ValueError, evts.run)
+
+if __name__ == '__main__':
+    suite = PastEventsTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+    FinanceTest.delete_data()
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from finance.test import FinanceTest
+from finance.events import Significance
+
+class SignificanceTest(FinanceTest):
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(SignificanceTest('test_parametric'))
+        suite.addTest(SignificanceTest('test_resampling'))
+        return suite
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.residual_var = rng.uniform(0.0001, 0.0009, size=200)
+        self.ar = rng.normal(0, 1, size=(200, 11)) * np.sqrt(self.residual_var)[:, np.newaxis]
+        self.ar[:, 5:] = self.ar[:, 5:] + 0.01
+        self.ar[3, 2] = np.nan
+        self.days = np.arange(-5, 6)
+        frame = pd.DataFrame(self.ar.T, index=self.days)
+        self.sig = Significance(frame, self.residual_var, 100)
+
+    def test_parametric(self):
+        '''
+        Tests the t-test against scipy and the Patell and BMP tests against loops
+        '''
+        t_test = self.sig.t_test(cumulative=False)
+        self.assertEqual(t_test.index.values, self.days)
+        for day in range(11):
+            values = self.ar[:, day][~np.isnan(self.ar[:, day])]
+            sol = stats.ttest_1samp(values, 0)
+            self.assertAlmostEqual(t_test['t-test'].values[day], sol[0], 10)
+            self.assertAlmostEqual(t_test['p-value'].values[day], sol[1], 10)
+
+            sar = (self.ar[:, day] / np.sqrt(self.residual_var))[~np.isnan(self.ar[:, day])]
+            patell = sar.sum() / np.sqrt(len(sar) * 98.0 / 96.0)
+            self.assertAlmostEqual(self.sig.patell(cumulative=False)['Patell Z'].values[day], patell, 10)
+            self.assertAlmostEqual(self.sig.bmp(cumulative=False)['BMP t'].values[day],
+                                   stats.ttest_1samp(sar, 0)[0], 10)
+
+        # Test: the CAR of the last day is the sum of the AR
+        car = np.nansum(self.ar, axis=1)
+        self.assertAlmostEqual(self.sig.t_test()['t-test'].values[-1], stats.ttest_1samp(car, 0)[0], 10)
+        # Test: the abnormal returns after the event are significant
+        self.assertTrue((self.sig.bmp(cumulative=False)['p-value'].values[5:] < 0.01).all())
+
+    def test_resampling(self):
+        '''
+        Tests the bootstrap band and permutation test: same results on batches and processes
+        '''
+        band = self.sig.bootstrap(resamples=500, seed=0, batch_size=64)
+        car = np.nancumsum(self.ar, axis=1)
+        car[3, 2] = np.nan
+        self.assertEqual(band['Mean'].values, np.nanmean(car, axis=0), 10)
+        self.assertTrue((band['Lower'].values < band['Mean'].values).all())
+        self.assertTrue((band['Upper'].values > band['Mean'].values).all())
+        parallel = self.sig.bootstrap(resamples=500, seed=0, batch_size=64, processes=2)
+        self.assertEqual(parallel, band)
+
+        test = self.sig.permutation(resamples=500, cumulative=False, seed=0)
+        self.assertTrue((test['p-value'].values[5:] < 0.01).all())
+        self.assertTrue((test['p-value'].values > 0).all())
+
+if __name__ == '__main__':
+    suite = SignificanceTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -14,6 +14,7 @@ class MarketSimulatorTest(FinanceTest):
     def suite(self):
         suite = unittest.TestSuite()
         suite.addTest(MarketSimulatorTest('test_1'))
+        suite.addTest(MarketSimulatorTest('test_trades_from_event'))
         return suite
 
     def test_1(self):
@@ -52,6 +53,24 @@ class MarketSimulatorTest(FinanceTest):
             self.assertEqual(simulator.equities, solution['Equities value'])
             self.assertEqual(simulator.portfolio, solution['Portfolio value'])
 
+    def test_trades_from_event(self):
+        '''
+        Tests the trades after the events: NYSE open dates, and an error
+        if the dates are outside of the NYSE dates
+        '''
+        self.setUpDataAccess()
+
+        sim = MarketSimulator()
+        events = pd.Series(['AAA', 'BBB'], index=[datetime(2009, 1, 2), datetime(2009, 1, 5)])
+        sim.create_trades_from_event(events, daysAfter=2)
+        self.assertEqual(list(sim.trades.index), [datetime(2009, 1, 2), datetime(2009, 1, 5),
+                                                  datetime(2009, 1, 6), datetime(2009, 1, 7)])
+        self.assertEqual(list(sim.trades['action']), ['Buy', 'Buy', 'Sell', 'Sell'])
+        self.assertEqual(list(sim.trades['symbol']), ['AAA', 'BBB', 'AAA', 'BBB'])
+
+        events = pd.Series(['AAA', 'BBB'], index=[datetime(2009, 1, 2), datetime(2020, 12, 28)])
+        self.assertRaises(IndexError, sim.create_trades_from_event, events, daysAfter=5)
+
 if __name__ == '__main__':
     suite = MarketSimulatorTest().suite()
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -1,4 +1,7 @@
 import unittest
+import os
+import numpy as np
+import pandas as pd
 from datetime import datetime
 
 from finance.test import FinanceTest
@@ -10,6 +13,8 @@ class DataAccessTest(FinanceTest):
         suite = unittest.TestSuite()
         suite.addTest(DataAccessTest('test_get_data'))
         suite.addTest(DataAccessTest('test_save_load_custom_name'))
+        suite.addTest(DataAccessTest('test_save_load_formats'))
+        suite.addTest(DataAccessTest('test_cache_coverage'))
         return suite
 
     def test_get_data(self):
@@ -79,6 +84,117 @@ class DataAccessTest(FinanceTest):
         self.assertEqual(list(close.columns), list(close_loaded.columns))
         self.assertEqual(len(close), len(close_loaded))
 
+    def test_save_load_formats(self):
+        '''
+        Tests that the binary and csv cache formats return the same data
+        '''
+        self.setUpDataAccess()
+
+        index = pd.DatetimeIndex([datetime(2015, 1, 2), datetime(2015, 1, 5), datetime(2015, 1, 6)],
+                                    name='timestamp')
+        data = pd.DataFrame({'AAPL': [1.5, np.nan, 2.5], 'GLD': [3.0, 4.0, 5.0]}, index=index)
+
+        for cache_format in ['binary', 'csv']:
+            self.data_access.cache_format = cache_format
+            self.data_access.save(data, "formatName")
+            loaded = self.data_access.load("formatName")
+            self.assertEqual(list(loaded.columns), list(data.columns))
+            self.assertEqual(list(loaded.index), list(data.index))
+            self.assertEqual(loaded.values, data.values, 6)
+
+        # Test: missing data returns None
+        self.assertEqual(self.data_access.load("missingName"), None)
+
+        # Test: empty DataFrames (e.g. all the symbols missing) are saved as binary
+        self.data_access.cache_format = 'binary'
+        self.data_access.save(pd.DataFrame(), "emptyName")
+        loaded = self.data_access.load("emptyName")
+        self.assertEqual(loaded.shape, (0, 0))
+
+        # Test: non-numeric DataFrames are saved as csv
+        text = pd.DataFrame({'symbol': ['AAPL', 'GLD']}, index=index[:2])
+        self.data_access.save(text, "textName")
+        loaded = self.data_access.load("textName")
+        self.assertEqual(list(loaded['symbol']), ['AAPL', 'GLD'])
+
+        # Test: unreadable binary files are not cached
+        with open(self.data_access.cache_filename("pickleName"), 'wb') as f:
+            np.savez(f, values=np.array([None], dtype=object))
+        self.assertEqual(self.data_access.load("pickleName"), None)
+
+    def test_cache_coverage(self):
+        '''
+        Equities: AAA, BBB, CCC, DDD (random walks from FinanceTest.setUpFixtures)
+
+        Tests that sub-ranges, subsets and reordered symbols of a cached
+        DataFrame are loaded from the cache, and that only the symbols not
+        covered are read from the csv files
+        '''
+        self.setUpDataAccess()
+        self.setUpFixtures(["AAA", "BBB", "CCC"], datetime(2015, 1, 1), datetime(2017, 12, 31))
+
+        symbols = ["AAA", "BBB", "CCC"]
+        start_date = datetime(2015, 1, 1)
+        end_date = datetime(2017, 12, 31)
+        close = self.data_access.get_data(symbols, start_date, end_date, 'close', useStore=False)
+        self.assertEqual(list(close.columns), symbols)
+
+        # Delete the csv files: everything has to come from the cache
+        self.data_access.empty_dir(delete=False)
+        requested = []
+        get_filenames = self.data_access.file_manager.get_filenames
+        def spy(symbols, *args, **kwargs):
+            requested.extend(symbols)
+            return get_filenames(symbols, *args, **kwargs)
+        self.data_access.file_manager.get_filenames = spy
+
+        # Test: sub-range
+        start_date = datetime(2016, 1, 1)
+        end_date = datetime(2016, 12, 31)
+        df = self.data_access.get_data(symbols, start_date, end_date, 'close',
+                                        downloadMissing=False, useStore=False)
+        self.assertEqual(list(df.columns), symbols)
+        self.assertEqual(len(df), 252)
+        self.assertEqual(df, close[start_date:end_date])
+
+        # Test: subset of the symbols on other order
+        df = self.data_access.get_data(["CCC", "AAA"], start_date, end_date, 'close',
+                                        downloadMissing=False, useStore=False)
+        self.assertEqual(list(df.columns), ["CCC", "AAA"])
+        self.assertEqual(df['AAA'].values, close['AAA'][start_date:end_date].values)
+        self.assertEqual(df['CCC'].values, close['CCC'][start_date:end_date].values)
+
+        # Test: one symbol
+        df = self.data_access.get_data("BBB", start_date, end_date, 'close',
+                                        downloadMissing=False, useStore=False)
+        self.assertEqual(list(df.columns), ['close'])
+        self.assertEqual(df['close'].values, close['BBB'][start_date:end_date].values)
+        self.assertEqual(requested, [])
+
+        # Test: partially covered request: only DDD is read from the csv files
+        self.setUpFixtures(["DDD"], datetime(2015, 1, 1), datetime(2017, 12, 31), seed=1)
+        df = self.data_access.get_data(["AAA", "DDD"], start_date, end_date, 'close',
+                                        downloadMissing=False, useStore=False)
+        self.assertEqual(requested, ["DDD"])
+        self.assertEqual(list(df.columns), ["AAA", "DDD"])
+        self.assertEqual(df['AAA'].values, close['AAA'][start_date:end_date].values)
+        self.assertEqual(df['DDD'].isnull().sum(), 0)
+
+        # Test: the columns already registered are not added again to the index
+        index_file = os.path.join(self.data_access.cache_dir, 'index.csv')
+        rows = len(pd.read_csv(index_file))
+        self.data_access.get_data(["AAA", "DDD"], start_date, end_date, 'close',
+                                  downloadMissing=False, useStore=False, useCache=False)
+        self.assertEqual(len(pd.read_csv(index_file)), rows)
+
+        # Test: the entries of deleted cached files are removed from the index file
+        name = "AAA_DDD_%s_%s_close" % (start_date.strftime('%m-%d-%Y'), end_date.strftime('%m-%d-%Y'))
+        self.assertTrue(name in set(pd.read_csv(index_file)['name']))
+        os.remove(self.data_access.cache_filename(name))
+        self.data_access.get_data(["DDD"], datetime(2016, 3, 1), end_date, 'close',
+                                  downloadMissing=False, useStore=False)
+        self.assertFalse(name in set(pd.read_csv(index_file)['name']))
+
 
 def benchmark():
     from time import clock, time
@@ -1,9 +1,11 @@
 import unittest
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 from finance.test import FinanceTest
 from finance.utils import DateUtils
+from finance.utils import ListUtils
 
 class DateUtilsTest(FinanceTest):
 
@@ -13,6 +15,8 @@ class DateUtilsTest(FinanceTest):
         suite.addTest(DateUtilsTest('nyse_dates_advanced'))
         suite.addTest(DateUtilsTest('nyse_dates_event'))
         suite.addTest(DateUtilsTest('nyse_add_and_substract'))
+        suite.addTest(DateUtilsTest('nyse_calendar'))
+        suite.addTest(DateUtilsTest('search_closer_dates'))
         return suite
 
     def nyse_dates_basic(self):
@@ -160,6 +164,55 @@ class DateUtilsTest(FinanceTest):
         ans = DateUtils.nyse_substract(datetime(1990, 10, 1), 3)        
         self.assertEquals(ans, datetime(1990, 9, 26))
 
+        # Test: many dates in one call, non open dates move to the previous open date
+        dates = pd.DatetimeIndex([datetime(2009, 4, 13), datetime(2009, 4, 12), datetime(1990, 10, 1)])
+        ans = DateUtils.nyse_add(dates, 5)
+        self.assertEqual(ans.tolist(), [datetime(2009, 4, 20), datetime(2009, 4, 17), datetime(1990, 10, 8)])
+        ans = DateUtils.nyse_substract(dates, np.array([5, 1, 3]))
+        self.assertEqual(ans.tolist(), [datetime(2009, 4, 3), datetime(2009, 4, 8), datetime(1990, 9, 26)])
+        # Test: outside of the NYSE dates
+        ans = DateUtils.nyse_shift([datetime(1962, 7, 5), datetime(1950, 1, 1)], -1)
+        self.assertTrue(ans.isnull().all())
+        self.assertRaises(IndexError, DateUtils.nyse_substract, datetime(1962, 7, 5), 1)
+
+    def nyse_calendar(self):
+        '''
+        Tests the array of NYSE dates: loaded once, sorted, equal to the lists and to NYSE_dates.txt
+        '''
+        calendar = ListUtils.NYSE_calendar()
+        self.assertEquals(calendar.dtype, np.dtype('datetime64[D]'))
+        self.assertIs(calendar, ListUtils.NYSE_calendar())
+        self.assertFalse(calendar.flags.writeable)
+        self.assertTrue((np.diff(calendar.astype(np.int64)) > 0).all())
+        self.assertEquals(calendar[0], np.datetime64('1962-07-05'))
+        # Test: the npy file is the parsed txt file
+        self.assertEqual(ListUtils.build_calendar(save=False), np.asarray(calendar))
+
+        dates = ListUtils.NYSE()
+        self.assertEquals(dates[0], datetime(2007, 1, 3))
+        self.assertEquals(len(ListUtils.NYSE(complete=True)), len(calendar))
+
+    def search_closer_dates(self):
+        '''
+        Tests the search of one and many dates: 2009-4-10 (Good Friday) and
+        2009-4-11, 2009-4-12 (weekend) are not open dates
+        '''
+        dates = DateUtils.nyse_dates(start=datetime(2009, 1, 1), end=datetime(2009, 12, 31))
+        ans = DateUtils.search_closer_date(datetime(2009, 4, 12), dates)
+        self.assertEquals(dates[ans], datetime(2009, 4, 9))
+        ans = DateUtils.search_closer_date(datetime(2009, 4, 12), dates, searchBack=False)
+        self.assertEquals(dates[ans], datetime(2009, 4, 13))
+        ans = DateUtils.search_closer_date(datetime(2009, 4, 12), dates, maxDistance=3)
+        self.assertEquals(ans, None)
+        self.assertRaises(ValueError, DateUtils.search_closer_date, datetime(2009, 4, 12), dates, exact=True)
+
+        # Test: many dates in one call
+        to_find = pd.DatetimeIndex([datetime(2009, 4, 12), datetime(2009, 4, 13), datetime(1990, 1, 1)])
+        ans = DateUtils.search_closer_dates(to_find, dates)
+        self.assertEqual(ans, np.array([dates.index(datetime(2009, 4, 9)), dates.index(datetime(2009, 4, 13)), -1]))
+        ans = DateUtils.search_closer_dates(to_find, dates, exact=True)
+        self.assertEqual(ans, np.array([-1, dates.index(datetime(2009, 4, 13)), -1]))
+
 if __name__ == '__main__':
     suite = DateUtilsTest().suite()
     unittest.TextTestRunner(verbosity=2).run(suite)
\ No newline at end of file
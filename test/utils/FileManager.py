@@ -1,18 +1,65 @@
 import unittest
+import os
+import shutil
+import tempfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
 
 from finance.test import FinanceTest
 from finance.utils import FileManager
+from finance.utils.RateLimiter import RateLimiter
+
+class AlphaVantageStandIn(BaseHTTPRequestHandler):
+    '''
+    Local stand-in of the Alpha Vantage API: serves the same csv for every
+    known symbol (the last 2 days on compact output), an error for FAKE symbols
+    and a server error on the first request of RETRY
+    '''
+    protocol_version = 'HTTP/1.1'
+    csv = ("timestamp,open,high,low,close,adjusted_close,volume,dividend_amount,split_coefficient\n"
+           "2009-01-06,3.0,3.0,3.0,3.0,3.0,300,0.0,1.0\n"
+           "2009-01-05,2.0,2.0,2.0,2.0,2.0,200,0.0,1.0\n"
+           "2009-01-02,1.0,1.0,1.0,1.0,1.0,100,0.0,1.0\n")
+    requests = []
+
+    def do_GET(self):
+        params = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        symbol = params['symbol'][0]
+        outputsize = params['outputsize'][0]
+        AlphaVantageStandIn.requests.append((symbol, self.client_address[1], outputsize))
+
+        status, body = 200, self.csv
+        if outputsize == 'compact':
+            body = ''.join(self.csv.splitlines(True)[:3])
+        if symbol.startswith('FAKE'):
+            body = '{"Error Message": "Invalid API call"}'
+        elif symbol == 'RETRY' and [r[0] for r in self.requests].count('RETRY') == 1:
+            status, body = 503, 'Unavailable'
+        body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
 
 class FileManagerTest(FinanceTest):
 
     def setUp1(self):
-        self.file_manager = FileManager('./data')
-        self.file_manager.empty_dir(delete=False)
+        data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, data_dir, True)
+        self.file_manager = FileManager(data_dir)
 
     def suite(self):
         suite = unittest.TestSuite()
         suite.addTest(FileManagerTest('test_get_filenames'))
+        suite.addTest(FileManagerTest('test_catalog'))
+        suite.addTest(FileManagerTest('test_bulk_download'))
+        suite.addTest(FileManagerTest('test_read_window'))
+        suite.addTest(FileManagerTest('test_merge_adjacent'))
         return suite
 
     def test_get_filenames(self):
@@ -48,17 +95,20 @@ class FileManagerTest(FinanceTest):
         ans = self.file_manager.get_filenames(symbols[0], start_date, end_date, downloadMissing=True)
         self.assertEqual(ans, "AAPL_2008-1-1_2009-12-31.csv")
 
-        # Test: Bigger start date: download another file
+        # Test: Bigger start date: add the head to the file
         start_date = datetime(2007, 1, 1) # Bigger
         end_date = datetime(2009, 6, 6)  # Smaller
         ans = self.file_manager.get_filenames(symbols[0], start_date, end_date, downloadMissing=True)
-        self.assertEqual(ans, "AAPL_2007-1-1_2009-6-6.csv")
+        self.assertEqual(ans, "AAPL_2007-1-1_2009-12-31.csv")
 
-        # Test: Bigger end date: download another file
+        # Test: Bigger end date: add the tail to the file
         start_date = datetime(2007, 1, 1) # Bigger
         end_date = datetime(2010, 6, 6) # Smaller
         ans = self.file_manager.get_filenames(symbols[0], start_date, end_date, downloadMissing=True)
         self.assertEqual(ans, "AAPL_2007-1-1_2010-6-6.csv")
+        # Test: the superseded files were deleted
+        self.assertEqual(len(self.file_manager.catalog["AAPL"]), 1)
+        self.assertFalse(os.access(os.path.join(self.file_manager.dir, "AAPL_2008-1-1_2009-12-31.csv"), os.F_OK))
 
         # Test: Download multiple files
         start_date = datetime(2015, 1, 1)
@@ -85,6 +135,147 @@ class FileManagerTest(FinanceTest):
                 "XOM_2015-1-1_2017-1-1.csv", None]
         self.assertEqual(ans, sol)
 
+    def test_catalog(self):
+        '''
+        Tests the exact symbol matching and the catalog of files
+        '''
+        self.setUp1()
+        file_names = ["A_2008-1-1_2009-12-31.csv", "AAPL_2008-1-1_2009-12-31.csv",
+                        "AAPL_2007-1-1_2010-6-6.csv", "BRK_B_2008-1-1_2009-12-31.csv"]
+        for file_name in file_names:
+            open(os.path.join(self.file_manager.dir, file_name), 'w').close()
+
+        start_date = datetime(2008, 6, 6)
+        end_date = datetime(2009, 6, 6)
+
+        # Test: A does not match AAPL
+        ans = self.file_manager.get_filenames("A", start_date, end_date, downloadMissing=False)
+        self.assertEqual(ans, "A_2008-1-1_2009-12-31.csv")
+        # Test: Symbols with underscores
+        ans = self.file_manager.get_filenames("BRK_B", start_date, end_date, downloadMissing=False)
+        self.assertEqual(ans, "BRK_B_2008-1-1_2009-12-31.csv")
+        # Test: The file with the smallest range is returned
+        ans = self.file_manager.get_filenames("AAPL", start_date, end_date, downloadMissing=False)
+        self.assertEqual(ans, "AAPL_2008-1-1_2009-12-31.csv")
+        ans = self.file_manager.get_filenames("AAPL", datetime(2007, 6, 6), end_date, downloadMissing=False)
+        self.assertEqual(ans, "AAPL_2007-1-1_2010-6-6.csv")
+
+        # Test: The catalog is persistent
+        file_manager = FileManager(self.file_manager.dir)
+        self.assertEqual(len(file_manager.catalog["AAPL"]), 2)
+
+        # Test: Deleted files are removed from the catalog
+        os.remove(os.path.join(self.file_manager.dir, "AAPL_2008-1-1_2009-12-31.csv"))
+        ans = self.file_manager.get_filenames("AAPL", start_date, end_date, downloadMissing=False)
+        self.assertEqual(ans, "AAPL_2007-1-1_2010-6-6.csv")
+
+        # Test: the directory is scanned again only if it changed
+        # The files were written less than a second ago: mark the catalog as up to date
+        self.file_manager.build_catalog()
+        self.file_manager.catalog_mtime = self.file_manager.dir_mtime()
+        build_catalog = self.file_manager.build_catalog
+        self.file_manager.build_catalog = lambda: self.fail('Scanned an unchanged directory')
+        ans = self.file_manager.get_filenames("XOM", start_date, end_date, downloadMissing=False)
+        self.assertEqual(ans, [])
+        self.file_manager.build_catalog = build_catalog
+        open(os.path.join(self.file_manager.dir, "XOM_2008-1-1_2009-12-31.csv"), 'w').close()
+        os.utime(self.file_manager.dir, ns=(0, self.file_manager.catalog_mtime + 1))
+        ans = self.file_manager.get_filenames("XOM", start_date, end_date, downloadMissing=False)
+        self.assertEqual(ans, "XOM_2008-1-1_2009-12-31.csv")
+
+    def test_bulk_download(self):
+        '''
+        Tests the concurrent downloads against a local stand-in of the API:
+        retries, missing symbols and keep-alive connections
+        '''
+        self.setUp1()
+        server = ThreadingHTTPServer(('127.0.0.1', 0), AlphaVantageStandIn)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        AlphaVantageStandIn.requests = []
+
+        rate_limiter, retry_delay = FileManager.rate_limiter, FileManager.retry_delay
+        FileManager.rate_limiter = RateLimiter(calls=1000, period=60)
+        FileManager.retry_delay = 0.01
+        self.file_manager.alpha_vantage_url = 'http://127.0.0.1:%d/query' % server.server_address[1]
+        try:
+            symbols = ["AAPL", "GLD", "FAKE1", "RETRY", "SPY", "XOM", "GOOG", "IBM"]
+            start_date = datetime(2009, 1, 1)
+            end_date = datetime(2009, 1, 5)
+            ans = self.file_manager.bulk_download(symbols, start_date, end_date, max_workers=3)
+            sol = dict([(symbol, None if symbol == "FAKE1" else FileManager.filename(symbol, start_date, end_date))
+                            for symbol in symbols])
+            self.assertEqual(ans, sol)
+
+            # Test: RETRY was requested twice, the rest once
+            requested = [r[0] for r in AlphaVantageStandIn.requests]
+            self.assertEqual(sorted(requested), sorted(symbols + ["RETRY"]))
+            # Test: the connections were reused
+            ports = set([r[1] for r in AlphaVantageStandIn.requests])
+            self.assertTrue(len(ports) <= 3 + 1)
+
+            # Test: the files are on the catalog and truncated to the dates
+            ans = self.file_manager.get_filenames(symbols, start_date, end_date, downloadMissing=False)
+            self.assertEqual(len(ans), 7)
+            with open(os.path.join(self.file_manager.dir, ans[0])) as f:
+                self.assertEqual(len(f.readlines()), 3)
+
+            # Test: incremental update of the tail using the compact output
+            self.file_manager.compact_days = 100000
+            AlphaVantageStandIn.requests = []
+            ans = self.file_manager.get_filenames("AAPL", start_date, datetime(2009, 1, 6))
+            self.assertEqual(ans, "AAPL_2009-1-1_2009-1-6.csv")
+            self.assertEqual([r[2] for r in AlphaVantageStandIn.requests], ['compact'])
+            self.assertEqual(len(self.file_manager.catalog["AAPL"]), 1)
+            with open(os.path.join(self.file_manager.dir, ans)) as f:
+                self.assertEqual(len(f.readlines()), 4)
+        finally:
+            FileManager.rate_limiter, FileManager.retry_delay = rate_limiter, retry_delay
+            server.shutdown()
+            server.server_close()
+
+    def test_read_window(self):
+        '''
+        Tests the streaming read of the csv: lines between the dates, earliest
+        first, and stops reading on the first line before the start date
+        '''
+        def lines():
+            yield b"2009-01-07,4.0\n"
+            yield b"2009-01-06,3.0\n"
+            yield b"2009-01-05,2.0\n"
+            yield b"2009-01-02,1.0\n"
+            raise Exception('Read after the start date')
+
+        header, rows = FileManager.read_window(b"timestamp,close\n", lines(),
+                                                datetime(2009, 1, 3), datetime(2009, 1, 6))
+        self.assertEqual(header, "timestamp,close")
+        self.assertEqual(rows, ["2009-01-05,2.0", "2009-01-06,3.0"])
+
+        # Test: lines sorted so earliest comes first are read completely
+        ascending = [b"2009-01-02,1.0\n", b"2009-01-05,2.0\n", b"2009-01-06,3.0\n"]
+        header, rows = FileManager.read_window(b"timestamp,close\n", ascending, datetime(2009, 1, 3))
+        self.assertEqual(rows, ["2009-01-05,2.0", "2009-01-06,3.0"])
+
+    def test_merge_adjacent(self):
+        '''
+        Tests that adjacent files covering the dates are merged without downloading
+        '''
+        self.setUp1()
+        header = "timestamp,close\n"
+        with open(os.path.join(self.file_manager.dir, "AAPL_2009-1-1_2009-1-2.csv"), 'w') as f:
+            f.write(header + "2009-01-02,1.0\n")
+        with open(os.path.join(self.file_manager.dir, "AAPL_2009-1-3_2009-1-6.csv"), 'w') as f:
+            f.write(header + "2009-01-05,2.0\n2009-01-06,3.0\n")
+        self.file_manager.set_dir(self.file_manager.dir)
+        # Any download fails
+        self.file_manager.alpha_vantage_url = 'http://127.0.0.1:1/query'
+
+        ans = self.file_manager.get_filenames("AAPL", datetime(2009, 1, 1), datetime(2009, 1, 6))
+        self.assertEqual(ans, "AAPL_2009-1-1_2009-1-6.csv")
+        self.assertEqual(len(self.file_manager.catalog["AAPL"]), 1)
+        with open(os.path.join(self.file_manager.dir, ans)) as f:
+            self.assertEqual(len(f.readlines()), 4)
+
 if __name__ == '__main__':
     suite = FileManagerTest().suite()
     unittest.TextTestRunner(verbosity=2).run(suite)
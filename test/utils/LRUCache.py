@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+
+from finance.test import FinanceTest
+from finance.utils import LRUCache
+
+class LRUCacheTest(FinanceTest):
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(LRUCacheTest('test_eviction'))
+        suite.addTest(LRUCacheTest('test_invalidate'))
+        return suite
+
+    def test_eviction(self):
+        '''
+        Tests the budget in bytes and the statistics
+        '''
+        cache = LRUCache(max_bytes=3 * 800)
+        for symbol in ['AAPL', 'GLD', 'SPY']:
+            cache.put((symbol, 'file'), np.zeros(100))
+        self.assertEqual(cache.stats()['bytes'], 3 * 800)
+
+        # Test: use AAPL so GLD is the least recently used
+        self.assertIsNotNone(cache.get(('AAPL', 'file')))
+        cache.put(('XOM', 'file'), np.zeros(100))
+        self.assertIsNone(cache.get(('GLD', 'file')))
+        self.assertIsNotNone(cache.get(('AAPL', 'file')))
+
+        stats = cache.stats()
+        self.assertEqual(stats['items'], 3)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 1)
+
+        # Test: smaller budget evicts items
+        cache.resize(800)
+        self.assertEqual(cache.stats()['items'], 1)
+        self.assertIsNotNone(cache.get(('AAPL', 'file')))
+
+        # Test: items bigger than the budget are not added
+        cache.put(('BIG', 'file'), np.zeros(1000))
+        self.assertIsNone(cache.get(('BIG', 'file')))
+
+    def test_invalidate(self):
+        cache = LRUCache()
+        cache.put(('AAPL', 'file1'), np.zeros(10))
+        cache.put(('AAPL', 'file2'), np.zeros(10))
+        cache.put(('SPY', 'file1'), np.zeros(10))
+
+        self.assertEqual(cache.invalidate('AAPL'), 2)
+        self.assertIsNone(cache.get(('AAPL', 'file1')))
+        self.assertIsNotNone(cache.get(('SPY', 'file1')))
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertEqual(cache.stats()['bytes'], 0)
+
+if __name__ == '__main__':
+    suite = LRUCacheTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,62 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from finance.test import FinanceTest
+from finance.utils import PriceStore
+
+class PriceStoreTest(FinanceTest):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.store = PriceStore(os.path.join(self.dir, 'store'))
+
+    def tearDown(self):
+        self.store = None
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(PriceStoreTest('test_add_get'))
+        return suite
+
+    def test_add_get(self):
+        '''
+        Tests the coverage of the symbols and the values returned
+        '''
+        index = pd.DatetimeIndex([datetime(2009, 1, 2), datetime(2009, 1, 5), datetime(2009, 1, 6)])
+        aaa = pd.DataFrame({'close': [1.0, 2.0, 3.0], 'volume': [10, 20, 30]}, index=index)
+        bbb = pd.DataFrame({'close': [4.0, 5.0, 6.0], 'volume': [40, 50, 60]}, index=index)
+        self.store.add('AAA', aaa, datetime(2009, 1, 1), datetime(2009, 1, 6))
+        self.store.add('BBB', bbb, datetime(2009, 1, 1), datetime(2009, 1, 6))
+
+        # Test: coverage
+        self.assertTrue(self.store.covers(['AAA', 'BBB'], datetime(2009, 1, 2), datetime(2009, 1, 5), ['close']))
+        self.assertFalse(self.store.covers(['AAA', 'CCC'], datetime(2009, 1, 2), datetime(2009, 1, 5), ['close']))
+        self.assertFalse(self.store.covers(['AAA'], datetime(2009, 1, 2), datetime(2009, 1, 7), ['close']))
+        self.assertFalse(self.store.covers(['AAA'], datetime(2009, 1, 2), datetime(2009, 1, 5), ['open']))
+
+        # Test: contiguous symbols are a view of the memory-mapped array
+        dates, values = self.store.get(['AAA', 'BBB'], datetime(2009, 1, 5), datetime(2009, 1, 6), 'close')
+        self.assertEqual(len(dates), 2)
+        self.assertEqual(np.asarray(values), np.array([[2.0, 5.0], [3.0, 6.0]]))
+        self.assertTrue(isinstance(values, np.memmap))
+        # Test: the views are read-only, the files can not be modified through them
+        self.assertFalse(values.flags.writeable)
+        self.assertRaises(ValueError, values.__imul__, 0)
+
+        # Test: symbols on a different order
+        dates, values = self.store.get(['BBB', 'AAA'], datetime(2009, 1, 2), datetime(2009, 1, 2), 'volume')
+        self.assertEqual(np.asarray(values), np.array([[40.0, 10.0]]))
+
+        # Test: the store is persistent
+        store = PriceStore(self.store.dir)
+        self.assertTrue(store.covers(['AAA', 'BBB'], datetime(2009, 1, 2), datetime(2009, 1, 6), ['close']))
+
+if __name__ == '__main__':
+    suite = PriceStoreTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
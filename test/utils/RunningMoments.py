@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+
+from finance.test import FinanceTest
+from finance.utils import RunningMoments
+
+class RunningMomentsTest(FinanceTest):
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(RunningMomentsTest('test_batches'))
+        suite.addTest(RunningMomentsTest('test_combine'))
+        return suite
+
+    def test_batches(self):
+        '''
+        Tests the moments of batches of rows against numpy on all the rows
+        '''
+        rng = np.random.RandomState(0)
+        values = rng.normal(5, 2, size=(100, 4))
+        values[rng.rand(100, 4) < 0.1] = np.nan
+        values[:, 3] = np.nan
+        values[0, 3] = 1
+
+        moments = RunningMoments(4)
+        for first in range(0, 100, 7):
+            moments.update(values[first:first + 7])
+
+        self.assertEqual(moments.count, (~np.isnan(values)).sum(axis=0).astype(float))
+        self.assertEqual(moments.means()[:3], np.nanmean(values[:, :3], axis=0), 10)
+        self.assertEqual(moments.variances()[:3], np.nanvar(values[:, :3], axis=0, ddof=1), 10)
+        self.assertEqual(moments.stds(ddof=0)[:3], np.nanstd(values[:, :3], axis=0), 10)
+        # Test: one value has mean but no sample variance
+        self.assertEqual(moments.means()[3], 1)
+        self.assertTrue(np.isnan(moments.variances()[3]))
+
+    def test_combine(self):
+        '''
+        Tests that the moments of two shards combined are the moments of all the rows
+        '''
+        rng = np.random.RandomState(1)
+        values = rng.normal(0, 1, size=(50, 3))
+        left, right, empty = RunningMoments(3), RunningMoments(3), RunningMoments(3)
+        left.update(values[:20])
+        right.update(values[20:])
+        left.combine(right)
+        left.combine(empty)
+        self.assertEqual(left.means(), values.mean(axis=0), 10)
+        self.assertEqual(left.variances(), values.var(axis=0, ddof=1), 10)
+        self.assertTrue(np.isnan(empty.means()).all())
+
+if __name__ == '__main__':
+    suite = RunningMomentsTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
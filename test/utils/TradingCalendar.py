@@ -0,0 +1,82 @@
+import sys
+import unittest
+import subprocess
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from finance.test import FinanceTest
+from finance.utils import DateUtils
+from finance.utils import TradingCalendar
+
+class TradingCalendarTest(FinanceTest):
+
+    def suite(self):
+        suite = unittest.TestSuite()
+        suite.addTest(TradingCalendarTest('test_ordinal'))
+        suite.addTest(TradingCalendarTest('test_range_window'))
+        suite.addTest(TradingCalendarTest('test_boundaries'))
+        suite.addTest(TradingCalendarTest('test_lazy'))
+        return suite
+
+    def test_ordinal(self):
+        '''
+        Tests the hash index: 2009-4-10 (Good Friday) is not an open date
+        '''
+        calendar = TradingCalendar.NYSE()
+        self.assertIs(calendar, TradingCalendar.NYSE())
+        self.assertIs(calendar, DateUtils.calendar())
+
+        ordinal = calendar.ordinal(datetime(2009, 4, 9))
+        self.assertEqual(calendar.date(ordinal), datetime(2009, 4, 9))
+        self.assertEqual(calendar.ordinal(datetime(2009, 4, 13)), ordinal + 1)
+        self.assertEqual(calendar.ordinal(pd.Timestamp('2009-04-13')), ordinal + 1)
+        self.assertRaises(KeyError, calendar.ordinal, datetime(2009, 4, 10))
+        self.assertTrue(datetime(2009, 4, 9) in calendar)
+        self.assertFalse(datetime(2009, 4, 10) in calendar)
+
+    def test_range_window(self):
+        '''
+        Tests the ranges are views of the calendar and equal to DateUtils.nyse_dates
+        '''
+        calendar = TradingCalendar.NYSE()
+        dates = calendar.range(datetime(2009, 1, 1), datetime(2011, 1, 1))
+        self.assertEqual(dates[0], datetime(2009, 1, 2))
+        self.assertEqual(dates[-1], datetime(2010, 12, 31))
+        self.assertEqual(len(dates), 504)
+        self.assertTrue(np.shares_memory(dates.values, calendar.index.values))
+
+        dates = calendar.range(datetime(2009, 1, 1), datetime(2011, 1, 1), back=10, forward=10)
+        self.assertEqual(dates[0], datetime(2008, 12, 17))
+        self.assertEqual(dates[-1], datetime(2011, 1, 14))
+
+        dates = calendar.window(datetime(2009, 1, 5), 260, 10)
+        self.assertEqual(dates.tolist(), DateUtils.nyse_dates_event(datetime(2009, 1, 5), 10, 10, 250))
+
+    def test_boundaries(self):
+        '''
+        Tests the first and last open dates of the months, quarters and years
+        '''
+        calendar = TradingCalendar(DateUtils.nyse_dates(start=datetime(2009, 1, 1), end=datetime(2010, 12, 31)))
+        self.assertEqual(len(calendar.month_starts), 24)
+        self.assertEqual(len(calendar.quarter_starts), 8)
+        self.assertEqual(len(calendar.year_starts), 2)
+        self.assertEqual(calendar.date(calendar.month_starts[3]), datetime(2009, 4, 1))
+        self.assertEqual(calendar.date(calendar.month_ends[3]), datetime(2009, 4, 30))
+        self.assertEqual(calendar.date(calendar.quarter_ends[0]), datetime(2009, 3, 31))
+        self.assertEqual(calendar.date(calendar.year_starts[1]), datetime(2010, 1, 4))
+        self.assertEqual(calendar.date(calendar.year_ends[1]), datetime(2010, 12, 31))
+
+    def test_lazy(self):
+        '''
+        Tests that importing the modules does not load the calendar
+        '''
+        code = ('import finance.utils, finance.events\n'
+                'from finance.utils import TradingCalendar\n'
+                'assert TradingCalendar.nyse is None')
+        env = {'PYTHONPATH': ':'.join(p for p in sys.path if p)}
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], env=env), 0)
+
+if __name__ == '__main__':
+    suite = TradingCalendarTest().suite()
+    unittest.TextTestRunner(verbosity=2).run(suite)
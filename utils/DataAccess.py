@@ -1,12 +1,18 @@
 import os
 import hashlib
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from finance.utils.FileManager import FileManager
+from finance.utils.PriceStore import PriceStore
+from finance.utils.LRUCache import LRUCache
+from finance.utils.TradingCalendar import TradingCalendar
 
 class DataAccess(object):
 
     path = ''
+    cache_format = 'binary'
+    memory_cache = LRUCache(max_bytes=256 * 1024 * 1024)
     '''
     Class to manage the Access to the Data
     
@@ -21,6 +27,25 @@ class DataAccess(object):
         1. Set the enviroment variable: FINANCEPATH
         2. Set the Static Variable DataAccess.path
 
+    Cache format
+    ------------
+        Set DataAccess.cache_format (or the attribute of one instance) to:
+        1. 'binary' (default): float64 block + int64 datetime index (.npz)
+        2. 'csv': plain text, slower to load; use export() to get csv files
+
+    Memory cache
+    ------------
+        The data read from the csv files is kept on DataAccess.memory_cache:
+        a LRU cache shared by all the instances of the process.
+        Change the budget: DataAccess.memory_cache.resize(max_bytes)
+        Statistics: DataAccess.memory_cache.stats()
+        Invalidate: DataAccess.memory_cache.invalidate(symbol)
+
+    Calendar
+    --------
+        DataAccess().calendar: the TradingCalendar of the NYSE open dates,
+        shared with the PriceStore and the events modules; loaded on the first use
+
     '''
     def __init__(self):
         if self.path != '':
@@ -32,6 +57,12 @@ class DataAccess(object):
             else:
                 raise Exception('No path defined')
 
+    @property
+    def calendar(self):
+        '''
+        The TradingCalendar of the NYSE open dates, created on the first use
+        '''
+        return TradingCalendar.NYSE()
 
     def set_dir(self, dir_path):
         '''
@@ -53,6 +84,10 @@ class DataAccess(object):
         if not (os.access(self.cache_dir, os.F_OK)):
             os.makedirs(self.cache_dir)
 
+        self.store = PriceStore(os.path.join(self.dir, 'store'))
+        self.file_manager.store = self.store
+        self.load_cache_index()
+
     def empty_dir(self, delete=True):
         '''
         Empty the directory of csv files. Do not delete the cache files/folder
@@ -62,10 +97,12 @@ class DataAccess(object):
             delete:boolean, True if want to delete the folder too
         '''
         self.file_manager.empty_dir(delete)
+        self.memory_cache.invalidate()
 
     def empty_cache(self, delete=True):
         '''
-        Empty the directory of cached files. Does not delete the csv files/folder
+        Empty the directory of cached files and the price store.
+        Does not delete the csv files/folder
 
         Parameters
         ----------
@@ -80,6 +117,8 @@ class DataAccess(object):
 
         if delete:
             os.rmdir(self.cache_dir)
+        self.store.empty(delete)
+        self.cache_index = {}
 
     def empty_dirs(self, delete=True):
         '''
@@ -92,22 +131,55 @@ class DataAccess(object):
         self.empty_cache(delete)
         self.empty_dir(delete)
 
-    def save(self, data, name, extension='.data'):
+    def cache_filename(self, name, extension='.data', cache_format=None):
         '''
-        Saves a serialized (pickle) version of the data to the cache directory
+        Returns the absolute path of the cache file of an identifier
 
         Parameters
         ----------
-            data: object
             name: str, identifier of the data
             extension: str, extension of the filename
+            cache_format: str, 'binary' or 'csv'; default self.cache_format
+
+        Returns
+        -------
+            filename: str
         '''
+        cache_format = self.cache_format if cache_format is None else cache_format
         h = hashlib.md5()
         h.update(name.encode('utf8'))
         filename = h.hexdigest() + extension
+        if cache_format == 'binary':
+            filename = filename + '.npz'
+        return os.path.join(self.cache_dir, filename)
+
+    def save(self, data, name, extension='.data'):
+        '''
+        Saves a serialized version of the data to the cache directory
+        using the format on self.cache_format.
+        The data that can not be saved as binary (non-numeric values or index)
+        is saved as csv
 
-        f = os.path.join(self.cache_dir, filename)
-        data.to_csv(f)
+        Parameters
+        ----------
+            data: pandas.DataFrame
+            name: str, identifier of the data
+            extension: str, extension of the filename
+        '''
+        if self.cache_format == 'binary':
+            f = self.cache_filename(name, extension)
+            try:
+                self.save_binary(data, f)
+                return
+            except ValueError:
+                # The csv is loaded only if there is no binary file
+                if os.access(f, os.F_OK):
+                    os.remove(f)
+            data.to_csv(self.cache_filename(name, extension, 'csv'))
+        elif self.cache_format == 'csv':
+            data.to_csv(self.cache_filename(name, extension))
+        else:
+            raise Exception('Unknown cache format: %s' % self.cache_format)
 
     def load(self, name, extension='.data'):
         '''
@@ -122,25 +194,250 @@ class DataAccess(object):
         -------
             data: object (usually pandas.DataFrame), if file was available; None otherwise.
         '''
-        h = hashlib.md5()
-        h.update(name.encode('utf8'))
-        filename = h.hexdigest() + extension
-
-        f = os.path.join(self.cache_dir, filename)
+        if self.cache_format not in ('binary', 'csv'):
+            raise Exception('Unknown cache format: %s' % self.cache_format)
+        if self.cache_format == 'binary':
+            f = self.cache_filename(name, extension)
+            if os.access(f, os.F_OK):
+                try:
+                    return self.load_binary(f)
+                except ValueError:
+                    # Unreadable file (e.g. saved with object arrays): not cached
+                    return None
+        f = self.cache_filename(name, extension, 'csv')
         if os.access(f, os.F_OK):
             return pd.read_csv(f, parse_dates=True, index_col='timestamp')
 
+    @staticmethod
+    def save_binary(data, file_path):
+        '''
+        Saves a DataFrame as a typed binary file: one float64 block with the
+        values and the index as int64 or datetime64[ns] so loading it is a
+        memory read instead of a text parse. An empty index is saved as datetime64[ns]
+
+        Parameters
+        ----------
+            data: pandas.DataFrame, with numeric values
+            file_path: str, absolute path of the file
+
+        Raises ValueError if the values are not numeric or the index is not dates or integers
+        '''
+        index = data.index
+        if isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+            index_values = np.asarray(index.values, dtype='datetime64[ns]')
+        elif index.dtype.kind in 'iu':
+            index_values = np.asarray(index.values, dtype=np.int64)
+        else:
+            raise ValueError('Index of type %s can not be saved as binary' % index.dtype)
+        try:
+            values = np.asarray(data.values, dtype=np.float64).reshape(len(index), len(data.columns))
+        except (ValueError, TypeError):
+            raise ValueError('Non-numeric data can not be saved as binary')
+        columns = np.array([str(c) for c in data.columns], dtype=np.str_)
+        with open(file_path, 'wb') as f:
+            np.savez(f, values=values, index=index_values, columns=columns,
+                        names=np.array([str(index.name or ''), str(data.columns.name or '')]))
+
+    @staticmethod
+    def load_binary(file_path):
+        '''
+        Loads a DataFrame saved with DataAccess.save_binary
+
+        Parameters
+        ----------
+            file_path: str, absolute path of the file
+
+        Returns
+        -------
+            data: pandas.DataFrame
+        '''
+        with np.load(file_path, allow_pickle=False) as f:
+            values = f['values']
+            index = f['index']
+            columns = f['columns'].tolist()
+            index_name, columns_name = f['names'].tolist()
+
+        if index.dtype.kind == 'M':
+            index = pd.DatetimeIndex(index)
+        else:
+            index = pd.Index(index)
+        index.name = index_name if index_name != '' else None
+        data = pd.DataFrame(values, index=index, columns=columns)
+        data.columns.name = columns_name if columns_name != '' else None
+        return data
+
+    def export(self, data, file_path):
+        '''
+        Exports the data to a csv file, independent of the cache format
+
+        Parameters
+        ----------
+            data: pandas.DataFrame
+            file_path: str
+        '''
+        data.to_csv(file_path)
+
+    def load_cache_index(self):
+        '''
+        Loads the index of the cached DataFrames: for each (symbol, field) a list of
+        (start, end, name, column) with the dates covered by a cached DataFrame
+        '''
+        self.cache_index = {}
+        f = os.path.join(self.cache_dir, 'index.csv')
+        if os.access(f, os.F_OK):
+            index = pd.read_csv(f, keep_default_na=False, parse_dates=['start', 'end'])
+            for row in index.itertuples(index=False):
+                entry = (row.start, row.end, row.name, row.column)
+                entries = self.cache_index.setdefault((row.symbol, row.field), [])
+                if entry not in entries:
+                    entries.append(entry)
+            if sum(len(entries) for entries in self.cache_index.values()) < len(index):
+                # Repeated rows: keep each entry once on the file
+                self.save_cache_index()
+
+    def save_cache_index(self):
+        '''
+        Rewrites the index of the cached DataFrames from cache_index
+        '''
+        rows = [(name, symbol, field, start.strftime('%Y-%m-%d %H:%M:%S'),
+                    end.strftime('%Y-%m-%d %H:%M:%S'), column)
+                    for (symbol, field), entries in self.cache_index.items()
+                    for start, end, name, column in entries]
+        rows = pd.DataFrame(rows, columns=['name', 'symbol', 'field', 'start', 'end', 'column'])
+        rows.to_csv(os.path.join(self.cache_dir, 'index.csv'), index=False)
+
+    def register_cache(self, name, pairs, start, end, symbols, fields):
+        '''
+        Adds the columns of a cached DataFrame to the cache index,
+        the columns already registered are skipped
+
+        Parameters
+        ----------
+            name: str, identifier of the cached data
+            pairs: list of (symbol, field), columns to register
+            start: datetime
+            end: datetime
+            symbols: list of str, all the symbols of the cached DataFrame
+            fields: list of str, all the fields of the cached DataFrame
+        '''
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        rows = []
+        for symbol, field in pairs:
+            column = self.column_name(symbol, field, symbols, fields)
+            entries = self.cache_index.setdefault((symbol, field), [])
+            if (start, end, name, column) in entries:
+                continue
+            entries.append((start, end, name, column))
+            rows.append((name, symbol, field, start.strftime('%Y-%m-%d %H:%M:%S'),
+                            end.strftime('%Y-%m-%d %H:%M:%S'), column))
+        if len(rows) == 0:
+            return
+
+        f = os.path.join(self.cache_dir, 'index.csv')
+        new_file = not os.access(f, os.F_OK)
+        rows = pd.DataFrame(rows, columns=['name', 'symbol', 'field', 'start', 'end', 'column'])
+        rows.to_csv(f, mode='a', header=new_file, index=False)
+
+    def load_covered(self, symbols, start, end, fields):
+        '''
+        Returns the (symbol, field) series available on cached DataFrames
+        that cover the dates between start and end.
+        Each cached DataFrame is loaded only once.
+
+        Parameters
+        ----------
+            symbols: list of str
+            start: datetime
+            end: datetime
+            fields: list of str
+
+        Returns
+        -------
+            series: dict of (symbol, field) -> pandas.Series
+        '''
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        # 1. Find a cached DataFrame for each (symbol, field)
+        needed = {}
+        for symbol in symbols:
+            for field in fields:
+                for entry_start, entry_end, name, column in self.cache_index.get((symbol, field), []):
+                    if entry_start <= start and entry_end >= end:
+                        needed.setdefault(name, []).append((symbol, field, column))
+                        break
+
+        # 2. Load each DataFrame and select the columns
+        series = {}
+        for name, columns in needed.items():
+            data = self.load(name)
+            if data is None:
+                # The cached file was deleted: forget it, also on the file
+                for key in self.cache_index:
+                    self.cache_index[key] = [e for e in self.cache_index[key] if e[2] != name]
+                self.save_cache_index()
+                continue
+            data = data[start:end]
+            for symbol, field, column in columns:
+                series[(symbol, field)] = data[column].dropna()
+        return series
+
+    def read_file(self, symbol, filename):
+        '''
+        Returns the DataFrame of a csv file of the FileManager directory.
+        Uses the memory cache shared by all the instances.
+
+        Parameters
+        ----------
+            symbol: str
+            filename: str, relative to the directory
+
+        Returns
+        -------
+            data: pandas.DataFrame, do not modify it
+        '''
+        key = (symbol, os.path.join(self.dir, filename))
+        data = self.memory_cache.get(key)
+        if data is None:
+            # Create DataFrame from the csv, the index of the DataFrame is the date
+            data = pd.read_csv(key[1], parse_dates=True, index_col='timestamp')
+            self.memory_cache.put(key, data)
+        return data
+
+    @staticmethod
+    def column_name(symbol, field, symbols, fields):
+        '''
+        Returns the name of the column of a symbol and field on get_data
+
+        Parameters
+        ----------
+            symbol: str
+            field: str
+            symbols: list of str, all the symbols requested
+            fields: list of str, all the fields requested
+        '''
+        if len(symbols) == 1 and len(fields) == 1:
+            # Single symbol and Single field
+            return field
+        elif len(symbols) > 1 and len(fields) == 1:
+            # Multiple symbols and single fields
+            return symbol
+        elif len(symbols) == 1 and len(fields) > 1:
+            # Single symbol and Multiple fields
+            return field
+        else:
+            # Multiple symbols and multiple fields
+            return "%s %s" % (symbol, field)
 
     def get_data(self, symbols, start, end, fields='adjusted_close', save=True, useCache=True,
-                    downloadMissing=True, ignoreMissing=True):
+                    downloadMissing=True, ignoreMissing=True, useStore=True):
         '''
         Returns a pandas DataFrame with the data of the symbols and field
         fields between the specified dates with the fields specified
 
         Optional: 
-            1. Load a serialized version of the data
-            2. Saves a serialized version of the data
-            3. If data is not available download the missing data
+            1. Load the data from the price store (memory-mapped)
+            2. Load a serialized version of the data
+            3. Saves a serialized version of the data
+            4. If data is not available download the missing data
 
         Parameters
         ----------
@@ -152,6 +449,7 @@ class DataAccess(object):
             useCache: boolean: True if want to load a cached version (if available)
             downloadMissing: boolean, True if want to download unavailable data
             ignoreMissing=True
+            useStore: boolean, True if want to use the price store (if available)
 
         Returns
         -------
@@ -163,55 +461,101 @@ class DataAccess(object):
         if type(fields) == str:
             fields = [fields]
 
-        # 1. Load the Data, if requested
+        # 1. Slice the price store, if requested and available
+        if useStore == True and self.store.covers(symbols, start, end, fields):
+            return self.get_store_data(symbols, start, end, fields)
+
+        # 2. Load the Data, if requested
+        #    Either the exact request was cached or pieces of cached DataFrames cover it
         filename_id = "%s_%s_%s_%s" % ('_'.join(symbols), start.strftime('%m-%d-%Y'),
                                         end.strftime('%m-%d-%Y'), '-'.join(fields))
+        series = {}
         if useCache == True:
             data = self.load(filename_id)
             if data is not None:
-                # 1.1 Data was cached before and loaded => return
+                # 2.1 Data was cached before and loaded => return
                 return data
+            series = self.load_covered(symbols, start, end, fields)
+        cached = list(series.keys())
+
+        # 3. Load the pieces not cached before from the csv files
+        missing = [symbol for symbol in symbols if any((symbol, field) not in series for field in fields)]
+
+        # 3.1 Get the list of filenames from the FileManager
+        files = []
+        if len(missing) > 0:
+            files = self.file_manager.get_filenames(missing, start, end, downloadMissing, ignoreMissing=False)
+
+        for f, symbol in zip(files, missing):
+            if f is None:
+                if ignoreMissing:
+                    continue
+                raise Exception('No data available for %s' % symbol)
+            new_data = self.read_file(symbol, f)
+            if save == True:
+                self.store.add(symbol, new_data, start, end)
+            for field in fields:
+                series[(symbol, field)] = new_data[field]
 
-        # 1. Data was not cached before need to load the data from csv files
-        
-        # 1.1 Get the list of filenames from the FileManager
-        files = self.file_manager.get_filenames(symbols, start, end, downloadMissing, ignoreMissing)
-
-        # 1.2 We are going to create a pd.DataFrame from a dictionary of pd.Series
+        # 3.2 We are going to create a pd.DataFrame from a dictionary of pd.Series
         data_dic = {}
-
-        for f, symbol in zip(files, symbols):
-            # Create DataFrame from the csv
-            new_data = pd.read_csv(os.path.join(self.dir, f))
-            # Change the index of the DataFrame to be the date
-            new_data = pd.read_csv(os.path.join(self.dir, f), parse_dates=True, index_col='timestamp')
-
+        for symbol in symbols:
             for field in fields:
-                # For each field in fields, creates a new column
-                colname = ''
-                if len(symbols) == 1 and len(fields) == 1:
-                    # Single symbol and Single field
-                    colname = field
-                elif len(symbols) > 1 and len(fields) == 1:
-                    # Multiple symbols and single fields
-                    colname = symbol
-                elif len(symbols) == 1 and len(fields) > 1:
-                    # Single symbol and Multiple fields
-                    colname = field
-                else:
-                    # Multiple symbols and multiple fields
-                    colname = "%s %s" % (symbol, field)
-                # Adds the pd.Series to the dictionary
-                data_dic[colname] = new_data[field]
-
-        # 1.4. Create, slice and sort the data
+                if (symbol, field) in series:
+                    # For each field in fields, creates a new column
+                    colname = self.column_name(symbol, field, symbols, fields)
+                    data_dic[colname] = series[(symbol, field)]
+
+        # 3.3. Create, sort and slice the data
         data = pd.DataFrame(data_dic)
         data = data.sort_index()
+        if len(data_dic) > 0:
+            data = data[start:end]
 
         # Save a cache version if requested
         if save == True:
             self.save(data, filename_id)
+            new_pairs = [key for key in series if key not in cached]
+            self.register_cache(filename_id, new_pairs, start, end, symbols, fields)
+        return data
+
+    def get_store_data(self, symbols, start, end, fields):
+        '''
+        Returns the data from the price store, same format as get_data
+        For a single field the DataFrame is a read-only view of the memory-mapped arrays:
+        use DataFrame.copy() before modifying it in place
+
+        Parameters
+        ----------
+            symbols: list of str
+            start: datetime
+            end: datetime
+            fields: list of str
+
+        Returns
+        -------
+            data: pandas.DataFrame
+        '''
+        if len(fields) == 1:
+            dates, values = self.store.get(symbols, start, end, fields[0])
+            columns = [self.column_name(symbol, fields[0], symbols, fields) for symbol in symbols]
+            data = pd.DataFrame(values, index=pd.DatetimeIndex(dates, name='timestamp'),
+                                columns=columns, copy=False)
+        else:
+            values = {}
+            for field in fields:
+                dates, values[field] = self.store.get(symbols, start, end, field)
+            data_dic = {}
+            for i, symbol in enumerate(symbols):
+                for field in fields:
+                    data_dic[self.column_name(symbol, field, symbols, fields)] = values[field][:, i]
+            data = pd.DataFrame(data_dic, index=pd.DatetimeIndex(dates, name='timestamp'))
+
+        # Dates without data for any symbol are not returned (same as the csv files)
+        empty = np.isnan(data.values).all(axis=1)
+        if empty.any():
+            data = data[~empty]
         return data
     
     def download(self, symbols, start, end):
-        self.get_data(symbols, start, end, useCache=False, save=False)
+        self.get_data(symbols, start, end, useCache=False, save=False, useStore=False)
@@ -2,13 +2,19 @@ import math
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from finance.utils import ListUtils
+from finance.utils.TradingCalendar import TradingCalendar
+
+def calendar():
+    '''
+    Returns the NYSE TradingCalendar shared by all the modules
+    '''
+    return TradingCalendar.NYSE()
 
 def nyse_dates(start=datetime(2007,1,1), end=datetime.today(),
                 insideSearch=True, lookbackDays=0, lookforwardDays=0,
                 series=False):
     '''
-    Returns the NYSE open dates
+    Returns the NYSE open dates, sliced from the shared TradingCalendar (see DateUtils.calendar)
 
     Parameters
     ----------
@@ -29,53 +35,61 @@ def nyse_dates(start=datetime(2007,1,1), end=datetime.today(),
     '''
     start = datetime(start.year, start.month, start.day)
     end = datetime(end.year, end.month, end.day)
-    
-    if start < datetime(2007, 1, 1) or end < datetime(2007, 1, 1):
-        # If specify an start date or end date before 2007-1-1
-        dates = ListUtils.NYSE(complete=True)
-
-        if end < datetime(2007, 1, 1) and start == datetime(2007, 1, 1):
-            # In case only specify an end date lower than 2007-1-1
-            start = dates[0]
-    else:
-        # Get dates from 2007-1-1
-        dates = ListUtils.NYSE()
-
-    # Get the indexes to slice the array
-    idx_start = 0
-    idx_end = len(dates)
-    # Get the indexes of the start and end dates
-    if start is not datetime(2007,1,1):
-        idx_start = search_closer_date(start, dates, searchBack=False)
-    if end is not datetime.today():
-        idx_end = search_closer_date(end, dates, searchBack=True)
-
-    # Modify the indexes with the lookback and lookforward days
-    if lookbackDays is not 0:
-        idx_start = idx_start - lookbackDays
-    if lookforwardDays is not 0:
-        idx_end = idx_end + lookforwardDays
-
-    # Slice the dates using the indexes
-    dates = dates[idx_start:idx_end+1]
+
+    if end < datetime(2007, 1, 1) and start == datetime(2007, 1, 1):
+        # In case only specify an end date lower than 2007-1-1
+        start = datetime(1962, 7, 5)
+
+    dates = calendar().range(start, end, lookbackDays, lookforwardDays)
+    dates = dates.to_pydatetime().tolist()
 
     if series:
         return pd.Series(index=dates, data=dates)
     else:
         return dates
 
+def nyse_shift(dates, amounts):
+    '''
+    Adds (or substracts) a number of NYSE open dates to many dates in one call.
+    Dates that are not open dates are moved to the previous open date first.
+
+    Parameters
+    ----------
+        dates: list or np.array or pd.DatetimeIndex
+        amounts: int or np.array of int (one for each date), how many days wants to add
+
+    Returns
+    -------
+        dates: pd.DatetimeIndex, NaT if the result is outside of the NYSE dates
+    '''
+    sessions = calendar().sessions
+    idx = search_closer_dates(dates, sessions, searchBack=True)
+    new_idx = idx + np.asarray(amounts)
+    valid = (idx >= 0) & (new_idx >= 0) & (new_idx < len(sessions))
+
+    ans = np.full(len(idx), np.datetime64('NaT'), dtype='datetime64[ns]')
+    ans[valid] = sessions[new_idx[valid]]
+    return pd.DatetimeIndex(ans)
+
 def nyse_add(date, amount):
     '''
     Add a number of date to a current date using the NYSE open dates
 
     Parameters
     ----------
-        date: datetime
-        amount: int, how many days wants to add
+        date: datetime or list or np.array or pd.DatetimeIndex
+        amount: int or np.array of int, how many days wants to add
+
+    Returns
+    -------
+        date: datetime if date is datetime; pd.DatetimeIndex otherwise (see DateUtils.nyse_shift)
     '''
-    dates = nyse_dates(start=date)
-    idx = search_closer_date(date, dates)
-    return dates[idx+amount]
+    if np.ndim(date) > 0:
+        return nyse_shift(date, amount)
+    ans = nyse_shift([date], amount)[0]
+    if ans is pd.NaT:
+        raise IndexError('%s is outside of the NYSE dates' % date)
+    return ans.to_pydatetime()
 
 def nyse_substract(date, amount):
     '''
@@ -83,17 +97,68 @@ def nyse_substract(date, amount):
 
     Parameters
     ----------
-        date: datetime
-        amount: int, how many days wants to substract
+        date: datetime or list or np.array or pd.DatetimeIndex
+        amount: int or np.array of int, how many days wants to substract
 
     Returns
     -------
-        date: datetime
+        date: datetime if date is datetime; pd.DatetimeIndex otherwise (see DateUtils.nyse_shift)
     '''
-    dates = nyse_dates(end=date)
-    idx = search_closer_date(date, dates)
-    return dates[idx-amount]
+    return nyse_add(date, -np.asarray(amount))
 
+def to_datetime64(dates):
+    '''
+    Converts dates to a numpy array of datetime64[ns]
+
+    Parameters
+    ----------
+        dates: datetime or list or np.array or pd.DatetimeIndex or pd.Series
+    '''
+    if isinstance(dates, np.ndarray) and dates.dtype.kind == 'M':
+        return dates.astype('datetime64[ns]')
+    if isinstance(dates, pd.Series):
+        dates = dates.values
+    return pd.DatetimeIndex(dates).values.astype('datetime64[ns]')
+
+def search_closer_dates(dates_to_find, dates, exact=False, searchBack=True, maxDistance=10):
+    '''
+    Vectorized DateUtils.search_closer_date: get the indexes of many dates in one call
+    using a binary search (np.searchsorted)
+
+    Parameters
+    ----------
+        dates_to_find: list or np.array or pd.DatetimeIndex, dates to look for
+        dates: list or np.array or pd.DatetimeIndex, sorted list to look the dates on
+        exact: boolean, True to look only for the same date
+        searchBack: boolean, True to search for the date into the past
+        maxDistance: int, maximum distance (on days) to look for the date
+
+    Returns
+    -------
+        indexes: np.array of int, -1 if the date was not found
+    '''
+    dates = to_datetime64(dates)
+    dates_to_find = to_datetime64(dates_to_find)
+    max_distance = np.timedelta64(maxDistance, 'D')
+
+    if exact:
+        idx = np.searchsorted(dates, dates_to_find, side='left')
+        valid = idx < len(dates)
+        found = np.zeros(len(idx), dtype=bool)
+        found[valid] = dates[idx[valid]] == dates_to_find[valid]
+    elif searchBack:
+        # Last date lower or equal
+        idx = np.searchsorted(dates, dates_to_find, side='right') - 1
+        valid = idx >= 0
+        found = np.zeros(len(idx), dtype=bool)
+        found[valid] = dates_to_find[valid] - dates[idx[valid]] < max_distance
+    else:
+        # First date greater or equal
+        idx = np.searchsorted(dates, dates_to_find, side='left')
+        valid = idx < len(dates)
+        found = np.zeros(len(idx), dtype=bool)
+        found[valid] = dates[idx[valid]] - dates_to_find[valid] < max_distance
+    return np.where(found, idx, -1)
 
 def search_closer_date(date, dates, exact=False, searchBack=True, maxDistance=10):
     '''
@@ -102,27 +167,21 @@ def search_closer_date(date, dates, exact=False, searchBack=True, maxDistance=10
     Parameters
     ----------
         date: datetime
-        dates: list or np.array or pd.DatetimeIndex, list to look the date on
+        dates: list or np.array or pd.DatetimeIndex, sorted list to look the date on
+        exact: boolean, True to look only for the same date; raises ValueError if is not found
         searchBack: boolean, True to search for the date into the past
         maxDistance: int, maximum distance (on days) to look for the date
+
+    Returns
+    -------
+        index: int, None if the date was not found
     '''
-    # 0. Diferent type of parameters
-    if type(dates) == pd.DatetimeIndex:
-        dates = dates.to_pydatetime()
-    if type(dates) == np.ndarray:
-        dates = dates.tolist()
-
-    if exact == False:
-        searchBack = -1 if searchBack else 1
-        idx = 0
-        for i in range(maxDistance):
-            try:
-                d = date + searchBack * timedelta(days=i)
-                return dates.index(d)
-            except ValueError:
-                pass
-    else:
-        return dates.index(date)
+    idx = search_closer_dates([date], dates, exact, searchBack, maxDistance)[0]
+    if idx == -1:
+        if exact:
+            raise ValueError('%s is not in the list' % date)
+        return None
+    return int(idx)
 
 def nyse_dates_event(eventDate, lookbackDays, lookforwardDays, estimationPeriod, pastEvent=True):
     '''
@@ -1,19 +1,61 @@
+import io
 import os
 import sys
+import json
+import queue
 import urllib.parse
 import urllib.request
-from datetime import datetime
+import http.client
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import time
+from finance.utils.RateLimiter import RateLimiter
 
 class FileManager(object):
     '''
     Class to manage the files from:
         - Yahoo Finance
         - Alpha Vantage
+
+    The files are named SYMBOL_start_end.csv, e.g: AAPL_2009-1-1_2010-1-1.csv
+    and indexed on a catalog (catalog.csv on the directory):
+        symbol -> list of (start, end, filename)
+    The catalog is rebuilt from the directory only when a symbol is not found
+    and the directory changed (mtime) since the last build.
+
+    Downloads
+    ---------
+        Missing symbols are downloaded concurrently (max_workers threads) over a
+        pool of keep-alive connections. All the FileManager instances share the
+        rate limiter of the API key: FileManager.rate_limiter (calls per minute).
+        Failed requests are retried (retries) with exponential backoff (retry_delay).
+
+    Incremental updates
+    -------------------
+        If the files of a symbol overlap the requested dates only the missing
+        head/tail is added: the data is merged on a new file covering all the
+        dates and the old files are deleted. When only the last days are missing
+        (compact_days) the compact output of the API is used (last 100 days).
+
+    Streaming
+    ---------
+        The responses are read as a stream keeping only the lines of the requested
+        dates, the download stops when the dates are older than requested.
+        If FileManager.store (a PriceStore) is set the data is also added to it.
     '''
+    alpha_vantage_url = 'https://www.alphavantage.co/query'
+    rate_limiter = RateLimiter(calls=5, period=60)
+    max_workers = 4
+    retries = 3
+    retry_delay = 2.0
+    timeout = 60
+    compact_days = 140
+
     def __init__(self, dir_path='./data/'):
         self.set_dir(dir_path)
+        self.connections = queue.Queue()
+        self.store = None
 
         env_var_key = os.getenv("ALPHAVANTAGEKEY")
         if env_var_key is not None:
@@ -36,6 +78,8 @@ class FileManager(object):
         if not (os.access(self.dir, os.F_OK)):
             os.makedirs(self.dir)
 
+        self.load_catalog()
+
     def empty_dir(self, delete=True):
         '''
         Empty the directory of files
@@ -53,6 +97,130 @@ class FileManager(object):
 
         if delete:
             os.rmdir(self.dir)
+        self.catalog = {}
+        self.catalog_mtime = None
+
+    @staticmethod
+    def filename(symbol, start_date, end_date):
+        '''
+        Returns the name of the file of a symbol between two dates
+            e.g: AAPL_2009-1-1_2010-1-1.csv
+        '''
+        return "%s_%d-%d-%d_%d-%d-%d.csv" % (symbol, start_date.year, start_date.month,
+                    start_date.day, end_date.year, end_date.month, end_date.day)
+
+    @staticmethod
+    def parse_filename(file_name):
+        '''
+        Returns the symbol, start date and end date of a file name,
+        None if the name is not SYMBOL_start_end.csv
+
+        Parameters
+        ----------
+            file_name: str
+
+        Returns
+        -------
+            (symbol, start_date, end_date) or None
+        '''
+        if not file_name.endswith('.csv'):
+            return None
+        parts = file_name[:-4].rsplit('_', 2)
+        if len(parts) != 3:
+            return None
+        try:
+            return (parts[0], datetime.strptime(parts[1], "%Y-%m-%d"),
+                    datetime.strptime(parts[2], "%Y-%m-%d"))
+        except ValueError:
+            return None
+
+    def load_catalog(self):
+        '''
+        Loads the catalog of the files from catalog.csv, builds it if doesn't exist
+        '''
+        f = os.path.join(self.dir, 'catalog.csv')
+        if os.access(f, os.F_OK):
+            # The saved catalog is up to date if it was written after the last change of the directory
+            mtime = self.dir_mtime()
+            self.catalog_mtime = mtime if os.stat(f).st_mtime_ns >= mtime else None
+            self.catalog = {}
+            catalog = pd.read_csv(f, keep_default_na=False, parse_dates=['start', 'end'])
+            for symbol, start, end, file_name in zip(catalog['symbol'], catalog['start'],
+                                                     catalog['end'], catalog['file']):
+                entry = (start.to_pydatetime(), end.to_pydatetime(), file_name)
+                self.catalog.setdefault(symbol, []).append(entry)
+        else:
+            self.build_catalog()
+
+    def build_catalog(self):
+        '''
+        Builds the catalog from the files of the directory and saves it
+        '''
+        mtime = self.dir_mtime()
+        # Files written on the same tick of the clock as the last change do not change
+        # the mtime: a catalog built just after a change is checked again on the next miss
+        self.catalog_mtime = mtime if time.time_ns() - mtime > 1e9 else None
+        self.catalog = {}
+        for file_name in os.listdir(self.dir):
+            parsed = self.parse_filename(file_name)
+            if parsed is not None and os.path.isfile(os.path.join(self.dir, file_name)):
+                symbol, start, end = parsed
+                self.catalog.setdefault(symbol, []).append((start, end, file_name))
+        self.save_catalog()
+
+    def dir_mtime(self):
+        return os.stat(self.dir).st_mtime_ns
+
+    def catalog_changed(self):
+        '''
+        True if the directory changed since the catalog was built
+        '''
+        return self.catalog_mtime is None or self.catalog_mtime != self.dir_mtime()
+
+    def save_catalog(self):
+        rows = [(symbol, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'), file_name)
+                    for symbol in self.catalog for start, end, file_name in self.catalog[symbol]]
+        catalog = pd.DataFrame(rows, columns=['symbol', 'start', 'end', 'file'])
+        catalog.to_csv(os.path.join(self.dir, 'catalog.csv'), index=False)
+
+    def add_to_catalog(self, symbol, start_date, end_date, file_name):
+        '''
+        Adds a new file to the catalog
+
+        Parameters
+        ----------
+            symbol: str
+            start_date: datetime
+            end_date: datetime
+            file_name: str
+        '''
+        entries = self.catalog.setdefault(symbol, [])
+        if (start_date, end_date, file_name) not in entries:
+            entries.append((start_date, end_date, file_name))
+            self.save_catalog()
+
+    def find_filename(self, symbol, start_date, end_date):
+        '''
+        Returns the file with the information of the symbol between the dates,
+        the file with the smallest range if there are many; None if there is no file
+
+        Parameters
+        ----------
+            symbol: str
+            start_date: datetime
+            end_date: datetime
+        '''
+        ans = None
+        for fi_start_date, fi_end_date, file_name in self.catalog.get(symbol, []):
+            if fi_start_date <= start_date and fi_end_date >= end_date:
+                if ans is None or (fi_end_date - fi_start_date) < (ans[1] - ans[0]):
+                    ans = (fi_start_date, fi_end_date, file_name)
+        if ans is not None and not os.access(os.path.join(self.dir, ans[2]), os.F_OK):
+            # The file was deleted
+            self.catalog[symbol].remove(ans)
+            self.save_catalog()
+            return self.find_filename(symbol, start_date, end_date)
+        return None if ans is None else ans[2]
 
     def get_filenames(self, symbol_s, start_date, end_date, downloadMissing=True, ignoreMissing=True):
         '''
@@ -78,37 +246,32 @@ class FileManager(object):
         elif type(symbol_s) == list:
             symbols = symbol_s
 
-        # 1. Get the list of files available
-        list_files = [f for f in os.listdir(self.dir) if os.path.isfile(os.path.join(self.dir,f))]
-        ans = []
+        # 1. For symbol in symbols look for the file on the catalog
+        files = {}
+        rescanned = False
+        for symbol in symbols:
+            f = self.find_filename(symbol, start_date, end_date)
+            if f is None and not rescanned and self.catalog_changed():
+                # The files could be added by other process: update the catalog once
+                self.build_catalog()
+                rescanned = True
+                f = self.find_filename(symbol, start_date, end_date)
+            files[symbol] = f
+
+        # 2. Download (or update) the missing symbols
+        if downloadMissing:
+            missing = [symbol for symbol in files if files[symbol] is None]
+            files.update(self.bulk_download(missing, start_date, end_date))
 
-        # For symbol in symbols and for each file_name in files
+        ans = []
         for symbol in symbols:
-            f = None
-            for file_name in list_files:
-                # Check the name of the stock
-                if file_name.startswith(symbol):
-                    # Check if the dates of the file are greater or equal than the requested
-                    # Note: split to get each date and file_name[:-4] to remove the .csv
-                    fi_start_date = datetime.strptime(file_name[:-4].split('_')[1], "%Y-%m-%d")
-                    fi_end_date = datetime.strptime(file_name[:-4].split('_')[2], "%Y-%m-%d")
-                    if fi_start_date <= start_date and fi_end_date >= end_date:
-                        f = file_name
-
-            if f is None and downloadMissing:
-                success = self.alphavantage_download(symbol, start_date, end_date)
-                if success:
-                    # If download was susccesfull add the path to the new file
-                    f = "%s_%d-%d-%d_%d-%d-%d.csv" % (symbol, start_date.year, start_date.month,
-                        start_date.day, end_date.year, end_date.month, end_date.day)
-            
+            f = files[symbol]
             if ignoreMissing == False:
                 ans.append(f)
             else:
                 if f is not None:
                     ans.append(f)
 
-
         if type(symbol_s) == str:
             if len(ans) == 1:
                 return ans[0]
@@ -120,6 +283,234 @@ class FileManager(object):
     def download(self, symbols, start_date, end_date):
         self.get_filenames(symbols, start_date, end_date, downloadMissing=True)
 
+    def bulk_download(self, symbols, start_date, end_date, max_workers=None):
+        '''
+        Downloads (or updates) many symbols concurrently and updates the catalog
+
+        Parameters
+        ----------
+            symbols: list of str
+            start_date: datetime
+            end_date: datetime
+            max_workers: int, number of concurrent downloads; default FileManager.max_workers
+
+        Returns
+        -------
+            dict: symbol -> str with the new file name; None if was not able to download the symbol
+        '''
+        max_workers = self.max_workers if max_workers is None else max_workers
+        download = lambda symbol: self.download_symbol(symbol, start_date, end_date)
+        if len(symbols) <= 1 or max_workers <= 1:
+            results = [download(symbol) for symbol in symbols]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(download, symbols))
+
+        # The catalog is updated only from this thread
+        ans = {}
+        for symbol, result in zip(symbols, results):
+            ans[symbol] = None
+            if result is not None:
+                file_name, fi_start_date, fi_end_date, retired = result
+                for entry in retired:
+                    # Superseded files
+                    self.catalog[symbol].remove(entry)
+                    if entry[2] != file_name:
+                        os.remove(os.path.join(self.dir, entry[2]))
+                self.add_to_catalog(symbol, fi_start_date, fi_end_date, file_name)
+                ans[symbol] = file_name
+        return ans
+
+    def download_symbol(self, symbol, start_date, end_date):
+        '''
+        Downloads a symbol: if there are files overlapping the dates the missing
+        data is merged with them (FileManager.alphavantage_update) otherwise downloads
+        the dates (FileManager.alphavantage_download).
+        Does not modify the catalog: can run on other threads.
+
+        Returns
+        -------
+            (file_name, start_date, end_date, retired catalog entries) or None if failed
+        '''
+        overlap = [entry for entry in self.catalog.get(symbol, [])
+                    if entry[0] <= end_date and entry[1] >= start_date]
+        if len(overlap) > 0:
+            return self.alphavantage_update(symbol, start_date, end_date, overlap)
+        if self.alphavantage_download(symbol, start_date, end_date):
+            return (self.filename(symbol, start_date, end_date), start_date, end_date, [])
+        return None
+
+    def get_connection(self, url):
+        '''
+        Returns a keep-alive connection from the pool (or a new one) to the host of the url
+        '''
+        try:
+            return self.connections.get_nowait()
+        except queue.Empty:
+            if url.scheme == 'https':
+                return http.client.HTTPSConnection(url.netloc, timeout=self.timeout)
+            return http.client.HTTPConnection(url.netloc, timeout=self.timeout)
+
+    def release_connection(self, conn, response):
+        '''
+        Returns the connection to the pool if the response was read completely,
+        closes it otherwise (e.g. the stream was not read until the end)
+        '''
+        if not response.isclosed() and response.length == 0:
+            response.read()
+        if response.isclosed():
+            self.connections.put(conn)
+        else:
+            conn.close()
+
+    def alphavantage_request(self, params, parse=None):
+        '''
+        Makes a request to the Alpha Vantage API using the pooled connections
+        and the rate limiter. Retries with exponential backoff on connection
+        errors, server errors and rate limit messages.
+
+        Parameters
+        ----------
+            params: dict, parameters of the query (without the apikey)
+            parse: function(first_line, response), reads the body of the response
+                   as a stream and returns the result; by default returns the body
+
+        Returns
+        -------
+            body: bytes or the result of parse
+        '''
+        params = dict(params, apikey=self.alpha_vantage_key)
+        url = urllib.parse.urlsplit(self.alpha_vantage_url)
+        path = "%s?%s" % (url.path or '/', urllib.parse.urlencode(params))
+
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            self.rate_limiter.wait()
+            conn = self.get_connection(url)
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                if response.status != 200:
+                    response.read()
+                    self.release_connection(conn, response)
+                    if response.status == 429 or response.status >= 500:
+                        error = Exception('HTTP %d' % response.status)
+                        continue
+                    raise Exception('HTTP %d' % response.status)
+
+                first_line = response.readline()
+                if first_line.lstrip().startswith(b'{'):
+                    # Alpha Vantage reports errors as json
+                    message = json.loads((first_line + response.read()).decode('utf-8'))
+                    self.release_connection(conn, response)
+                    if 'Error Message' in message:
+                        raise Exception(message['Error Message'])
+                    # 'Note' or 'Information': limit of calls
+                    error = Exception(' '.join(str(v) for v in message.values()))
+                    continue
+
+                if parse is None:
+                    result = first_line + response.read()
+                else:
+                    result = parse(first_line, response)
+            except (http.client.HTTPException, OSError):
+                # Broken keep-alive connection: do not return it to the pool
+                conn.close()
+                error = sys.exc_info()[1]
+                continue
+            except:
+                conn.close()
+                raise
+            self.release_connection(conn, response)
+            return result
+        raise error
+
+    @staticmethod
+    def read_window(first_line, lines, start_date=None, end_date=None):
+        '''
+        Reads the lines of a csv (timestamp first) as a stream keeping only the
+        lines between the dates. The dates are compared as strings (YYYY-MM-DD)
+        so the other lines are not parsed. If the lines are sorted with the
+        latest first (Alpha Vantage) stops reading on the first line before start_date.
+
+        Parameters
+        ----------
+            first_line: bytes, header of the csv
+            lines: iterable of bytes
+            start_date: datetime
+            end_date: datetime
+
+        Returns
+        -------
+            header: str
+            rows: list of str, lines between the dates sorted so earliest comes first
+        '''
+        header = first_line.decode('utf-8').strip()
+        start = '0000-00-00' if start_date is None else start_date.strftime('%Y-%m-%d')
+        end = '9999-99-99' if end_date is None else end_date.strftime('%Y-%m-%d')
+
+        rows = []
+        descending = True
+        previous = None
+        for line in lines:
+            line = line.decode('utf-8').strip()
+            if line == '':
+                continue
+            date = line[:10]
+            if previous is not None and date > previous:
+                descending = False
+            if date < start:
+                if descending and previous is not None:
+                    break
+            elif date <= end:
+                rows.append(line)
+            previous = date
+
+        rows.sort()
+        return header, rows
+
+    def alphavantage_lines(self, symbol, start_date=None, end_date=None, outputsize='full'):
+        '''
+        Downloads the daily adjusted information of a symbol from Alpha Vantage
+        reading the response as a stream: only the lines between the dates are kept
+
+        Parameters
+        ----------
+            symbol: str
+            start_date: datetime
+            end_date: datetime
+            outputsize: str, 'full' for all the history or 'compact' for the last 100 days
+
+        Returns
+        -------
+            header: str
+            rows: list of str, earliest first
+        '''
+        return self.alphavantage_request(
+            {
+                'function': 'TIME_SERIES_DAILY_ADJUSTED',
+                'symbol': symbol,
+                'outputsize': outputsize,
+                'datatype': 'csv'
+            },
+            parse=lambda first_line, response: self.read_window(first_line, response, start_date, end_date))
+
+    @staticmethod
+    def lines_to_frame(header, rows):
+        '''
+        Returns a DataFrame (index: timestamp) from the lines of a csv
+        '''
+        return pd.read_csv(io.StringIO('\n'.join([header] + rows)), parse_dates=True, index_col='timestamp')
+
+    def alphavantage_data(self, symbol, start_date=None, end_date=None, outputsize='full'):
+        '''
+        Same as FileManager.alphavantage_lines but returns a pandas.DataFrame
+        sorted so earliest comes first
+        '''
+        header, rows = self.alphavantage_lines(symbol, start_date, end_date, outputsize)
+        return self.lines_to_frame(header, rows)
+
     def yahoo_download(self, symbol, start_date, end_date):
         '''
         Downloads and saves the equitiy information from Yahoo! Finance between
@@ -144,8 +535,7 @@ class FileManager(object):
                                 'd': end_date.month - 1, 'e': end_date.day, 'f': end_date.year
                             })
             webFile = urllib.request.urlopen("http://ichart.finance.yahoo.com/table.csv?%s" % params)
-            filename = "%s_%d-%d-%d_%d-%d-%d.csv" % (symbol, start_date.year, start_date.month,
-                        start_date.day, end_date.year, end_date.month, end_date.day)
+            filename = self.filename(symbol, start_date, end_date)
             localFile = open( os.path.join(self.dir, filename), 'w')
             localFile.write(webFile.read().decode('utf-8'))
             webFile.close()
@@ -157,7 +547,7 @@ class FileManager(object):
 
     def alphavantage_download(self, symbol, start_date, end_date):
         """
-        Downloads and saves the equitiy information from Yahoo! Finance between
+        Downloads and saves the equitiy information from Alpha Vantage between
         the specified dates.
         Saves the csv file with the name: SYMBOL_start_date_end_date.csv
             e.g: AAPL_2009-1-1_2010-1-1.csv
@@ -173,41 +563,94 @@ class FileManager(object):
             boolean: True if was able to download the symbol, False otherwise
         """
         try:
-            params = urllib.parse.urlencode(
-                {
-                    'function': 'TIME_SERIES_DAILY_ADJUSTED',
-                    'symbol': symbol,
-                    'outputsize': 'full',
-                    'datatype': 'csv',
-                    'apikey': self.alpha_vantage_key
-                })
-            sourceURL = "https://www.alphavantage.co/query?{0}".format(params)
-            webFile = urllib.request.urlopen(sourceURL)
-            # print(webFile.read().decode('utf-8'))
-            #print("start_date: {0}".format(start_date))
-            #print("end_date: {0}".format(end_date))
-
-            # extract start date and end date from webfile
-            csvData = pd.read_csv(webFile, parse_dates=True, index_col='timestamp')
-            # Sort so earliest comes first
-            csvData = csvData.sort_index()
-            csvData = csvData.truncate(before=start_date)
-            csvData = csvData.truncate(after=end_date)
-            #print(csvData.head())
-            #print(csvData.tail())
-            data_start_date = csvData.index.tolist()[0]
-            #print("data start_date: {0}".format(data_start_date))
-
-            data_end_date = csvData.index.tolist()[-1]
-            #print("data end_date: {0}".format(data_end_date))
-
-            filename = "%s_%d-%d-%d_%d-%d-%d.csv" % (symbol, start_date.year, start_date.month,
-                                                     start_date.day, end_date.year, end_date.month, end_date.day)
-            localFile = open(os.path.join(self.dir, filename), 'w')
-            csvData.to_csv(localFile)
-            webFile.close()
-            localFile.close()
+            header, rows = self.alphavantage_lines(symbol, start_date, end_date)
+            if len(rows) == 0:
+                raise Exception('No data between the dates')
+
+            # The lines are written as they were downloaded
+            filename = self.filename(symbol, start_date, end_date)
+            with open(os.path.join(self.dir, filename), 'w') as localFile:
+                localFile.write('\n'.join([header] + rows) + '\n')
+            if self.store is not None:
+                self.store.add(symbol, self.lines_to_frame(header, rows), start_date, end_date)
             return True
         except:
             print("FileManager::alphaVantageDownload: {0}, {1}".format(symbol, sys.exc_info()[1]))
             return False
+
+    def alphavantage_update(self, symbol, start_date, end_date, entries):
+        """
+        Adds the missing head and/or tail of the requested dates to the files (entries)
+        of a symbol. Saves the merged data on a new file covering all the dates.
+
+        Parameters
+        ----------
+            symbol: str
+            start_date: datetime
+            end_date: datetime
+            entries: list of catalog entries (start, end, file_name) overlapping the dates
+
+        Returns
+        -------
+            (file_name, start_date, end_date, entries) or None if the download failed
+        """
+        # 1. Dates covered and the missing intervals
+        entries = sorted(entries)
+        new_start = min(start_date, entries[0][0])
+        new_end = max(end_date, max(entry[1] for entry in entries))
+        missing = []
+        covered_end = new_start - timedelta(days=1)
+        for fi_start_date, fi_end_date, file_name in entries:
+            if fi_start_date > covered_end + timedelta(days=1):
+                missing.append((covered_end + timedelta(days=1), fi_start_date - timedelta(days=1)))
+            covered_end = max(covered_end, fi_end_date)
+        if covered_end < new_end:
+            missing.append((covered_end + timedelta(days=1), new_end))
+
+        old = [pd.read_csv(os.path.join(self.dir, file_name), parse_dates=True, index_col='timestamp')
+                    for fi_start_date, fi_end_date, file_name in entries]
+        data = pd.concat(old)
+
+        # 2. Download the missing dates, if any: the adjacent files may cover all the dates
+        if len(missing) > 0:
+            try:
+                new = self.alphavantage_missing(symbol, missing, new_start, new_end)
+            except Exception:
+                print("FileManager::alphaVantageUpdate: {0}, {1}".format(symbol, sys.exc_info()[1]))
+                return None
+            data = pd.concat([data] + [new[fi_start:fi_end] for fi_start, fi_end in missing])
+
+        # 3. Merge and save
+        data = data[~data.index.duplicated(keep='first')].sort_index()
+        filename = self.filename(symbol, new_start, new_end)
+        data.to_csv(os.path.join(self.dir, filename))
+        if self.store is not None:
+            self.store.add(symbol, data, new_start, new_end)
+        return (filename, new_start, new_end, entries)
+
+    def alphavantage_missing(self, symbol, missing, new_start, new_end):
+        """
+        Downloads the data of the missing intervals of FileManager.alphavantage_update
+        If only the tail is missing and is recent uses the compact output
+
+        Parameters
+        ----------
+            symbol: str
+            missing: list of (start, end), sorted
+            new_start: datetime, first date of the merged file
+            new_end: datetime, last date of the merged file
+
+        Returns
+        -------
+            data: pandas.DataFrame from the first to the last missing dates
+        """
+        # Some days before the missing dates: to check that the compact output reaches them
+        window_start = missing[0][0] - timedelta(days=10)
+        window_end = missing[-1][1]
+        tail_only = len(missing) == 1 and missing[0][1] == new_end and missing[0][0] > new_start
+        if tail_only and missing[0][0] >= datetime.today() - timedelta(days=self.compact_days):
+            new = self.alphavantage_data(symbol, window_start, window_end, outputsize='compact')
+            if len(new) > 0 and new.index[0] < missing[0][0]:
+                return new
+            # Compact output does not reach the data we have
+        return self.alphavantage_data(symbol, window_start, window_end)
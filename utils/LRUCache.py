@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+
+class LRUCache(object):
+    '''
+    Memory-bounded Least Recently Used cache
+
+    Used by DataAccess to share the loaded data between all the instances of
+    one process. The size of each item is estimated in bytes and the least
+    recently used items are evicted when the budget is exceeded.
+
+    Note: The items are shared, do not modify them.
+
+    Parameters
+    ----------
+        max_bytes: int, budget of the cache
+    '''
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.items = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def sizeof(item):
+        '''
+        Estimates the size in bytes of an item: pandas objects and numpy arrays
+        '''
+        if hasattr(item, 'memory_usage'):
+            usage = item.memory_usage(index=True, deep=True)
+            return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+        if hasattr(item, 'nbytes'):
+            return int(item.nbytes)
+        return 0
+
+    def get(self, key):
+        '''
+        Returns the item of the key, None if is not on the cache
+        '''
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                self.hits = self.hits + 1
+                return self.items[key]
+            self.misses = self.misses + 1
+            return None
+
+    def put(self, key, item):
+        '''
+        Adds an item to the cache and evicts the least recently used items
+        if the budget is exceeded. Items bigger than the budget are not added.
+        '''
+        size = self.sizeof(item)
+        with self.lock:
+            self.remove(key)
+            if size > self.max_bytes:
+                return
+            self.items[key] = item
+            self.sizes[key] = size
+            self.bytes = self.bytes + size
+            self.evict()
+
+    def remove(self, key):
+        if key in self.items:
+            del self.items[key]
+            self.bytes = self.bytes - self.sizes.pop(key)
+
+    def evict(self):
+        while self.bytes > self.max_bytes and len(self.items) > 0:
+            key, item = self.items.popitem(last=False)
+            self.bytes = self.bytes - self.sizes.pop(key)
+            self.evictions = self.evictions + 1
+
+    def resize(self, max_bytes):
+        '''
+        Changes the budget of the cache, evicting items if necessary
+
+        Parameters
+        ----------
+            max_bytes: int
+        '''
+        with self.lock:
+            self.max_bytes = max_bytes
+            self.evict()
+
+    def invalidate(self, match=None):
+        '''
+        Removes items from the cache
+
+        Parameters
+        ----------
+            match: None to remove all the items;
+                   otherwise removes the keys equal to match or tuples starting with match
+                   e.g: invalidate('AAPL') removes ('AAPL', 'path/AAPL_2009-1-1_2010-1-1.csv')
+
+        Returns
+        -------
+            removed: int, number of items removed
+        '''
+        with self.lock:
+            if match is None:
+                keys = list(self.items.keys())
+            else:
+                keys = [key for key in self.items if key == match or
+                        (type(key) == tuple and len(key) > 0 and key[0] == match)]
+            for key in keys:
+                self.remove(key)
+            return len(keys)
+
+    def stats(self):
+        '''
+        Returns a dictionary with the statistics of the cache:
+            items, bytes, max_bytes, hits, misses, evictions
+        '''
+        with self.lock:
+            return {'items': len(self.items), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def reset_stats(self):
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
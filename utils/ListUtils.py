@@ -1,16 +1,56 @@
+import os
+import numpy as np
+import pandas as pd
 
+NYSE_CALENDAR = None
+
+def NYSE_calendar():
+    '''
+    Returns the NYSE open dates as a read-only numpy array of datetime64[D]
+    The array is loaded once (lists/NYSE_dates.npy) and shared by all the callers
+
+    Note: lists/NYSE_dates.npy is generated from lists/NYSE_dates.txt with build_calendar()
+    '''
+    global NYSE_CALENDAR
+    if NYSE_CALENDAR is None:
+        self_dir = os.path.dirname(os.path.abspath(__file__))
+        calendar = np.load(os.path.join(self_dir, 'lists', 'NYSE_dates.npy'))
+        calendar.flags.writeable = False
+        NYSE_CALENDAR = calendar
+    return NYSE_CALENDAR
+
+def build_calendar(save=True):
+    '''
+    Parses lists/NYSE_dates.txt (one m/d/Y date per line) and saves it on
+    lists/NYSE_dates.npy, run it after updating the txt file
+
+    Parameters
+    ----------
+        save: boolean, True to save the npy file
+
+    Returns
+    -------
+        calendar: np.array of datetime64[D]
+    '''
+    self_dir = os.path.dirname(os.path.abspath(__file__))
+    dates = np.loadtxt(os.path.join(self_dir, 'lists', 'NYSE_dates.txt'), dtype=str)
+    calendar = pd.to_datetime(dates, format='%m/%d/%Y').values.astype('datetime64[D]')
+    if save:
+        np.save(os.path.join(self_dir, 'lists', 'NYSE_dates.npy'), calendar)
+    return calendar
 
 def NYSE(complete=False):
-    if complete:
-        import os, inspect
-        import numpy as np
-        from datetime import datetime
-        self_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
-        filename = os.path.join(self_dir, './lists/NYSE_dates.txt')
-        return [datetime.strptime(x, "%m/%d/%Y") for x in np.loadtxt(filename, dtype=str)]
-    else:
-        from finance.utils.lists import NYSE_dates
-        return NYSE_dates.all_dates
+    '''
+    Returns the NYSE open dates as a list of datetime
+
+    Parameters
+    ----------
+        complete: boolean, True for all the dates (since 1962-7-5), False for the dates since 2007-1-1
+    '''
+    calendar = NYSE_calendar()
+    if not complete:
+        calendar = calendar[calendar >= np.datetime64('2007-01-01')]
+    return calendar.astype('datetime64[us]').tolist()
 
 def SP500(year=2012):
     if year == 2012:
@@ -18,4 +58,4 @@ def SP500(year=2012):
         return SP500_2012.all_symbols
     elif year == 2008:
         from finance.utils.lists import SP500_2008
-        return SP500_2008.all_symbols
\ No newline at end of file
+        return SP500_2008.all_symbols
@@ -0,0 +1,267 @@
+import os
+import threading
+import numpy as np
+import pandas as pd
+from finance.utils.TradingCalendar import TradingCalendar
+
+class PriceStore(object):
+    '''
+    Consolidated on-disk store of the prices
+
+    One memory-mapped float64 array per field (e.g. adjusted_close.npy):
+        rows: open dates of the calendar (default: TradingCalendar.NYSE())
+        columns: symbols, in the order they were added
+
+    Each symbol keeps the range of dates it covers, requests inside that
+    range are answered slicing the arrays: no parsing and, for a single field
+    and contiguous symbols, no copies.
+    PriceStore.add can be called from many threads (e.g. FileManager downloads).
+
+    Files
+    -----
+        FIELD.npy: np.memmap of shape (len(dates), capacity)
+        symbols.csv: symbol, first and last row covered
+    '''
+    initial_capacity = 64
+
+    def __init__(self, dir_path, calendar=None):
+        self.trading_calendar = calendar
+        self.arrays = {}
+        self.lock = threading.Lock()
+        self.set_dir(dir_path)
+
+    @property
+    def calendar(self):
+        '''
+        The calendar of the rows, the NYSE calendar is loaded on the first use
+        '''
+        if self.trading_calendar is None:
+            return TradingCalendar.NYSE()
+        return self.trading_calendar
+
+    @property
+    def dates(self):
+        return self.calendar.sessions
+
+    def set_dir(self, dir_path):
+        '''
+        1. Set global variables with absolute paths to the directory
+        2. Creates the directory
+        3. Loads the list of symbols and their coverage
+
+        Parameters
+        ----------
+            dir_path: str
+        '''
+        self.dir = os.path.realpath(dir_path)
+        if not (os.access(self.dir, os.F_OK)):
+            os.makedirs(self.dir)
+
+        self.symbols = []
+        self.coverage = {}
+        self.columns = {}
+        self.arrays = {}
+        index_file = os.path.join(self.dir, 'symbols.csv')
+        if os.access(index_file, os.F_OK):
+            index = pd.read_csv(index_file, keep_default_na=False)
+            for symbol, first, last in zip(index['symbol'], index['first'], index['last']):
+                self.columns[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+                self.coverage[symbol] = (first, last)
+
+    def empty(self, delete=True):
+        '''
+        Empty the store
+
+        Parameters
+        ----------
+            delete: boolean, True if want to delete the folder too
+        '''
+        self.arrays = {}
+        for f in os.listdir(self.dir):
+            try:
+                os.remove(os.path.join(self.dir, f))
+            except:
+                pass
+
+        if delete:
+            os.rmdir(self.dir)
+        else:
+            self.set_dir(self.dir)
+
+    def fields(self):
+        '''
+        Returns the list of fields available on the store
+        '''
+        return [f[:-4] for f in os.listdir(self.dir) if f.endswith('.npy')]
+
+    def array(self, field, writable=False):
+        '''
+        Returns the memory-mapped array of a field, None if is not on the store
+        The arrays are read-only: the views returned by get can not modify the files,
+        only add (through reserve) opens them writable
+
+        Parameters
+        ----------
+            field: str
+            writable: boolean, True to open the file on read/write mode
+        '''
+        key = (field, writable)
+        if key not in self.arrays:
+            f = os.path.join(self.dir, field + '.npy')
+            if not os.access(f, os.F_OK):
+                return None
+            self.arrays[key] = np.load(f, mmap_mode='r+' if writable else 'r')
+        return self.arrays[key]
+
+    def rows(self, start, end):
+        '''
+        Returns the row indexes [first, last) of the dates between start and end (inclusive)
+
+        Parameters
+        ----------
+            start: datetime
+            end: datetime
+        '''
+        return self.calendar.bounds(start, end)
+
+    def covers(self, symbols, start, end, fields):
+        '''
+        True if all the symbols and fields are available between start and end
+
+        Parameters
+        ----------
+            symbols: list of str
+            start: datetime
+            end: datetime
+            fields: list of str
+        '''
+        first, last = self.rows(start, end)
+        if np.datetime64(end, 'D') > self.dates[-1]:
+            # The calendar does not have the dates
+            return False
+        for field in fields:
+            if self.array(field) is None:
+                return False
+        for symbol in symbols:
+            if symbol not in self.coverage:
+                return False
+            cov_first, cov_last = self.coverage[symbol]
+            if cov_first > first or cov_last < last - 1:
+                return False
+        return True
+
+    def get(self, symbols, start, end, field):
+        '''
+        Returns the values of the symbols between start and end (inclusive)
+        If the symbols are contiguous on the store the result is a view of the
+        memory-mapped file
+
+        Parameters
+        ----------
+            symbols: list of str
+            start: datetime
+            end: datetime
+            field: str
+
+        Returns
+        -------
+            dates: np.array of datetime64[D]
+            values: np.array of shape (len(dates), len(symbols))
+        '''
+        first, last = self.rows(start, end)
+        cols = [self.columns[symbol] for symbol in symbols]
+        array = self.array(field)
+        if cols == list(range(cols[0], cols[0] + len(cols))):
+            values = array[first:last, cols[0]:cols[0] + len(cols)]
+        else:
+            values = array[first:last, cols]
+        return self.dates[first:last], values
+
+    def add(self, symbol, data, start, end):
+        '''
+        Adds (or updates) the data of a symbol to the store
+
+        Parameters
+        ----------
+            symbol: str
+            data: pandas.DataFrame, index: dates, columns: fields
+            start: datetime, first date covered by the data
+            end: datetime, last date covered by the data
+        '''
+        with self.lock:
+            self.add_symbol(symbol, data, start, end)
+
+    def add_symbol(self, symbol, data, start, end):
+        if symbol not in self.columns:
+            self.columns[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        col = self.columns[symbol]
+
+        # Align the data to the calendar, dates not on the calendar are ignored
+        dates = np.array(data.index.values, dtype='datetime64[D]')
+        idx = np.searchsorted(self.dates, dates)
+        valid = (idx < len(self.dates))
+        valid[valid] = self.dates[idx[valid]] == dates[valid]
+        idx = idx[valid]
+
+        for field in data.columns:
+            values = pd.to_numeric(data[field], errors='coerce').values[valid]
+            array = self.reserve(field, col + 1)
+            array[idx, col] = values
+            array.flush()
+
+        # Update the coverage: union if the ranges overlap
+        first, last = self.rows(start, end)
+        last = last - 1
+        if symbol in self.coverage:
+            cov_first, cov_last = self.coverage[symbol]
+            if first <= cov_last + 1 and last >= cov_first - 1:
+                first, last = min(first, cov_first), max(last, cov_last)
+        self.coverage[symbol] = (first, last)
+        self.save_index()
+
+    def reserve(self, field, num_symbols):
+        '''
+        Returns the array of a field with space for at least num_symbols columns
+        Creates or grows (doubling the capacity) the file if necessary
+
+        Parameters
+        ----------
+            field: str
+            num_symbols: int
+        '''
+        array = self.array(field, writable=True)
+        if array is not None and array.shape[1] >= num_symbols:
+            return array
+
+        capacity = self.initial_capacity
+        if array is not None:
+            capacity = array.shape[1]
+        while capacity < num_symbols:
+            capacity = capacity * 2
+
+        f = os.path.join(self.dir, field + '.npy')
+        tmp = f + '.tmp'
+        new_array = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float64,
+                                            shape=(len(self.dates), capacity))
+        new_array[:] = np.nan
+        if array is not None:
+            new_array[:, :array.shape[1]] = array
+        new_array.flush()
+        del new_array
+        self.arrays.pop((field, False), None)
+        self.arrays.pop((field, True), None)
+        del array
+        os.replace(tmp, f)
+        return self.array(field, writable=True)
+
+    def save_index(self):
+        '''
+        Saves the list of symbols and their coverage
+        '''
+        index = pd.DataFrame({'symbol': self.symbols,
+                              'first': [self.coverage[s][0] for s in self.symbols],
+                              'last': [self.coverage[s][1] for s in self.symbols]},
+                             columns=['symbol', 'first', 'last'])
+        index.to_csv(os.path.join(self.dir, 'symbols.csv'), index=False)
@@ -0,0 +1,33 @@
+import time
+import threading
+from collections import deque
+
+class RateLimiter(object):
+    '''
+    Client-side rate limiter: allows at most `calls` calls on any window of
+    `period` seconds. Thread-safe, the threads wait on wait() until a call is allowed.
+
+    Parameters
+    ----------
+        calls: int, calls allowed on each period
+        period: float, seconds; default 60 (calls per minute)
+    '''
+    def __init__(self, calls=5, period=60.0):
+        self.calls = calls
+        self.period = period
+        self.times = deque()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        '''
+        Blocks until a new call is allowed and registers it
+        '''
+        with self.lock:
+            while True:
+                now = time.monotonic()
+                while len(self.times) > 0 and self.times[0] <= now - self.period:
+                    self.times.popleft()
+                if len(self.times) < self.calls:
+                    self.times.append(now)
+                    return
+                time.sleep(self.times[0] + self.period - now)
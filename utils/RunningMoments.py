@@ -0,0 +1,73 @@
+import numpy as np
+
+class RunningMoments(object):
+    '''
+    Running count, mean and variance of each column of batches of rows
+
+    The batches are combined with the parallel algorithm of Chan et al.
+    (Welford's update for batches): the values are never kept, only
+    three arrays of the size of a row. NaN values are ignored.
+    Two RunningMoments of the same size can be combined exactly.
+
+    Parameters
+    ----------
+        size: int, number of columns
+    '''
+    def __init__(self, size):
+        self.count = np.zeros(size)
+        self.mean = np.zeros(size)
+        self.m2 = np.zeros(size)
+
+    def update(self, values):
+        '''
+        Adds a batch of rows
+
+        Parameters
+        ----------
+            values: np.array of shape (rows, size)
+        '''
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.count))
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(np.float64)
+        total = np.where(valid, values, 0).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, total / count, 0)
+        m2 = (np.where(valid, values - mean, 0) ** 2).sum(axis=0)
+        self.add(count, mean, m2)
+
+    def combine(self, other):
+        '''
+        Adds the rows of other RunningMoments
+        '''
+        self.add(other.count, other.mean, other.m2)
+
+    def add(self, count, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0)
+            self.m2 = np.where(total > 0, self.m2 + m2 + delta ** 2 * self.count * count / total, 0)
+        self.count = total
+
+    def means(self):
+        '''
+        Returns the mean of each column, NaN if the column has no values
+        '''
+        return np.where(self.count > 0, self.mean, np.nan)
+
+    def variances(self, ddof=1):
+        '''
+        Returns the variance of each column, NaN if the column has ddof values or less
+
+        Parameters
+        ----------
+            ddof: int, delta degrees of freedom; default 1 (sample variance like pandas)
+        '''
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def stds(self, ddof=1):
+        '''
+        Returns the standard deviation of each column
+        '''
+        return np.sqrt(self.variances(ddof))
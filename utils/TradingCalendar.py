@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+from finance.utils import ListUtils
+
+class TradingCalendar(object):
+    '''
+    Calendar of open dates (sessions) with precomputed indexes
+
+    The sessions are stored once and the ranges are returned as slices
+    (views) of them, no new lists are created on each call.
+    Use TradingCalendar.NYSE() to get the instance shared by DataAccess,
+    EventFinder, MultipleEvents and PastEvent.
+
+    Attributes
+    ----------
+        sessions: np.array of datetime64[D], read-only
+        index: pd.DatetimeIndex of the sessions
+        month_starts, quarter_starts, year_starts: np.array of int, ordinal of
+            the first session of each month, quarter and year
+        month_ends, quarter_ends, year_ends: np.array of int, ordinal of
+            the last session of each month, quarter and year
+
+    Parameters
+    ----------
+        sessions: sorted list or np.array or pd.DatetimeIndex of the open dates
+    '''
+    nyse = None
+
+    def __init__(self, sessions):
+        sessions = np.array(sessions, dtype='datetime64[D]')
+        sessions.flags.writeable = False
+        self.sessions = sessions
+        self.index = pd.DatetimeIndex(sessions.astype('datetime64[ns]'))
+
+        # Hash index: day number -> ordinal
+        days = sessions.astype(np.int64).tolist()
+        self.ordinals = dict(zip(days, range(len(days))))
+
+        # Boundaries of the periods
+        months = sessions.astype('datetime64[M]').astype(np.int64)
+        self.month_starts, self.month_ends = self.boundaries(months)
+        self.quarter_starts, self.quarter_ends = self.boundaries(months // 3)
+        self.year_starts, self.year_ends = self.boundaries(months // 12)
+
+    @classmethod
+    def NYSE(cls):
+        '''
+        Returns the calendar of the NYSE open dates (ListUtils.NYSE_calendar()),
+        created once and shared by all the callers
+        '''
+        if cls.nyse is None:
+            cls.nyse = cls(ListUtils.NYSE_calendar())
+        return cls.nyse
+
+    @staticmethod
+    def boundaries(periods):
+        '''
+        Returns the ordinals of the first and last sessions of each period
+
+        Parameters
+        ----------
+            periods: np.array of int, period number of each session
+        '''
+        starts = np.flatnonzero(np.concatenate(([True], periods[1:] != periods[:-1])))
+        ends = np.concatenate((starts[1:] - 1, [len(periods) - 1]))
+        return starts, ends
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __contains__(self, date):
+        return self.day(date) in self.ordinals
+
+    @staticmethod
+    def day(date):
+        '''
+        Returns the day number (days since 1970-1-1) of a date
+        '''
+        return int(np.datetime64(date, 'D').astype(np.int64))
+
+    def ordinal(self, date):
+        '''
+        Returns the position of an open date on the calendar: O(1)
+
+        Parameters
+        ----------
+            date: datetime
+
+        Returns
+        -------
+            ordinal: int; raises KeyError if the date is not an open date
+        '''
+        try:
+            return self.ordinals[self.day(date)]
+        except KeyError:
+            raise KeyError('%s is not an open date' % date)
+
+    def date(self, ordinal):
+        '''
+        Returns the open date on a position of the calendar as datetime
+        '''
+        return self.index[ordinal].to_pydatetime()
+
+    def bounds(self, start, end, back=0, forward=0):
+        '''
+        Returns the ordinals [first, last) of the open dates between start and end
+        (inclusive), extended back and forward a number of open dates
+
+        Parameters
+        ----------
+            start: datetime
+            end: datetime
+            back: int
+            forward: int
+        '''
+        first = np.searchsorted(self.sessions, np.datetime64(start, 'D'), side='left')
+        last = np.searchsorted(self.sessions, np.datetime64(end, 'D'), side='right')
+        first = max(int(first) - back, 0)
+        last = min(int(last) + forward, len(self.sessions))
+        return first, max(last, first)
+
+    def range(self, start, end, back=0, forward=0):
+        '''
+        Returns the open dates between start and end (inclusive), extended
+        back and forward a number of open dates
+
+        Parameters
+        ----------
+            start: datetime
+            end: datetime
+            back: int
+            forward: int
+
+        Returns
+        -------
+            dates: pd.DatetimeIndex, slice of TradingCalendar.index
+        '''
+        first, last = self.bounds(start, end, back, forward)
+        return self.index[first:last]
+
+    def window(self, date, back, forward):
+        '''
+        Returns the open dates around a date: back open dates before and
+        forward open dates after
+
+        Parameters
+        ----------
+            date: datetime
+            back: int
+            forward: int
+
+        Returns
+        -------
+            dates: pd.DatetimeIndex, slice of TradingCalendar.index
+        '''
+        return self.range(date, date, back, forward)
@@ -1,4 +1,8 @@
 #from finance.utils.BasicUtils import BasicUtils
 #from finance.utils.DateUtils import DateUtils
+from finance.utils.TradingCalendar import TradingCalendar
 from finance.utils.DataAccess import DataAccess
 from finance.utils.FileManager import FileManager
+from finance.utils.PriceStore import PriceStore
+from finance.utils.LRUCache import LRUCache
+from finance.utils.RunningMoments import RunningMoments
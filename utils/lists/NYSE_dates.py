@@ -1,2 +0,0 @@
-import datetime
-all_dates = [datetime.datetime(2007, 1, 3, 0, 0), datetime.datetime(2007, 1, 4, 0, 0), datetime.datetime(2007, 1, 5, 0, 0), datetime.datetime(2007, 1, 8, 0, 0), datetime.datetime(2007, 1, 9, 0, 0), datetime.datetime(2007, 1, 10, 0, 0), datetime.datetime(2007, 1, 11, 0, 0), datetime.datetime(2007, 1, 12, 0, 0), datetime.datetime(2007, 1, 16, 0, 0), datetime.datetime(2007, 1, 17, 0, 0), datetime.datetime(2007, 1, 18, 0, 0), datetime.datetime(2007, 1, 19, 0, 0), datetime.datetime(2007, 1, 22, 0, 0), datetime.datetime(2007, 1, 23, 0, 0), datetime.datetime(2007, 1, 24, 0, 0), datetime.datetime(2007, 1, 25, 0, 0), datetime.datetime(2007, 1, 26, 0, 0), datetime.datetime(2007, 1, 29, 0, 0), datetime.datetime(2007, 1, 30, 0, 0), datetime.datetime(2007, 1, 31, 0, 0), datetime.datetime(2007, 2, 1, 0, 0), datetime.datetime(2007, 2, 2, 0, 0), datetime.datetime(2007, 2, 5, 0, 0), datetime.datetime(2007, 2, 6, 0, 0), datetime.datetime(2007, 2, 7, 0, 0), datetime.datetime(2007, 2, 8, 0, 0), datetime.datetime(2007, 2, 9, 0, 0), datetime.datetime(2007, 2, 12, 0, 0), datetime.datetime(2007, 2, 13, 0, 0), datetime.datetime(2007, 2, 14, 0, 0), datetime.datetime(2007, 2, 15, 0, 0), datetime.datetime(2007, 2, 16, 0, 0), datetime.datetime(2007, 2, 20, 0, 0), datetime.datetime(2007, 2, 21, 0, 0), datetime.datetime(2007, 2, 22, 0, 0), datetime.datetime(2007, 2, 23, 0, 0), datetime.datetime(2007, 2, 26, 0, 0), datetime.datetime(2007, 2, 27, 0, 0), datetime.datetime(2007, 2, 28, 0, 0), datetime.datetime(2007, 3, 1, 0, 0), datetime.datetime(2007, 3, 2, 0, 0), datetime.datetime(2007, 3, 5, 0, 0), datetime.datetime(2007, 3, 6, 0, 0), datetime.datetime(2007, 3, 7, 0, 0), datetime.datetime(2007, 3, 8, 0, 0), datetime.datetime(2007, 3, 9, 0, 0), datetime.datetime(2007, 3, 12, 0, 0), datetime.datetime(2007, 3, 13, 0, 0), datetime.datetime(2007, 3, 14, 0, 0), datetime.datetime(2007, 3, 15, 0, 0), datetime.datetime(2007, 3, 16, 0, 0), datetime.datetime(2007, 3, 19, 0, 0), datetime.datetime(2007, 3, 20, 0, 0), datetime.datetime(2007, 3, 21, 0, 0), datetime.datetime(2007, 3, 22, 0, 0), datetime.datetime(2007, 3, 23, 0, 0), datetime.datetime(2007, 3, 26, 0, 0), datetime.datetime(2007, 3, 27, 0, 0), datetime.datetime(2007, 3, 28, 0, 0), datetime.datetime(2007, 3, 29, 0, 0), datetime.datetime(2007, 3, 30, 0, 0), datetime.datetime(2007, 4, 2, 0, 0), datetime.datetime(2007, 4, 3, 0, 0), datetime.datetime(2007, 4, 4, 0, 0), datetime.datetime(2007, 4, 5, 0, 0), datetime.datetime(2007, 4, 9, 0, 0), datetime.datetime(2007, 4, 10, 0, 0), datetime.datetime(2007, 4, 11, 0, 0), datetime.datetime(2007, 4, 12, 0, 0), datetime.datetime(2007, 4, 13, 0, 0), datetime.datetime(2007, 4, 16, 0, 0), datetime.datetime(2007, 4, 17, 0, 0), datetime.datetime(2007, 4, 18, 0, 0), datetime.datetime(2007, 4, 19, 0, 0), datetime.datetime(2007, 4, 20, 0, 0), datetime.datetime(2007, 4, 23, 0, 0), datetime.datetime(2007, 4, 24, 0, 0), datetime.datetime(2007, 4, 25, 0, 0), datetime.datetime(2007, 4, 26, 0, 0), datetime.datetime(2007, 4, 27, 0, 0), datetime.datetime(2007, 4, 30, 0, 0), datetime.datetime(2007, 5, 1, 0, 0), datetime.datetime(2007, 5, 2, 0, 0), datetime.datetime(2007, 5, 3, 0, 0), datetime.datetime(2007, 5, 4, 0, 0), datetime.datetime(2007, 5, 7, 0, 0), datetime.datetime(2007, 5, 8, 0, 0), datetime.datetime(2007, 5, 9, 0, 0), datetime.datetime(2007, 5, 10, 0, 0), datetime.datetime(2007, 5, 11, 0, 0), datetime.datetime(2007, 5, 14, 0, 0), datetime.datetime(2007, 5, 15, 0, 0), datetime.datetime(2007, 5, 16, 0, 0), datetime.datetime(2007, 5, 17, 0, 0), datetime.datetime(2007, 5, 18, 0, 0), datetime.datetime(2007, 5, 21, 0, 0), datetime.datetime(2007, 5, 22, 0, 0), datetime.datetime(2007, 5, 23, 0, 0), datetime.datetime(2007, 5, 24, 0, 0), datetime.datetime(2007, 5, 25, 0, 0), datetime.datetime(2007, 5, 29, 0, 0), datetime.datetime(2007, 5, 30, 0, 0), datetime.datetime(2007, 5, 31, 0, 0), datetime.datetime(2007, 6, 1, 0, 0), datetime.datetime(2007, 6, 4, 0, 0), datetime.datetime(2007, 6, 5, 0, 0), datetime.datetime(2007, 6, 6, 0, 0), datetime.datetime(2007, 6, 7, 0, 0), datetime.datetime(2007, 6, 8, 0, 0), datetime.datetime(2007, 6, 11, 0, 0), datetime.datetime(2007, 6, 12, 0, 0), datetime.datetime(2007, 6, 13, 0, 0), datetime.datetime(2007, 6, 14, 0, 0), datetime.datetime(2007, 6, 15, 0, 0), datetime.datetime(2007, 6, 18, 0, 0), datetime.datetime(2007, 6, 19, 0, 0), datetime.datetime(2007, 6, 20, 0, 0), datetime.datetime(2007, 6, 21, 0, 0), datetime.datetime(2007, 6, 22, 0, 0), datetime.datetime(2007, 6, 25, 0, 0), datetime.datetime(2007, 6, 26, 0, 0), datetime.datetime(2007, 6, 27, 0, 0), datetime.datetime(2007, 6, 28, 0, 0), datetime.datetime(2007, 6, 29, 0, 0), datetime.datetime(2007, 7, 2, 0, 0), datetime.datetime(2007, 7, 3, 0, 0), datetime.datetime(2007, 7, 5, 0, 0), datetime.datetime(2007, 7, 6, 0, 0), datetime.datetime(2007, 7, 9, 0, 0), datetime.datetime(2007, 7, 10, 0, 0), datetime.datetime(2007, 7, 11, 0, 0), datetime.datetime(2007, 7, 12, 0, 0), datetime.datetime(2007, 7, 13, 0, 0), datetime.datetime(2007, 7, 16, 0, 0), datetime.datetime(2007, 7, 17, 0, 0), datetime.datetime(2007, 7, 18, 0, 0), datetime.datetime(2007, 7, 19, 0, 0), datetime.datetime(2007, 7, 20, 0, 0), datetime.datetime(2007, 7, 23, 0, 0), datetime.datetime(2007, 7, 24, 0, 0), datetime.datetime(2007, 7, 25, 0, 0), datetime.datetime(2007, 7, 26, 0, 0), datetime.datetime(2007, 7, 27, 0, 0), datetime.datetime(2007, 7, 30, 0, 0), datetime.datetime(2007, 7, 31, 0, 0), datetime.datetime(2007, 8, 1, 0, 0), datetime.datetime(2007, 8, 2, 0, 0), datetime.datetime(2007, 8, 3, 0, 0), datetime.datetime(2007, 8, 6, 0, 0), datetime.datetime(2007, 8, 7, 0, 0), datetime.datetime(2007, 8, 8, 0, 0), datetime.datetime(2007, 8, 9, 0, 0), datetime.datetime(2007, 8, 10, 0, 0), datetime.datetime(2007, 8, 13, 0, 0), datetime.datetime(2007, 8, 14, 0, 0), datetime.datetime(2007, 8, 15, 0, 0), datetime.datetime(2007, 8, 16, 0, 0), datetime.datetime(2007, 8, 17, 0, 0), datetime.datetime(2007, 8, 20, 0, 0), datetime.datetime(2007, 8, 21, 0, 0), datetime.datetime(2007, 8, 22, 0, 0), datetime.datetime(2007, 8, 23, 0, 0), datetime.datetime(2007, 8, 24, 0, 0), datetime.datetime(2007, 8, 27, 0, 0), datetime.datetime(2007, 8, 28, 0, 0), datetime.datetime(2007, 8, 29, 0, 0), datetime.datetime(2007, 8, 30, 0, 0), datetime.datetime(2007, 8, 31, 0, 0), datetime.datetime(2007, 9, 4, 0, 0), datetime.datetime(2007, 9, 5, 0, 0), datetime.datetime(2007, 9, 6, 0, 0), datetime.datetime(2007, 9, 7, 0, 0), datetime.datetime(2007, 9, 10, 0, 0), datetime.datetime(2007, 9, 11, 0, 0), datetime.datetime(2007, 9, 12, 0, 0), datetime.datetime(2007, 9, 13, 0, 0), datetime.datetime(2007, 9, 14, 0, 0), datetime.datetime(2007, 9, 17, 0, 0), datetime.datetime(2007, 9, 18, 0, 0), datetime.datetime(2007, 9, 19, 0, 0), datetime.datetime(2007, 9, 20, 0, 0), datetime.datetime(2007, 9, 21, 0, 0), datetime.datetime(2007, 9, 24, 0, 0), datetime.datetime(2007, 9, 25, 0, 0), datetime.datetime(2007, 9, 26, 0, 0), datetime.datetime(2007, 9, 27, 0, 0), datetime.datetime(2007, 9, 28, 0, 0), datetime.datetime(2007, 10, 1, 0, 0), datetime.datetime(2007, 10, 2, 0, 0), datetime.datetime(2007, 10, 3, 0, 0), datetime.datetime(2007, 10, 4, 0, 0), datetime.datetime(2007, 10, 5, 0, 0), datetime.datetime(2007, 10, 8, 0, 0), datetime.datetime(2007, 10, 9, 0, 0), datetime.datetime(2007, 10, 10, 0, 0), datetime.datetime(2007, 10, 11, 0, 0), datetime.datetime(2007, 10, 12, 0, 0), datetime.datetime(2007, 10, 15, 0, 0), datetime.datetime(2007, 10, 16, 0, 0), datetime.datetime(2007, 10, 17, 0, 0), datetime.datetime(2007, 10, 18, 0, 0), datetime.datetime(2007, 10, 19, 0, 0), datetime.datetime(2007, 10, 22, 0, 0), datetime.datetime(2007, 10, 23, 0, 0), datetime.datetime(2007, 10, 24, 0, 0), datetime.datetime(2007, 10, 25, 0, 0), datetime.datetime(2007, 10, 26, 0, 0), datetime.datetime(2007, 10, 29, 0, 0), datetime.datetime(2007, 10, 30, 0, 0), datetime.datetime(2007, 10, 31, 0, 0), datetime.datetime(2007, 11, 1, 0, 0), datetime.datetime(2007, 11, 2, 0, 0), datetime.datetime(2007, 11, 5, 0, 0), datetime.datetime(2007, 11, 6, 0, 0), datetime.datetime(2007, 11, 7, 0, 0), datetime.datetime(2007, 11, 8, 0, 0), datetime.datetime(2007, 11, 9, 0, 0), datetime.datetime(2007, 11, 12, 0, 0), datetime.datetime(2007, 11, 13, 0, 0), datetime.datetime(2007, 11, 14, 0, 0), datetime.datetime(2007, 11, 15, 0, 0), datetime.datetime(2007, 11, 16, 0, 0), datetime.datetime(2007, 11, 19, 0, 0), datetime.datetime(2007, 11, 20, 0, 0), datetime.datetime(2007, 11, 21, 0, 0), datetime.datetime(2007, 11, 23, 0, 0), datetime.datetime(2007, 11, 26, 0, 0), datetime.datetime(2007, 11, 27, 0, 0), datetime.datetime(2007, 11, 28, 0, 0), datetime.datetime(2007, 11, 29, 0, 0), datetime.datetime(2007, 11, 30, 0, 0), datetime.datetime(2007, 12, 3, 0, 0), datetime.datetime(2007, 12, 4, 0, 0), datetime.datetime(2007, 12, 5, 0, 0), datetime.datetime(2007, 12, 6, 0, 0), datetime.datetime(2007, 12, 7, 0, 0), datetime.datetime(2007, 12, 10, 0, 0), datetime.datetime(2007, 12, 11, 0, 0), datetime.datetime(2007, 12, 12, 0, 0), datetime.datetime(2007, 12, 13, 0, 0), datetime.datetime(2007, 12, 14, 0, 0), datetime.datetime(2007, 12, 17, 0, 0), datetime.datetime(2007, 12, 18, 0, 0), datetime.datetime(2007, 12, 19, 0, 0), datetime.datetime(2007, 12, 20, 0, 0), datetime.datetime(2007, 12, 21, 0, 0), datetime.datetime(2007, 12, 24, 0, 0), datetime.datetime(2007, 12, 26, 0, 0), datetime.datetime(2007, 12, 27, 0, 0), datetime.datetime(2007, 12, 28, 0, 0), datetime.datetime(2007, 12, 31, 0, 0), datetime.datetime(2008, 1, 2, 0, 0), datetime.datetime(2008, 1, 3, 0, 0), datetime.datetime(2008, 1, 4, 0, 0), datetime.datetime(2008, 1, 7, 0, 0), datetime.datetime(2008, 1, 8, 0, 0), datetime.datetime(2008, 1, 9, 0, 0), datetime.datetime(2008, 1, 10, 0, 0), datetime.datetime(2008, 1, 11, 0, 0), datetime.datetime(2008, 1, 14, 0, 0), datetime.datetime(2008, 1, 15, 0, 0), datetime.datetime(2008, 1, 16, 0, 0), datetime.datetime(2008, 1, 17, 0, 0), datetime.datetime(2008, 1, 18, 0, 0), datetime.datetime(2008, 1, 22, 0, 0), datetime.datetime(2008, 1, 23, 0, 0), datetime.datetime(2008, 1, 24, 0, 0), datetime.datetime(2008, 1, 25, 0, 0), datetime.datetime(2008, 1, 28, 0, 0), datetime.datetime(2008, 1, 29, 0, 0), datetime.datetime(2008, 1, 30, 0, 0), datetime.datetime(2008, 1, 31, 0, 0), datetime.datetime(2008, 2, 1, 0, 0), datetime.datetime(2008, 2, 4, 0, 0), datetime.datetime(2008, 2, 5, 0, 0), datetime.datetime(2008, 2, 6, 0, 0), datetime.datetime(2008, 2, 7, 0, 0), datetime.datetime(2008, 2, 8, 0, 0), datetime.datetime(2008, 2, 11, 0, 0), datetime.datetime(2008, 2, 12, 0, 0), datetime.datetime(2008, 2, 13, 0, 0), datetime.datetime(2008, 2, 14, 0, 0), datetime.datetime(2008, 2, 15, 0, 0), datetime.datetime(2008, 2, 19, 0, 0), datetime.datetime(2008, 2, 20, 0, 0), datetime.datetime(2008, 2, 21, 0, 0), datetime.datetime(2008, 2, 22, 0, 0), datetime.datetime(2008, 2, 25, 0, 0), datetime.datetime(2008, 2, 26, 0, 0), datetime.datetime(2008, 2, 27, 0, 0), datetime.datetime(2008, 2, 28, 0, 0), datetime.datetime(2008, 2, 29, 0, 0), datetime.datetime(2008, 3, 3, 0, 0), datetime.datetime(2008, 3, 4, 0, 0), datetime.datetime(2008, 3, 5, 0, 0), datetime.datetime(2008, 3, 6, 0, 0), datetime.datetime(2008, 3, 7, 0, 0), datetime.datetime(2008, 3, 10, 0, 0), datetime.datetime(2008, 3, 11, 0, 0), datetime.datetime(2008, 3, 12, 0, 0), datetime.datetime(2008, 3, 13, 0, 0), datetime.datetime(2008, 3, 14, 0, 0), datetime.datetime(2008, 3, 17, 0, 0), datetime.datetime(2008, 3, 18, 0, 0), datetime.datetime(2008, 3, 19, 0, 0), datetime.datetime(2008, 3, 20, 0, 0), datetime.datetime(2008, 3, 24, 0, 0), datetime.datetime(2008, 3, 25, 0, 0), datetime.datetime(2008, 3, 26, 0, 0), datetime.datetime(2008, 3, 27, 0, 0), datetime.datetime(2008, 3, 28, 0, 0), datetime.datetime(2008, 3, 31, 0, 0), datetime.datetime(2008, 4, 1, 0, 0), datetime.datetime(2008, 4, 2, 0, 0), datetime.datetime(2008, 4, 3, 0, 0), datetime.datetime(2008, 4, 4, 0, 0), datetime.datetime(2008, 4, 7, 0, 0), datetime.datetime(2008, 4, 8, 0, 0), datetime.datetime(2008, 4, 9, 0, 0), datetime.datetime(2008, 4, 10, 0, 0), datetime.datetime(2008, 4, 11, 0, 0), datetime.datetime(2008, 4, 14, 0, 0), datetime.datetime(2008, 4, 15, 0, 0), datetime.datetime(2008, 4, 16, 0, 0), datetime.datetime(2008, 4, 17, 0, 0), datetime.datetime(2008, 4, 18, 0, 0), datetime.datetime(2008, 4, 21, 0, 0), datetime.datetime(2008, 4, 22, 0, 0), datetime.datetime(2008, 4, 23, 0, 0), datetime.datetime(2008, 4, 24, 0, 0), datetime.datetime(2008, 4, 25, 0, 0), datetime.datetime(2008, 4, 28, 0, 0), datetime.datetime(2008, 4, 29, 0, 0), datetime.datetime(2008, 4, 30, 0, 0), datetime.datetime(2008, 5, 1, 0, 0), datetime.datetime(2008, 5, 2, 0, 0), datetime.datetime(2008, 5, 5, 0, 0), datetime.datetime(2008, 5, 6, 0, 0), datetime.datetime(2008, 5, 7, 0, 0), datetime.datetime(2008, 5, 8, 0, 0), datetime.datetime(2008, 5, 9, 0, 0), datetime.datetime(2008, 5, 12, 0, 0), datetime.datetime(2008, 5, 13, 0, 0), datetime.datetime(2008, 5, 14, 0, 0), datetime.datetime(2008, 5, 15, 0, 0), datetime.datetime(2008, 5, 16, 0, 0), datetime.datetime(2008, 5, 19, 0, 0), datetime.datetime(2008, 5, 20, 0, 0), datetime.datetime(2008, 5, 21, 0, 0), datetime.datetime(2008, 5, 22, 0, 0), datetime.datetime(2008, 5, 23, 0, 0), datetime.datetime(2008, 5, 27, 0, 0), datetime.datetime(2008, 5, 28, 0, 0), datetime.datetime(2008, 5, 29, 0, 0), datetime.datetime(2008, 5, 30, 0, 0), datetime.datetime(2008, 6, 2, 0, 0), datetime.datetime(2008, 6, 3, 0, 0), datetime.datetime(2008, 6, 4, 0, 0), datetime.datetime(2008, 6, 5, 0, 0), datetime.datetime(2008, 6, 6, 0, 0), datetime.datetime(2008, 6, 9, 0, 0), datetime.datetime(2008, 6, 10, 0, 0), datetime.datetime(2008, 6, 11, 0, 0), datetime.datetime(2008, 6, 12, 0, 0), datetime.datetime(2008, 6, 13, 0, 0), datetime.datetime(2008, 6, 16, 0, 0), datetime.datetime(2008, 6, 17, 0, 0), datetime.datetime(2008, 6, 18, 0, 0), datetime.datetime(2008, 6, 19, 0, 0), datetime.datetime(2008, 6, 20, 0, 0), datetime.datetime(2008, 6, 23, 0, 0), datetime.datetime(2008, 6, 24, 0, 0), datetime.datetime(2008, 6, 25, 0, 0), datetime.datetime(2008, 6, 26, 0, 0), datetime.datetime(2008, 6, 27, 0, 0), datetime.datetime(2008, 6, 30, 0, 0), datetime.datetime(2008, 7, 1, 0, 0), datetime.datetime(2008, 7, 2, 0, 0), datetime.datetime(2008, 7, 3, 0, 0), datetime.datetime(2008, 7, 7, 0, 0), datetime.datetime(2008, 7, 8, 0, 0), datetime.datetime(2008, 7, 9, 0, 0), datetime.datetime(2008, 7, 10, 0, 0), datetime.datetime(2008, 7, 11, 0, 0), datetime.datetime(2008, 7, 14, 0, 0), datetime.datetime(2008, 7, 15, 0, 0), datetime.datetime(2008, 7, 16, 0, 0), datetime.datetime(2008, 7, 17, 0, 0), datetime.datetime(2008, 7, 18, 0, 0), datetime.datetime(2008, 7, 21, 0, 0), datetime.datetime(2008, 7, 22, 0, 0), datetime.datetime(2008, 7, 23, 0, 0), datetime.datetime(2008, 7, 24, 0, 0), datetime.datetime(2008, 7, 25, 0, 0), datetime.datetime(2008, 7, 28, 0, 0), datetime.datetime(2008, 7, 29, 0, 0), datetime.datetime(2008, 7, 30, 0, 0), datetime.datetime(2008, 7, 31, 0, 0), datetime.datetime(2008, 8, 1, 0, 0), datetime.datetime(2008, 8, 4, 0, 0), datetime.datetime(2008, 8, 5, 0, 0), datetime.datetime(2008, 8, 6, 0, 0), datetime.datetime(2008, 8, 7, 0, 0), datetime.datetime(2008, 8, 8, 0, 0), datetime.datetime(2008, 8, 11, 0, 0), datetime.datetime(2008, 8, 12, 0, 0), datetime.datetime(2008, 8, 13, 0, 0), datetime.datetime(2008, 8, 14, 0, 0), datetime.datetime(2008, 8, 15, 0, 0), datetime.datetime(2008, 8, 18, 0, 0), datetime.datetime(2008, 8, 19, 0, 0), datetime.datetime(2008, 8, 20, 0, 0), datetime.datetime(2008, 8, 21, 0, 0), datetime.datetime(2008, 8, 22, 0, 0), datetime.datetime(2008, 8, 25, 0, 0), datetime.datetime(2008, 8, 26, 0, 0), datetime.datetime(2008, 8, 27, 0, 0), datetime.datetime(2008, 8, 28, 0, 0), datetime.datetime(2008, 8, 29, 0, 0), datetime.datetime(2008, 9, 2, 0, 0), datetime.datetime(2008, 9, 3, 0, 0), datetime.datetime(2008, 9, 4, 0, 0), datetime.datetime(2008, 9, 5, 0, 0), datetime.datetime(2008, 9, 8, 0, 0), datetime.datetime(2008, 9, 9, 0, 0), datetime.datetime(2008, 9, 10, 0, 0), datetime.datetime(2008, 9, 11, 0, 0), datetime.datetime(2008, 9, 12, 0, 0), datetime.datetime(2008, 9, 15, 0, 0), datetime.datetime(2008, 9, 16, 0, 0), datetime.datetime(2008, 9, 17, 0, 0), datetime.datetime(2008, 9, 18, 0, 0), datetime.datetime(2008, 9, 19, 0, 0), datetime.datetime(2008, 9, 22, 0, 0), datetime.datetime(2008, 9, 23, 0, 0), datetime.datetime(2008, 9, 24, 0, 0), datetime.datetime(2008, 9, 25, 0, 0), datetime.datetime(2008, 9, 26, 0, 0), datetime.datetime(2008, 9, 29, 0, 0), datetime.datetime(2008, 9, 30, 0, 0), datetime.datetime(2008, 10, 1, 0, 0), datetime.datetime(2008, 10, 2, 0, 0), datetime.datetime(2008, 10, 3, 0, 0), datetime.datetime(2008, 10, 6, 0, 0), datetime.datetime(2008, 10, 7, 0, 0), datetime.datetime(2008, 10, 8, 0, 0), datetime.datetime(2008, 10, 9, 0, 0), datetime.datetime(2008, 10, 10, 0, 0), datetime.datetime(2008, 10, 13, 0, 0), datetime.datetime(2008, 10, 14, 0, 0), datetime.datetime(2008, 10, 15, 0, 0), datetime.datetime(2008, 10, 16, 0, 0), datetime.datetime(2008, 10, 17, 0, 0), datetime.datetime(2008, 10, 20, 0, 0), datetime.datetime(2008, 10, 21, 0, 0), datetime.datetime(2008, 10, 22, 0, 0), datetime.datetime(2008, 10, 23, 0, 0), datetime.datetime(2008, 10, 24, 0, 0), datetime.datetime(2008, 10, 27, 0, 0), datetime.datetime(2008, 10, 28, 0, 0), datetime.datetime(2008, 10, 29, 0, 0), datetime.datetime(2008, 10, 30, 0, 0), datetime.datetime(2008, 10, 31, 0, 0), datetime.datetime(2008, 11, 3, 0, 0), datetime.datetime(2008, 11, 4, 0, 0), datetime.datetime(2008, 11, 5, 0, 0), datetime.datetime(2008, 11, 6, 0, 0), datetime.datetime(2008, 11, 7, 0, 0), datetime.datetime(2008, 11, 10, 0, 0), datetime.datetime(2008, 11, 11, 0, 0), datetime.datetime(2008, 11, 12, 0, 0), datetime.datetime(2008, 11, 13, 0, 0), datetime.datetime(2008, 11, 14, 0, 0), datetime.datetime(2008, 11, 17, 0, 0), datetime.datetime(2008, 11, 18, 0, 0), datetime.datetime(2008, 11, 19, 0, 0), datetime.datetime(2008, 11, 20, 0, 0), datetime.datetime(2008, 11, 21, 0, 0), datetime.datetime(2008, 11, 24, 0, 0), datetime.datetime(2008, 11, 25, 0, 0), datetime.datetime(2008, 11, 26, 0, 0), datetime.datetime(2008, 11, 28, 0, 0), datetime.datetime(2008, 12, 1, 0, 0), datetime.datetime(2008, 12, 2, 0, 0), datetime.datetime(2008, 12, 3, 0, 0), datetime.datetime(2008, 12, 4, 0, 0), datetime.datetime(2008, 12, 5, 0, 0), datetime.datetime(2008, 12, 8, 0, 0), datetime.datetime(2008, 12, 9, 0, 0), datetime.datetime(2008, 12, 10, 0, 0), datetime.datetime(2008, 12, 11, 0, 0), datetime.datetime(2008, 12, 12, 0, 0), datetime.datetime(2008, 12, 15, 0, 0), datetime.datetime(2008, 12, 16, 0, 0), datetime.datetime(2008, 12, 17, 0, 0), datetime.datetime(2008, 12, 18, 0, 0), datetime.datetime(2008, 12, 19, 0, 0), datetime.datetime(2008, 12, 22, 0, 0), datetime.datetime(2008, 12, 23, 0, 0), datetime.datetime(2008, 12, 24, 0, 0), datetime.datetime(2008, 12, 26, 0, 0), datetime.datetime(2008, 12, 29, 0, 0), datetime.datetime(2008, 12, 30, 0, 0), datetime.datetime(2008, 12, 31, 0, 0), datetime.datetime(2009, 1, 2, 0, 0), datetime.datetime(2009, 1, 5, 0, 0), datetime.datetime(2009, 1, 6, 0, 0), datetime.datetime(2009, 1, 7, 0, 0), datetime.datetime(2009, 1, 8, 0, 0), datetime.datetime(2009, 1, 9, 0, 0), datetime.datetime(2009, 1, 12, 0, 0), datetime.datetime(2009, 1, 13, 0, 0), datetime.datetime(2009, 1, 14, 0, 0), datetime.datetime(2009, 1, 15, 0, 0), datetime.datetime(2009, 1, 16, 0, 0), datetime.datetime(2009, 1, 20, 0, 0), datetime.datetime(2009, 1, 21, 0, 0), datetime.datetime(2009, 1, 22, 0, 0), datetime.datetime(2009, 1, 23, 0, 0), datetime.datetime(2009, 1, 26, 0, 0), datetime.datetime(2009, 1, 27, 0, 0), datetime.datetime(2009, 1, 28, 0, 0), datetime.datetime(2009, 1, 29, 0, 0), datetime.datetime(2009, 1, 30, 0, 0), datetime.datetime(2009, 2, 2, 0, 0), datetime.datetime(2009, 2, 3, 0, 0), datetime.datetime(2009, 2, 4, 0, 0), datetime.datetime(2009, 2, 5, 0, 0), datetime.datetime(2009, 2, 6, 0, 0), datetime.datetime(2009, 2, 9, 0, 0), datetime.datetime(2009, 2, 10, 0, 0), datetime.datetime(2009, 2, 11, 0, 0), datetime.datetime(2009, 2, 12, 0, 0), datetime.datetime(2009, 2, 13, 0, 0), datetime.datetime(2009, 2, 17, 0, 0), datetime.datetime(2009, 2, 18, 0, 0), datetime.datetime(2009, 2, 19, 0, 0), datetime.datetime(2009, 2, 20, 0, 0), datetime.datetime(2009, 2, 23, 0, 0), datetime.datetime(2009, 2, 24, 0, 0), datetime.datetime(2009, 2, 25, 0, 0), datetime.datetime(2009, 2, 26, 0, 0), datetime.datetime(2009, 2, 27, 0, 0), datetime.datetime(2009, 3, 2, 0, 0), datetime.datetime(2009, 3, 3, 0, 0), datetime.datetime(2009, 3, 4, 0, 0), datetime.datetime(2009, 3, 5, 0, 0), datetime.datetime(2009, 3, 6, 0, 0), datetime.datetime(2009, 3, 9, 0, 0), datetime.datetime(2009, 3, 10, 0, 0), datetime.datetime(2009, 3, 11, 0, 0), datetime.datetime(2009, 3, 12, 0, 0), datetime.datetime(2009, 3, 13, 0, 0), datetime.datetime(2009, 3, 16, 0, 0), datetime.datetime(2009, 3, 17, 0, 0), datetime.datetime(2009, 3, 18, 0, 0), datetime.datetime(2009, 3, 19, 0, 0), datetime.datetime(2009, 3, 20, 0, 0), datetime.datetime(2009, 3, 23, 0, 0), datetime.datetime(2009, 3, 24, 0, 0), datetime.datetime(2009, 3, 25, 0, 0), datetime.datetime(2009, 3, 26, 0, 0), datetime.datetime(2009, 3, 27, 0, 0), datetime.datetime(2009, 3, 30, 0, 0), datetime.datetime(2009, 3, 31, 0, 0), datetime.datetime(2009, 4, 1, 0, 0), datetime.datetime(2009, 4, 2, 0, 0), datetime.datetime(2009, 4, 3, 0, 0), datetime.datetime(2009, 4, 6, 0, 0), datetime.datetime(2009, 4, 7, 0, 0), datetime.datetime(2009, 4, 8, 0, 0), datetime.datetime(2009, 4, 9, 0, 0), datetime.datetime(2009, 4, 13, 0, 0), datetime.datetime(2009, 4, 14, 0, 0), datetime.datetime(2009, 4, 15, 0, 0), datetime.datetime(2009, 4, 16, 0, 0), datetime.datetime(2009, 4, 17, 0, 0), datetime.datetime(2009, 4, 20, 0, 0), datetime.datetime(2009, 4, 21, 0, 0), datetime.datetime(2009, 4, 22, 0, 0), datetime.datetime(2009, 4, 23, 0, 0), datetime.datetime(2009, 4, 24, 0, 0), datetime.datetime(2009, 4, 27, 0, 0), datetime.datetime(2009, 4, 28, 0, 0), datetime.datetime(2009, 4, 29, 0, 0), datetime.datetime(2009, 4, 30, 0, 0), datetime.datetime(2009, 5, 1, 0, 0), datetime.datetime(2009, 5, 4, 0, 0), datetime.datetime(2009, 5, 5, 0, 0), datetime.datetime(2009, 5, 6, 0, 0), datetime.datetime(2009, 5, 7, 0, 0), datetime.datetime(2009, 5, 8, 0, 0), datetime.datetime(2009, 5, 11, 0, 0), datetime.datetime(2009, 5, 12, 0, 0), datetime.datetime(2009, 5, 13, 0, 0), datetime.datetime(2009, 5, 14, 0, 0), datetime.datetime(2009, 5, 15, 0, 0), datetime.datetime(2009, 5, 18, 0, 0), datetime.datetime(2009, 5, 19, 0, 0), datetime.datetime(2009, 5, 20, 0, 0), datetime.datetime(2009, 5, 21, 0, 0), datetime.datetime(2009, 5, 22, 0, 0), datetime.datetime(2009, 5, 26, 0, 0), datetime.datetime(2009, 5, 27, 0, 0), datetime.datetime(2009, 5, 28, 0, 0), datetime.datetime(2009, 5, 29, 0, 0), datetime.datetime(2009, 6, 1, 0, 0), datetime.datetime(2009, 6, 2, 0, 0), datetime.datetime(2009, 6, 3, 0, 0), datetime.datetime(2009, 6, 4, 0, 0), datetime.datetime(2009, 6, 5, 0, 0), datetime.datetime(2009, 6, 8, 0, 0), datetime.datetime(2009, 6, 9, 0, 0), datetime.datetime(2009, 6, 10, 0, 0), datetime.datetime(2009, 6, 11, 0, 0), datetime.datetime(2009, 6, 12, 0, 0), datetime.datetime(2009, 6, 15, 0, 0), datetime.datetime(2009, 6, 16, 0, 0), datetime.datetime(2009, 6, 17, 0, 0), datetime.datetime(2009, 6, 18, 0, 0), datetime.datetime(2009, 6, 19, 0, 0), datetime.datetime(2009, 6, 22, 0, 0), datetime.datetime(2009, 6, 23, 0, 0), datetime.datetime(2009, 6, 24, 0, 0), datetime.datetime(2009, 6, 25, 0, 0), datetime.datetime(2009, 6, 26, 0, 0), datetime.datetime(2009, 6, 29, 0, 0), datetime.datetime(2009, 6, 30, 0, 0), datetime.datetime(2009, 7, 1, 0, 0), datetime.datetime(2009, 7, 2, 0, 0), datetime.datetime(2009, 7, 6, 0, 0), datetime.datetime(2009, 7, 7, 0, 0), datetime.datetime(2009, 7, 8, 0, 0), datetime.datetime(2009, 7, 9, 0, 0), datetime.datetime(2009, 7, 10, 0, 0), datetime.datetime(2009, 7, 13, 0, 0), datetime.datetime(2009, 7, 14, 0, 0), datetime.datetime(2009, 7, 15, 0, 0), datetime.datetime(2009, 7, 16, 0, 0), datetime.datetime(2009, 7, 17, 0, 0), datetime.datetime(2009, 7, 20, 0, 0), datetime.datetime(2009, 7, 21, 0, 0), datetime.datetime(2009, 7, 22, 0, 0), datetime.datetime(2009, 7, 23, 0, 0), datetime.datetime(2009, 7, 24, 0, 0), datetime.datetime(2009, 7, 27, 0, 0), datetime.datetime(2009, 7, 28, 0, 0), datetime.datetime(2009, 7, 29, 0, 0), datetime.datetime(2009, 7, 30, 0, 0), datetime.datetime(2009, 7, 31, 0, 0), datetime.datetime(2009, 8, 3, 0, 0), datetime.datetime(2009, 8, 4, 0, 0), datetime.datetime(2009, 8, 5, 0, 0), datetime.datetime(2009, 8, 6, 0, 0), datetime.datetime(2009, 8, 7, 0, 0), datetime.datetime(2009, 8, 10, 0, 0), datetime.datetime(2009, 8, 11, 0, 0), datetime.datetime(2009, 8, 12, 0, 0), datetime.datetime(2009, 8, 13, 0, 0), datetime.datetime(2009, 8, 14, 0, 0), datetime.datetime(2009, 8, 17, 0, 0), datetime.datetime(2009, 8, 18, 0, 0), datetime.datetime(2009, 8, 19, 0, 0), datetime.datetime(2009, 8, 20, 0, 0), datetime.datetime(2009, 8, 21, 0, 0), datetime.datetime(2009, 8, 24, 0, 0), datetime.datetime(2009, 8, 25, 0, 0), datetime.datetime(2009, 8, 26, 0, 0), datetime.datetime(2009, 8, 27, 0, 0), datetime.datetime(2009, 8, 28, 0, 0), datetime.datetime(2009, 8, 31, 0, 0), datetime.datetime(2009, 9, 1, 0, 0), datetime.datetime(2009, 9, 2, 0, 0), datetime.datetime(2009, 9, 3, 0, 0), datetime.datetime(2009, 9, 4, 0, 0), datetime.datetime(2009, 9, 8, 0, 0), datetime.datetime(2009, 9, 9, 0, 0), datetime.datetime(2009, 9, 10, 0, 0), datetime.datetime(2009, 9, 11, 0, 0), datetime.datetime(2009, 9, 14, 0, 0), datetime.datetime(2009, 9, 15, 0, 0), datetime.datetime(2009, 9, 16, 0, 0), datetime.datetime(2009, 9, 17, 0, 0), datetime.datetime(2009, 9, 18, 0, 0), datetime.datetime(2009, 9, 21, 0, 0), datetime.datetime(2009, 9, 22, 0, 0), datetime.datetime(2009, 9, 23, 0, 0), datetime.datetime(2009, 9, 24, 0, 0), datetime.datetime(2009, 9, 25, 0, 0), datetime.datetime(2009, 9, 28, 0, 0), datetime.datetime(2009, 9, 29, 0, 0), datetime.datetime(2009, 9, 30, 0, 0), datetime.datetime(2009, 10, 1, 0, 0), datetime.datetime(2009, 10, 2, 0, 0), datetime.datetime(2009, 10, 5, 0, 0), datetime.datetime(2009, 10, 6, 0, 0), datetime.datetime(2009, 10, 7, 0, 0), datetime.datetime(2009, 10, 8, 0, 0), datetime.datetime(2009, 10, 9, 0, 0), datetime.datetime(2009, 10, 12, 0, 0), datetime.datetime(2009, 10, 13, 0, 0), datetime.datetime(2009, 10, 14, 0, 0), datetime.datetime(2009, 10, 15, 0, 0), datetime.datetime(2009, 10, 16, 0, 0), datetime.datetime(2009, 10, 19, 0, 0), datetime.datetime(2009, 10, 20, 0, 0), datetime.datetime(2009, 10, 21, 0, 0), datetime.datetime(2009, 10, 22, 0, 0), datetime.datetime(2009, 10, 23, 0, 0), datetime.datetime(2009, 10, 26, 0, 0), datetime.datetime(2009, 10, 27, 0, 0), datetime.datetime(2009, 10, 28, 0, 0), datetime.datetime(2009, 10, 29, 0, 0), datetime.datetime(2009, 10, 30, 0, 0), datetime.datetime(2009, 11, 2, 0, 0), datetime.datetime(2009, 11, 3, 0, 0), datetime.datetime(2009, 11, 4, 0, 0), datetime.datetime(2009, 11, 5, 0, 0), datetime.datetime(2009, 11, 6, 0, 0), datetime.datetime(2009, 11, 9, 0, 0), datetime.datetime(2009, 11, 10, 0, 0), datetime.datetime(2009, 11, 11, 0, 0), datetime.datetime(2009, 11, 12, 0, 0), datetime.datetime(2009, 11, 13, 0, 0), datetime.datetime(2009, 11, 16, 0, 0), datetime.datetime(2009, 11, 17, 0, 0), datetime.datetime(2009, 11, 18, 0, 0), datetime.datetime(2009, 11, 19, 0, 0), datetime.datetime(2009, 11, 20, 0, 0), datetime.datetime(2009, 11, 23, 0, 0), datetime.datetime(2009, 11, 24, 0, 0), datetime.datetime(2009, 11, 25, 0, 0), datetime.datetime(2009, 11, 27, 0, 0), datetime.datetime(2009, 11, 30, 0, 0), datetime.datetime(2009, 12, 1, 0, 0), datetime.datetime(2009, 12, 2, 0, 0), datetime.datetime(2009, 12, 3, 0, 0), datetime.datetime(2009, 12, 4, 0, 0), datetime.datetime(2009, 12, 7, 0, 0), datetime.datetime(2009, 12, 8, 0, 0), datetime.datetime(2009, 12, 9, 0, 0), datetime.datetime(2009, 12, 10, 0, 0), datetime.datetime(2009, 12, 11, 0, 0), datetime.datetime(2009, 12, 14, 0, 0), datetime.datetime(2009, 12, 15, 0, 0), datetime.datetime(2009, 12, 16, 0, 0), datetime.datetime(2009, 12, 17, 0, 0), datetime.datetime(2009, 12, 18, 0, 0), datetime.datetime(2009, 12, 21, 0, 0), datetime.datetime(2009, 12, 22, 0, 0), datetime.datetime(2009, 12, 23, 0, 0), datetime.datetime(2009, 12, 24, 0, 0), datetime.datetime(2009, 12, 28, 0, 0), datetime.datetime(2009, 12, 29, 0, 0), datetime.datetime(2009, 12, 30, 0, 0), datetime.datetime(2009, 12, 31, 0, 0), datetime.datetime(2010, 1, 4, 0, 0), datetime.datetime(2010, 1, 5, 0, 0), datetime.datetime(2010, 1, 6, 0, 0), datetime.datetime(2010, 1, 7, 0, 0), datetime.datetime(2010, 1, 8, 0, 0), datetime.datetime(2010, 1, 11, 0, 0), datetime.datetime(2010, 1, 12, 0, 0), datetime.datetime(2010, 1, 13, 0, 0), datetime.datetime(2010, 1, 14, 0, 0), datetime.datetime(2010, 1, 15, 0, 0), datetime.datetime(2010, 1, 19, 0, 0), datetime.datetime(2010, 1, 20, 0, 0), datetime.datetime(2010, 1, 21, 0, 0), datetime.datetime(2010, 1, 22, 0, 0), datetime.datetime(2010, 1, 25, 0, 0), datetime.datetime(2010, 1, 26, 0, 0), datetime.datetime(2010, 1, 27, 0, 0), datetime.datetime(2010, 1, 28, 0, 0), datetime.datetime(2010, 1, 29, 0, 0), datetime.datetime(2010, 2, 1, 0, 0), datetime.datetime(2010, 2, 2, 0, 0), datetime.datetime(2010, 2, 3, 0, 0), datetime.datetime(2010, 2, 4, 0, 0), datetime.datetime(2010, 2, 5, 0, 0), datetime.datetime(2010, 2, 8, 0, 0), datetime.datetime(2010, 2, 9, 0, 0), datetime.datetime(2010, 2, 10, 0, 0), datetime.datetime(2010, 2, 11, 0, 0), datetime.datetime(2010, 2, 12, 0, 0), datetime.datetime(2010, 2, 16, 0, 0), datetime.datetime(2010, 2, 17, 0, 0), datetime.datetime(2010, 2, 18, 0, 0), datetime.datetime(2010, 2, 19, 0, 0), datetime.datetime(2010, 2, 22, 0, 0), datetime.datetime(2010, 2, 23, 0, 0), datetime.datetime(2010, 2, 24, 0, 0), datetime.datetime(2010, 2, 25, 0, 0), datetime.datetime(2010, 2, 26, 0, 0), datetime.datetime(2010, 3, 1, 0, 0), datetime.datetime(2010, 3, 2, 0, 0), datetime.datetime(2010, 3, 3, 0, 0), datetime.datetime(2010, 3, 4, 0, 0), datetime.datetime(2010, 3, 5, 0, 0), datetime.datetime(2010, 3, 8, 0, 0), datetime.datetime(2010, 3, 9, 0, 0), datetime.datetime(2010, 3, 10, 0, 0), datetime.datetime(2010, 3, 11, 0, 0), datetime.datetime(2010, 3, 12, 0, 0), datetime.datetime(2010, 3, 15, 0, 0), datetime.datetime(2010, 3, 16, 0, 0), datetime.datetime(2010, 3, 17, 0, 0), datetime.datetime(2010, 3, 18, 0, 0), datetime.datetime(2010, 3, 19, 0, 0), datetime.datetime(2010, 3, 22, 0, 0), datetime.datetime(2010, 3, 23, 0, 0), datetime.datetime(2010, 3, 24, 0, 0), datetime.datetime(2010, 3, 25, 0, 0), datetime.datetime(2010, 3, 26, 0, 0), datetime.datetime(2010, 3, 29, 0, 0), datetime.datetime(2010, 3, 30, 0, 0), datetime.datetime(2010, 3, 31, 0, 0), datetime.datetime(2010, 4, 1, 0, 0), datetime.datetime(2010, 4, 5, 0, 0), datetime.datetime(2010, 4, 6, 0, 0), datetime.datetime(2010, 4, 7, 0, 0), datetime.datetime(2010, 4, 8, 0, 0), datetime.datetime(2010, 4, 9, 0, 0), datetime.datetime(2010, 4, 12, 0, 0), datetime.datetime(2010, 4, 13, 0, 0), datetime.datetime(2010, 4, 14, 0, 0), datetime.datetime(2010, 4, 15, 0, 0), datetime.datetime(2010, 4, 16, 0, 0), datetime.datetime(2010, 4, 19, 0, 0), datetime.datetime(2010, 4, 20, 0, 0), datetime.datetime(2010, 4, 21, 0, 0), datetime.datetime(2010, 4, 22, 0, 0), datetime.datetime(2010, 4, 23, 0, 0), datetime.datetime(2010, 4, 26, 0, 0), datetime.datetime(2010, 4, 27, 0, 0), datetime.datetime(2010, 4, 28, 0, 0), datetime.datetime(2010, 4, 29, 0, 0), datetime.datetime(2010, 4, 30, 0, 0), datetime.datetime(2010, 5, 3, 0, 0), datetime.datetime(2010, 5, 4, 0, 0), datetime.datetime(2010, 5, 5, 0, 0), datetime.datetime(2010, 5, 6, 0, 0), datetime.datetime(2010, 5, 7, 0, 0), datetime.datetime(2010, 5, 10, 0, 0), datetime.datetime(2010, 5, 11, 0, 0), datetime.datetime(2010, 5, 12, 0, 0), datetime.datetime(2010, 5, 13, 0, 0), datetime.datetime(2010, 5, 14, 0, 0), datetime.datetime(2010, 5, 17, 0, 0), datetime.datetime(2010, 5, 18, 0, 0), datetime.datetime(2010, 5, 19, 0, 0), datetime.datetime(2010, 5, 20, 0, 0), datetime.datetime(2010, 5, 21, 0, 0), datetime.datetime(2010, 5, 24, 0, 0), datetime.datetime(2010, 5, 25, 0, 0), datetime.datetime(2010, 5, 26, 0, 0), datetime.datetime(2010, 5, 27, 0, 0), datetime.datetime(2010, 5, 28, 0, 0), datetime.datetime(2010, 6, 1, 0, 0), datetime.datetime(2010, 6, 2, 0, 0), datetime.datetime(2010, 6, 3, 0, 0), datetime.datetime(2010, 6, 4, 0, 0), datetime.datetime(2010, 6, 7, 0, 0), datetime.datetime(2010, 6, 8, 0, 0), datetime.datetime(2010, 6, 9, 0, 0), datetime.datetime(2010, 6, 10, 0, 0), datetime.datetime(2010, 6, 11, 0, 0), datetime.datetime(2010, 6, 14, 0, 0), datetime.datetime(2010, 6, 15, 0, 0), datetime.datetime(2010, 6, 16, 0, 0), datetime.datetime(2010, 6, 17, 0, 0), datetime.datetime(2010, 6, 18, 0, 0), datetime.datetime(2010, 6, 21, 0, 0), datetime.datetime(2010, 6, 22, 0, 0), datetime.datetime(2010, 6, 23, 0, 0), datetime.datetime(2010, 6, 24, 0, 0), datetime.datetime(2010, 6, 25, 0, 0), datetime.datetime(2010, 6, 28, 0, 0), datetime.datetime(2010, 6, 29, 0, 0), datetime.datetime(2010, 6, 30, 0, 0), datetime.datetime(2010, 7, 1, 0, 0), datetime.datetime(2010, 7, 2, 0, 0), datetime.datetime(2010, 7, 6, 0, 0), datetime.datetime(2010, 7, 7, 0, 0), datetime.datetime(2010, 7, 8, 0, 0), datetime.datetime(2010, 7, 9, 0, 0), datetime.datetime(2010, 7, 12, 0, 0), datetime.datetime(2010, 7, 13, 0, 0), datetime.datetime(2010, 7, 14, 0, 0), datetime.datetime(2010, 7, 15, 0, 0), datetime.datetime(2010, 7, 16, 0, 0), datetime.datetime(2010, 7, 19, 0, 0), datetime.datetime(2010, 7, 20, 0, 0), datetime.datetime(2010, 7, 21, 0, 0), datetime.datetime(2010, 7, 22, 0, 0), datetime.datetime(2010, 7, 23, 0, 0), datetime.datetime(2010, 7, 26, 0, 0), datetime.datetime(2010, 7, 27, 0, 0), datetime.datetime(2010, 7, 28, 0, 0), datetime.datetime(2010, 7, 29, 0, 0), datetime.datetime(2010, 7, 30, 0, 0), datetime.datetime(2010, 8, 2, 0, 0), datetime.datetime(2010, 8, 3, 0, 0), datetime.datetime(2010, 8, 4, 0, 0), datetime.datetime(2010, 8, 5, 0, 0), datetime.datetime(2010, 8, 6, 0, 0), datetime.datetime(2010, 8, 9, 0, 0), datetime.datetime(2010, 8, 10, 0, 0), datetime.datetime(2010, 8, 11, 0, 0), datetime.datetime(2010, 8, 12, 0, 0), datetime.datetime(2010, 8, 13, 0, 0), datetime.datetime(2010, 8, 16, 0, 0), datetime.datetime(2010, 8, 17, 0, 0), datetime.datetime(2010, 8, 18, 0, 0), datetime.datetime(2010, 8, 19, 0, 0), datetime.datetime(2010, 8, 20, 0, 0), datetime.datetime(2010, 8, 23, 0, 0), datetime.datetime(2010, 8, 24, 0, 0), datetime.datetime(2010, 8, 25, 0, 0), datetime.datetime(2010, 8, 26, 0, 0), datetime.datetime(2010, 8, 27, 0, 0), datetime.datetime(2010, 8, 30, 0, 0), datetime.datetime(2010, 8, 31, 0, 0), datetime.datetime(2010, 9, 1, 0, 0), datetime.datetime(2010, 9, 2, 0, 0), datetime.datetime(2010, 9, 3, 0, 0), datetime.datetime(2010, 9, 7, 0, 0), datetime.datetime(2010, 9, 8, 0, 0), datetime.datetime(2010, 9, 9, 0, 0), datetime.datetime(2010, 9, 10, 0, 0), datetime.datetime(2010, 9, 13, 0, 0), datetime.datetime(2010, 9, 14, 0, 0), datetime.datetime(2010, 9, 15, 0, 0), datetime.datetime(2010, 9, 16, 0, 0), datetime.datetime(2010, 9, 17, 0, 0), datetime.datetime(2010, 9, 20, 0, 0), datetime.datetime(2010, 9, 21, 0, 0), datetime.datetime(2010, 9, 22, 0, 0), datetime.datetime(2010, 9, 23, 0, 0), datetime.datetime(2010, 9, 24, 0, 0), datetime.datetime(2010, 9, 27, 0, 0), datetime.datetime(2010, 9, 28, 0, 0), datetime.datetime(2010, 9, 29, 0, 0), datetime.datetime(2010, 9, 30, 0, 0), datetime.datetime(2010, 10, 1, 0, 0), datetime.datetime(2010, 10, 4, 0, 0), datetime.datetime(2010, 10, 5, 0, 0), datetime.datetime(2010, 10, 6, 0, 0), datetime.datetime(2010, 10, 7, 0, 0), datetime.datetime(2010, 10, 8, 0, 0), datetime.datetime(2010, 10, 11, 0, 0), datetime.datetime(2010, 10, 12, 0, 0), datetime.datetime(2010, 10, 13, 0, 0), datetime.datetime(2010, 10, 14, 0, 0), datetime.datetime(2010, 10, 15, 0, 0), datetime.datetime(2010, 10, 18, 0, 0), datetime.datetime(2010, 10, 19, 0, 0), datetime.datetime(2010, 10, 20, 0, 0), datetime.datetime(2010, 10, 21, 0, 0), datetime.datetime(2010, 10, 22, 0, 0), datetime.datetime(2010, 10, 25, 0, 0), datetime.datetime(2010, 10, 26, 0, 0), datetime.datetime(2010, 10, 27, 0, 0), datetime.datetime(2010, 10, 28, 0, 0), datetime.datetime(2010, 10, 29, 0, 0), datetime.datetime(2010, 11, 1, 0, 0), datetime.datetime(2010, 11, 2, 0, 0), datetime.datetime(2010, 11, 3, 0, 0), datetime.datetime(2010, 11, 4, 0, 0), datetime.datetime(2010, 11, 5, 0, 0), datetime.datetime(2010, 11, 8, 0, 0), datetime.datetime(2010, 11, 9, 0, 0), datetime.datetime(2010, 11, 10, 0, 0), datetime.datetime(2010, 11, 11, 0, 0), datetime.datetime(2010, 11, 12, 0, 0), datetime.datetime(2010, 11, 15, 0, 0), datetime.datetime(2010, 11, 16, 0, 0), datetime.datetime(2010, 11, 17, 0, 0), datetime.datetime(2010, 11, 18, 0, 0), datetime.datetime(2010, 11, 19, 0, 0), datetime.datetime(2010, 11, 22, 0, 0), datetime.datetime(2010, 11, 23, 0, 0), datetime.datetime(2010, 11, 24, 0, 0), datetime.datetime(2010, 11, 26, 0, 0), datetime.datetime(2010, 11, 29, 0, 0), datetime.datetime(2010, 11, 30, 0, 0), datetime.datetime(2010, 12, 1, 0, 0), datetime.datetime(2010, 12, 2, 0, 0), datetime.datetime(2010, 12, 3, 0, 0), datetime.datetime(2010, 12, 6, 0, 0), datetime.datetime(2010, 12, 7, 0, 0), datetime.datetime(2010, 12, 8, 0, 0), datetime.datetime(2010, 12, 9, 0, 0), datetime.datetime(2010, 12, 10, 0, 0), datetime.datetime(2010, 12, 13, 0, 0), datetime.datetime(2010, 12, 14, 0, 0), datetime.datetime(2010, 12, 15, 0, 0), datetime.datetime(2010, 12, 16, 0, 0), datetime.datetime(2010, 12, 17, 0, 0), datetime.datetime(2010, 12, 20, 0, 0), datetime.datetime(2010, 12, 21, 0, 0), datetime.datetime(2010, 12, 22, 0, 0), datetime.datetime(2010, 12, 23, 0, 0), datetime.datetime(2010, 12, 27, 0, 0), datetime.datetime(2010, 12, 28, 0, 0), datetime.datetime(2010, 12, 29, 0, 0), datetime.datetime(2010, 12, 30, 0, 0), datetime.datetime(2010, 12, 31, 0, 0), datetime.datetime(2011, 1, 3, 0, 0), datetime.datetime(2011, 1, 4, 0, 0), datetime.datetime(2011, 1, 5, 0, 0), datetime.datetime(2011, 1, 6, 0, 0), datetime.datetime(2011, 1, 7, 0, 0), datetime.datetime(2011, 1, 10, 0, 0), datetime.datetime(2011, 1, 11, 0, 0), datetime.datetime(2011, 1, 12, 0, 0), datetime.datetime(2011, 1, 13, 0, 0), datetime.datetime(2011, 1, 14, 0, 0), datetime.datetime(2011, 1, 18, 0, 0), datetime.datetime(2011, 1, 19, 0, 0), datetime.datetime(2011, 1, 20, 0, 0), datetime.datetime(2011, 1, 21, 0, 0), datetime.datetime(2011, 1, 24, 0, 0), datetime.datetime(2011, 1, 25, 0, 0), datetime.datetime(2011, 1, 26, 0, 0), datetime.datetime(2011, 1, 27, 0, 0), datetime.datetime(2011, 1, 28, 0, 0), datetime.datetime(2011, 1, 31, 0, 0), datetime.datetime(2011, 2, 1, 0, 0), datetime.datetime(2011, 2, 2, 0, 0), datetime.datetime(2011, 2, 3, 0, 0), datetime.datetime(2011, 2, 4, 0, 0), datetime.datetime(2011, 2, 7, 0, 0), datetime.datetime(2011, 2, 8, 0, 0), datetime.datetime(2011, 2, 9, 0, 0), datetime.datetime(2011, 2, 10, 0, 0), datetime.datetime(2011, 2, 11, 0, 0), datetime.datetime(2011, 2, 14, 0, 0), datetime.datetime(2011, 2, 15, 0, 0), datetime.datetime(2011, 2, 16, 0, 0), datetime.datetime(2011, 2, 17, 0, 0), datetime.datetime(2011, 2, 18, 0, 0), datetime.datetime(2011, 2, 22, 0, 0), datetime.datetime(2011, 2, 23, 0, 0), datetime.datetime(2011, 2, 24, 0, 0), datetime.datetime(2011, 2, 25, 0, 0), datetime.datetime(2011, 2, 28, 0, 0), datetime.datetime(2011, 3, 1, 0, 0), datetime.datetime(2011, 3, 2, 0, 0), datetime.datetime(2011, 3, 3, 0, 0), datetime.datetime(2011, 3, 4, 0, 0), datetime.datetime(2011, 3, 7, 0, 0), datetime.datetime(2011, 3, 8, 0, 0), datetime.datetime(2011, 3, 9, 0, 0), datetime.datetime(2011, 3, 10, 0, 0), datetime.datetime(2011, 3, 11, 0, 0), datetime.datetime(2011, 3, 14, 0, 0), datetime.datetime(2011, 3, 15, 0, 0), datetime.datetime(2011, 3, 16, 0, 0), datetime.datetime(2011, 3, 17, 0, 0), datetime.datetime(2011, 3, 18, 0, 0), datetime.datetime(2011, 3, 21, 0, 0), datetime.datetime(2011, 3, 22, 0, 0), datetime.datetime(2011, 3, 23, 0, 0), datetime.datetime(2011, 3, 24, 0, 0), datetime.datetime(2011, 3, 25, 0, 0), datetime.datetime(2011, 3, 28, 0, 0), datetime.datetime(2011, 3, 29, 0, 0), datetime.datetime(2011, 3, 30, 0, 0), datetime.datetime(2011, 3, 31, 0, 0), datetime.datetime(2011, 4, 1, 0, 0), datetime.datetime(2011, 4, 4, 0, 0), datetime.datetime(2011, 4, 5, 0, 0), datetime.datetime(2011, 4, 6, 0, 0), datetime.datetime(2011, 4, 7, 0, 0), datetime.datetime(2011, 4, 8, 0, 0), datetime.datetime(2011, 4, 11, 0, 0), datetime.datetime(2011, 4, 12, 0, 0), datetime.datetime(2011, 4, 13, 0, 0), datetime.datetime(2011, 4, 14, 0, 0), datetime.datetime(2011, 4, 15, 0, 0), datetime.datetime(2011, 4, 18, 0, 0), datetime.datetime(2011, 4, 19, 0, 0), datetime.datetime(2011, 4, 20, 0, 0), datetime.datetime(2011, 4, 21, 0, 0), datetime.datetime(2011, 4, 25, 0, 0), datetime.datetime(2011, 4, 26, 0, 0), datetime.datetime(2011, 4, 27, 0, 0), datetime.datetime(2011, 4, 28, 0, 0), datetime.datetime(2011, 4, 29, 0, 0), datetime.datetime(2011, 5, 2, 0, 0), datetime.datetime(2011, 5, 3, 0, 0), datetime.datetime(2011, 5, 4, 0, 0), datetime.datetime(2011, 5, 5, 0, 0), datetime.datetime(2011, 5, 6, 0, 0), datetime.datetime(2011, 5, 9, 0, 0), datetime.datetime(2011, 5, 10, 0, 0), datetime.datetime(2011, 5, 11, 0, 0), datetime.datetime(2011, 5, 12, 0, 0), datetime.datetime(2011, 5, 13, 0, 0), datetime.datetime(2011, 5, 16, 0, 0), datetime.datetime(2011, 5, 17, 0, 0), datetime.datetime(2011, 5, 18, 0, 0), datetime.datetime(2011, 5, 19, 0, 0), datetime.datetime(2011, 5, 20, 0, 0), datetime.datetime(2011, 5, 23, 0, 0), datetime.datetime(2011, 5, 24, 0, 0), datetime.datetime(2011, 5, 25, 0, 0), datetime.datetime(2011, 5, 26, 0, 0), datetime.datetime(2011, 5, 27, 0, 0), datetime.datetime(2011, 5, 31, 0, 0), datetime.datetime(2011, 6, 1, 0, 0), datetime.datetime(2011, 6, 2, 0, 0), datetime.datetime(2011, 6, 3, 0, 0), datetime.datetime(2011, 6, 6, 0, 0), datetime.datetime(2011, 6, 7, 0, 0), datetime.datetime(2011, 6, 8, 0, 0), datetime.datetime(2011, 6, 9, 0, 0), datetime.datetime(2011, 6, 10, 0, 0), datetime.datetime(2011, 6, 13, 0, 0), datetime.datetime(2011, 6, 14, 0, 0), datetime.datetime(2011, 6, 15, 0, 0), datetime.datetime(2011, 6, 16, 0, 0), datetime.datetime(2011, 6, 17, 0, 0), datetime.datetime(2011, 6, 20, 0, 0), datetime.datetime(2011, 6, 21, 0, 0), datetime.datetime(2011, 6, 22, 0, 0), datetime.datetime(2011, 6, 23, 0, 0), datetime.datetime(2011, 6, 24, 0, 0), datetime.datetime(2011, 6, 27, 0, 0), datetime.datetime(2011, 6, 28, 0, 0), datetime.datetime(2011, 6, 29, 0, 0), datetime.datetime(2011, 6, 30, 0, 0), datetime.datetime(2011, 7, 1, 0, 0), datetime.datetime(2011, 7, 5, 0, 0), datetime.datetime(2011, 7, 6, 0, 0), datetime.datetime(2011, 7, 7, 0, 0), datetime.datetime(2011, 7, 8, 0, 0), datetime.datetime(2011, 7, 11, 0, 0), datetime.datetime(2011, 7, 12, 0, 0), datetime.datetime(2011, 7, 13, 0, 0), datetime.datetime(2011, 7, 14, 0, 0), datetime.datetime(2011, 7, 15, 0, 0), datetime.datetime(2011, 7, 18, 0, 0), datetime.datetime(2011, 7, 19, 0, 0), datetime.datetime(2011, 7, 20, 0, 0), datetime.datetime(2011, 7, 21, 0, 0), datetime.datetime(2011, 7, 22, 0, 0), datetime.datetime(2011, 7, 25, 0, 0), datetime.datetime(2011, 7, 26, 0, 0), datetime.datetime(2011, 7, 27, 0, 0), datetime.datetime(2011, 7, 28, 0, 0), datetime.datetime(2011, 7, 29, 0, 0), datetime.datetime(2011, 8, 1, 0, 0), datetime.datetime(2011, 8, 2, 0, 0), datetime.datetime(2011, 8, 3, 0, 0), datetime.datetime(2011, 8, 4, 0, 0), datetime.datetime(2011, 8, 5, 0, 0), datetime.datetime(2011, 8, 8, 0, 0), datetime.datetime(2011, 8, 9, 0, 0), datetime.datetime(2011, 8, 10, 0, 0), datetime.datetime(2011, 8, 11, 0, 0), datetime.datetime(2011, 8, 12, 0, 0), datetime.datetime(2011, 8, 15, 0, 0), datetime.datetime(2011, 8, 16, 0, 0), datetime.datetime(2011, 8, 17, 0, 0), datetime.datetime(2011, 8, 18, 0, 0), datetime.datetime(2011, 8, 19, 0, 0), datetime.datetime(2011, 8, 22, 0, 0), datetime.datetime(2011, 8, 23, 0, 0), datetime.datetime(2011, 8, 24, 0, 0), datetime.datetime(2011, 8, 25, 0, 0), datetime.datetime(2011, 8, 26, 0, 0), datetime.datetime(2011, 8, 29, 0, 0), datetime.datetime(2011, 8, 30, 0, 0), datetime.datetime(2011, 8, 31, 0, 0), datetime.datetime(2011, 9, 1, 0, 0), datetime.datetime(2011, 9, 2, 0, 0), datetime.datetime(2011, 9, 6, 0, 0), datetime.datetime(2011, 9, 7, 0, 0), datetime.datetime(2011, 9, 8, 0, 0), datetime.datetime(2011, 9, 9, 0, 0), datetime.datetime(2011, 9, 12, 0, 0), datetime.datetime(2011, 9, 13, 0, 0), datetime.datetime(2011, 9, 14, 0, 0), datetime.datetime(2011, 9, 15, 0, 0), datetime.datetime(2011, 9, 16, 0, 0), datetime.datetime(2011, 9, 19, 0, 0), datetime.datetime(2011, 9, 20, 0, 0), datetime.datetime(2011, 9, 21, 0, 0), datetime.datetime(2011, 9, 22, 0, 0), datetime.datetime(2011, 9, 23, 0, 0), datetime.datetime(2011, 9, 26, 0, 0), datetime.datetime(2011, 9, 27, 0, 0), datetime.datetime(2011, 9, 28, 0, 0), datetime.datetime(2011, 9, 29, 0, 0), datetime.datetime(2011, 9, 30, 0, 0), datetime.datetime(2011, 10, 3, 0, 0), datetime.datetime(2011, 10, 4, 0, 0), datetime.datetime(2011, 10, 5, 0, 0), datetime.datetime(2011, 10, 6, 0, 0), datetime.datetime(2011, 10, 7, 0, 0), datetime.datetime(2011, 10, 10, 0, 0), datetime.datetime(2011, 10, 11, 0, 0), datetime.datetime(2011, 10, 12, 0, 0), datetime.datetime(2011, 10, 13, 0, 0), datetime.datetime(2011, 10, 14, 0, 0), datetime.datetime(2011, 10, 17, 0, 0), datetime.datetime(2011, 10, 18, 0, 0), datetime.datetime(2011, 10, 19, 0, 0), datetime.datetime(2011, 10, 20, 0, 0), datetime.datetime(2011, 10, 21, 0, 0), datetime.datetime(2011, 10, 24, 0, 0), datetime.datetime(2011, 10, 25, 0, 0), datetime.datetime(2011, 10, 26, 0, 0), datetime.datetime(2011, 10, 27, 0, 0), datetime.datetime(2011, 10, 28, 0, 0), datetime.datetime(2011, 10, 31, 0, 0), datetime.datetime(2011, 11, 1, 0, 0), datetime.datetime(2011, 11, 2, 0, 0), datetime.datetime(2011, 11, 3, 0, 0), datetime.datetime(2011, 11, 4, 0, 0), datetime.datetime(2011, 11, 7, 0, 0), datetime.datetime(2011, 11, 8, 0, 0), datetime.datetime(2011, 11, 9, 0, 0), datetime.datetime(2011, 11, 10, 0, 0), datetime.datetime(2011, 11, 11, 0, 0), datetime.datetime(2011, 11, 14, 0, 0), datetime.datetime(2011, 11, 15, 0, 0), datetime.datetime(2011, 11, 16, 0, 0), datetime.datetime(2011, 11, 17, 0, 0), datetime.datetime(2011, 11, 18, 0, 0), datetime.datetime(2011, 11, 21, 0, 0), datetime.datetime(2011, 11, 22, 0, 0), datetime.datetime(2011, 11, 23, 0, 0), datetime.datetime(2011, 11, 25, 0, 0), datetime.datetime(2011, 11, 28, 0, 0), datetime.datetime(2011, 11, 29, 0, 0), datetime.datetime(2011, 11, 30, 0, 0), datetime.datetime(2011, 12, 1, 0, 0), datetime.datetime(2011, 12, 2, 0, 0), datetime.datetime(2011, 12, 5, 0, 0), datetime.datetime(2011, 12, 6, 0, 0), datetime.datetime(2011, 12, 7, 0, 0), datetime.datetime(2011, 12, 8, 0, 0), datetime.datetime(2011, 12, 9, 0, 0), datetime.datetime(2011, 12, 12, 0, 0), datetime.datetime(2011, 12, 13, 0, 0), datetime.datetime(2011, 12, 14, 0, 0), datetime.datetime(2011, 12, 15, 0, 0), datetime.datetime(2011, 12, 16, 0, 0), datetime.datetime(2011, 12, 19, 0, 0), datetime.datetime(2011, 12, 20, 0, 0), datetime.datetime(2011, 12, 21, 0, 0), datetime.datetime(2011, 12, 22, 0, 0), datetime.datetime(2011, 12, 23, 0, 0), datetime.datetime(2011, 12, 27, 0, 0), datetime.datetime(2011, 12, 28, 0, 0), datetime.datetime(2011, 12, 29, 0, 0), datetime.datetime(2011, 12, 30, 0, 0), datetime.datetime(2012, 1, 3, 0, 0), datetime.datetime(2012, 1, 4, 0, 0), datetime.datetime(2012, 1, 5, 0, 0), datetime.datetime(2012, 1, 6, 0, 0), datetime.datetime(2012, 1, 9, 0, 0), datetime.datetime(2012, 1, 10, 0, 0), datetime.datetime(2012, 1, 11, 0, 0), datetime.datetime(2012, 1, 12, 0, 0), datetime.datetime(2012, 1, 13, 0, 0), datetime.datetime(2012, 1, 17, 0, 0), datetime.datetime(2012, 1, 18, 0, 0), datetime.datetime(2012, 1, 19, 0, 0), datetime.datetime(2012, 1, 20, 0, 0), datetime.datetime(2012, 1, 23, 0, 0), datetime.datetime(2012, 1, 24, 0, 0), datetime.datetime(2012, 1, 25, 0, 0), datetime.datetime(2012, 1, 26, 0, 0), datetime.datetime(2012, 1, 27, 0, 0), datetime.datetime(2012, 1, 30, 0, 0), datetime.datetime(2012, 1, 31, 0, 0), datetime.datetime(2012, 2, 1, 0, 0), datetime.datetime(2012, 2, 2, 0, 0), datetime.datetime(2012, 2, 3, 0, 0), datetime.datetime(2012, 2, 6, 0, 0), datetime.datetime(2012, 2, 7, 0, 0), datetime.datetime(2012, 2, 8, 0, 0), datetime.datetime(2012, 2, 9, 0, 0), datetime.datetime(2012, 2, 10, 0, 0), datetime.datetime(2012, 2, 13, 0, 0), datetime.datetime(2012, 2, 14, 0, 0), datetime.datetime(2012, 2, 15, 0, 0), datetime.datetime(2012, 2, 16, 0, 0), datetime.datetime(2012, 2, 17, 0, 0), datetime.datetime(2012, 2, 21, 0, 0), datetime.datetime(2012, 2, 22, 0, 0), datetime.datetime(2012, 2, 23, 0, 0), datetime.datetime(2012, 2, 24, 0, 0), datetime.datetime(2012, 2, 27, 0, 0), datetime.datetime(2012, 2, 28, 0, 0), datetime.datetime(2012, 2, 29, 0, 0), datetime.datetime(2012, 3, 1, 0, 0), datetime.datetime(2012, 3, 2, 0, 0), datetime.datetime(2012, 3, 5, 0, 0), datetime.datetime(2012, 3, 6, 0, 0), datetime.datetime(2012, 3, 7, 0, 0), datetime.datetime(2012, 3, 8, 0, 0), datetime.datetime(2012, 3, 9, 0, 0), datetime.datetime(2012, 3, 12, 0, 0), datetime.datetime(2012, 3, 13, 0, 0), datetime.datetime(2012, 3, 14, 0, 0), datetime.datetime(2012, 3, 15, 0, 0), datetime.datetime(2012, 3, 16, 0, 0), datetime.datetime(2012, 3, 19, 0, 0), datetime.datetime(2012, 3, 20, 0, 0), datetime.datetime(2012, 3, 21, 0, 0), datetime.datetime(2012, 3, 22, 0, 0), datetime.datetime(2012, 3, 23, 0, 0), datetime.datetime(2012, 3, 26, 0, 0), datetime.datetime(2012, 3, 27, 0, 0), datetime.datetime(2012, 3, 28, 0, 0), datetime.datetime(2012, 3, 29, 0, 0), datetime.datetime(2012, 3, 30, 0, 0), datetime.datetime(2012, 4, 2, 0, 0), datetime.datetime(2012, 4, 3, 0, 0), datetime.datetime(2012, 4, 4, 0, 0), datetime.datetime(2012, 4, 5, 0, 0), datetime.datetime(2012, 4, 9, 0, 0), datetime.datetime(2012, 4, 10, 0, 0), datetime.datetime(2012, 4, 11, 0, 0), datetime.datetime(2012, 4, 12, 0, 0), datetime.datetime(2012, 4, 13, 0, 0), datetime.datetime(2012, 4, 16, 0, 0), datetime.datetime(2012, 4, 17, 0, 0), datetime.datetime(2012, 4, 18, 0, 0), datetime.datetime(2012, 4, 19, 0, 0), datetime.datetime(2012, 4, 20, 0, 0), datetime.datetime(2012, 4, 23, 0, 0), datetime.datetime(2012, 4, 24, 0, 0), datetime.datetime(2012, 4, 25, 0, 0), datetime.datetime(2012, 4, 26, 0, 0), datetime.datetime(2012, 4, 27, 0, 0), datetime.datetime(2012, 4, 30, 0, 0), datetime.datetime(2012, 5, 1, 0, 0), datetime.datetime(2012, 5, 2, 0, 0), datetime.datetime(2012, 5, 3, 0, 0), datetime.datetime(2012, 5, 4, 0, 0), datetime.datetime(2012, 5, 7, 0, 0), datetime.datetime(2012, 5, 8, 0, 0), datetime.datetime(2012, 5, 9, 0, 0), datetime.datetime(2012, 5, 10, 0, 0), datetime.datetime(2012, 5, 11, 0, 0), datetime.datetime(2012, 5, 14, 0, 0), datetime.datetime(2012, 5, 15, 0, 0), datetime.datetime(2012, 5, 16, 0, 0), datetime.datetime(2012, 5, 17, 0, 0), datetime.datetime(2012, 5, 18, 0, 0), datetime.datetime(2012, 5, 21, 0, 0), datetime.datetime(2012, 5, 22, 0, 0), datetime.datetime(2012, 5, 23, 0, 0), datetime.datetime(2012, 5, 24, 0, 0), datetime.datetime(2012, 5, 25, 0, 0), datetime.datetime(2012, 5, 29, 0, 0), datetime.datetime(2012, 5, 30, 0, 0), datetime.datetime(2012, 5, 31, 0, 0), datetime.datetime(2012, 6, 1, 0, 0), datetime.datetime(2012, 6, 4, 0, 0), datetime.datetime(2012, 6, 5, 0, 0), datetime.datetime(2012, 6, 6, 0, 0), datetime.datetime(2012, 6, 7, 0, 0), datetime.datetime(2012, 6, 8, 0, 0), datetime.datetime(2012, 6, 11, 0, 0), datetime.datetime(2012, 6, 12, 0, 0), datetime.datetime(2012, 6, 13, 0, 0), datetime.datetime(2012, 6, 14, 0, 0), datetime.datetime(2012, 6, 15, 0, 0), datetime.datetime(2012, 6, 18, 0, 0), datetime.datetime(2012, 6, 19, 0, 0), datetime.datetime(2012, 6, 20, 0, 0), datetime.datetime(2012, 6, 21, 0, 0), datetime.datetime(2012, 6, 22, 0, 0), datetime.datetime(2012, 6, 25, 0, 0), datetime.datetime(2012, 6, 26, 0, 0), datetime.datetime(2012, 6, 27, 0, 0), datetime.datetime(2012, 6, 28, 0, 0), datetime.datetime(2012, 6, 29, 0, 0), datetime.datetime(2012, 7, 2, 0, 0), datetime.datetime(2012, 7, 3, 0, 0), datetime.datetime(2012, 7, 5, 0, 0), datetime.datetime(2012, 7, 6, 0, 0), datetime.datetime(2012, 7, 9, 0, 0), datetime.datetime(2012, 7, 10, 0, 0), datetime.datetime(2012, 7, 11, 0, 0), datetime.datetime(2012, 7, 12, 0, 0), datetime.datetime(2012, 7, 13, 0, 0), datetime.datetime(2012, 7, 16, 0, 0), datetime.datetime(2012, 7, 17, 0, 0), datetime.datetime(2012, 7, 18, 0, 0), datetime.datetime(2012, 7, 19, 0, 0), datetime.datetime(2012, 7, 20, 0, 0), datetime.datetime(2012, 7, 23, 0, 0), datetime.datetime(2012, 7, 24, 0, 0), datetime.datetime(2012, 7, 25, 0, 0), datetime.datetime(2012, 7, 26, 0, 0), datetime.datetime(2012, 7, 27, 0, 0), datetime.datetime(2012, 7, 30, 0, 0), datetime.datetime(2012, 7, 31, 0, 0), datetime.datetime(2012, 8, 1, 0, 0), datetime.datetime(2012, 8, 2, 0, 0), datetime.datetime(2012, 8, 3, 0, 0), datetime.datetime(2012, 8, 6, 0, 0), datetime.datetime(2012, 8, 7, 0, 0), datetime.datetime(2012, 8, 8, 0, 0), datetime.datetime(2012, 8, 9, 0, 0), datetime.datetime(2012, 8, 10, 0, 0), datetime.datetime(2012, 8, 13, 0, 0), datetime.datetime(2012, 8, 14, 0, 0), datetime.datetime(2012, 8, 15, 0, 0), datetime.datetime(2012, 8, 16, 0, 0), datetime.datetime(2012, 8, 17, 0, 0), datetime.datetime(2012, 8, 20, 0, 0), datetime.datetime(2012, 8, 21, 0, 0), datetime.datetime(2012, 8, 22, 0, 0), datetime.datetime(2012, 8, 23, 0, 0), datetime.datetime(2012, 8, 24, 0, 0), datetime.datetime(2012, 8, 27, 0, 0), datetime.datetime(2012, 8, 28, 0, 0), datetime.datetime(2012, 8, 29, 0, 0), datetime.datetime(2012, 8, 30, 0, 0), datetime.datetime(2012, 8, 31, 0, 0), datetime.datetime(2012, 9, 4, 0, 0), datetime.datetime(2012, 9, 5, 0, 0), datetime.datetime(2012, 9, 6, 0, 0), datetime.datetime(2012, 9, 7, 0, 0), datetime.datetime(2012, 9, 10, 0, 0), datetime.datetime(2012, 9, 11, 0, 0), datetime.datetime(2012, 9, 12, 0, 0), datetime.datetime(2012, 9, 13, 0, 0), datetime.datetime(2012, 9, 14, 0, 0), datetime.datetime(2012, 9, 17, 0, 0), datetime.datetime(2012, 9, 18, 0, 0), datetime.datetime(2012, 9, 19, 0, 0), datetime.datetime(2012, 9, 20, 0, 0), datetime.datetime(2012, 9, 21, 0, 0), datetime.datetime(2012, 9, 24, 0, 0), datetime.datetime(2012, 9, 25, 0, 0), datetime.datetime(2012, 9, 26, 0, 0), datetime.datetime(2012, 9, 27, 0, 0), datetime.datetime(2012, 9, 28, 0, 0), datetime.datetime(2012, 10, 1, 0, 0), datetime.datetime(2012, 10, 2, 0, 0), datetime.datetime(2012, 10, 3, 0, 0), datetime.datetime(2012, 10, 4, 0, 0), datetime.datetime(2012, 10, 5, 0, 0), datetime.datetime(2012, 10, 8, 0, 0), datetime.datetime(2012, 10, 9, 0, 0), datetime.datetime(2012, 10, 10, 0, 0), datetime.datetime(2012, 10, 11, 0, 0), datetime.datetime(2012, 10, 12, 0, 0), datetime.datetime(2012, 10, 15, 0, 0), datetime.datetime(2012, 10, 16, 0, 0), datetime.datetime(2012, 10, 17, 0, 0), datetime.datetime(2012, 10, 18, 0, 0), datetime.datetime(2012, 10, 19, 0, 0), datetime.datetime(2012, 10, 22, 0, 0), datetime.datetime(2012, 10, 23, 0, 0), datetime.datetime(2012, 10, 24, 0, 0), datetime.datetime(2012, 10, 25, 0, 0), datetime.datetime(2012, 10, 26, 0, 0), datetime.datetime(2012, 10, 29, 0, 0), datetime.datetime(2012, 10, 30, 0, 0), datetime.datetime(2012, 10, 31, 0, 0), datetime.datetime(2012, 11, 1, 0, 0), datetime.datetime(2012, 11, 2, 0, 0), datetime.datetime(2012, 11, 5, 0, 0), datetime.datetime(2012, 11, 6, 0, 0), datetime.datetime(2012, 11, 7, 0, 0), datetime.datetime(2012, 11, 8, 0, 0), datetime.datetime(2012, 11, 9, 0, 0), datetime.datetime(2012, 11, 12, 0, 0), datetime.datetime(2012, 11, 13, 0, 0), datetime.datetime(2012, 11, 14, 0, 0), datetime.datetime(2012, 11, 15, 0, 0), datetime.datetime(2012, 11, 16, 0, 0), datetime.datetime(2012, 11, 19, 0, 0), datetime.datetime(2012, 11, 20, 0, 0), datetime.datetime(2012, 11, 21, 0, 0), datetime.datetime(2012, 11, 23, 0, 0), datetime.datetime(2012, 11, 26, 0, 0), datetime.datetime(2012, 11, 27, 0, 0), datetime.datetime(2012, 11, 28, 0, 0), datetime.datetime(2012, 11, 29, 0, 0), datetime.datetime(2012, 11, 30, 0, 0), datetime.datetime(2012, 12, 3, 0, 0), datetime.datetime(2012, 12, 4, 0, 0), datetime.datetime(2012, 12, 5, 0, 0), datetime.datetime(2012, 12, 6, 0, 0), datetime.datetime(2012, 12, 7, 0, 0), datetime.datetime(2012, 12, 10, 0, 0), datetime.datetime(2012, 12, 11, 0, 0), datetime.datetime(2012, 12, 12, 0, 0), datetime.datetime(2012, 12, 13, 0, 0), datetime.datetime(2012, 12, 14, 0, 0), datetime.datetime(2012, 12, 17, 0, 0), datetime.datetime(2012, 12, 18, 0, 0), datetime.datetime(2012, 12, 19, 0, 0), datetime.datetime(2012, 12, 20, 0, 0), datetime.datetime(2012, 12, 21, 0, 0), datetime.datetime(2012, 12, 24, 0, 0), datetime.datetime(2012, 12, 26, 0, 0), datetime.datetime(2012, 12, 27, 0, 0), datetime.datetime(2012, 12, 28, 0, 0), datetime.datetime(2012, 12, 31, 0, 0), datetime.datetime(2013, 1, 2, 0, 0), datetime.datetime(2013, 1, 3, 0, 0), datetime.datetime(2013, 1, 4, 0, 0), datetime.datetime(2013, 1, 7, 0, 0), datetime.datetime(2013, 1, 8, 0, 0), datetime.datetime(2013, 1, 9, 0, 0), datetime.datetime(2013, 1, 10, 0, 0), datetime.datetime(2013, 1, 11, 0, 0), datetime.datetime(2013, 1, 14, 0, 0), datetime.datetime(2013, 1, 15, 0, 0), datetime.datetime(2013, 1, 16, 0, 0), datetime.datetime(2013, 1, 17, 0, 0), datetime.datetime(2013, 1, 18, 0, 0), datetime.datetime(2013, 1, 22, 0, 0), datetime.datetime(2013, 1, 23, 0, 0), datetime.datetime(2013, 1, 24, 0, 0), datetime.datetime(2013, 1, 25, 0, 0), datetime.datetime(2013, 1, 28, 0, 0), datetime.datetime(2013, 1, 29, 0, 0), datetime.datetime(2013, 1, 30, 0, 0), datetime.datetime(2013, 1, 31, 0, 0), datetime.datetime(2013, 2, 1, 0, 0), datetime.datetime(2013, 2, 4, 0, 0), datetime.datetime(2013, 2, 5, 0, 0), datetime.datetime(2013, 2, 6, 0, 0), datetime.datetime(2013, 2, 7, 0, 0), datetime.datetime(2013, 2, 8, 0, 0), datetime.datetime(2013, 2, 11, 0, 0), datetime.datetime(2013, 2, 12, 0, 0), datetime.datetime(2013, 2, 13, 0, 0), datetime.datetime(2013, 2, 14, 0, 0), datetime.datetime(2013, 2, 15, 0, 0), datetime.datetime(2013, 2, 19, 0, 0), datetime.datetime(2013, 2, 20, 0, 0), datetime.datetime(2013, 2, 21, 0, 0), datetime.datetime(2013, 2, 22, 0, 0), datetime.datetime(2013, 2, 25, 0, 0), datetime.datetime(2013, 2, 26, 0, 0), datetime.datetime(2013, 2, 27, 0, 0), datetime.datetime(2013, 2, 28, 0, 0), datetime.datetime(2013, 3, 1, 0, 0), datetime.datetime(2013, 3, 4, 0, 0), datetime.datetime(2013, 3, 5, 0, 0), datetime.datetime(2013, 3, 6, 0, 0), datetime.datetime(2013, 3, 7, 0, 0), datetime.datetime(2013, 3, 8, 0, 0), datetime.datetime(2013, 3, 11, 0, 0), datetime.datetime(2013, 3, 12, 0, 0), datetime.datetime(2013, 3, 13, 0, 0), datetime.datetime(2013, 3, 14, 0, 0), datetime.datetime(2013, 3, 15, 0, 0), datetime.datetime(2013, 3, 18, 0, 0), datetime.datetime(2013, 3, 19, 0, 0), datetime.datetime(2013, 3, 20, 0, 0), datetime.datetime(2013, 3, 21, 0, 0), datetime.datetime(2013, 3, 22, 0, 0), datetime.datetime(2013, 3, 25, 0, 0), datetime.datetime(2013, 3, 26, 0, 0), datetime.datetime(2013, 3, 27, 0, 0), datetime.datetime(2013, 3, 28, 0, 0), datetime.datetime(2013, 4, 1, 0, 0), datetime.datetime(2013, 4, 2, 0, 0), datetime.datetime(2013, 4, 3, 0, 0), datetime.datetime(2013, 4, 4, 0, 0), datetime.datetime(2013, 4, 5, 0, 0), datetime.datetime(2013, 4, 8, 0, 0), datetime.datetime(2013, 4, 9, 0, 0), datetime.datetime(2013, 4, 10, 0, 0), datetime.datetime(2013, 4, 11, 0, 0), datetime.datetime(2013, 4, 12, 0, 0), datetime.datetime(2013, 4, 15, 0, 0), datetime.datetime(2013, 4, 16, 0, 0), datetime.datetime(2013, 4, 17, 0, 0), datetime.datetime(2013, 4, 18, 0, 0), datetime.datetime(2013, 4, 19, 0, 0), datetime.datetime(2013, 4, 22, 0, 0), datetime.datetime(2013, 4, 23, 0, 0), datetime.datetime(2013, 4, 24, 0, 0), datetime.datetime(2013, 4, 25, 0, 0), datetime.datetime(2013, 4, 26, 0, 0), datetime.datetime(2013, 4, 29, 0, 0), datetime.datetime(2013, 4, 30, 0, 0), datetime.datetime(2013, 5, 1, 0, 0), datetime.datetime(2013, 5, 2, 0, 0), datetime.datetime(2013, 5, 3, 0, 0), datetime.datetime(2013, 5, 6, 0, 0), datetime.datetime(2013, 5, 7, 0, 0), datetime.datetime(2013, 5, 8, 0, 0), datetime.datetime(2013, 5, 9, 0, 0), datetime.datetime(2013, 5, 10, 0, 0), datetime.datetime(2013, 5, 13, 0, 0), datetime.datetime(2013, 5, 14, 0, 0), datetime.datetime(2013, 5, 15, 0, 0), datetime.datetime(2013, 5, 16, 0, 0), datetime.datetime(2013, 5, 17, 0, 0), datetime.datetime(2013, 5, 20, 0, 0), datetime.datetime(2013, 5, 21, 0, 0), datetime.datetime(2013, 5, 22, 0, 0), datetime.datetime(2013, 5, 23, 0, 0), datetime.datetime(2013, 5, 24, 0, 0), datetime.datetime(2013, 5, 28, 0, 0), datetime.datetime(2013, 5, 29, 0, 0), datetime.datetime(2013, 5, 30, 0, 0), datetime.datetime(2013, 5, 31, 0, 0), datetime.datetime(2013, 6, 3, 0, 0), datetime.datetime(2013, 6, 4, 0, 0), datetime.datetime(2013, 6, 5, 0, 0), datetime.datetime(2013, 6, 6, 0, 0), datetime.datetime(2013, 6, 7, 0, 0), datetime.datetime(2013, 6, 10, 0, 0), datetime.datetime(2013, 6, 11, 0, 0), datetime.datetime(2013, 6, 12, 0, 0), datetime.datetime(2013, 6, 13, 0, 0), datetime.datetime(2013, 6, 14, 0, 0), datetime.datetime(2013, 6, 17, 0, 0), datetime.datetime(2013, 6, 18, 0, 0), datetime.datetime(2013, 6, 19, 0, 0), datetime.datetime(2013, 6, 20, 0, 0), datetime.datetime(2013, 6, 21, 0, 0), datetime.datetime(2013, 6, 24, 0, 0), datetime.datetime(2013, 6, 25, 0, 0), datetime.datetime(2013, 6, 26, 0, 0), datetime.datetime(2013, 6, 27, 0, 0), datetime.datetime(2013, 6, 28, 0, 0), datetime.datetime(2013, 7, 1, 0, 0), datetime.datetime(2013, 7, 2, 0, 0), datetime.datetime(2013, 7, 3, 0, 0), datetime.datetime(2013, 7, 5, 0, 0), datetime.datetime(2013, 7, 8, 0, 0), datetime.datetime(2013, 7, 9, 0, 0), datetime.datetime(2013, 7, 10, 0, 0), datetime.datetime(2013, 7, 11, 0, 0), datetime.datetime(2013, 7, 12, 0, 0), datetime.datetime(2013, 7, 15, 0, 0), datetime.datetime(2013, 7, 16, 0, 0), datetime.datetime(2013, 7, 17, 0, 0), datetime.datetime(2013, 7, 18, 0, 0), datetime.datetime(2013, 7, 19, 0, 0), datetime.datetime(2013, 7, 22, 0, 0), datetime.datetime(2013, 7, 23, 0, 0), datetime.datetime(2013, 7, 24, 0, 0), datetime.datetime(2013, 7, 25, 0, 0), datetime.datetime(2013, 7, 26, 0, 0), datetime.datetime(2013, 7, 29, 0, 0), datetime.datetime(2013, 7, 30, 0, 0), datetime.datetime(2013, 7, 31, 0, 0), datetime.datetime(2013, 8, 1, 0, 0), datetime.datetime(2013, 8, 2, 0, 0), datetime.datetime(2013, 8, 5, 0, 0), datetime.datetime(2013, 8, 6, 0, 0), datetime.datetime(2013, 8, 7, 0, 0), datetime.datetime(2013, 8, 8, 0, 0), datetime.datetime(2013, 8, 9, 0, 0), datetime.datetime(2013, 8, 12, 0, 0), datetime.datetime(2013, 8, 13, 0, 0), datetime.datetime(2013, 8, 14, 0, 0), datetime.datetime(2013, 8, 15, 0, 0), datetime.datetime(2013, 8, 16, 0, 0), datetime.datetime(2013, 8, 19, 0, 0), datetime.datetime(2013, 8, 20, 0, 0), datetime.datetime(2013, 8, 21, 0, 0), datetime.datetime(2013, 8, 22, 0, 0), datetime.datetime(2013, 8, 23, 0, 0), datetime.datetime(2013, 8, 26, 0, 0), datetime.datetime(2013, 8, 27, 0, 0), datetime.datetime(2013, 8, 28, 0, 0), datetime.datetime(2013, 8, 29, 0, 0), datetime.datetime(2013, 8, 30, 0, 0), datetime.datetime(2013, 9, 3, 0, 0), datetime.datetime(2013, 9, 4, 0, 0), datetime.datetime(2013, 9, 5, 0, 0), datetime.datetime(2013, 9, 6, 0, 0), datetime.datetime(2013, 9, 9, 0, 0), datetime.datetime(2013, 9, 10, 0, 0), datetime.datetime(2013, 9, 11, 0, 0), datetime.datetime(2013, 9, 12, 0, 0), datetime.datetime(2013, 9, 13, 0, 0), datetime.datetime(2013, 9, 16, 0, 0), datetime.datetime(2013, 9, 17, 0, 0), datetime.datetime(2013, 9, 18, 0, 0), datetime.datetime(2013, 9, 19, 0, 0), datetime.datetime(2013, 9, 20, 0, 0), datetime.datetime(2013, 9, 23, 0, 0), datetime.datetime(2013, 9, 24, 0, 0), datetime.datetime(2013, 9, 25, 0, 0), datetime.datetime(2013, 9, 26, 0, 0), datetime.datetime(2013, 9, 27, 0, 0), datetime.datetime(2013, 9, 30, 0, 0), datetime.datetime(2013, 10, 1, 0, 0), datetime.datetime(2013, 10, 2, 0, 0), datetime.datetime(2013, 10, 3, 0, 0), datetime.datetime(2013, 10, 4, 0, 0), datetime.datetime(2013, 10, 7, 0, 0), datetime.datetime(2013, 10, 8, 0, 0), datetime.datetime(2013, 10, 9, 0, 0), datetime.datetime(2013, 10, 10, 0, 0), datetime.datetime(2013, 10, 11, 0, 0), datetime.datetime(2013, 10, 14, 0, 0), datetime.datetime(2013, 10, 15, 0, 0), datetime.datetime(2013, 10, 16, 0, 0), datetime.datetime(2013, 10, 17, 0, 0), datetime.datetime(2013, 10, 18, 0, 0), datetime.datetime(2013, 10, 21, 0, 0), datetime.datetime(2013, 10, 22, 0, 0), datetime.datetime(2013, 10, 23, 0, 0), datetime.datetime(2013, 10, 24, 0, 0), datetime.datetime(2013, 10, 25, 0, 0), datetime.datetime(2013, 10, 28, 0, 0), datetime.datetime(2013, 10, 29, 0, 0), datetime.datetime(2013, 10, 30, 0, 0), datetime.datetime(2013, 10, 31, 0, 0), datetime.datetime(2013, 11, 1, 0, 0), datetime.datetime(2013, 11, 4, 0, 0), datetime.datetime(2013, 11, 5, 0, 0), datetime.datetime(2013, 11, 6, 0, 0), datetime.datetime(2013, 11, 7, 0, 0), datetime.datetime(2013, 11, 8, 0, 0), datetime.datetime(2013, 11, 11, 0, 0), datetime.datetime(2013, 11, 12, 0, 0), datetime.datetime(2013, 11, 13, 0, 0), datetime.datetime(2013, 11, 14, 0, 0), datetime.datetime(2013, 11, 15, 0, 0), datetime.datetime(2013, 11, 18, 0, 0), datetime.datetime(2013, 11, 19, 0, 0), datetime.datetime(2013, 11, 20, 0, 0), datetime.datetime(2013, 11, 21, 0, 0), datetime.datetime(2013, 11, 22, 0, 0), datetime.datetime(2013, 11, 25, 0, 0), datetime.datetime(2013, 11, 26, 0, 0), datetime.datetime(2013, 11, 27, 0, 0), datetime.datetime(2013, 11, 29, 0, 0), datetime.datetime(2013, 12, 2, 0, 0), datetime.datetime(2013, 12, 3, 0, 0), datetime.datetime(2013, 12, 4, 0, 0), datetime.datetime(2013, 12, 5, 0, 0), datetime.datetime(2013, 12, 6, 0, 0), datetime.datetime(2013, 12, 9, 0, 0), datetime.datetime(2013, 12, 10, 0, 0), datetime.datetime(2013, 12, 11, 0, 0), datetime.datetime(2013, 12, 12, 0, 0), datetime.datetime(2013, 12, 13, 0, 0), datetime.datetime(2013, 12, 16, 0, 0), datetime.datetime(2013, 12, 17, 0, 0), datetime.datetime(2013, 12, 18, 0, 0), datetime.datetime(2013, 12, 19, 0, 0), datetime.datetime(2013, 12, 20, 0, 0), datetime.datetime(2013, 12, 23, 0, 0), datetime.datetime(2013, 12, 24, 0, 0), datetime.datetime(2013, 12, 26, 0, 0), datetime.datetime(2013, 12, 27, 0, 0), datetime.datetime(2013, 12, 30, 0, 0), datetime.datetime(2013, 12, 31, 0, 0), datetime.datetime(2014, 1, 2, 0, 0), datetime.datetime(2014, 1, 3, 0, 0), datetime.datetime(2014, 1, 6, 0, 0), datetime.datetime(2014, 1, 7, 0, 0), datetime.datetime(2014, 1, 8, 0, 0), datetime.datetime(2014, 1, 9, 0, 0), datetime.datetime(2014, 1, 10, 0, 0), datetime.datetime(2014, 1, 13, 0, 0), datetime.datetime(2014, 1, 14, 0, 0), datetime.datetime(2014, 1, 15, 0, 0), datetime.datetime(2014, 1, 16, 0, 0), datetime.datetime(2014, 1, 17, 0, 0), datetime.datetime(2014, 1, 21, 0, 0), datetime.datetime(2014, 1, 22, 0, 0), datetime.datetime(2014, 1, 23, 0, 0), datetime.datetime(2014, 1, 24, 0, 0), datetime.datetime(2014, 1, 27, 0, 0), datetime.datetime(2014, 1, 28, 0, 0), datetime.datetime(2014, 1, 29, 0, 0), datetime.datetime(2014, 1, 30, 0, 0), datetime.datetime(2014, 1, 31, 0, 0), datetime.datetime(2014, 2, 3, 0, 0), datetime.datetime(2014, 2, 4, 0, 0), datetime.datetime(2014, 2, 5, 0, 0), datetime.datetime(2014, 2, 6, 0, 0), datetime.datetime(2014, 2, 7, 0, 0), datetime.datetime(2014, 2, 10, 0, 0), datetime.datetime(2014, 2, 11, 0, 0), datetime.datetime(2014, 2, 12, 0, 0), datetime.datetime(2014, 2, 13, 0, 0), datetime.datetime(2014, 2, 14, 0, 0), datetime.datetime(2014, 2, 18, 0, 0), datetime.datetime(2014, 2, 19, 0, 0), datetime.datetime(2014, 2, 20, 0, 0), datetime.datetime(2014, 2, 21, 0, 0), datetime.datetime(2014, 2, 24, 0, 0), datetime.datetime(2014, 2, 25, 0, 0), datetime.datetime(2014, 2, 26, 0, 0), datetime.datetime(2014, 2, 27, 0, 0), datetime.datetime(2014, 2, 28, 0, 0), datetime.datetime(2014, 3, 3, 0, 0), datetime.datetime(2014, 3, 4, 0, 0), datetime.datetime(2014, 3, 5, 0, 0), datetime.datetime(2014, 3, 6, 0, 0), datetime.datetime(2014, 3, 7, 0, 0), datetime.datetime(2014, 3, 10, 0, 0), datetime.datetime(2014, 3, 11, 0, 0), datetime.datetime(2014, 3, 12, 0, 0), datetime.datetime(2014, 3, 13, 0, 0), datetime.datetime(2014, 3, 14, 0, 0), datetime.datetime(2014, 3, 17, 0, 0), datetime.datetime(2014, 3, 18, 0, 0), datetime.datetime(2014, 3, 19, 0, 0), datetime.datetime(2014, 3, 20, 0, 0), datetime.datetime(2014, 3, 21, 0, 0), datetime.datetime(2014, 3, 24, 0, 0), datetime.datetime(2014, 3, 25, 0, 0), datetime.datetime(2014, 3, 26, 0, 0), datetime.datetime(2014, 3, 27, 0, 0), datetime.datetime(2014, 3, 28, 0, 0), datetime.datetime(2014, 3, 31, 0, 0), datetime.datetime(2014, 4, 1, 0, 0), datetime.datetime(2014, 4, 2, 0, 0), datetime.datetime(2014, 4, 3, 0, 0), datetime.datetime(2014, 4, 4, 0, 0), datetime.datetime(2014, 4, 7, 0, 0), datetime.datetime(2014, 4, 8, 0, 0), datetime.datetime(2014, 4, 9, 0, 0), datetime.datetime(2014, 4, 10, 0, 0), datetime.datetime(2014, 4, 11, 0, 0), datetime.datetime(2014, 4, 14, 0, 0), datetime.datetime(2014, 4, 15, 0, 0), datetime.datetime(2014, 4, 16, 0, 0), datetime.datetime(2014, 4, 17, 0, 0), datetime.datetime(2014, 4, 21, 0, 0), datetime.datetime(2014, 4, 22, 0, 0), datetime.datetime(2014, 4, 23, 0, 0), datetime.datetime(2014, 4, 24, 0, 0), datetime.datetime(2014, 4, 25, 0, 0), datetime.datetime(2014, 4, 28, 0, 0), datetime.datetime(2014, 4, 29, 0, 0), datetime.datetime(2014, 4, 30, 0, 0), datetime.datetime(2014, 5, 1, 0, 0), datetime.datetime(2014, 5, 2, 0, 0), datetime.datetime(2014, 5, 5, 0, 0), datetime.datetime(2014, 5, 6, 0, 0), datetime.datetime(2014, 5, 7, 0, 0), datetime.datetime(2014, 5, 8, 0, 0), datetime.datetime(2014, 5, 9, 0, 0), datetime.datetime(2014, 5, 12, 0, 0), datetime.datetime(2014, 5, 13, 0, 0), datetime.datetime(2014, 5, 14, 0, 0), datetime.datetime(2014, 5, 15, 0, 0), datetime.datetime(2014, 5, 16, 0, 0), datetime.datetime(2014, 5, 19, 0, 0), datetime.datetime(2014, 5, 20, 0, 0), datetime.datetime(2014, 5, 21, 0, 0), datetime.datetime(2014, 5, 22, 0, 0), datetime.datetime(2014, 5, 23, 0, 0), datetime.datetime(2014, 5, 27, 0, 0), datetime.datetime(2014, 5, 28, 0, 0), datetime.datetime(2014, 5, 29, 0, 0), datetime.datetime(2014, 5, 30, 0, 0), datetime.datetime(2014, 6, 2, 0, 0), datetime.datetime(2014, 6, 3, 0, 0), datetime.datetime(2014, 6, 4, 0, 0), datetime.datetime(2014, 6, 5, 0, 0), datetime.datetime(2014, 6, 6, 0, 0), datetime.datetime(2014, 6, 9, 0, 0), datetime.datetime(2014, 6, 10, 0, 0), datetime.datetime(2014, 6, 11, 0, 0), datetime.datetime(2014, 6, 12, 0, 0), datetime.datetime(2014, 6, 13, 0, 0), datetime.datetime(2014, 6, 16, 0, 0), datetime.datetime(2014, 6, 17, 0, 0), datetime.datetime(2014, 6, 18, 0, 0), datetime.datetime(2014, 6, 19, 0, 0), datetime.datetime(2014, 6, 20, 0, 0), datetime.datetime(2014, 6, 23, 0, 0), datetime.datetime(2014, 6, 24, 0, 0), datetime.datetime(2014, 6, 25, 0, 0), datetime.datetime(2014, 6, 26, 0, 0), datetime.datetime(2014, 6, 27, 0, 0), datetime.datetime(2014, 6, 30, 0, 0), datetime.datetime(2014, 7, 1, 0, 0), datetime.datetime(2014, 7, 2, 0, 0), datetime.datetime(2014, 7, 3, 0, 0), datetime.datetime(2014, 7, 7, 0, 0), datetime.datetime(2014, 7, 8, 0, 0), datetime.datetime(2014, 7, 9, 0, 0), datetime.datetime(2014, 7, 10, 0, 0), datetime.datetime(2014, 7, 11, 0, 0), datetime.datetime(2014, 7, 14, 0, 0), datetime.datetime(2014, 7, 15, 0, 0), datetime.datetime(2014, 7, 16, 0, 0), datetime.datetime(2014, 7, 17, 0, 0), datetime.datetime(2014, 7, 18, 0, 0), datetime.datetime(2014, 7, 21, 0, 0), datetime.datetime(2014, 7, 22, 0, 0), datetime.datetime(2014, 7, 23, 0, 0), datetime.datetime(2014, 7, 24, 0, 0), datetime.datetime(2014, 7, 25, 0, 0), datetime.datetime(2014, 7, 28, 0, 0), datetime.datetime(2014, 7, 29, 0, 0), datetime.datetime(2014, 7, 30, 0, 0), datetime.datetime(2014, 7, 31, 0, 0), datetime.datetime(2014, 8, 1, 0, 0), datetime.datetime(2014, 8, 4, 0, 0), datetime.datetime(2014, 8, 5, 0, 0), datetime.datetime(2014, 8, 6, 0, 0), datetime.datetime(2014, 8, 7, 0, 0), datetime.datetime(2014, 8, 8, 0, 0), datetime.datetime(2014, 8, 11, 0, 0), datetime.datetime(2014, 8, 12, 0, 0), datetime.datetime(2014, 8, 13, 0, 0), datetime.datetime(2014, 8, 14, 0, 0), datetime.datetime(2014, 8, 15, 0, 0), datetime.datetime(2014, 8, 18, 0, 0), datetime.datetime(2014, 8, 19, 0, 0), datetime.datetime(2014, 8, 20, 0, 0), datetime.datetime(2014, 8, 21, 0, 0), datetime.datetime(2014, 8, 22, 0, 0), datetime.datetime(2014, 8, 25, 0, 0), datetime.datetime(2014, 8, 26, 0, 0), datetime.datetime(2014, 8, 27, 0, 0), datetime.datetime(2014, 8, 28, 0, 0), datetime.datetime(2014, 8, 29, 0, 0), datetime.datetime(2014, 9, 2, 0, 0), datetime.datetime(2014, 9, 3, 0, 0), datetime.datetime(2014, 9, 4, 0, 0), datetime.datetime(2014, 9, 5, 0, 0), datetime.datetime(2014, 9, 8, 0, 0), datetime.datetime(2014, 9, 9, 0, 0), datetime.datetime(2014, 9, 10, 0, 0), datetime.datetime(2014, 9, 11, 0, 0), datetime.datetime(2014, 9, 12, 0, 0), datetime.datetime(2014, 9, 15, 0, 0), datetime.datetime(2014, 9, 16, 0, 0), datetime.datetime(2014, 9, 17, 0, 0), datetime.datetime(2014, 9, 18, 0, 0), datetime.datetime(2014, 9, 19, 0, 0), datetime.datetime(2014, 9, 22, 0, 0), datetime.datetime(2014, 9, 23, 0, 0), datetime.datetime(2014, 9, 24, 0, 0), datetime.datetime(2014, 9, 25, 0, 0), datetime.datetime(2014, 9, 26, 0, 0), datetime.datetime(2014, 9, 29, 0, 0), datetime.datetime(2014, 9, 30, 0, 0), datetime.datetime(2014, 10, 1, 0, 0), datetime.datetime(2014, 10, 2, 0, 0), datetime.datetime(2014, 10, 3, 0, 0), datetime.datetime(2014, 10, 6, 0, 0), datetime.datetime(2014, 10, 7, 0, 0), datetime.datetime(2014, 10, 8, 0, 0), datetime.datetime(2014, 10, 9, 0, 0), datetime.datetime(2014, 10, 10, 0, 0), datetime.datetime(2014, 10, 13, 0, 0), datetime.datetime(2014, 10, 14, 0, 0), datetime.datetime(2014, 10, 15, 0, 0), datetime.datetime(2014, 10, 16, 0, 0), datetime.datetime(2014, 10, 17, 0, 0), datetime.datetime(2014, 10, 20, 0, 0), datetime.datetime(2014, 10, 21, 0, 0), datetime.datetime(2014, 10, 22, 0, 0), datetime.datetime(2014, 10, 23, 0, 0), datetime.datetime(2014, 10, 24, 0, 0), datetime.datetime(2014, 10, 27, 0, 0), datetime.datetime(2014, 10, 28, 0, 0), datetime.datetime(2014, 10, 29, 0, 0), datetime.datetime(2014, 10, 30, 0, 0), datetime.datetime(2014, 10, 31, 0, 0), datetime.datetime(2014, 11, 3, 0, 0), datetime.datetime(2014, 11, 4, 0, 0), datetime.datetime(2014, 11, 5, 0, 0), datetime.datetime(2014, 11, 6, 0, 0), datetime.datetime(2014, 11, 7, 0, 0), datetime.datetime(2014, 11, 10, 0, 0), datetime.datetime(2014, 11, 11, 0, 0), datetime.datetime(2014, 11, 12, 0, 0), datetime.datetime(2014, 11, 13, 0, 0), datetime.datetime(2014, 11, 14, 0, 0), datetime.datetime(2014, 11, 17, 0, 0), datetime.datetime(2014, 11, 18, 0, 0), datetime.datetime(2014, 11, 19, 0, 0), datetime.datetime(2014, 11, 20, 0, 0), datetime.datetime(2014, 11, 21, 0, 0), datetime.datetime(2014, 11, 24, 0, 0), datetime.datetime(2014, 11, 25, 0, 0), datetime.datetime(2014, 11, 26, 0, 0), datetime.datetime(2014, 11, 28, 0, 0), datetime.datetime(2014, 12, 1, 0, 0), datetime.datetime(2014, 12, 2, 0, 0), datetime.datetime(2014, 12, 3, 0, 0), datetime.datetime(2014, 12, 4, 0, 0), datetime.datetime(2014, 12, 5, 0, 0), datetime.datetime(2014, 12, 8, 0, 0), datetime.datetime(2014, 12, 9, 0, 0), datetime.datetime(2014, 12, 10, 0, 0), datetime.datetime(2014, 12, 11, 0, 0), datetime.datetime(2014, 12, 12, 0, 0), datetime.datetime(2014, 12, 15, 0, 0), datetime.datetime(2014, 12, 16, 0, 0), datetime.datetime(2014, 12, 17, 0, 0), datetime.datetime(2014, 12, 18, 0, 0), datetime.datetime(2014, 12, 19, 0, 0), datetime.datetime(2014, 12, 22, 0, 0), datetime.datetime(2014, 12, 23, 0, 0), datetime.datetime(2014, 12, 24, 0, 0), datetime.datetime(2014, 12, 26, 0, 0), datetime.datetime(2014, 12, 29, 0, 0), datetime.datetime(2014, 12, 30, 0, 0), datetime.datetime(2014, 12, 31, 0, 0), datetime.datetime(2015, 1, 2, 0, 0), datetime.datetime(2015, 1, 5, 0, 0), datetime.datetime(2015, 1, 6, 0, 0), datetime.datetime(2015, 1, 7, 0, 0), datetime.datetime(2015, 1, 8, 0, 0), datetime.datetime(2015, 1, 9, 0, 0), datetime.datetime(2015, 1, 12, 0, 0), datetime.datetime(2015, 1, 13, 0, 0), datetime.datetime(2015, 1, 14, 0, 0), datetime.datetime(2015, 1, 15, 0, 0), datetime.datetime(2015, 1, 16, 0, 0), datetime.datetime(2015, 1, 20, 0, 0), datetime.datetime(2015, 1, 21, 0, 0), datetime.datetime(2015, 1, 22, 0, 0), datetime.datetime(2015, 1, 23, 0, 0), datetime.datetime(2015, 1, 26, 0, 0), datetime.datetime(2015, 1, 27, 0, 0), datetime.datetime(2015, 1, 28, 0, 0), datetime.datetime(2015, 1, 29, 0, 0), datetime.datetime(2015, 1, 30, 0, 0), datetime.datetime(2015, 2, 2, 0, 0), datetime.datetime(2015, 2, 3, 0, 0), datetime.datetime(2015, 2, 4, 0, 0), datetime.datetime(2015, 2, 5, 0, 0), datetime.datetime(2015, 2, 6, 0, 0), datetime.datetime(2015, 2, 9, 0, 0), datetime.datetime(2015, 2, 10, 0, 0), datetime.datetime(2015, 2, 11, 0, 0), datetime.datetime(2015, 2, 12, 0, 0), datetime.datetime(2015, 2, 13, 0, 0), datetime.datetime(2015, 2, 17, 0, 0), datetime.datetime(2015, 2, 18, 0, 0), datetime.datetime(2015, 2, 19, 0, 0), datetime.datetime(2015, 2, 20, 0, 0), datetime.datetime(2015, 2, 23, 0, 0), datetime.datetime(2015, 2, 24, 0, 0), datetime.datetime(2015, 2, 25, 0, 0), datetime.datetime(2015, 2, 26, 0, 0), datetime.datetime(2015, 2, 27, 0, 0), datetime.datetime(2015, 3, 2, 0, 0), datetime.datetime(2015, 3, 3, 0, 0), datetime.datetime(2015, 3, 4, 0, 0), datetime.datetime(2015, 3, 5, 0, 0), datetime.datetime(2015, 3, 6, 0, 0), datetime.datetime(2015, 3, 9, 0, 0), datetime.datetime(2015, 3, 10, 0, 0), datetime.datetime(2015, 3, 11, 0, 0), datetime.datetime(2015, 3, 12, 0, 0), datetime.datetime(2015, 3, 13, 0, 0), datetime.datetime(2015, 3, 16, 0, 0), datetime.datetime(2015, 3, 17, 0, 0), datetime.datetime(2015, 3, 18, 0, 0), datetime.datetime(2015, 3, 19, 0, 0), datetime.datetime(2015, 3, 20, 0, 0), datetime.datetime(2015, 3, 23, 0, 0), datetime.datetime(2015, 3, 24, 0, 0), datetime.datetime(2015, 3, 25, 0, 0), datetime.datetime(2015, 3, 26, 0, 0), datetime.datetime(2015, 3, 27, 0, 0), datetime.datetime(2015, 3, 30, 0, 0), datetime.datetime(2015, 3, 31, 0, 0), datetime.datetime(2015, 4, 1, 0, 0), datetime.datetime(2015, 4, 2, 0, 0), datetime.datetime(2015, 4, 6, 0, 0), datetime.datetime(2015, 4, 7, 0, 0), datetime.datetime(2015, 4, 8, 0, 0), datetime.datetime(2015, 4, 9, 0, 0), datetime.datetime(2015, 4, 10, 0, 0), datetime.datetime(2015, 4, 13, 0, 0), datetime.datetime(2015, 4, 14, 0, 0), datetime.datetime(2015, 4, 15, 0, 0), datetime.datetime(2015, 4, 16, 0, 0), datetime.datetime(2015, 4, 17, 0, 0), datetime.datetime(2015, 4, 20, 0, 0), datetime.datetime(2015, 4, 21, 0, 0), datetime.datetime(2015, 4, 22, 0, 0), datetime.datetime(2015, 4, 23, 0, 0), datetime.datetime(2015, 4, 24, 0, 0), datetime.datetime(2015, 4, 27, 0, 0), datetime.datetime(2015, 4, 28, 0, 0), datetime.datetime(2015, 4, 29, 0, 0), datetime.datetime(2015, 4, 30, 0, 0), datetime.datetime(2015, 5, 1, 0, 0), datetime.datetime(2015, 5, 4, 0, 0), datetime.datetime(2015, 5, 5, 0, 0), datetime.datetime(2015, 5, 6, 0, 0), datetime.datetime(2015, 5, 7, 0, 0), datetime.datetime(2015, 5, 8, 0, 0), datetime.datetime(2015, 5, 11, 0, 0), datetime.datetime(2015, 5, 12, 0, 0), datetime.datetime(2015, 5, 13, 0, 0), datetime.datetime(2015, 5, 14, 0, 0), datetime.datetime(2015, 5, 15, 0, 0), datetime.datetime(2015, 5, 18, 0, 0), datetime.datetime(2015, 5, 19, 0, 0), datetime.datetime(2015, 5, 20, 0, 0), datetime.datetime(2015, 5, 21, 0, 0), datetime.datetime(2015, 5, 22, 0, 0), datetime.datetime(2015, 5, 26, 0, 0), datetime.datetime(2015, 5, 27, 0, 0), datetime.datetime(2015, 5, 28, 0, 0), datetime.datetime(2015, 5, 29, 0, 0), datetime.datetime(2015, 6, 1, 0, 0), datetime.datetime(2015, 6, 2, 0, 0), datetime.datetime(2015, 6, 3, 0, 0), datetime.datetime(2015, 6, 4, 0, 0), datetime.datetime(2015, 6, 5, 0, 0), datetime.datetime(2015, 6, 8, 0, 0), datetime.datetime(2015, 6, 9, 0, 0), datetime.datetime(2015, 6, 10, 0, 0), datetime.datetime(2015, 6, 11, 0, 0), datetime.datetime(2015, 6, 12, 0, 0), datetime.datetime(2015, 6, 15, 0, 0), datetime.datetime(2015, 6, 16, 0, 0), datetime.datetime(2015, 6, 17, 0, 0), datetime.datetime(2015, 6, 18, 0, 0), datetime.datetime(2015, 6, 19, 0, 0), datetime.datetime(2015, 6, 22, 0, 0), datetime.datetime(2015, 6, 23, 0, 0), datetime.datetime(2015, 6, 24, 0, 0), datetime.datetime(2015, 6, 25, 0, 0), datetime.datetime(2015, 6, 26, 0, 0), datetime.datetime(2015, 6, 29, 0, 0), datetime.datetime(2015, 6, 30, 0, 0), datetime.datetime(2015, 7, 1, 0, 0), datetime.datetime(2015, 7, 2, 0, 0), datetime.datetime(2015, 7, 6, 0, 0), datetime.datetime(2015, 7, 7, 0, 0), datetime.datetime(2015, 7, 8, 0, 0), datetime.datetime(2015, 7, 9, 0, 0), datetime.datetime(2015, 7, 10, 0, 0), datetime.datetime(2015, 7, 13, 0, 0), datetime.datetime(2015, 7, 14, 0, 0), datetime.datetime(2015, 7, 15, 0, 0), datetime.datetime(2015, 7, 16, 0, 0), datetime.datetime(2015, 7, 17, 0, 0), datetime.datetime(2015, 7, 20, 0, 0), datetime.datetime(2015, 7, 21, 0, 0), datetime.datetime(2015, 7, 22, 0, 0), datetime.datetime(2015, 7, 23, 0, 0), datetime.datetime(2015, 7, 24, 0, 0), datetime.datetime(2015, 7, 27, 0, 0), datetime.datetime(2015, 7, 28, 0, 0), datetime.datetime(2015, 7, 29, 0, 0), datetime.datetime(2015, 7, 30, 0, 0), datetime.datetime(2015, 7, 31, 0, 0), datetime.datetime(2015, 8, 3, 0, 0), datetime.datetime(2015, 8, 4, 0, 0), datetime.datetime(2015, 8, 5, 0, 0), datetime.datetime(2015, 8, 6, 0, 0), datetime.datetime(2015, 8, 7, 0, 0), datetime.datetime(2015, 8, 10, 0, 0), datetime.datetime(2015, 8, 11, 0, 0), datetime.datetime(2015, 8, 12, 0, 0), datetime.datetime(2015, 8, 13, 0, 0), datetime.datetime(2015, 8, 14, 0, 0), datetime.datetime(2015, 8, 17, 0, 0), datetime.datetime(2015, 8, 18, 0, 0), datetime.datetime(2015, 8, 19, 0, 0), datetime.datetime(2015, 8, 20, 0, 0), datetime.datetime(2015, 8, 21, 0, 0), datetime.datetime(2015, 8, 24, 0, 0), datetime.datetime(2015, 8, 25, 0, 0), datetime.datetime(2015, 8, 26, 0, 0), datetime.datetime(2015, 8, 27, 0, 0), datetime.datetime(2015, 8, 28, 0, 0), datetime.datetime(2015, 8, 31, 0, 0), datetime.datetime(2015, 9, 1, 0, 0), datetime.datetime(2015, 9, 2, 0, 0), datetime.datetime(2015, 9, 3, 0, 0), datetime.datetime(2015, 9, 4, 0, 0), datetime.datetime(2015, 9, 8, 0, 0), datetime.datetime(2015, 9, 9, 0, 0), datetime.datetime(2015, 9, 10, 0, 0), datetime.datetime(2015, 9, 11, 0, 0), datetime.datetime(2015, 9, 14, 0, 0), datetime.datetime(2015, 9, 15, 0, 0), datetime.datetime(2015, 9, 16, 0, 0), datetime.datetime(2015, 9, 17, 0, 0), datetime.datetime(2015, 9, 18, 0, 0), datetime.datetime(2015, 9, 21, 0, 0), datetime.datetime(2015, 9, 22, 0, 0), datetime.datetime(2015, 9, 23, 0, 0), datetime.datetime(2015, 9, 24, 0, 0), datetime.datetime(2015, 9, 25, 0, 0), datetime.datetime(2015, 9, 28, 0, 0), datetime.datetime(2015, 9, 29, 0, 0), datetime.datetime(2015, 9, 30, 0, 0), datetime.datetime(2015, 10, 1, 0, 0), datetime.datetime(2015, 10, 2, 0, 0), datetime.datetime(2015, 10, 5, 0, 0), datetime.datetime(2015, 10, 6, 0, 0), datetime.datetime(2015, 10, 7, 0, 0), datetime.datetime(2015, 10, 8, 0, 0), datetime.datetime(2015, 10, 9, 0, 0), datetime.datetime(2015, 10, 12, 0, 0), datetime.datetime(2015, 10, 13, 0, 0), datetime.datetime(2015, 10, 14, 0, 0), datetime.datetime(2015, 10, 15, 0, 0), datetime.datetime(2015, 10, 16, 0, 0), datetime.datetime(2015, 10, 19, 0, 0), datetime.datetime(2015, 10, 20, 0, 0), datetime.datetime(2015, 10, 21, 0, 0), datetime.datetime(2015, 10, 22, 0, 0), datetime.datetime(2015, 10, 23, 0, 0), datetime.datetime(2015, 10, 26, 0, 0), datetime.datetime(2015, 10, 27, 0, 0), datetime.datetime(2015, 10, 28, 0, 0), datetime.datetime(2015, 10, 29, 0, 0), datetime.datetime(2015, 10, 30, 0, 0), datetime.datetime(2015, 11, 2, 0, 0), datetime.datetime(2015, 11, 3, 0, 0), datetime.datetime(2015, 11, 4, 0, 0), datetime.datetime(2015, 11, 5, 0, 0), datetime.datetime(2015, 11, 6, 0, 0), datetime.datetime(2015, 11, 9, 0, 0), datetime.datetime(2015, 11, 10, 0, 0), datetime.datetime(2015, 11, 11, 0, 0), datetime.datetime(2015, 11, 12, 0, 0), datetime.datetime(2015, 11, 13, 0, 0), datetime.datetime(2015, 11, 16, 0, 0), datetime.datetime(2015, 11, 17, 0, 0), datetime.datetime(2015, 11, 18, 0, 0), datetime.datetime(2015, 11, 19, 0, 0), datetime.datetime(2015, 11, 20, 0, 0), datetime.datetime(2015, 11, 23, 0, 0), datetime.datetime(2015, 11, 24, 0, 0), datetime.datetime(2015, 11, 25, 0, 0), datetime.datetime(2015, 11, 27, 0, 0), datetime.datetime(2015, 11, 30, 0, 0), datetime.datetime(2015, 12, 1, 0, 0), datetime.datetime(2015, 12, 2, 0, 0), datetime.datetime(2015, 12, 3, 0, 0), datetime.datetime(2015, 12, 4, 0, 0), datetime.datetime(2015, 12, 7, 0, 0), datetime.datetime(2015, 12, 8, 0, 0), datetime.datetime(2015, 12, 9, 0, 0), datetime.datetime(2015, 12, 10, 0, 0), datetime.datetime(2015, 12, 11, 0, 0), datetime.datetime(2015, 12, 14, 0, 0), datetime.datetime(2015, 12, 15, 0, 0), datetime.datetime(2015, 12, 16, 0, 0), datetime.datetime(2015, 12, 17, 0, 0), datetime.datetime(2015, 12, 18, 0, 0), datetime.datetime(2015, 12, 21, 0, 0), datetime.datetime(2015, 12, 22, 0, 0), datetime.datetime(2015, 12, 23, 0, 0), datetime.datetime(2015, 12, 24, 0, 0), datetime.datetime(2015, 12, 28, 0, 0), datetime.datetime(2015, 12, 29, 0, 0), datetime.datetime(2015, 12, 30, 0, 0), datetime.datetime(2015, 12, 31, 0, 0), datetime.datetime(2016, 1, 4, 0, 0), datetime.datetime(2016, 1, 5, 0, 0), datetime.datetime(2016, 1, 6, 0, 0), datetime.datetime(2016, 1, 7, 0, 0), datetime.datetime(2016, 1, 8, 0, 0), datetime.datetime(2016, 1, 11, 0, 0), datetime.datetime(2016, 1, 12, 0, 0), datetime.datetime(2016, 1, 13, 0, 0), datetime.datetime(2016, 1, 14, 0, 0), datetime.datetime(2016, 1, 15, 0, 0), datetime.datetime(2016, 1, 19, 0, 0), datetime.datetime(2016, 1, 20, 0, 0), datetime.datetime(2016, 1, 21, 0, 0), datetime.datetime(2016, 1, 22, 0, 0), datetime.datetime(2016, 1, 25, 0, 0), datetime.datetime(2016, 1, 26, 0, 0), datetime.datetime(2016, 1, 27, 0, 0), datetime.datetime(2016, 1, 28, 0, 0), datetime.datetime(2016, 1, 29, 0, 0), datetime.datetime(2016, 2, 1, 0, 0), datetime.datetime(2016, 2, 2, 0, 0), datetime.datetime(2016, 2, 3, 0, 0), datetime.datetime(2016, 2, 4, 0, 0), datetime.datetime(2016, 2, 5, 0, 0), datetime.datetime(2016, 2, 8, 0, 0), datetime.datetime(2016, 2, 9, 0, 0), datetime.datetime(2016, 2, 10, 0, 0), datetime.datetime(2016, 2, 11, 0, 0), datetime.datetime(2016, 2, 12, 0, 0), datetime.datetime(2016, 2, 16, 0, 0), datetime.datetime(2016, 2, 17, 0, 0), datetime.datetime(2016, 2, 18, 0, 0), datetime.datetime(2016, 2, 19, 0, 0), datetime.datetime(2016, 2, 22, 0, 0), datetime.datetime(2016, 2, 23, 0, 0), datetime.datetime(2016, 2, 24, 0, 0), datetime.datetime(2016, 2, 25, 0, 0), datetime.datetime(2016, 2, 26, 0, 0), datetime.datetime(2016, 2, 29, 0, 0), datetime.datetime(2016, 3, 1, 0, 0), datetime.datetime(2016, 3, 2, 0, 0), datetime.datetime(2016, 3, 3, 0, 0), datetime.datetime(2016, 3, 4, 0, 0), datetime.datetime(2016, 3, 7, 0, 0), datetime.datetime(2016, 3, 8, 0, 0), datetime.datetime(2016, 3, 9, 0, 0), datetime.datetime(2016, 3, 10, 0, 0), datetime.datetime(2016, 3, 11, 0, 0), datetime.datetime(2016, 3, 14, 0, 0), datetime.datetime(2016, 3, 15, 0, 0), datetime.datetime(2016, 3, 16, 0, 0), datetime.datetime(2016, 3, 17, 0, 0), datetime.datetime(2016, 3, 18, 0, 0), datetime.datetime(2016, 3, 21, 0, 0), datetime.datetime(2016, 3, 22, 0, 0), datetime.datetime(2016, 3, 23, 0, 0), datetime.datetime(2016, 3, 24, 0, 0), datetime.datetime(2016, 3, 28, 0, 0), datetime.datetime(2016, 3, 29, 0, 0), datetime.datetime(2016, 3, 30, 0, 0), datetime.datetime(2016, 3, 31, 0, 0), datetime.datetime(2016, 4, 1, 0, 0), datetime.datetime(2016, 4, 4, 0, 0), datetime.datetime(2016, 4, 5, 0, 0), datetime.datetime(2016, 4, 6, 0, 0), datetime.datetime(2016, 4, 7, 0, 0), datetime.datetime(2016, 4, 8, 0, 0), datetime.datetime(2016, 4, 11, 0, 0), datetime.datetime(2016, 4, 12, 0, 0), datetime.datetime(2016, 4, 13, 0, 0), datetime.datetime(2016, 4, 14, 0, 0), datetime.datetime(2016, 4, 15, 0, 0), datetime.datetime(2016, 4, 18, 0, 0), datetime.datetime(2016, 4, 19, 0, 0), datetime.datetime(2016, 4, 20, 0, 0), datetime.datetime(2016, 4, 21, 0, 0), datetime.datetime(2016, 4, 22, 0, 0), datetime.datetime(2016, 4, 25, 0, 0), datetime.datetime(2016, 4, 26, 0, 0), datetime.datetime(2016, 4, 27, 0, 0), datetime.datetime(2016, 4, 28, 0, 0), datetime.datetime(2016, 4, 29, 0, 0), datetime.datetime(2016, 5, 2, 0, 0), datetime.datetime(2016, 5, 3, 0, 0), datetime.datetime(2016, 5, 4, 0, 0), datetime.datetime(2016, 5, 5, 0, 0), datetime.datetime(2016, 5, 6, 0, 0), datetime.datetime(2016, 5, 9, 0, 0), datetime.datetime(2016, 5, 10, 0, 0), datetime.datetime(2016, 5, 11, 0, 0), datetime.datetime(2016, 5, 12, 0, 0), datetime.datetime(2016, 5, 13, 0, 0), datetime.datetime(2016, 5, 16, 0, 0), datetime.datetime(2016, 5, 17, 0, 0), datetime.datetime(2016, 5, 18, 0, 0), datetime.datetime(2016, 5, 19, 0, 0), datetime.datetime(2016, 5, 20, 0, 0), datetime.datetime(2016, 5, 23, 0, 0), datetime.datetime(2016, 5, 24, 0, 0), datetime.datetime(2016, 5, 25, 0, 0), datetime.datetime(2016, 5, 26, 0, 0), datetime.datetime(2016, 5, 27, 0, 0), datetime.datetime(2016, 5, 31, 0, 0), datetime.datetime(2016, 6, 1, 0, 0), datetime.datetime(2016, 6, 2, 0, 0), datetime.datetime(2016, 6, 3, 0, 0), datetime.datetime(2016, 6, 6, 0, 0), datetime.datetime(2016, 6, 7, 0, 0), datetime.datetime(2016, 6, 8, 0, 0), datetime.datetime(2016, 6, 9, 0, 0), datetime.datetime(2016, 6, 10, 0, 0), datetime.datetime(2016, 6, 13, 0, 0), datetime.datetime(2016, 6, 14, 0, 0), datetime.datetime(2016, 6, 15, 0, 0), datetime.datetime(2016, 6, 16, 0, 0), datetime.datetime(2016, 6, 17, 0, 0), datetime.datetime(2016, 6, 20, 0, 0), datetime.datetime(2016, 6, 21, 0, 0), datetime.datetime(2016, 6, 22, 0, 0), datetime.datetime(2016, 6, 23, 0, 0), datetime.datetime(2016, 6, 24, 0, 0), datetime.datetime(2016, 6, 27, 0, 0), datetime.datetime(2016, 6, 28, 0, 0), datetime.datetime(2016, 6, 29, 0, 0), datetime.datetime(2016, 6, 30, 0, 0), datetime.datetime(2016, 7, 1, 0, 0), datetime.datetime(2016, 7, 5, 0, 0), datetime.datetime(2016, 7, 6, 0, 0), datetime.datetime(2016, 7, 7, 0, 0), datetime.datetime(2016, 7, 8, 0, 0), datetime.datetime(2016, 7, 11, 0, 0), datetime.datetime(2016, 7, 12, 0, 0), datetime.datetime(2016, 7, 13, 0, 0), datetime.datetime(2016, 7, 14, 0, 0), datetime.datetime(2016, 7, 15, 0, 0), datetime.datetime(2016, 7, 18, 0, 0), datetime.datetime(2016, 7, 19, 0, 0), datetime.datetime(2016, 7, 20, 0, 0), datetime.datetime(2016, 7, 21, 0, 0), datetime.datetime(2016, 7, 22, 0, 0), datetime.datetime(2016, 7, 25, 0, 0), datetime.datetime(2016, 7, 26, 0, 0), datetime.datetime(2016, 7, 27, 0, 0), datetime.datetime(2016, 7, 28, 0, 0), datetime.datetime(2016, 7, 29, 0, 0), datetime.datetime(2016, 8, 1, 0, 0), datetime.datetime(2016, 8, 2, 0, 0), datetime.datetime(2016, 8, 3, 0, 0), datetime.datetime(2016, 8, 4, 0, 0), datetime.datetime(2016, 8, 5, 0, 0), datetime.datetime(2016, 8, 8, 0, 0), datetime.datetime(2016, 8, 9, 0, 0), datetime.datetime(2016, 8, 10, 0, 0), datetime.datetime(2016, 8, 11, 0, 0), datetime.datetime(2016, 8, 12, 0, 0), datetime.datetime(2016, 8, 15, 0, 0), datetime.datetime(2016, 8, 16, 0, 0), datetime.datetime(2016, 8, 17, 0, 0), datetime.datetime(2016, 8, 18, 0, 0), datetime.datetime(2016, 8, 19, 0, 0), datetime.datetime(2016, 8, 22, 0, 0), datetime.datetime(2016, 8, 23, 0, 0), datetime.datetime(2016, 8, 24, 0, 0), datetime.datetime(2016, 8, 25, 0, 0), datetime.datetime(2016, 8, 26, 0, 0), datetime.datetime(2016, 8, 29, 0, 0), datetime.datetime(2016, 8, 30, 0, 0), datetime.datetime(2016, 8, 31, 0, 0), datetime.datetime(2016, 9, 1, 0, 0), datetime.datetime(2016, 9, 2, 0, 0), datetime.datetime(2016, 9, 6, 0, 0), datetime.datetime(2016, 9, 7, 0, 0), datetime.datetime(2016, 9, 8, 0, 0), datetime.datetime(2016, 9, 9, 0, 0), datetime.datetime(2016, 9, 12, 0, 0), datetime.datetime(2016, 9, 13, 0, 0), datetime.datetime(2016, 9, 14, 0, 0), datetime.datetime(2016, 9, 15, 0, 0), datetime.datetime(2016, 9, 16, 0, 0), datetime.datetime(2016, 9, 19, 0, 0), datetime.datetime(2016, 9, 20, 0, 0), datetime.datetime(2016, 9, 21, 0, 0), datetime.datetime(2016, 9, 22, 0, 0), datetime.datetime(2016, 9, 23, 0, 0), datetime.datetime(2016, 9, 26, 0, 0), datetime.datetime(2016, 9, 27, 0, 0), datetime.datetime(2016, 9, 28, 0, 0), datetime.datetime(2016, 9, 29, 0, 0), datetime.datetime(2016, 9, 30, 0, 0), datetime.datetime(2016, 10, 3, 0, 0), datetime.datetime(2016, 10, 4, 0, 0), datetime.datetime(2016, 10, 5, 0, 0), datetime.datetime(2016, 10, 6, 0, 0), datetime.datetime(2016, 10, 7, 0, 0), datetime.datetime(2016, 10, 10, 0, 0), datetime.datetime(2016, 10, 11, 0, 0), datetime.datetime(2016, 10, 12, 0, 0), datetime.datetime(2016, 10, 13, 0, 0), datetime.datetime(2016, 10, 14, 0, 0), datetime.datetime(2016, 10, 17, 0, 0), datetime.datetime(2016, 10, 18, 0, 0), datetime.datetime(2016, 10, 19, 0, 0), datetime.datetime(2016, 10, 20, 0, 0), datetime.datetime(2016, 10, 21, 0, 0), datetime.datetime(2016, 10, 24, 0, 0), datetime.datetime(2016, 10, 25, 0, 0), datetime.datetime(2016, 10, 26, 0, 0), datetime.datetime(2016, 10, 27, 0, 0), datetime.datetime(2016, 10, 28, 0, 0), datetime.datetime(2016, 10, 31, 0, 0), datetime.datetime(2016, 11, 1, 0, 0), datetime.datetime(2016, 11, 2, 0, 0), datetime.datetime(2016, 11, 3, 0, 0), datetime.datetime(2016, 11, 4, 0, 0), datetime.datetime(2016, 11, 7, 0, 0), datetime.datetime(2016, 11, 8, 0, 0), datetime.datetime(2016, 11, 9, 0, 0), datetime.datetime(2016, 11, 10, 0, 0), datetime.datetime(2016, 11, 11, 0, 0), datetime.datetime(2016, 11, 14, 0, 0), datetime.datetime(2016, 11, 15, 0, 0), datetime.datetime(2016, 11, 16, 0, 0), datetime.datetime(2016, 11, 17, 0, 0), datetime.datetime(2016, 11, 18, 0, 0), datetime.datetime(2016, 11, 21, 0, 0), datetime.datetime(2016, 11, 22, 0, 0), datetime.datetime(2016, 11, 23, 0, 0), datetime.datetime(2016, 11, 25, 0, 0), datetime.datetime(2016, 11, 28, 0, 0), datetime.datetime(2016, 11, 29, 0, 0), datetime.datetime(2016, 11, 30, 0, 0), datetime.datetime(2016, 12, 1, 0, 0), datetime.datetime(2016, 12, 2, 0, 0), datetime.datetime(2016, 12, 5, 0, 0), datetime.datetime(2016, 12, 6, 0, 0), datetime.datetime(2016, 12, 7, 0, 0), datetime.datetime(2016, 12, 8, 0, 0), datetime.datetime(2016, 12, 9, 0, 0), datetime.datetime(2016, 12, 12, 0, 0), datetime.datetime(2016, 12, 13, 0, 0), datetime.datetime(2016, 12, 14, 0, 0), datetime.datetime(2016, 12, 15, 0, 0), datetime.datetime(2016, 12, 16, 0, 0), datetime.datetime(2016, 12, 19, 0, 0), datetime.datetime(2016, 12, 20, 0, 0), datetime.datetime(2016, 12, 21, 0, 0), datetime.datetime(2016, 12, 22, 0, 0), datetime.datetime(2016, 12, 23, 0, 0), datetime.datetime(2016, 12, 27, 0, 0), datetime.datetime(2016, 12, 28, 0, 0), datetime.datetime(2016, 12, 29, 0, 0), datetime.datetime(2016, 12, 30, 0, 0), datetime.datetime(2017, 1, 3, 0, 0), datetime.datetime(2017, 1, 4, 0, 0), datetime.datetime(2017, 1, 5, 0, 0), datetime.datetime(2017, 1, 6, 0, 0), datetime.datetime(2017, 1, 9, 0, 0), datetime.datetime(2017, 1, 10, 0, 0), datetime.datetime(2017, 1, 11, 0, 0), datetime.datetime(2017, 1, 12, 0, 0), datetime.datetime(2017, 1, 13, 0, 0), datetime.datetime(2017, 1, 17, 0, 0), datetime.datetime(2017, 1, 18, 0, 0), datetime.datetime(2017, 1, 19, 0, 0), datetime.datetime(2017, 1, 20, 0, 0), datetime.datetime(2017, 1, 23, 0, 0), datetime.datetime(2017, 1, 24, 0, 0), datetime.datetime(2017, 1, 25, 0, 0), datetime.datetime(2017, 1, 26, 0, 0), datetime.datetime(2017, 1, 27, 0, 0), datetime.datetime(2017, 1, 30, 0, 0), datetime.datetime(2017, 1, 31, 0, 0), datetime.datetime(2017, 2, 1, 0, 0), datetime.datetime(2017, 2, 2, 0, 0), datetime.datetime(2017, 2, 3, 0, 0), datetime.datetime(2017, 2, 6, 0, 0), datetime.datetime(2017, 2, 7, 0, 0), datetime.datetime(2017, 2, 8, 0, 0), datetime.datetime(2017, 2, 9, 0, 0), datetime.datetime(2017, 2, 10, 0, 0), datetime.datetime(2017, 2, 13, 0, 0), datetime.datetime(2017, 2, 14, 0, 0), datetime.datetime(2017, 2, 15, 0, 0), datetime.datetime(2017, 2, 16, 0, 0), datetime.datetime(2017, 2, 17, 0, 0), datetime.datetime(2017, 2, 21, 0, 0), datetime.datetime(2017, 2, 22, 0, 0), datetime.datetime(2017, 2, 23, 0, 0), datetime.datetime(2017, 2, 24, 0, 0), datetime.datetime(2017, 2, 27, 0, 0), datetime.datetime(2017, 2, 28, 0, 0), datetime.datetime(2017, 3, 1, 0, 0), datetime.datetime(2017, 3, 2, 0, 0), datetime.datetime(2017, 3, 3, 0, 0), datetime.datetime(2017, 3, 6, 0, 0), datetime.datetime(2017, 3, 7, 0, 0), datetime.datetime(2017, 3, 8, 0, 0), datetime.datetime(2017, 3, 9, 0, 0), datetime.datetime(2017, 3, 10, 0, 0), datetime.datetime(2017, 3, 13, 0, 0), datetime.datetime(2017, 3, 14, 0, 0), datetime.datetime(2017, 3, 15, 0, 0), datetime.datetime(2017, 3, 16, 0, 0), datetime.datetime(2017, 3, 17, 0, 0), datetime.datetime(2017, 3, 20, 0, 0), datetime.datetime(2017, 3, 21, 0, 0), datetime.datetime(2017, 3, 22, 0, 0), datetime.datetime(2017, 3, 23, 0, 0), datetime.datetime(2017, 3, 24, 0, 0), datetime.datetime(2017, 3, 27, 0, 0), datetime.datetime(2017, 3, 28, 0, 0), datetime.datetime(2017, 3, 29, 0, 0), datetime.datetime(2017, 3, 30, 0, 0), datetime.datetime(2017, 3, 31, 0, 0), datetime.datetime(2017, 4, 3, 0, 0), datetime.datetime(2017, 4, 4, 0, 0), datetime.datetime(2017, 4, 5, 0, 0), datetime.datetime(2017, 4, 6, 0, 0), datetime.datetime(2017, 4, 7, 0, 0), datetime.datetime(2017, 4, 10, 0, 0), datetime.datetime(2017, 4, 11, 0, 0), datetime.datetime(2017, 4, 12, 0, 0), datetime.datetime(2017, 4, 13, 0, 0), datetime.datetime(2017, 4, 17, 0, 0), datetime.datetime(2017, 4, 18, 0, 0), datetime.datetime(2017, 4, 19, 0, 0), datetime.datetime(2017, 4, 20, 0, 0), datetime.datetime(2017, 4, 21, 0, 0), datetime.datetime(2017, 4, 24, 0, 0), datetime.datetime(2017, 4, 25, 0, 0), datetime.datetime(2017, 4, 26, 0, 0), datetime.datetime(2017, 4, 27, 0, 0), datetime.datetime(2017, 4, 28, 0, 0), datetime.datetime(2017, 5, 1, 0, 0), datetime.datetime(2017, 5, 2, 0, 0), datetime.datetime(2017, 5, 3, 0, 0), datetime.datetime(2017, 5, 4, 0, 0), datetime.datetime(2017, 5, 5, 0, 0), datetime.datetime(2017, 5, 8, 0, 0), datetime.datetime(2017, 5, 9, 0, 0), datetime.datetime(2017, 5, 10, 0, 0), datetime.datetime(2017, 5, 11, 0, 0), datetime.datetime(2017, 5, 12, 0, 0), datetime.datetime(2017, 5, 15, 0, 0), datetime.datetime(2017, 5, 16, 0, 0), datetime.datetime(2017, 5, 17, 0, 0), datetime.datetime(2017, 5, 18, 0, 0), datetime.datetime(2017, 5, 19, 0, 0), datetime.datetime(2017, 5, 22, 0, 0), datetime.datetime(2017, 5, 23, 0, 0), datetime.datetime(2017, 5, 24, 0, 0), datetime.datetime(2017, 5, 25, 0, 0), datetime.datetime(2017, 5, 26, 0, 0), datetime.datetime(2017, 5, 30, 0, 0), datetime.datetime(2017, 5, 31, 0, 0), datetime.datetime(2017, 6, 1, 0, 0), datetime.datetime(2017, 6, 2, 0, 0), datetime.datetime(2017, 6, 5, 0, 0), datetime.datetime(2017, 6, 6, 0, 0), datetime.datetime(2017, 6, 7, 0, 0), datetime.datetime(2017, 6, 8, 0, 0), datetime.datetime(2017, 6, 9, 0, 0), datetime.datetime(2017, 6, 12, 0, 0), datetime.datetime(2017, 6, 13, 0, 0), datetime.datetime(2017, 6, 14, 0, 0), datetime.datetime(2017, 6, 15, 0, 0), datetime.datetime(2017, 6, 16, 0, 0), datetime.datetime(2017, 6, 19, 0, 0), datetime.datetime(2017, 6, 20, 0, 0), datetime.datetime(2017, 6, 21, 0, 0), datetime.datetime(2017, 6, 22, 0, 0), datetime.datetime(2017, 6, 23, 0, 0), datetime.datetime(2017, 6, 26, 0, 0), datetime.datetime(2017, 6, 27, 0, 0), datetime.datetime(2017, 6, 28, 0, 0), datetime.datetime(2017, 6, 29, 0, 0), datetime.datetime(2017, 6, 30, 0, 0), datetime.datetime(2017, 7, 3, 0, 0), datetime.datetime(2017, 7, 5, 0, 0), datetime.datetime(2017, 7, 6, 0, 0), datetime.datetime(2017, 7, 7, 0, 0), datetime.datetime(2017, 7, 10, 0, 0), datetime.datetime(2017, 7, 11, 0, 0), datetime.datetime(2017, 7, 12, 0, 0), datetime.datetime(2017, 7, 13, 0, 0), datetime.datetime(2017, 7, 14, 0, 0), datetime.datetime(2017, 7, 17, 0, 0), datetime.datetime(2017, 7, 18, 0, 0), datetime.datetime(2017, 7, 19, 0, 0), datetime.datetime(2017, 7, 20, 0, 0), datetime.datetime(2017, 7, 21, 0, 0), datetime.datetime(2017, 7, 24, 0, 0), datetime.datetime(2017, 7, 25, 0, 0), datetime.datetime(2017, 7, 26, 0, 0), datetime.datetime(2017, 7, 27, 0, 0), datetime.datetime(2017, 7, 28, 0, 0), datetime.datetime(2017, 7, 31, 0, 0), datetime.datetime(2017, 8, 1, 0, 0), datetime.datetime(2017, 8, 2, 0, 0), datetime.datetime(2017, 8, 3, 0, 0), datetime.datetime(2017, 8, 4, 0, 0), datetime.datetime(2017, 8, 7, 0, 0), datetime.datetime(2017, 8, 8, 0, 0), datetime.datetime(2017, 8, 9, 0, 0), datetime.datetime(2017, 8, 10, 0, 0), datetime.datetime(2017, 8, 11, 0, 0), datetime.datetime(2017, 8, 14, 0, 0), datetime.datetime(2017, 8, 15, 0, 0), datetime.datetime(2017, 8, 16, 0, 0), datetime.datetime(2017, 8, 17, 0, 0), datetime.datetime(2017, 8, 18, 0, 0), datetime.datetime(2017, 8, 21, 0, 0), datetime.datetime(2017, 8, 22, 0, 0), datetime.datetime(2017, 8, 23, 0, 0), datetime.datetime(2017, 8, 24, 0, 0), datetime.datetime(2017, 8, 25, 0, 0), datetime.datetime(2017, 8, 28, 0, 0), datetime.datetime(2017, 8, 29, 0, 0), datetime.datetime(2017, 8, 30, 0, 0), datetime.datetime(2017, 8, 31, 0, 0), datetime.datetime(2017, 9, 1, 0, 0), datetime.datetime(2017, 9, 5, 0, 0), datetime.datetime(2017, 9, 6, 0, 0), datetime.datetime(2017, 9, 7, 0, 0), datetime.datetime(2017, 9, 8, 0, 0), datetime.datetime(2017, 9, 11, 0, 0), datetime.datetime(2017, 9, 12, 0, 0), datetime.datetime(2017, 9, 13, 0, 0), datetime.datetime(2017, 9, 14, 0, 0), datetime.datetime(2017, 9, 15, 0, 0), datetime.datetime(2017, 9, 18, 0, 0), datetime.datetime(2017, 9, 19, 0, 0), datetime.datetime(2017, 9, 20, 0, 0), datetime.datetime(2017, 9, 21, 0, 0), datetime.datetime(2017, 9, 22, 0, 0), datetime.datetime(2017, 9, 25, 0, 0), datetime.datetime(2017, 9, 26, 0, 0), datetime.datetime(2017, 9, 27, 0, 0), datetime.datetime(2017, 9, 28, 0, 0), datetime.datetime(2017, 9, 29, 0, 0), datetime.datetime(2017, 10, 2, 0, 0), datetime.datetime(2017, 10, 3, 0, 0), datetime.datetime(2017, 10, 4, 0, 0), datetime.datetime(2017, 10, 5, 0, 0), datetime.datetime(2017, 10, 6, 0, 0), datetime.datetime(2017, 10, 9, 0, 0), datetime.datetime(2017, 10, 10, 0, 0), datetime.datetime(2017, 10, 11, 0, 0), datetime.datetime(2017, 10, 12, 0, 0), datetime.datetime(2017, 10, 13, 0, 0), datetime.datetime(2017, 10, 16, 0, 0), datetime.datetime(2017, 10, 17, 0, 0), datetime.datetime(2017, 10, 18, 0, 0), datetime.datetime(2017, 10, 19, 0, 0), datetime.datetime(2017, 10, 20, 0, 0), datetime.datetime(2017, 10, 23, 0, 0), datetime.datetime(2017, 10, 24, 0, 0), datetime.datetime(2017, 10, 25, 0, 0), datetime.datetime(2017, 10, 26, 0, 0), datetime.datetime(2017, 10, 27, 0, 0), datetime.datetime(2017, 10, 30, 0, 0), datetime.datetime(2017, 10, 31, 0, 0), datetime.datetime(2017, 11, 1, 0, 0), datetime.datetime(2017, 11, 2, 0, 0), datetime.datetime(2017, 11, 3, 0, 0), datetime.datetime(2017, 11, 6, 0, 0), datetime.datetime(2017, 11, 7, 0, 0), datetime.datetime(2017, 11, 8, 0, 0), datetime.datetime(2017, 11, 9, 0, 0), datetime.datetime(2017, 11, 10, 0, 0), datetime.datetime(2017, 11, 13, 0, 0), datetime.datetime(2017, 11, 14, 0, 0), datetime.datetime(2017, 11, 15, 0, 0), datetime.datetime(2017, 11, 16, 0, 0), datetime.datetime(2017, 11, 17, 0, 0), datetime.datetime(2017, 11, 20, 0, 0), datetime.datetime(2017, 11, 21, 0, 0), datetime.datetime(2017, 11, 22, 0, 0), datetime.datetime(2017, 11, 24, 0, 0), datetime.datetime(2017, 11, 27, 0, 0), datetime.datetime(2017, 11, 28, 0, 0), datetime.datetime(2017, 11, 29, 0, 0), datetime.datetime(2017, 11, 30, 0, 0), datetime.datetime(2017, 12, 1, 0, 0), datetime.datetime(2017, 12, 4, 0, 0), datetime.datetime(2017, 12, 5, 0, 0), datetime.datetime(2017, 12, 6, 0, 0), datetime.datetime(2017, 12, 7, 0, 0), datetime.datetime(2017, 12, 8, 0, 0), datetime.datetime(2017, 12, 11, 0, 0), datetime.datetime(2017, 12, 12, 0, 0), datetime.datetime(2017, 12, 13, 0, 0), datetime.datetime(2017, 12, 14, 0, 0), datetime.datetime(2017, 12, 15, 0, 0), datetime.datetime(2017, 12, 18, 0, 0), datetime.datetime(2017, 12, 19, 0, 0), datetime.datetime(2017, 12, 20, 0, 0), datetime.datetime(2017, 12, 21, 0, 0), datetime.datetime(2017, 12, 22, 0, 0), datetime.datetime(2017, 12, 26, 0, 0), datetime.datetime(2017, 12, 27, 0, 0), datetime.datetime(2017, 12, 28, 0, 0), datetime.datetime(2017, 12, 29, 0, 0), datetime.datetime(2018, 1, 2, 0, 0), datetime.datetime(2018, 1, 3, 0, 0), datetime.datetime(2018, 1, 4, 0, 0), datetime.datetime(2018, 1, 5, 0, 0), datetime.datetime(2018, 1, 8, 0, 0), datetime.datetime(2018, 1, 9, 0, 0), datetime.datetime(2018, 1, 10, 0, 0), datetime.datetime(2018, 1, 11, 0, 0), datetime.datetime(2018, 1, 12, 0, 0), datetime.datetime(2018, 1, 16, 0, 0), datetime.datetime(2018, 1, 17, 0, 0), datetime.datetime(2018, 1, 18, 0, 0), datetime.datetime(2018, 1, 19, 0, 0), datetime.datetime(2018, 1, 22, 0, 0), datetime.datetime(2018, 1, 23, 0, 0), datetime.datetime(2018, 1, 24, 0, 0), datetime.datetime(2018, 1, 25, 0, 0), datetime.datetime(2018, 1, 26, 0, 0), datetime.datetime(2018, 1, 29, 0, 0), datetime.datetime(2018, 1, 30, 0, 0), datetime.datetime(2018, 1, 31, 0, 0), datetime.datetime(2018, 2, 1, 0, 0), datetime.datetime(2018, 2, 2, 0, 0), datetime.datetime(2018, 2, 5, 0, 0), datetime.datetime(2018, 2, 6, 0, 0), datetime.datetime(2018, 2, 7, 0, 0), datetime.datetime(2018, 2, 8, 0, 0), datetime.datetime(2018, 2, 9, 0, 0), datetime.datetime(2018, 2, 12, 0, 0), datetime.datetime(2018, 2, 13, 0, 0), datetime.datetime(2018, 2, 14, 0, 0), datetime.datetime(2018, 2, 15, 0, 0), datetime.datetime(2018, 2, 16, 0, 0), datetime.datetime(2018, 2, 20, 0, 0), datetime.datetime(2018, 2, 21, 0, 0), datetime.datetime(2018, 2, 22, 0, 0), datetime.datetime(2018, 2, 23, 0, 0), datetime.datetime(2018, 2, 26, 0, 0), datetime.datetime(2018, 2, 27, 0, 0), datetime.datetime(2018, 2, 28, 0, 0), datetime.datetime(2018, 3, 1, 0, 0), datetime.datetime(2018, 3, 2, 0, 0), datetime.datetime(2018, 3, 5, 0, 0), datetime.datetime(2018, 3, 6, 0, 0), datetime.datetime(2018, 3, 7, 0, 0), datetime.datetime(2018, 3, 8, 0, 0), datetime.datetime(2018, 3, 9, 0, 0), datetime.datetime(2018, 3, 12, 0, 0), datetime.datetime(2018, 3, 13, 0, 0), datetime.datetime(2018, 3, 14, 0, 0), datetime.datetime(2018, 3, 15, 0, 0), datetime.datetime(2018, 3, 16, 0, 0), datetime.datetime(2018, 3, 19, 0, 0), datetime.datetime(2018, 3, 20, 0, 0), datetime.datetime(2018, 3, 21, 0, 0), datetime.datetime(2018, 3, 22, 0, 0), datetime.datetime(2018, 3, 23, 0, 0), datetime.datetime(2018, 3, 26, 0, 0), datetime.datetime(2018, 3, 27, 0, 0), datetime.datetime(2018, 3, 28, 0, 0), datetime.datetime(2018, 3, 29, 0, 0), datetime.datetime(2018, 4, 2, 0, 0), datetime.datetime(2018, 4, 3, 0, 0), datetime.datetime(2018, 4, 4, 0, 0), datetime.datetime(2018, 4, 5, 0, 0), datetime.datetime(2018, 4, 6, 0, 0), datetime.datetime(2018, 4, 9, 0, 0), datetime.datetime(2018, 4, 10, 0, 0), datetime.datetime(2018, 4, 11, 0, 0), datetime.datetime(2018, 4, 12, 0, 0), datetime.datetime(2018, 4, 13, 0, 0), datetime.datetime(2018, 4, 16, 0, 0), datetime.datetime(2018, 4, 17, 0, 0), datetime.datetime(2018, 4, 18, 0, 0), datetime.datetime(2018, 4, 19, 0, 0), datetime.datetime(2018, 4, 20, 0, 0), datetime.datetime(2018, 4, 23, 0, 0), datetime.datetime(2018, 4, 24, 0, 0), datetime.datetime(2018, 4, 25, 0, 0), datetime.datetime(2018, 4, 26, 0, 0), datetime.datetime(2018, 4, 27, 0, 0), datetime.datetime(2018, 4, 30, 0, 0), datetime.datetime(2018, 5, 1, 0, 0), datetime.datetime(2018, 5, 2, 0, 0), datetime.datetime(2018, 5, 3, 0, 0), datetime.datetime(2018, 5, 4, 0, 0), datetime.datetime(2018, 5, 7, 0, 0), datetime.datetime(2018, 5, 8, 0, 0), datetime.datetime(2018, 5, 9, 0, 0), datetime.datetime(2018, 5, 10, 0, 0), datetime.datetime(2018, 5, 11, 0, 0), datetime.datetime(2018, 5, 14, 0, 0), datetime.datetime(2018, 5, 15, 0, 0), datetime.datetime(2018, 5, 16, 0, 0), datetime.datetime(2018, 5, 17, 0, 0), datetime.datetime(2018, 5, 18, 0, 0), datetime.datetime(2018, 5, 21, 0, 0), datetime.datetime(2018, 5, 22, 0, 0), datetime.datetime(2018, 5, 23, 0, 0), datetime.datetime(2018, 5, 24, 0, 0), datetime.datetime(2018, 5, 25, 0, 0), datetime.datetime(2018, 5, 29, 0, 0), datetime.datetime(2018, 5, 30, 0, 0), datetime.datetime(2018, 5, 31, 0, 0), datetime.datetime(2018, 6, 1, 0, 0), datetime.datetime(2018, 6, 4, 0, 0), datetime.datetime(2018, 6, 5, 0, 0), datetime.datetime(2018, 6, 6, 0, 0), datetime.datetime(2018, 6, 7, 0, 0), datetime.datetime(2018, 6, 8, 0, 0), datetime.datetime(2018, 6, 11, 0, 0), datetime.datetime(2018, 6, 12, 0, 0), datetime.datetime(2018, 6, 13, 0, 0), datetime.datetime(2018, 6, 14, 0, 0), datetime.datetime(2018, 6, 15, 0, 0), datetime.datetime(2018, 6, 18, 0, 0), datetime.datetime(2018, 6, 19, 0, 0), datetime.datetime(2018, 6, 20, 0, 0), datetime.datetime(2018, 6, 21, 0, 0), datetime.datetime(2018, 6, 22, 0, 0), datetime.datetime(2018, 6, 25, 0, 0), datetime.datetime(2018, 6, 26, 0, 0), datetime.datetime(2018, 6, 27, 0, 0), datetime.datetime(2018, 6, 28, 0, 0), datetime.datetime(2018, 6, 29, 0, 0), datetime.datetime(2018, 7, 2, 0, 0), datetime.datetime(2018, 7, 3, 0, 0), datetime.datetime(2018, 7, 5, 0, 0), datetime.datetime(2018, 7, 6, 0, 0), datetime.datetime(2018, 7, 9, 0, 0), datetime.datetime(2018, 7, 10, 0, 0), datetime.datetime(2018, 7, 11, 0, 0), datetime.datetime(2018, 7, 12, 0, 0), datetime.datetime(2018, 7, 13, 0, 0), datetime.datetime(2018, 7, 16, 0, 0), datetime.datetime(2018, 7, 17, 0, 0), datetime.datetime(2018, 7, 18, 0, 0), datetime.datetime(2018, 7, 19, 0, 0), datetime.datetime(2018, 7, 20, 0, 0), datetime.datetime(2018, 7, 23, 0, 0), datetime.datetime(2018, 7, 24, 0, 0), datetime.datetime(2018, 7, 25, 0, 0), datetime.datetime(2018, 7, 26, 0, 0), datetime.datetime(2018, 7, 27, 0, 0), datetime.datetime(2018, 7, 30, 0, 0), datetime.datetime(2018, 7, 31, 0, 0), datetime.datetime(2018, 8, 1, 0, 0), datetime.datetime(2018, 8, 2, 0, 0), datetime.datetime(2018, 8, 3, 0, 0), datetime.datetime(2018, 8, 6, 0, 0), datetime.datetime(2018, 8, 7, 0, 0), datetime.datetime(2018, 8, 8, 0, 0), datetime.datetime(2018, 8, 9, 0, 0), datetime.datetime(2018, 8, 10, 0, 0), datetime.datetime(2018, 8, 13, 0, 0), datetime.datetime(2018, 8, 14, 0, 0), datetime.datetime(2018, 8, 15, 0, 0), datetime.datetime(2018, 8, 16, 0, 0), datetime.datetime(2018, 8, 17, 0, 0), datetime.datetime(2018, 8, 20, 0, 0), datetime.datetime(2018, 8, 21, 0, 0), datetime.datetime(2018, 8, 22, 0, 0), datetime.datetime(2018, 8, 23, 0, 0), datetime.datetime(2018, 8, 24, 0, 0), datetime.datetime(2018, 8, 27, 0, 0), datetime.datetime(2018, 8, 28, 0, 0), datetime.datetime(2018, 8, 29, 0, 0), datetime.datetime(2018, 8, 30, 0, 0), datetime.datetime(2018, 8, 31, 0, 0), datetime.datetime(2018, 9, 4, 0, 0), datetime.datetime(2018, 9, 5, 0, 0), datetime.datetime(2018, 9, 6, 0, 0), datetime.datetime(2018, 9, 7, 0, 0), datetime.datetime(2018, 9, 10, 0, 0), datetime.datetime(2018, 9, 11, 0, 0), datetime.datetime(2018, 9, 12, 0, 0), datetime.datetime(2018, 9, 13, 0, 0), datetime.datetime(2018, 9, 14, 0, 0), datetime.datetime(2018, 9, 17, 0, 0), datetime.datetime(2018, 9, 18, 0, 0), datetime.datetime(2018, 9, 19, 0, 0), datetime.datetime(2018, 9, 20, 0, 0), datetime.datetime(2018, 9, 21, 0, 0), datetime.datetime(2018, 9, 24, 0, 0), datetime.datetime(2018, 9, 25, 0, 0), datetime.datetime(2018, 9, 26, 0, 0), datetime.datetime(2018, 9, 27, 0, 0), datetime.datetime(2018, 9, 28, 0, 0), datetime.datetime(2018, 10, 1, 0, 0), datetime.datetime(2018, 10, 2, 0, 0), datetime.datetime(2018, 10, 3, 0, 0), datetime.datetime(2018, 10, 4, 0, 0), datetime.datetime(2018, 10, 5, 0, 0), datetime.datetime(2018, 10, 8, 0, 0), datetime.datetime(2018, 10, 9, 0, 0), datetime.datetime(2018, 10, 10, 0, 0), datetime.datetime(2018, 10, 11, 0, 0), datetime.datetime(2018, 10, 12, 0, 0), datetime.datetime(2018, 10, 15, 0, 0), datetime.datetime(2018, 10, 16, 0, 0), datetime.datetime(2018, 10, 17, 0, 0), datetime.datetime(2018, 10, 18, 0, 0), datetime.datetime(2018, 10, 19, 0, 0), datetime.datetime(2018, 10, 22, 0, 0), datetime.datetime(2018, 10, 23, 0, 0), datetime.datetime(2018, 10, 24, 0, 0), datetime.datetime(2018, 10, 25, 0, 0), datetime.datetime(2018, 10, 26, 0, 0), datetime.datetime(2018, 10, 29, 0, 0), datetime.datetime(2018, 10, 30, 0, 0), datetime.datetime(2018, 10, 31, 0, 0), datetime.datetime(2018, 11, 1, 0, 0), datetime.datetime(2018, 11, 2, 0, 0), datetime.datetime(2018, 11, 5, 0, 0), datetime.datetime(2018, 11, 6, 0, 0), datetime.datetime(2018, 11, 7, 0, 0), datetime.datetime(2018, 11, 8, 0, 0), datetime.datetime(2018, 11, 9, 0, 0), datetime.datetime(2018, 11, 12, 0, 0), datetime.datetime(2018, 11, 13, 0, 0), datetime.datetime(2018, 11, 14, 0, 0), datetime.datetime(2018, 11, 15, 0, 0), datetime.datetime(2018, 11, 16, 0, 0), datetime.datetime(2018, 11, 19, 0, 0), datetime.datetime(2018, 11, 20, 0, 0), datetime.datetime(2018, 11, 21, 0, 0), datetime.datetime(2018, 11, 23, 0, 0), datetime.datetime(2018, 11, 26, 0, 0), datetime.datetime(2018, 11, 27, 0, 0), datetime.datetime(2018, 11, 28, 0, 0), datetime.datetime(2018, 11, 29, 0, 0), datetime.datetime(2018, 11, 30, 0, 0), datetime.datetime(2018, 12, 3, 0, 0), datetime.datetime(2018, 12, 4, 0, 0), datetime.datetime(2018, 12, 5, 0, 0), datetime.datetime(2018, 12, 6, 0, 0), datetime.datetime(2018, 12, 7, 0, 0), datetime.datetime(2018, 12, 10, 0, 0), datetime.datetime(2018, 12, 11, 0, 0), datetime.datetime(2018, 12, 12, 0, 0), datetime.datetime(2018, 12, 13, 0, 0), datetime.datetime(2018, 12, 14, 0, 0), datetime.datetime(2018, 12, 17, 0, 0), datetime.datetime(2018, 12, 18, 0, 0), datetime.datetime(2018, 12, 19, 0, 0), datetime.datetime(2018, 12, 20, 0, 0), datetime.datetime(2018, 12, 21, 0, 0), datetime.datetime(2018, 12, 24, 0, 0), datetime.datetime(2018, 12, 26, 0, 0), datetime.datetime(2018, 12, 27, 0, 0), datetime.datetime(2018, 12, 28, 0, 0), datetime.datetime(2018, 12, 31, 0, 0), datetime.datetime(2019, 1, 2, 0, 0), datetime.datetime(2019, 1, 3, 0, 0), datetime.datetime(2019, 1, 4, 0, 0), datetime.datetime(2019, 1, 7, 0, 0), datetime.datetime(2019, 1, 8, 0, 0), datetime.datetime(2019, 1, 9, 0, 0), datetime.datetime(2019, 1, 10, 0, 0), datetime.datetime(2019, 1, 11, 0, 0), datetime.datetime(2019, 1, 14, 0, 0), datetime.datetime(2019, 1, 15, 0, 0), datetime.datetime(2019, 1, 16, 0, 0), datetime.datetime(2019, 1, 17, 0, 0), datetime.datetime(2019, 1, 18, 0, 0), datetime.datetime(2019, 1, 22, 0, 0), datetime.datetime(2019, 1, 23, 0, 0), datetime.datetime(2019, 1, 24, 0, 0), datetime.datetime(2019, 1, 25, 0, 0), datetime.datetime(2019, 1, 28, 0, 0), datetime.datetime(2019, 1, 29, 0, 0), datetime.datetime(2019, 1, 30, 0, 0), datetime.datetime(2019, 1, 31, 0, 0), datetime.datetime(2019, 2, 1, 0, 0), datetime.datetime(2019, 2, 4, 0, 0), datetime.datetime(2019, 2, 5, 0, 0), datetime.datetime(2019, 2, 6, 0, 0), datetime.datetime(2019, 2, 7, 0, 0), datetime.datetime(2019, 2, 8, 0, 0), datetime.datetime(2019, 2, 11, 0, 0), datetime.datetime(2019, 2, 12, 0, 0), datetime.datetime(2019, 2, 13, 0, 0), datetime.datetime(2019, 2, 14, 0, 0), datetime.datetime(2019, 2, 15, 0, 0), datetime.datetime(2019, 2, 19, 0, 0), datetime.datetime(2019, 2, 20, 0, 0), datetime.datetime(2019, 2, 21, 0, 0), datetime.datetime(2019, 2, 22, 0, 0), datetime.datetime(2019, 2, 25, 0, 0), datetime.datetime(2019, 2, 26, 0, 0), datetime.datetime(2019, 2, 27, 0, 0), datetime.datetime(2019, 2, 28, 0, 0), datetime.datetime(2019, 3, 1, 0, 0), datetime.datetime(2019, 3, 4, 0, 0), datetime.datetime(2019, 3, 5, 0, 0), datetime.datetime(2019, 3, 6, 0, 0), datetime.datetime(2019, 3, 7, 0, 0), datetime.datetime(2019, 3, 8, 0, 0), datetime.datetime(2019, 3, 11, 0, 0), datetime.datetime(2019, 3, 12, 0, 0), datetime.datetime(2019, 3, 13, 0, 0), datetime.datetime(2019, 3, 14, 0, 0), datetime.datetime(2019, 3, 15, 0, 0), datetime.datetime(2019, 3, 18, 0, 0), datetime.datetime(2019, 3, 19, 0, 0), datetime.datetime(2019, 3, 20, 0, 0), datetime.datetime(2019, 3, 21, 0, 0), datetime.datetime(2019, 3, 22, 0, 0), datetime.datetime(2019, 3, 25, 0, 0), datetime.datetime(2019, 3, 26, 0, 0), datetime.datetime(2019, 3, 27, 0, 0), datetime.datetime(2019, 3, 28, 0, 0), datetime.datetime(2019, 3, 29, 0, 0), datetime.datetime(2019, 4, 1, 0, 0), datetime.datetime(2019, 4, 2, 0, 0), datetime.datetime(2019, 4, 3, 0, 0), datetime.datetime(2019, 4, 4, 0, 0), datetime.datetime(2019, 4, 5, 0, 0), datetime.datetime(2019, 4, 8, 0, 0), datetime.datetime(2019, 4, 9, 0, 0), datetime.datetime(2019, 4, 10, 0, 0), datetime.datetime(2019, 4, 11, 0, 0), datetime.datetime(2019, 4, 12, 0, 0), datetime.datetime(2019, 4, 15, 0, 0), datetime.datetime(2019, 4, 16, 0, 0), datetime.datetime(2019, 4, 17, 0, 0), datetime.datetime(2019, 4, 18, 0, 0), datetime.datetime(2019, 4, 22, 0, 0), datetime.datetime(2019, 4, 23, 0, 0), datetime.datetime(2019, 4, 24, 0, 0), datetime.datetime(2019, 4, 25, 0, 0), datetime.datetime(2019, 4, 26, 0, 0), datetime.datetime(2019, 4, 29, 0, 0), datetime.datetime(2019, 4, 30, 0, 0), datetime.datetime(2019, 5, 1, 0, 0), datetime.datetime(2019, 5, 2, 0, 0), datetime.datetime(2019, 5, 3, 0, 0), datetime.datetime(2019, 5, 6, 0, 0), datetime.datetime(2019, 5, 7, 0, 0), datetime.datetime(2019, 5, 8, 0, 0), datetime.datetime(2019, 5, 9, 0, 0), datetime.datetime(2019, 5, 10, 0, 0), datetime.datetime(2019, 5, 13, 0, 0), datetime.datetime(2019, 5, 14, 0, 0), datetime.datetime(2019, 5, 15, 0, 0), datetime.datetime(2019, 5, 16, 0, 0), datetime.datetime(2019, 5, 17, 0, 0), datetime.datetime(2019, 5, 20, 0, 0), datetime.datetime(2019, 5, 21, 0, 0), datetime.datetime(2019, 5, 22, 0, 0), datetime.datetime(2019, 5, 23, 0, 0), datetime.datetime(2019, 5, 24, 0, 0), datetime.datetime(2019, 5, 28, 0, 0), datetime.datetime(2019, 5, 29, 0, 0), datetime.datetime(2019, 5, 30, 0, 0), datetime.datetime(2019, 5, 31, 0, 0), datetime.datetime(2019, 6, 3, 0, 0), datetime.datetime(2019, 6, 4, 0, 0), datetime.datetime(2019, 6, 5, 0, 0), datetime.datetime(2019, 6, 6, 0, 0), datetime.datetime(2019, 6, 7, 0, 0), datetime.datetime(2019, 6, 10, 0, 0), datetime.datetime(2019, 6, 11, 0, 0), datetime.datetime(2019, 6, 12, 0, 0), datetime.datetime(2019, 6, 13, 0, 0), datetime.datetime(2019, 6, 14, 0, 0), datetime.datetime(2019, 6, 17, 0, 0), datetime.datetime(2019, 6, 18, 0, 0), datetime.datetime(2019, 6, 19, 0, 0), datetime.datetime(2019, 6, 20, 0, 0), datetime.datetime(2019, 6, 21, 0, 0), datetime.datetime(2019, 6, 24, 0, 0), datetime.datetime(2019, 6, 25, 0, 0), datetime.datetime(2019, 6, 26, 0, 0), datetime.datetime(2019, 6, 27, 0, 0), datetime.datetime(2019, 6, 28, 0, 0), datetime.datetime(2019, 7, 1, 0, 0), datetime.datetime(2019, 7, 2, 0, 0), datetime.datetime(2019, 7, 3, 0, 0), datetime.datetime(2019, 7, 5, 0, 0), datetime.datetime(2019, 7, 8, 0, 0), datetime.datetime(2019, 7, 9, 0, 0), datetime.datetime(2019, 7, 10, 0, 0), datetime.datetime(2019, 7, 11, 0, 0), datetime.datetime(2019, 7, 12, 0, 0), datetime.datetime(2019, 7, 15, 0, 0), datetime.datetime(2019, 7, 16, 0, 0), datetime.datetime(2019, 7, 17, 0, 0), datetime.datetime(2019, 7, 18, 0, 0), datetime.datetime(2019, 7, 19, 0, 0), datetime.datetime(2019, 7, 22, 0, 0), datetime.datetime(2019, 7, 23, 0, 0), datetime.datetime(2019, 7, 24, 0, 0), datetime.datetime(2019, 7, 25, 0, 0), datetime.datetime(2019, 7, 26, 0, 0), datetime.datetime(2019, 7, 29, 0, 0), datetime.datetime(2019, 7, 30, 0, 0), datetime.datetime(2019, 7, 31, 0, 0), datetime.datetime(2019, 8, 1, 0, 0), datetime.datetime(2019, 8, 2, 0, 0), datetime.datetime(2019, 8, 5, 0, 0), datetime.datetime(2019, 8, 6, 0, 0), datetime.datetime(2019, 8, 7, 0, 0), datetime.datetime(2019, 8, 8, 0, 0), datetime.datetime(2019, 8, 9, 0, 0), datetime.datetime(2019, 8, 12, 0, 0), datetime.datetime(2019, 8, 13, 0, 0), datetime.datetime(2019, 8, 14, 0, 0), datetime.datetime(2019, 8, 15, 0, 0), datetime.datetime(2019, 8, 16, 0, 0), datetime.datetime(2019, 8, 19, 0, 0), datetime.datetime(2019, 8, 20, 0, 0), datetime.datetime(2019, 8, 21, 0, 0), datetime.datetime(2019, 8, 22, 0, 0), datetime.datetime(2019, 8, 23, 0, 0), datetime.datetime(2019, 8, 26, 0, 0), datetime.datetime(2019, 8, 27, 0, 0), datetime.datetime(2019, 8, 28, 0, 0), datetime.datetime(2019, 8, 29, 0, 0), datetime.datetime(2019, 8, 30, 0, 0), datetime.datetime(2019, 9, 3, 0, 0), datetime.datetime(2019, 9, 4, 0, 0), datetime.datetime(2019, 9, 5, 0, 0), datetime.datetime(2019, 9, 6, 0, 0), datetime.datetime(2019, 9, 9, 0, 0), datetime.datetime(2019, 9, 10, 0, 0), datetime.datetime(2019, 9, 11, 0, 0), datetime.datetime(2019, 9, 12, 0, 0), datetime.datetime(2019, 9, 13, 0, 0), datetime.datetime(2019, 9, 16, 0, 0), datetime.datetime(2019, 9, 17, 0, 0), datetime.datetime(2019, 9, 18, 0, 0), datetime.datetime(2019, 9, 19, 0, 0), datetime.datetime(2019, 9, 20, 0, 0), datetime.datetime(2019, 9, 23, 0, 0), datetime.datetime(2019, 9, 24, 0, 0), datetime.datetime(2019, 9, 25, 0, 0), datetime.datetime(2019, 9, 26, 0, 0), datetime.datetime(2019, 9, 27, 0, 0), datetime.datetime(2019, 9, 30, 0, 0), datetime.datetime(2019, 10, 1, 0, 0), datetime.datetime(2019, 10, 2, 0, 0), datetime.datetime(2019, 10, 3, 0, 0), datetime.datetime(2019, 10, 4, 0, 0), datetime.datetime(2019, 10, 7, 0, 0), datetime.datetime(2019, 10, 8, 0, 0), datetime.datetime(2019, 10, 9, 0, 0), datetime.datetime(2019, 10, 10, 0, 0), datetime.datetime(2019, 10, 11, 0, 0), datetime.datetime(2019, 10, 14, 0, 0), datetime.datetime(2019, 10, 15, 0, 0), datetime.datetime(2019, 10, 16, 0, 0), datetime.datetime(2019, 10, 17, 0, 0), datetime.datetime(2019, 10, 18, 0, 0), datetime.datetime(2019, 10, 21, 0, 0), datetime.datetime(2019, 10, 22, 0, 0), datetime.datetime(2019, 10, 23, 0, 0), datetime.datetime(2019, 10, 24, 0, 0), datetime.datetime(2019, 10, 25, 0, 0), datetime.datetime(2019, 10, 28, 0, 0), datetime.datetime(2019, 10, 29, 0, 0), datetime.datetime(2019, 10, 30, 0, 0), datetime.datetime(2019, 10, 31, 0, 0), datetime.datetime(2019, 11, 1, 0, 0), datetime.datetime(2019, 11, 4, 0, 0), datetime.datetime(2019, 11, 5, 0, 0), datetime.datetime(2019, 11, 6, 0, 0), datetime.datetime(2019, 11, 7, 0, 0), datetime.datetime(2019, 11, 8, 0, 0), datetime.datetime(2019, 11, 11, 0, 0), datetime.datetime(2019, 11, 12, 0, 0), datetime.datetime(2019, 11, 13, 0, 0), datetime.datetime(2019, 11, 14, 0, 0), datetime.datetime(2019, 11, 15, 0, 0), datetime.datetime(2019, 11, 18, 0, 0), datetime.datetime(2019, 11, 19, 0, 0), datetime.datetime(2019, 11, 20, 0, 0), datetime.datetime(2019, 11, 21, 0, 0), datetime.datetime(2019, 11, 22, 0, 0), datetime.datetime(2019, 11, 25, 0, 0), datetime.datetime(2019, 11, 26, 0, 0), datetime.datetime(2019, 11, 27, 0, 0), datetime.datetime(2019, 11, 29, 0, 0), datetime.datetime(2019, 12, 2, 0, 0), datetime.datetime(2019, 12, 3, 0, 0), datetime.datetime(2019, 12, 4, 0, 0), datetime.datetime(2019, 12, 5, 0, 0), datetime.datetime(2019, 12, 6, 0, 0), datetime.datetime(2019, 12, 9, 0, 0), datetime.datetime(2019, 12, 10, 0, 0), datetime.datetime(2019, 12, 11, 0, 0), datetime.datetime(2019, 12, 12, 0, 0), datetime.datetime(2019, 12, 13, 0, 0), datetime.datetime(2019, 12, 16, 0, 0), datetime.datetime(2019, 12, 17, 0, 0), datetime.datetime(2019, 12, 18, 0, 0), datetime.datetime(2019, 12, 19, 0, 0), datetime.datetime(2019, 12, 20, 0, 0), datetime.datetime(2019, 12, 23, 0, 0), datetime.datetime(2019, 12, 24, 0, 0), datetime.datetime(2019, 12, 26, 0, 0), datetime.datetime(2019, 12, 27, 0, 0), datetime.datetime(2019, 12, 30, 0, 0), datetime.datetime(2019, 12, 31, 0, 0), datetime.datetime(2020, 1, 2, 0, 0), datetime.datetime(2020, 1, 3, 0, 0), datetime.datetime(2020, 1, 6, 0, 0), datetime.datetime(2020, 1, 7, 0, 0), datetime.datetime(2020, 1, 8, 0, 0), datetime.datetime(2020, 1, 9, 0, 0), datetime.datetime(2020, 1, 10, 0, 0), datetime.datetime(2020, 1, 13, 0, 0), datetime.datetime(2020, 1, 14, 0, 0), datetime.datetime(2020, 1, 15, 0, 0), datetime.datetime(2020, 1, 16, 0, 0), datetime.datetime(2020, 1, 17, 0, 0), datetime.datetime(2020, 1, 21, 0, 0), datetime.datetime(2020, 1, 22, 0, 0), datetime.datetime(2020, 1, 23, 0, 0), datetime.datetime(2020, 1, 24, 0, 0), datetime.datetime(2020, 1, 27, 0, 0), datetime.datetime(2020, 1, 28, 0, 0), datetime.datetime(2020, 1, 29, 0, 0), datetime.datetime(2020, 1, 30, 0, 0), datetime.datetime(2020, 1, 31, 0, 0), datetime.datetime(2020, 2, 3, 0, 0), datetime.datetime(2020, 2, 4, 0, 0), datetime.datetime(2020, 2, 5, 0, 0), datetime.datetime(2020, 2, 6, 0, 0), datetime.datetime(2020, 2, 7, 0, 0), datetime.datetime(2020, 2, 10, 0, 0), datetime.datetime(2020, 2, 11, 0, 0), datetime.datetime(2020, 2, 12, 0, 0), datetime.datetime(2020, 2, 13, 0, 0), datetime.datetime(2020, 2, 14, 0, 0), datetime.datetime(2020, 2, 18, 0, 0), datetime.datetime(2020, 2, 19, 0, 0), datetime.datetime(2020, 2, 20, 0, 0), datetime.datetime(2020, 2, 21, 0, 0), datetime.datetime(2020, 2, 24, 0, 0), datetime.datetime(2020, 2, 25, 0, 0), datetime.datetime(2020, 2, 26, 0, 0), datetime.datetime(2020, 2, 27, 0, 0), datetime.datetime(2020, 2, 28, 0, 0), datetime.datetime(2020, 3, 2, 0, 0), datetime.datetime(2020, 3, 3, 0, 0), datetime.datetime(2020, 3, 4, 0, 0), datetime.datetime(2020, 3, 5, 0, 0), datetime.datetime(2020, 3, 6, 0, 0), datetime.datetime(2020, 3, 9, 0, 0), datetime.datetime(2020, 3, 10, 0, 0), datetime.datetime(2020, 3, 11, 0, 0), datetime.datetime(2020, 3, 12, 0, 0), datetime.datetime(2020, 3, 13, 0, 0), datetime.datetime(2020, 3, 16, 0, 0), datetime.datetime(2020, 3, 17, 0, 0), datetime.datetime(2020, 3, 18, 0, 0), datetime.datetime(2020, 3, 19, 0, 0), datetime.datetime(2020, 3, 20, 0, 0), datetime.datetime(2020, 3, 23, 0, 0), datetime.datetime(2020, 3, 24, 0, 0), datetime.datetime(2020, 3, 25, 0, 0), datetime.datetime(2020, 3, 26, 0, 0), datetime.datetime(2020, 3, 27, 0, 0), datetime.datetime(2020, 3, 30, 0, 0), datetime.datetime(2020, 3, 31, 0, 0), datetime.datetime(2020, 4, 1, 0, 0), datetime.datetime(2020, 4, 2, 0, 0), datetime.datetime(2020, 4, 3, 0, 0), datetime.datetime(2020, 4, 6, 0, 0), datetime.datetime(2020, 4, 7, 0, 0), datetime.datetime(2020, 4, 8, 0, 0), datetime.datetime(2020, 4, 9, 0, 0), datetime.datetime(2020, 4, 13, 0, 0), datetime.datetime(2020, 4, 14, 0, 0), datetime.datetime(2020, 4, 15, 0, 0), datetime.datetime(2020, 4, 16, 0, 0), datetime.datetime(2020, 4, 17, 0, 0), datetime.datetime(2020, 4, 20, 0, 0), datetime.datetime(2020, 4, 21, 0, 0), datetime.datetime(2020, 4, 22, 0, 0), datetime.datetime(2020, 4, 23, 0, 0), datetime.datetime(2020, 4, 24, 0, 0), datetime.datetime(2020, 4, 27, 0, 0), datetime.datetime(2020, 4, 28, 0, 0), datetime.datetime(2020, 4, 29, 0, 0), datetime.datetime(2020, 4, 30, 0, 0), datetime.datetime(2020, 5, 1, 0, 0), datetime.datetime(2020, 5, 4, 0, 0), datetime.datetime(2020, 5, 5, 0, 0), datetime.datetime(2020, 5, 6, 0, 0), datetime.datetime(2020, 5, 7, 0, 0), datetime.datetime(2020, 5, 8, 0, 0), datetime.datetime(2020, 5, 11, 0, 0), datetime.datetime(2020, 5, 12, 0, 0), datetime.datetime(2020, 5, 13, 0, 0), datetime.datetime(2020, 5, 14, 0, 0), datetime.datetime(2020, 5, 15, 0, 0), datetime.datetime(2020, 5, 18, 0, 0), datetime.datetime(2020, 5, 19, 0, 0), datetime.datetime(2020, 5, 20, 0, 0), datetime.datetime(2020, 5, 21, 0, 0), datetime.datetime(2020, 5, 22, 0, 0), datetime.datetime(2020, 5, 26, 0, 0), datetime.datetime(2020, 5, 27, 0, 0), datetime.datetime(2020, 5, 28, 0, 0), datetime.datetime(2020, 5, 29, 0, 0), datetime.datetime(2020, 6, 1, 0, 0), datetime.datetime(2020, 6, 2, 0, 0), datetime.datetime(2020, 6, 3, 0, 0), datetime.datetime(2020, 6, 4, 0, 0), datetime.datetime(2020, 6, 5, 0, 0), datetime.datetime(2020, 6, 8, 0, 0), datetime.datetime(2020, 6, 9, 0, 0), datetime.datetime(2020, 6, 10, 0, 0), datetime.datetime(2020, 6, 11, 0, 0), datetime.datetime(2020, 6, 12, 0, 0), datetime.datetime(2020, 6, 15, 0, 0), datetime.datetime(2020, 6, 16, 0, 0), datetime.datetime(2020, 6, 17, 0, 0), datetime.datetime(2020, 6, 18, 0, 0), datetime.datetime(2020, 6, 19, 0, 0), datetime.datetime(2020, 6, 22, 0, 0), datetime.datetime(2020, 6, 23, 0, 0), datetime.datetime(2020, 6, 24, 0, 0), datetime.datetime(2020, 6, 25, 0, 0), datetime.datetime(2020, 6, 26, 0, 0), datetime.datetime(2020, 6, 29, 0, 0), datetime.datetime(2020, 6, 30, 0, 0), datetime.datetime(2020, 7, 1, 0, 0), datetime.datetime(2020, 7, 2, 0, 0), datetime.datetime(2020, 7, 6, 0, 0), datetime.datetime(2020, 7, 7, 0, 0), datetime.datetime(2020, 7, 8, 0, 0), datetime.datetime(2020, 7, 9, 0, 0), datetime.datetime(2020, 7, 10, 0, 0), datetime.datetime(2020, 7, 13, 0, 0), datetime.datetime(2020, 7, 14, 0, 0), datetime.datetime(2020, 7, 15, 0, 0), datetime.datetime(2020, 7, 16, 0, 0), datetime.datetime(2020, 7, 17, 0, 0), datetime.datetime(2020, 7, 20, 0, 0), datetime.datetime(2020, 7, 21, 0, 0), datetime.datetime(2020, 7, 22, 0, 0), datetime.datetime(2020, 7, 23, 0, 0), datetime.datetime(2020, 7, 24, 0, 0), datetime.datetime(2020, 7, 27, 0, 0), datetime.datetime(2020, 7, 28, 0, 0), datetime.datetime(2020, 7, 29, 0, 0), datetime.datetime(2020, 7, 30, 0, 0), datetime.datetime(2020, 7, 31, 0, 0), datetime.datetime(2020, 8, 3, 0, 0), datetime.datetime(2020, 8, 4, 0, 0), datetime.datetime(2020, 8, 5, 0, 0), datetime.datetime(2020, 8, 6, 0, 0), datetime.datetime(2020, 8, 7, 0, 0), datetime.datetime(2020, 8, 10, 0, 0), datetime.datetime(2020, 8, 11, 0, 0), datetime.datetime(2020, 8, 12, 0, 0), datetime.datetime(2020, 8, 13, 0, 0), datetime.datetime(2020, 8, 14, 0, 0), datetime.datetime(2020, 8, 17, 0, 0), datetime.datetime(2020, 8, 18, 0, 0), datetime.datetime(2020, 8, 19, 0, 0), datetime.datetime(2020, 8, 20, 0, 0), datetime.datetime(2020, 8, 21, 0, 0), datetime.datetime(2020, 8, 24, 0, 0), datetime.datetime(2020, 8, 25, 0, 0), datetime.datetime(2020, 8, 26, 0, 0), datetime.datetime(2020, 8, 27, 0, 0), datetime.datetime(2020, 8, 28, 0, 0), datetime.datetime(2020, 8, 31, 0, 0), datetime.datetime(2020, 9, 1, 0, 0), datetime.datetime(2020, 9, 2, 0, 0), datetime.datetime(2020, 9, 3, 0, 0), datetime.datetime(2020, 9, 4, 0, 0), datetime.datetime(2020, 9, 8, 0, 0), datetime.datetime(2020, 9, 9, 0, 0), datetime.datetime(2020, 9, 10, 0, 0), datetime.datetime(2020, 9, 11, 0, 0), datetime.datetime(2020, 9, 14, 0, 0), datetime.datetime(2020, 9, 15, 0, 0), datetime.datetime(2020, 9, 16, 0, 0), datetime.datetime(2020, 9, 17, 0, 0), datetime.datetime(2020, 9, 18, 0, 0), datetime.datetime(2020, 9, 21, 0, 0), datetime.datetime(2020, 9, 22, 0, 0), datetime.datetime(2020, 9, 23, 0, 0), datetime.datetime(2020, 9, 24, 0, 0), datetime.datetime(2020, 9, 25, 0, 0), datetime.datetime(2020, 9, 28, 0, 0), datetime.datetime(2020, 9, 29, 0, 0), datetime.datetime(2020, 9, 30, 0, 0), datetime.datetime(2020, 10, 1, 0, 0), datetime.datetime(2020, 10, 2, 0, 0), datetime.datetime(2020, 10, 5, 0, 0), datetime.datetime(2020, 10, 6, 0, 0), datetime.datetime(2020, 10, 7, 0, 0), datetime.datetime(2020, 10, 8, 0, 0), datetime.datetime(2020, 10, 9, 0, 0), datetime.datetime(2020, 10, 12, 0, 0), datetime.datetime(2020, 10, 13, 0, 0), datetime.datetime(2020, 10, 14, 0, 0), datetime.datetime(2020, 10, 15, 0, 0), datetime.datetime(2020, 10, 16, 0, 0), datetime.datetime(2020, 10, 19, 0, 0), datetime.datetime(2020, 10, 20, 0, 0), datetime.datetime(2020, 10, 21, 0, 0), datetime.datetime(2020, 10, 22, 0, 0), datetime.datetime(2020, 10, 23, 0, 0), datetime.datetime(2020, 10, 26, 0, 0), datetime.datetime(2020, 10, 27, 0, 0), datetime.datetime(2020, 10, 28, 0, 0), datetime.datetime(2020, 10, 29, 0, 0), datetime.datetime(2020, 10, 30, 0, 0), datetime.datetime(2020, 11, 2, 0, 0), datetime.datetime(2020, 11, 3, 0, 0), datetime.datetime(2020, 11, 4, 0, 0), datetime.datetime(2020, 11, 5, 0, 0), datetime.datetime(2020, 11, 6, 0, 0), datetime.datetime(2020, 11, 9, 0, 0), datetime.datetime(2020, 11, 10, 0, 0), datetime.datetime(2020, 11, 11, 0, 0), datetime.datetime(2020, 11, 12, 0, 0), datetime.datetime(2020, 11, 13, 0, 0), datetime.datetime(2020, 11, 16, 0, 0), datetime.datetime(2020, 11, 17, 0, 0), datetime.datetime(2020, 11, 18, 0, 0), datetime.datetime(2020, 11, 19, 0, 0), datetime.datetime(2020, 11, 20, 0, 0), datetime.datetime(2020, 11, 23, 0, 0), datetime.datetime(2020, 11, 24, 0, 0), datetime.datetime(2020, 11, 25, 0, 0), datetime.datetime(2020, 11, 27, 0, 0), datetime.datetime(2020, 11, 30, 0, 0), datetime.datetime(2020, 12, 1, 0, 0), datetime.datetime(2020, 12, 2, 0, 0), datetime.datetime(2020, 12, 3, 0, 0), datetime.datetime(2020, 12, 4, 0, 0), datetime.datetime(2020, 12, 7, 0, 0), datetime.datetime(2020, 12, 8, 0, 0), datetime.datetime(2020, 12, 9, 0, 0), datetime.datetime(2020, 12, 10, 0, 0), datetime.datetime(2020, 12, 11, 0, 0), datetime.datetime(2020, 12, 14, 0, 0), datetime.datetime(2020, 12, 15, 0, 0), datetime.datetime(2020, 12, 16, 0, 0), datetime.datetime(2020, 12, 17, 0, 0), datetime.datetime(2020, 12, 18, 0, 0), datetime.datetime(2020, 12, 21, 0, 0), datetime.datetime(2020, 12, 22, 0, 0), datetime.datetime(2020, 12, 23, 0, 0), datetime.datetime(2020, 12, 24, 0, 0), datetime.datetime(2020, 12, 28, 0, 0), datetime.datetime(2020, 12, 29, 0, 0), datetime.datetime(2020, 12, 30, 0, 0), datetime.datetime(2020, 12, 31, 0, 0)]
\ No newline at end of file